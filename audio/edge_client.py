@@ -0,0 +1,277 @@
+"""
+audio/edge_client.py — Edge TTS ueber einen persistenten asyncio-Loop
+
+Bisher lief pro Satz asyncio.run() (bzw. ein ThreadPoolExecutor, wenn
+bereits ein Loop lief), die MP3-Bytes wurden per += gesammelt und erst
+nach dem letzten Chunk komplett dekodiert. Jetzt:
+
+  - Ein langlebiger Loop-Thread (ars-edge-loop) fuehrt alle Anfragen aus;
+    kein Loop-Aufbau/-Abbau pro Satz.
+  - Anfragen liefern MP3-Chunks ueber eine Queue, sobald sie eintreffen.
+  - Mp3Decoder dekodiert inkrementell (PyAV, optional) — der erste Block
+    spielt, waehrend der Rest noch uebertragen wird. Ohne PyAV: Chunks in
+    einem BytesIO sammeln, am Ende einmal via soundfile dekodieren.
+  - prefetch(): Folgesaetze werden schon beim Einreihen angefragt (max.
+    EDGE_TTS_PREFETCH gleichzeitig), ihre Antwort liegt bereit, wenn der
+    Synthese-Worker sie erreicht.
+
+edge-tts oeffnet pro Communicate-Objekt einen eigenen Websocket; das
+Wiederverwenden einer Verbindung ueber Anfragen hinweg legt die Bibliothek
+nicht offen. Der persistente Loop und das Vorab-Anfragen verdecken die
+Verbindungs-Latenz stattdessen.
+
+communicate_factory(text, voice) ist austauschbar (Default:
+edge_tts.Communicate) — z.B. fuer einen lokalen Ersatz-Server ohne Netz.
+
+Konfiguration via .env:
+  EDGE_TTS_PREFETCH=2     # max. vorab laufende Anfragen
+  EDGE_TTS_TIMEOUT=30     # Sekunden ohne neuen Chunk bis Abbruch
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import logging
+import os
+import queue
+import threading
+from typing import Any, Callable, Iterator
+
+import numpy as np
+
+logger = logging.getLogger("ARS.audio.edge")
+
+EDGE_TTS_PREFETCH = max(0, int(os.getenv("EDGE_TTS_PREFETCH", "2")))
+EDGE_TTS_TIMEOUT  = float(os.getenv("EDGE_TTS_TIMEOUT", "30"))
+
+_DONE = object()          # Sentinel: Anfrage vollstaendig
+_CANCELLED = object()     # Sentinel: Anfrage abgebrochen (Barge-in)
+
+
+class EdgeCancelled(Exception):
+    """chunks() einer abgebrochenen Anfrage — das Audio ist unvollstaendig."""
+
+
+class EdgeRequest:
+    """Eine laufende Edge-Anfrage; chunks() liefert MP3-Bytes in Reihenfolge."""
+
+    def __init__(self, text: str, voice: str) -> None:
+        self.text = text
+        self.voice = voice
+        self._chunks: queue.Queue = queue.Queue()
+        self._future: Any = None
+
+    def chunks(self, timeout: float = EDGE_TTS_TIMEOUT) -> Iterator[bytes]:
+        """Blockiert bis zum naechsten Chunk; wirft den Fehler der Anfrage weiter."""
+        while True:
+            try:
+                item = self._chunks.get(timeout=timeout)
+            except queue.Empty:
+                self.cancel()
+                raise TimeoutError(f"Edge TTS: kein Audio seit {timeout:.0f} s")
+            if item is _DONE:
+                return
+            if item is _CANCELLED:
+                raise EdgeCancelled(self.text[:40])
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+
+    def cancel(self) -> None:
+        if self._future is not None:
+            self._future.cancel()
+        # Auch wenn die Koroutine noch nicht lief: chunks() nicht bis zum Timeout blockieren
+        self._chunks.put(_CANCELLED)
+
+
+class EdgeTTSClient:
+    """Persistenter Loop-Thread + Prefetch fuer Edge-TTS-Anfragen."""
+
+    def __init__(
+        self,
+        communicate_factory: Callable[[str, str], Any] | None = None,
+        prefetch: int = EDGE_TTS_PREFETCH,
+    ) -> None:
+        self._factory = communicate_factory
+        self._prefetch_limit = prefetch
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._prefetched: dict[tuple[str, str], EdgeRequest] = {}
+
+    # ------------------------------------------------------------------
+    # Loop-Thread
+    # ------------------------------------------------------------------
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=loop.run_forever, daemon=True, name="ars-edge-loop",
+                )
+                self._thread.start()
+                self._loop = loop
+            return self._loop
+
+    def close(self) -> None:
+        """Bricht offene Anfragen ab und beendet den Loop-Thread."""
+        self.cancel_prefetched()
+        with self._lock:
+            loop, self._loop = self._loop, None
+        if loop is not None:
+            # Laufende Anfragen abbrechen und auslaufen lassen, dann stoppen
+            try:
+                asyncio.run_coroutine_threadsafe(_cancel_tasks(), loop).result(timeout=1.0)
+            except Exception as exc:
+                logger.debug("Edge-Loop abbauen: %s", exc)
+            loop.call_soon_threadsafe(loop.stop)
+            if self._thread is not None:
+                self._thread.join(timeout=1.0)
+
+    # ------------------------------------------------------------------
+    # Anfragen
+    # ------------------------------------------------------------------
+
+    def submit(self, text: str, voice: str) -> EdgeRequest:
+        """Startet eine Anfrage sofort (kehrt ohne Warten zurueck)."""
+        request = EdgeRequest(text, voice)
+        request._future = asyncio.run_coroutine_threadsafe(
+            self._run(request), self._ensure_loop(),
+        )
+        return request
+
+    def prefetch(self, text: str, voice: str) -> None:
+        """Fragt einen kommenden Satz vorab an, solange das Limit es erlaubt."""
+        key = (text, voice)
+        with self._lock:
+            if key in self._prefetched or len(self._prefetched) >= self._prefetch_limit:
+                return
+        request = self.submit(text, voice)
+        with self._lock:
+            self._prefetched[key] = request
+
+    def take(self, text: str, voice: str) -> EdgeRequest:
+        """Vorab gestartete Anfrage fuer (text, voice), sonst eine neue."""
+        with self._lock:
+            request = self._prefetched.pop((text, voice), None)
+        return request if request is not None else self.submit(text, voice)
+
+    def cancel_prefetched(self) -> None:
+        """Verwirft alle vorab gestarteten Anfragen (Barge-in, neue Aeusserung)."""
+        with self._lock:
+            pending, self._prefetched = list(self._prefetched.values()), {}
+        for request in pending:
+            request.cancel()
+
+    async def _run(self, request: EdgeRequest) -> None:
+        try:
+            factory = self._factory
+            if factory is None:
+                import edge_tts  # type: ignore[import]
+                factory = edge_tts.Communicate
+            communicate = factory(request.text, request.voice)
+            async for chunk in communicate.stream():
+                if chunk["type"] == "audio":
+                    request._chunks.put(chunk["data"])
+        except asyncio.CancelledError:
+            request._chunks.put(_CANCELLED)
+            raise
+        except Exception as exc:
+            request._chunks.put(exc)
+        else:
+            request._chunks.put(_DONE)
+
+
+async def _cancel_tasks() -> None:
+    """Bricht alle anderen Tasks des Loops ab und wartet auf ihr Ende."""
+    tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class Mp3Decoder:
+    """
+    Inkrementeller MP3 -> float32-mono Decoder.
+
+    Mit PyAV liefert feed() fertige Frames sofort; ohne PyAV sammelt
+    feed() nur (None) und finish() dekodiert den ganzen Satz via soundfile.
+    """
+
+    def __init__(self) -> None:
+        self._codec: Any = None
+        self._buffer: io.BytesIO | None = None
+        try:
+            import av  # type: ignore[import]
+            self._codec = av.CodecContext.create("mp3", "r")
+        except Exception:
+            self._buffer = io.BytesIO()
+
+    @staticmethod
+    def available() -> bool:
+        """True wenn mindestens ein Decoder (PyAV oder soundfile) importierbar ist."""
+        for name in ("av", "soundfile"):
+            try:
+                __import__(name)
+                return True
+            except ImportError:
+                continue
+        return False
+
+    def feed(self, data: bytes) -> tuple[np.ndarray, int] | None:
+        if self._buffer is not None:
+            self._buffer.write(data)
+            return None
+        return self._decode(self._codec.parse(data))
+
+    def finish(self) -> tuple[np.ndarray, int] | None:
+        if self._buffer is not None:
+            if not self._buffer.tell():
+                return None
+            import soundfile as sf  # type: ignore[import]
+            samples, sample_rate = sf.read(io.BytesIO(self._buffer.getvalue()), dtype="float32")
+            if samples.ndim > 1:
+                samples = samples.mean(axis=1)
+            return samples, sample_rate
+        # Restliche Bytes im Parser + Decoder-Flush
+        packets = list(self._codec.parse(b"")) + [None]
+        return self._decode(packets)
+
+    def _decode(self, packets: Any) -> tuple[np.ndarray, int] | None:
+        parts: list[np.ndarray] = []
+        sample_rate = 0
+        for packet in packets:
+            for frame in self._codec.decode(packet):
+                sample_rate = frame.sample_rate
+                parts.append(_frame_to_mono(frame))
+        if not parts:
+            return None
+        return (parts[0] if len(parts) == 1 else np.concatenate(parts)), sample_rate
+
+
+def _frame_to_mono(frame: Any) -> np.ndarray:
+    """PyAV AudioFrame (planar oder interleaved, float oder int16) -> float32 mono."""
+    arr = frame.to_ndarray()
+    channels = len(frame.layout.channels)
+    if not frame.format.is_planar:
+        arr = arr.reshape(-1, channels).T
+    if arr.dtype == np.int16:
+        arr = arr.astype(np.float32) / 32768.0
+    elif arr.dtype != np.float32:
+        arr = arr.astype(np.float32)
+    return arr[0] if channels == 1 else arr.mean(axis=0)
+
+
+_client: EdgeTTSClient | None = None
+_client_lock = threading.Lock()
+
+
+def get_edge_client() -> EdgeTTSClient:
+    """Prozessweiter Edge-Client (ein Loop-Thread fuer alle TTS-Handler)."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = EdgeTTSClient()
+        return _client
@@ -7,22 +7,44 @@ Basiert auf pedalboard (Spotify) fuer Echtzeit-Audio-DSP.
 10 Presets fuer dramatische Variation:
   clean, hall, monster, ghost, robot, radio, underwater, cathedral, rage, old
 
+Zwei Pfade:
+  - apply():  ganzer Puffer, zustandslos
+  - stream(): EffectStream fuer Streaming-TTS — Bloecke mit reset=False,
+              Hall/Delay klingen ueber Satzgrenzen weiter, tail() am Ende
+Jede Kette endet in einem Limiter (statt Peak-Normalisierung pro Puffer);
+float32-Mono wird ohne Kopie als (1, N)-Sicht an pedalboard gereicht.
+
 Fallback: Wenn pedalboard nicht installiert → keine Effekte (passthrough).
 
 Usage:
     fx = AudioEffects()
     processed = fx.apply(samples, sample_rate, "hall")
+
+    stream = fx.stream("hall", 22050)
+    for block in blocks:
+        play(stream.process(block))
+    for block in stream.tail():
+        play(block)
 """
 
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import Any, Callable, Iterator
 
 import numpy as np
 
 logger = logging.getLogger("ARS.audio.effects")
 
+# Limiter am Ende jeder Kette (ersetzt die Peak-Normalisierung pro Puffer)
+LIMITER_THRESHOLD_DB = -1.0
+LIMITER_RELEASE_MS   = 100.0
+
+# Ausklingen (Hall/Delay) nach dem letzten Block
+TAIL_BLOCK       = 1024
+TAIL_MAX_SECONDS = 2.0
+TAIL_FLOOR       = 1e-3      # ~ -60 dBFS
+
 # Pedalboard lazy-loading
 _pb: Any = None
 _pb_available: bool | None = None
@@ -47,60 +69,123 @@ def _ensure_pedalboard() -> bool:
     return _pb_available
 
 
-def _build_presets() -> dict[str, Any]:
-    """Erstellt die Effekt-Preset-Boards. Nur aufrufen wenn pedalboard verfuegbar."""
+# Effekt-Ketten pro Preset (Factory: frische Plugin-Instanzen je Board,
+# damit Streams mit persistentem Zustand sich nichts teilen)
+_PRESET_CHAINS: dict[str, Callable[[Any], list[Any]]] = {
+    "clean": lambda pb: [],
+
+    "hall": lambda pb: [
+        pb.Reverb(room_size=0.7, wet_level=0.4, dry_level=0.7),
+    ],
+
+    "monster": lambda pb: [
+        pb.LowpassFilter(cutoff_frequency_hz=2000),
+        pb.Distortion(drive_db=15),
+    ],
+
+    "ghost": lambda pb: [
+        pb.HighpassFilter(cutoff_frequency_hz=800),
+        pb.Reverb(room_size=0.9, wet_level=0.6, dry_level=0.4),
+        pb.Gain(gain_db=-6),
+    ],
+
+    "robot": lambda pb: [
+        pb.Bitcrush(bit_depth=8),
+        pb.Chorus(rate_hz=2.0, depth=0.4, mix=0.5),
+    ],
+
+    "radio": lambda pb: [
+        pb.HighpassFilter(cutoff_frequency_hz=300),
+        pb.LowpassFilter(cutoff_frequency_hz=3500),
+        pb.Compressor(threshold_db=-20, ratio=6),
+        pb.Gain(gain_db=3),
+    ],
+
+    "underwater": lambda pb: [
+        pb.LowpassFilter(cutoff_frequency_hz=600),
+        pb.Chorus(rate_hz=0.3, depth=0.6, mix=0.4),
+    ],
+
+    "cathedral": lambda pb: [
+        pb.Delay(delay_seconds=0.12, feedback=0.3, mix=0.3),
+        pb.Reverb(room_size=0.85, wet_level=0.5, dry_level=0.5),
+    ],
+
+    "rage": lambda pb: [
+        pb.Compressor(threshold_db=-15, ratio=8),
+        pb.Distortion(drive_db=8),
+        pb.Gain(gain_db=3),
+    ],
+
+    "old": lambda pb: [
+        pb.LowpassFilter(cutoff_frequency_hz=3500),
+        pb.Gain(gain_db=-2),
+    ],
+}
+
+
+def _build_board(preset: str, semitones: float = 0.0) -> Any:
+    """
+    Pedalboard fuer ein Preset (+ optional PitchShift) mit Limiter am Ende,
+    oder None wenn nichts zu tun ist. Nur aufrufen wenn pedalboard verfuegbar.
+    """
     pb = _pb
-    return {
-        "clean": pb.Pedalboard([]),
-
-        "hall": pb.Pedalboard([
-            pb.Reverb(room_size=0.7, wet_level=0.4, dry_level=0.7),
-        ]),
-
-        "monster": pb.Pedalboard([
-            pb.LowpassFilter(cutoff_frequency_hz=2000),
-            pb.Distortion(drive_db=15),
-        ]),
-
-        "ghost": pb.Pedalboard([
-            pb.HighpassFilter(cutoff_frequency_hz=800),
-            pb.Reverb(room_size=0.9, wet_level=0.6, dry_level=0.4),
-            pb.Gain(gain_db=-6),
-        ]),
-
-        "robot": pb.Pedalboard([
-            pb.Bitcrush(bit_depth=8),
-            pb.Chorus(rate_hz=2.0, depth=0.4, mix=0.5),
-        ]),
-
-        "radio": pb.Pedalboard([
-            pb.HighpassFilter(cutoff_frequency_hz=300),
-            pb.LowpassFilter(cutoff_frequency_hz=3500),
-            pb.Compressor(threshold_db=-20, ratio=6),
-            pb.Gain(gain_db=3),
-        ]),
-
-        "underwater": pb.Pedalboard([
-            pb.LowpassFilter(cutoff_frequency_hz=600),
-            pb.Chorus(rate_hz=0.3, depth=0.6, mix=0.4),
-        ]),
-
-        "cathedral": pb.Pedalboard([
-            pb.Delay(delay_seconds=0.12, feedback=0.3, mix=0.3),
-            pb.Reverb(room_size=0.85, wet_level=0.5, dry_level=0.5),
-        ]),
-
-        "rage": pb.Pedalboard([
-            pb.Compressor(threshold_db=-15, ratio=8),
-            pb.Distortion(drive_db=8),
-            pb.Gain(gain_db=3),
-        ]),
-
-        "old": pb.Pedalboard([
-            pb.LowpassFilter(cutoff_frequency_hz=3500),
-            pb.Gain(gain_db=-2),
-        ]),
-    }
+    chain = _PRESET_CHAINS[preset](pb)
+    if abs(semitones) >= 0.01:
+        chain.insert(0, pb.PitchShift(semitones=semitones))
+    if not chain:
+        return None
+    chain.append(pb.Limiter(threshold_db=LIMITER_THRESHOLD_DB, release_ms=LIMITER_RELEASE_MS))
+    return pb.Pedalboard(chain)
+
+
+def _as_block(samples: np.ndarray) -> np.ndarray:
+    """float32 (1, N)-Sicht auf mono Samples — kopiert nur wenn noetig."""
+    return np.asarray(samples, dtype=np.float32).reshape(1, -1)
+
+
+class EffectStream:
+    """
+    Blockweiser Effekt-Prozessor fuer ein Preset bei fester Sample-Rate.
+
+    Das Board wird mit reset=False aufgerufen: Hall, Delay und Chorus
+    laufen ueber Block- und Satzgrenzen weiter. tail() laesst den Effekt
+    am Ende ausklingen, statt ihn abzuschneiden.
+    """
+
+    def __init__(self, preset: str, sample_rate: int, semitones: float = 0.0) -> None:
+        self.preset = preset
+        self.sample_rate = sample_rate
+        self._board = _build_board(preset, semitones) if _ensure_pedalboard() else None
+        self._dirty = False
+
+    @property
+    def active(self) -> bool:
+        return self._board is not None
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """Verarbeitet einen Block (mono float32) und gibt den Ausgabeblock zurueck."""
+        if self._board is None:
+            return samples
+        self._dirty = True
+        return self._board(_as_block(samples), self.sample_rate, reset=False)[0]
+
+    def tail(self, max_seconds: float = TAIL_MAX_SECONDS) -> Iterator[np.ndarray]:
+        """Speist Stille ein bis der Ausgang unter TAIL_FLOOR faellt; setzt dann zurueck."""
+        if self._board is None or not self._dirty:
+            return
+        silence = np.zeros(TAIL_BLOCK, dtype=np.float32)
+        for _ in range(max(1, int(max_seconds * self.sample_rate / TAIL_BLOCK))):
+            block = self.process(silence)
+            yield block
+            if float(np.abs(block).max(initial=0.0)) < TAIL_FLOOR:
+                break
+        self.reset()
+
+    def reset(self) -> None:
+        if self._board is not None:
+            self._board.reset()
+        self._dirty = False
 
 
 # Standard-Preset pro Stimmenrolle
@@ -143,7 +228,7 @@ class AudioEffects:
             return True
         if not _ensure_pedalboard():
             return False
-        self._presets = _build_presets()
+        self._presets = {name: _build_board(name) for name in _PRESET_CHAINS}
         return True
 
     def apply(
@@ -153,7 +238,7 @@ class AudioEffects:
         preset: str = "clean",
     ) -> np.ndarray:
         """
-        Wendet ein Effekt-Preset auf Audio-Samples an.
+        Wendet ein Effekt-Preset auf einen ganzen Puffer an (zustandslos).
 
         Args:
             samples: float32 numpy array (mono)
@@ -169,30 +254,19 @@ class AudioEffects:
         if not self._ensure_loaded():
             return samples
 
-        board = self._presets.get(preset)
-        if board is None:
+        if preset not in self._presets:
             logger.warning("Unbekanntes Effekt-Preset '%s' — passthrough.", preset)
             return samples
 
-        # pedalboard erwartet (channels, samples) oder (samples,) fuer mono
-        # Sicherstellen: float32, 2D mit shape (1, N)
-        if samples.ndim == 1:
-            audio_2d = samples.reshape(1, -1).astype(np.float32)
-        else:
-            audio_2d = samples.astype(np.float32)
+        # Limiter am Board-Ende statt Normalisierung ueber den ganzen Puffer
+        return self._presets[preset](_as_block(samples), sample_rate)[0]
 
-        processed = board(audio_2d, sample_rate)
-
-        # Zurueck zu 1D mono
-        result = processed.flatten()
-
-        # Clipping-Schutz: Normalisiere wenn noetig
-        peak = np.abs(result).max()
-        if peak > 1.0:
-            result = result / peak
-            logger.debug("Effekt '%s': Clipping verhindert (Peak %.2f).", preset, peak)
-
-        return result
+    def stream(self, preset: str, sample_rate: int, semitones: float = 0.0) -> EffectStream:
+        """Blockweiser Prozessor mit persistentem Zustand (Streaming-TTS)."""
+        if preset not in _PRESET_CHAINS:
+            logger.warning("Unbekanntes Effekt-Preset '%s' — passthrough.", preset)
+            preset = "clean"
+        return EffectStream(preset, sample_rate, semitones)
 
     @staticmethod
     def get_role_preset(role: str) -> str:
@@ -202,7 +276,10 @@ class AudioEffects:
 
 def pitch_shift(samples: np.ndarray, sample_rate: int, semitones: float) -> np.ndarray:
     """
-    Pitch-Shift via Resampling (scipy).
+    Pitch-Shift bei gleichem Tempo via pedalboard.PitchShift.
+
+    Fuer Streaming: AudioEffects.stream(preset, rate, semitones=...) haengt
+    denselben PitchShift blockweise vor die Preset-Kette.
 
     Args:
         samples: float32 mono array
@@ -215,19 +292,9 @@ def pitch_shift(samples: np.ndarray, sample_rate: int, semitones: float) -> np.n
     if abs(semitones) < 0.01:
         return samples
 
-    try:
-        from scipy.signal import resample
-
-        # Faktor: hoeher = kuerzer resampled = hoehere Tonhoehe
-        factor = 2 ** (semitones / 12.0)
-        new_length = int(len(samples) / factor)
-        shifted = resample(samples, new_length).astype(np.float32)
-
-        # Auf Originallaenge bringen (Tempo beibehalten)
-        result = resample(shifted, len(samples)).astype(np.float32)
-
-        return result
-
-    except ImportError:
-        logger.warning("scipy nicht installiert — pitch_shift nicht verfuegbar.")
+    if not _ensure_pedalboard():
+        logger.warning("pedalboard nicht installiert — pitch_shift nicht verfuegbar.")
         return samples
+
+    board = _pb.Pedalboard([_pb.PitchShift(semitones=semitones)])
+    return board(_as_block(samples), sample_rate)[0]
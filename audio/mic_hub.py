@@ -0,0 +1,250 @@
+"""
+audio/mic_hub.py — Gemeinsame Mikrofon-Aufnahme fuer STT und Barge-in
+
+Bisher oeffneten STTHandler._vad_listen und der Barge-in-Monitor der
+VoicePipeline je einen eigenen sd.InputStream, kopierten jeden 512er-Block
+in eine Queue und liessen Silero VAD getrennt laufen (beide auf demselben
+zustandsbehafteten Modell); pro speak() entstand ein neuer Monitor-Thread.
+
+MicCaptureHub:
+  - Ein InputStream, einmal geoeffnet und dann dauerhaft aktiv — keine
+    Device-Oeffnungs-Latenz pro Zug.
+  - Der PortAudio-Callback schreibt nur in einen vorab allozierten
+    Ring-Puffer (RING_BLOCKS x CHUNK_SIZE float32) und weckt den Hub-Thread.
+  - Der Hub-Thread arbeitet den Rueckstau als Stapel ab (nur solange es
+    Abonnenten gibt): RMS/ZCR-Vorfilter (audio/vad.py PreGate) vektorisiert,
+    Silero nur fuer durchgelassene Bloecke in einem probs()-Aufruf — eine
+    VAD-Inferenz pro Block fuer alle Abonnenten. Dann MicBlock an alle:
+      subscribe()           -> MicSubscription mit eigener, begrenzter Queue
+      subscribe(callback=f) -> f(block) direkt im Hub-Thread (leichtgewichtig!)
+
+MicBlock.samples ist eine Zeile der Stapel-Kopie, die der Hub-Thread
+ohnehin fuer Merkmale und VAD aus dem Ring zieht — nicht der Ring selbst.
+Wartende Bloecke in einer Queue bleiben so gueltig, auch wenn der Callback
+den Ring waehrenddessen ueberschreibt (Hub im Rueckstand). Bloecke sind
+read-only und werden zwischen Abonnenten geteilt.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, NamedTuple
+
+import numpy as np
+
+from audio.vad import PreGate, SileroVad, block_features
+
+logger = logging.getLogger("ARS.audio.mic_hub")
+
+SAMPLE_RATE = 16_000      # Hz — Silero VAD und Whisper Standard
+CHUNK_SIZE  = 512         # Samples pro Block ~32ms (Silero VAD Pflicht)
+RING_BLOCKS = 256         # ~8 s Ring
+QUEUE_BLOCKS = 128        # max. wartende Bloecke pro Abonnent
+MAX_BATCH   = 32          # max. Bloecke pro VAD-Aufruf (~1 s Rueckstau)
+
+
+class MicBlock(NamedTuple):
+    """Ein 32ms-Block mit den einmal berechneten Merkmalen."""
+    index: int              # fortlaufende Blocknummer seit Start
+    samples: np.ndarray     # Zeile der Stapel-Kopie (float32 mono, read-only)
+    rms: float
+    vad: float              # Silero-Konfidenz (0.0 wenn vom Vorfilter verworfen)
+    t: float                # time.monotonic() bei Verarbeitung
+
+
+class MicSubscription:
+    """Abonnent des Hubs: Queue-basiert (get) oder Callback-basiert."""
+
+    def __init__(
+        self,
+        hub: MicCaptureHub,
+        callback: Callable[[MicBlock], None] | None,
+        maxsize: int,
+    ) -> None:
+        self._hub = hub
+        self._callback = callback
+        self._items: deque[MicBlock] = deque(maxlen=maxsize)
+        self._cond = threading.Condition()
+        self.dropped = 0
+        self.closed = False
+
+    def get(self, timeout: float | None = None) -> MicBlock | None:
+        """Naechster Block, oder None nach timeout bzw. wenn geschlossen."""
+        with self._cond:
+            if not self._items and not self.closed:
+                self._cond.wait(timeout)
+            return self._items.popleft() if self._items else None
+
+    def close(self) -> None:
+        self._hub._unsubscribe(self)
+        with self._cond:
+            self.closed = True
+            self._cond.notify_all()
+
+    def _deliver(self, block: MicBlock) -> None:
+        if self._callback is not None:
+            self._callback(block)
+            return
+        with self._cond:
+            if len(self._items) == self._items.maxlen:
+                self.dropped += 1                # deque verwirft den aeltesten
+            self._items.append(block)
+            self._cond.notify()
+
+
+class MicCaptureHub:
+    """Ein InputStream, ein Ring, eine VAD-Inferenz pro Block, Fan-out."""
+
+    def __init__(self, vad: SileroVad, device: Any = None) -> None:
+        self._vad = vad
+        self._gate = PreGate()
+        self._device = device
+        self._ring = np.zeros((RING_BLOCKS, CHUNK_SIZE), dtype=np.float32)
+        self._written = 0          # vom Callback geschriebene Bloecke
+        self._read = 0             # vom Hub-Thread verarbeitete Bloecke
+        self._wake = threading.Event()
+        self._subs: list[MicSubscription] = []
+        self._subs_lock = threading.Lock()
+        self._stream: Any = None
+        self._thread: threading.Thread | None = None
+        self._running = False
+        self.overruns = 0
+
+    # ------------------------------------------------------------------
+    # Lebenszyklus
+    # ------------------------------------------------------------------
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def start(self) -> None:
+        """Oeffnet das Mikrofon und startet den Hub-Thread (idempotent)."""
+        if self._running:
+            return
+        import sounddevice as sd  # type: ignore[import]
+
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True, name="ars-mic-hub")
+        self._thread.start()
+        try:
+            self._stream = sd.InputStream(
+                samplerate=SAMPLE_RATE,
+                channels=1,
+                dtype="float32",
+                blocksize=CHUNK_SIZE,
+                device=self._device,
+                callback=self._callback,
+            )
+            self._stream.start()
+        except Exception:
+            self._running = False
+            self._wake.set()
+            raise
+        logger.info("Mikrofon-Hub gestartet (%d Hz, %d Samples/Block).", SAMPLE_RATE, CHUNK_SIZE)
+
+    def close(self) -> None:
+        """Schliesst Stream und Thread; offene Abonnements enden (get -> None)."""
+        self._running = False
+        self._wake.set()
+        if self._stream is not None:
+            try:
+                self._stream.stop()
+                self._stream.close()
+            except Exception as exc:
+                logger.debug("Mikrofon-Hub schliessen: %s", exc)
+            self._stream = None
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+        with self._subs_lock:
+            subs, self._subs = self._subs, []
+        for sub in subs:
+            with sub._cond:
+                sub.closed = True
+                sub._cond.notify_all()
+
+    # ------------------------------------------------------------------
+    # Abonnements
+    # ------------------------------------------------------------------
+
+    def subscribe(
+        self,
+        callback: Callable[[MicBlock], None] | None = None,
+        maxsize: int = QUEUE_BLOCKS,
+    ) -> MicSubscription:
+        """Neues Abonnement ab dem naechsten Block."""
+        sub = MicSubscription(self, callback, maxsize)
+        with self._subs_lock:
+            self._subs.append(sub)
+        return sub
+
+    def _unsubscribe(self, sub: MicSubscription) -> None:
+        with self._subs_lock:
+            if sub in self._subs:
+                self._subs.remove(sub)
+
+    # ------------------------------------------------------------------
+    # Audio-Pfad
+    # ------------------------------------------------------------------
+
+    def _callback(self, indata: Any, frames: int, time_info: Any, status: Any) -> None:
+        """PortAudio-Thread: nur kopieren und wecken."""
+        if status:
+            logger.debug("Mikrofon-Hub Status: %s", status)
+        n = min(frames, CHUNK_SIZE)
+        self._ring[self._written % RING_BLOCKS, :n] = indata[:n, 0]
+        self._written += 1
+        self._wake.set()
+
+    def _run(self) -> None:
+        while self._running:
+            self._wake.wait(timeout=0.5)
+            self._wake.clear()
+            while self._read < self._written and self._running:
+                if self._written - self._read >= RING_BLOCKS:
+                    # Hub-Thread zu langsam: uebersprungene Bloecke sind ueberschrieben
+                    skipped = self._written - self._read - RING_BLOCKS // 2
+                    self._read += skipped
+                    self.overruns += skipped
+                    logger.debug("Mikrofon-Hub: %d Bloecke uebersprungen", skipped)
+                end = min(self._written, self._read + MAX_BATCH)
+                self._process(self._read, end)
+                self._read = end
+
+    def _process(self, start: int, end: int) -> None:
+        """Verarbeitet die Bloecke [start, end) als Stapel."""
+        with self._subs_lock:
+            subs = list(self._subs)
+        if not subs:
+            return
+        slots = np.arange(start, end) % RING_BLOCKS
+        batch = self._ring[slots]                        # (k, 512) Kopie
+        batch.flags.writeable = False                    # Zeilen gehen an alle Abonnenten
+        rms, zcr = block_features(batch)
+        mask = self._gate(rms, zcr)
+        vad = np.zeros(len(slots), dtype=np.float32)
+        if mask.any():
+            try:
+                vad[mask] = self._vad.probs(batch[mask])
+            except Exception as exc:
+                logger.debug("Mikrofon-Hub VAD-Fehler: %s", exc)
+        now = time.monotonic()
+        for i in range(len(slots)):
+            # Zeile der Kopie, nicht des Rings: bleibt gueltig, solange ein Abonnent sie haelt
+            block = MicBlock(start + i, batch[i], float(rms[i]), float(vad[i]), now)
+            for sub in subs:
+                try:
+                    sub._deliver(block)
+                except Exception as exc:
+                    logger.debug("Mikrofon-Hub Abonnent-Fehler: %s", exc)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "blocks": self._read,
+            "vad_blocks": self._gate.passed,
+            "gated_blocks": self._gate.skipped,
+            "overruns": self.overruns,
+        }
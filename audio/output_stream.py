@@ -0,0 +1,505 @@
+"""
+audio/output_stream.py — Persistenter Audio-Ausgabestrom mit Ring-Buffer
+
+Statt pro Aeusserung einen Device-Stream zu oeffnen und zu schliessen,
+laeuft ein einziger Callback-Stream fuer die gesamte Sitzung. Die
+Synthese-Seite schreibt PCM in einen Ring-Buffer, der Audio-Callback liest
+blockweise daraus (Stille bei Unterlauf).
+
+  write(samples, rate) -> SRC auf Ausgaberate -> RingBuffer -> Sink-Callback
+
+  - RingBuffer:  Single-Producer/Single-Consumer ohne Lock — nur der
+                 Schreiber bewegt _write/_discard, nur der Leser _read
+  - SRC:         StreamResampler — polyphasiger Kaiser-Sinc-Filter mit
+                 Zustand ueber write()-Aufrufe hinweg (Eingangs-Historie
+                 und Ausgabephase); blockweise Eingabe ergibt exakt das
+                 Signal einer Konvertierung am Stueck (keine Drift, keine
+                 Klicks an Blockgrenzen). Ausklang via finish() in drain().
+  - Barge-in:    flush() verwirft alles Gepufferte; der Callback springt
+                 beim naechsten Block (~10 ms) auf Stille
+  - Latenz:      Zeit von write() des ersten Samples bis der Callback es
+                 ausgibt, plus gemeldete Device-Latenz
+
+Sinks (TTS_OUTPUT_SINK):
+  device        — sounddevice.OutputStream (Default)
+  null          — verwirft Audio in Echtzeit-Takt (Tests, kein Device)
+  file:<pfad>   — schreibt das ausgegebene Audio als WAV (Tests)
+
+Konfiguration via .env:
+  TTS_OUTPUT_SINK=device
+  TTS_OUTPUT_RATE=48000   # Ausgaberate in Hz
+  TTS_OUTPUT_BLOCK=512    # Frames pro Callback (Barge-in Granularitaet)
+
+Verwendung:
+    out = get_audio_output()
+    out.write(samples, 22050, stop_event)
+    out.drain(stop_event)
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import os
+import threading
+import time
+import wave
+from typing import Any, Callable
+
+import numpy as np
+
+logger = logging.getLogger("ARS.audio.output")
+
+OUTPUT_RATE  = int(os.getenv("TTS_OUTPUT_RATE", "48000"))
+OUTPUT_BLOCK = int(os.getenv("TTS_OUTPUT_BLOCK", "512"))
+RING_SECONDS = 2.0        # Kapazitaet des Ring-Buffers
+WRITE_CHUNK  = 2048       # Frames pro push (Barge-in Check im Schreiber)
+_POLL        = 0.01       # Sekunden — Warten auf Platz / Leerlauf
+
+# render(out) -> Anzahl echter Samples (Rest wurde mit Stille gefuellt)
+RenderFn = Callable[[np.ndarray], int]
+
+
+# ---------------------------------------------------------------------------
+# Ring-Buffer
+# ---------------------------------------------------------------------------
+
+class RingBuffer:
+    """
+    float32-Ring fuer genau einen Schreiber und einen Leser.
+
+    Positionen sind monoton wachsende Zaehler (Index = pos % capacity).
+    discard() verschiebt nur die Verwerfgrenze; der Leser zieht _read
+    beim naechsten pop_into() nach — so bleibt jede Variable einem Thread
+    zugeordnet und es wird kein Lock benoetigt.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self._buf = np.zeros(capacity, dtype=np.float32)
+        self.capacity = capacity
+        self._write = 0
+        self._read = 0
+        self._discard = 0
+
+    @property
+    def write_pos(self) -> int:
+        return self._write
+
+    @property
+    def read_pos(self) -> int:
+        return max(self._read, self._discard)
+
+    def available(self) -> int:
+        return self._write - self.read_pos
+
+    def space(self) -> int:
+        return self.capacity - self.available()
+
+    def push(self, data: np.ndarray) -> int:
+        """Schreibt so viel wie Platz ist; gibt die Anzahl geschriebener Samples zurueck."""
+        n = min(len(data), self.space())
+        if n <= 0:
+            return 0
+        start = self._write % self.capacity
+        first = min(n, self.capacity - start)
+        self._buf[start:start + first] = data[:first]
+        if n > first:
+            self._buf[:n - first] = data[first:n]
+        self._write += n
+        return n
+
+    def pop_into(self, out: np.ndarray) -> int:
+        """Liest bis zu len(out) Samples; nur vom Leser-Thread aufrufen."""
+        if self._read < self._discard:
+            self._read = self._discard
+        n = min(len(out), self._write - self._read)
+        if n <= 0:
+            return 0
+        start = self._read % self.capacity
+        first = min(n, self.capacity - start)
+        out[:first] = self._buf[start:start + first]
+        if n > first:
+            out[first:n] = self._buf[:n - first]
+        self._read += n
+        return n
+
+    def discard(self) -> None:
+        """Verwirft alles Geschriebene (vom Schreiber-Thread)."""
+        self._discard = self._write
+
+
+# ---------------------------------------------------------------------------
+# Sample-Rate-Konvertierung
+# ---------------------------------------------------------------------------
+
+SRC_TAPS = 32             # Filter-Taps pro Polyphase (Qualitaet vs. Rechenzeit)
+SRC_BETA = 8.6            # Kaiser-Fenster (~-90 dB Sperrdaempfung)
+
+
+class StreamResampler:
+    """
+    Rationale Abtastraten-Konvertierung (up/down) fuer einen Blockstrom.
+
+    Ausgabe k liegt bei Eingabezeit k * src/dst; der Filter ist um diesen
+    Punkt zentriert (SRC_TAPS/2 Samples Vorausschau, keine Verzoegerung).
+    process() liefert alle Ausgaben, deren Fenster vollstaendig vorliegt,
+    finish() den Rest — zusammen ceil(n * dst / src) Samples, identisch
+    zur Konvertierung des ganzen Signals in einem Aufruf.
+    """
+
+    def __init__(self, src_rate: int, dst_rate: int, taps: int = SRC_TAPS) -> None:
+        g = math.gcd(src_rate, dst_rate)
+        self.src_rate = src_rate
+        self.up = dst_rate // g
+        self.down = src_rate // g
+        self.taps = taps
+        n = taps * self.up
+        self._center = n // 2
+        # Tiefpass im hochgetasteten Bereich, Grenze = min(Nyquist) beider Raten
+        fc = 0.5 / max(self.up, self.down)
+        t = np.arange(n, dtype=np.float64) - self._center
+        window = np.kaiser(2 * self._center + 1, SRC_BETA)[:n]     # symmetrisch um center
+        h = 2.0 * fc * np.sinc(2.0 * fc * t) * window * self.up
+        # _phases[p, m] = h[p + (taps-1-m) * up] — passend zu Fenstern x[n-taps+1 .. n]
+        self._phases = h.reshape(taps, self.up).T[:, ::-1].astype(np.float32)
+        self._hist = np.zeros(taps - 1, dtype=np.float32)   # x[consumed-taps+1 .. consumed-1]
+        self._consumed = 0        # bisher gelieferte Eingabe-Samples
+        self._k = 0               # naechster Ausgabe-Index
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        x = np.asarray(samples, dtype=np.float32).reshape(-1)
+        return self._run(x, self._consumed + len(x))
+
+    def finish(self) -> np.ndarray:
+        """Restliche Ausgabe (Vorausschau mit Stille aufgefuellt); danach zurueckgesetzt."""
+        total = self._consumed
+        n_out = -(-total * self.up // self.down)          # ceil
+        pad = np.zeros(self.taps, dtype=np.float32)
+        out = self._run(pad, total + self.taps, limit=n_out)
+        self.reset()
+        return out
+
+    def reset(self) -> None:
+        self._hist[:] = 0.0
+        self._consumed = 0
+        self._k = 0
+
+    def _run(self, x: np.ndarray, available: int, limit: int | None = None) -> np.ndarray:
+        taps = self.taps
+        buf = np.concatenate((self._hist, x))
+        start = self._consumed - (taps - 1)                # globaler Index von buf[0]
+        # Ausgabe k braucht Eingabe bis n = (k*down + center) // up <= available - 1
+        k_end = -(-(available * self.up - self._center) // self.down)
+        if limit is not None:
+            k_end = min(k_end, limit)
+        out = np.zeros(0, dtype=np.float32)
+        if k_end > self._k:
+            ks = np.arange(self._k, k_end, dtype=np.int64)
+            m0 = ks * self.down + self._center
+            n, p = m0 // self.up, m0 % self.up
+            windows = np.lib.stride_tricks.sliding_window_view(buf, taps)
+            out = np.einsum("ij,ij->i", windows[n - start - (taps - 1)], self._phases[p])
+            self._k = k_end
+        self._consumed += len(x)
+        self._hist = buf[len(buf) - (taps - 1):].copy()
+        return out.astype(np.float32, copy=False)
+
+
+def resample(samples: np.ndarray, src_rate: int, dst_rate: int) -> np.ndarray:
+    """Konvertiert ein ganzes mono-float32-Signal von src_rate nach dst_rate."""
+    samples = np.asarray(samples, dtype=np.float32).reshape(-1)
+    if src_rate == dst_rate or len(samples) == 0:
+        return samples
+    src = StreamResampler(src_rate, dst_rate)
+    head = src.process(samples)
+    return np.concatenate((head, src.finish()))
+
+
+# ---------------------------------------------------------------------------
+# Sinks
+# ---------------------------------------------------------------------------
+
+class DeviceSink:
+    """sounddevice-Callback-Stream auf dem Standard-Ausgabegeraet."""
+
+    def __init__(self) -> None:
+        self._stream: Any = None
+
+    def start(self, render: RenderFn, rate: int, block: int) -> None:
+        import sounddevice as sd
+
+        def _callback(outdata, frames, time_info, status) -> None:
+            render(outdata[:, 0])
+
+        self._stream = sd.OutputStream(
+            samplerate=rate, channels=1, dtype="float32",
+            blocksize=block, latency="low", callback=_callback,
+        )
+        self._stream.start()
+
+    @property
+    def latency(self) -> float:
+        return float(self._stream.latency) if self._stream is not None else 0.0
+
+    def stop(self) -> None:
+        stream, self._stream = self._stream, None
+        if stream is not None:
+            stream.abort()
+            stream.close()
+
+
+class NullSink:
+    """Zieht Bloecke im Echtzeit-Takt aus einem eigenen Thread (ohne Device)."""
+
+    def __init__(self, realtime: bool = True) -> None:
+        self._realtime = realtime
+        self._running = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self, render: RenderFn, rate: int, block: int) -> None:
+        self._running.set()
+        self._thread = threading.Thread(
+            target=self._run, args=(render, rate, block),
+            daemon=True, name="ars-audio-sink",
+        )
+        self._thread.start()
+
+    def _run(self, render: RenderFn, rate: int, block: int) -> None:
+        out = np.zeros(block, dtype=np.float32)
+        period = block / rate
+        next_tick = time.monotonic()
+        while self._running.is_set():
+            n = render(out)
+            self._consume(out, n)
+            if self._realtime:
+                next_tick += period
+                delay = next_tick - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    next_tick = time.monotonic()
+
+    def _consume(self, block: np.ndarray, n: int) -> None:
+        pass
+
+    @property
+    def latency(self) -> float:
+        return 0.0
+
+    def stop(self) -> None:
+        self._running.clear()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+
+class FileSink(NullSink):
+    """Wie NullSink, schreibt aber alle Bloecke mit Audio als 16-bit WAV."""
+
+    def __init__(self, path: str, realtime: bool = True) -> None:
+        super().__init__(realtime)
+        self.path = path
+        self._wav: wave.Wave_write | None = None
+
+    def start(self, render: RenderFn, rate: int, block: int) -> None:
+        self._wav = wave.open(self.path, "wb")
+        self._wav.setnchannels(1)
+        self._wav.setsampwidth(2)
+        self._wav.setframerate(rate)
+        super().start(render, rate, block)
+
+    def _consume(self, block: np.ndarray, n: int) -> None:
+        # Leerlauf-Stille nicht mitschreiben, sonst waechst die Datei endlos
+        if n > 0 and self._wav is not None:
+            pcm = np.clip(block[:n], -1.0, 1.0) * 32767.0
+            self._wav.writeframes(pcm.astype("<i2").tobytes())
+
+    def stop(self) -> None:
+        super().stop()
+        if self._wav is not None:
+            self._wav.close()
+            self._wav = None
+
+
+def make_sink(spec: str) -> DeviceSink | NullSink:
+    """'device' | 'null' | 'file:<pfad>' -> Sink-Instanz."""
+    spec = (spec or "device").strip()
+    if spec == "null":
+        return NullSink()
+    if spec.startswith("file:"):
+        return FileSink(spec[5:])
+    return DeviceSink()
+
+
+# ---------------------------------------------------------------------------
+# AudioOutput
+# ---------------------------------------------------------------------------
+
+class AudioOutput:
+    """
+    Persistenter Ausgabestrom: ein Sink, ein Ring-Buffer, feste Ausgaberate.
+
+    write()/drain()/flush() werden vom Wiedergabe-Thread der TTS-Pipeline
+    aufgerufen; der Sink-Callback liest ausschliesslich ueber _render().
+    """
+
+    def __init__(
+        self,
+        sink: DeviceSink | NullSink | None = None,
+        rate: int = OUTPUT_RATE,
+        block: int = OUTPUT_BLOCK,
+    ) -> None:
+        self.rate = rate
+        self.block = block
+        self._sink = sink or make_sink(os.getenv("TTS_OUTPUT_SINK", "device"))
+        self._ring = RingBuffer(int(rate * RING_SECONDS))
+        self._src: StreamResampler | None = None   # SRC-Zustand der laufenden Aeusserung
+        self._started = False
+        self._playing = False           # Aeusserung aktiv -> Unterlaeufe zaehlen
+        self._draining = False
+        self._starved = False
+        self._mark_pos = -1             # Ring-Position des ersten Samples
+        self._mark_time = 0.0
+        self.underruns = 0
+        self.last_latency_ms: float | None = None
+
+    # -- Sink-Seite ---------------------------------------------------------
+
+    def _render(self, out: np.ndarray) -> int:
+        n = self._ring.pop_into(out)
+        if n < len(out):
+            out[n:] = 0.0
+            # Unterlauf = Luecke mitten in einer Aeusserung (nicht das Ende)
+            if self._playing and not self._draining and not self._starved:
+                self.underruns += 1
+            self._starved = True
+        else:
+            self._starved = False
+        if self._mark_pos >= 0 and self._ring.read_pos > self._mark_pos:
+            played_at = time.monotonic() + self._sink.latency
+            self.last_latency_ms = (played_at - self._mark_time) * 1000.0
+            self._mark_pos = -1
+        return n
+
+    # -- Schreiber-Seite ------------------------------------------------------
+
+    def start(self) -> None:
+        if not self._started:
+            self._sink.start(self._render, self.rate, self.block)
+            self._started = True
+            logger.info(
+                "Audio-Ausgabe gestartet: %s, %d Hz, Block %d, Latenz %.1f ms",
+                type(self._sink).__name__, self.rate, self.block,
+                self._sink.latency * 1000.0,
+            )
+
+    def write(self, samples: Any, sample_rate: int, stop_event: threading.Event) -> bool:
+        """
+        Konvertiert auf die Ausgaberate und schreibt in den Ring-Buffer.
+        Blockiert nur solange der Ring voll ist; False bei Barge-in.
+        """
+        self.start()
+        if not self._playing:
+            self._playing = True
+            self._mark_pos = self._ring.write_pos
+            self._mark_time = time.monotonic()
+        return self._push(self._convert(samples, sample_rate), stop_event)
+
+    def _convert(self, samples: Any, sample_rate: int) -> np.ndarray:
+        """SRC mit Zustand ueber Bloecke; ein Ratenwechsel schliesst den alten Strom ab."""
+        samples = np.asarray(samples, dtype=np.float32).reshape(-1)
+        src, tail = self._src, None
+        if src is not None and src.src_rate != sample_rate:
+            tail, self._src, src = src.finish(), None, None
+        if sample_rate == self.rate:
+            data = samples
+        else:
+            if src is None:
+                self._src = src = StreamResampler(sample_rate, self.rate)
+            data = src.process(samples)
+        if tail is not None and len(tail):
+            data = np.concatenate((tail, data))
+        return data
+
+    def _push(self, data: np.ndarray, stop_event: threading.Event) -> bool:
+        pos = 0
+        while pos < len(data):
+            if stop_event.is_set():
+                self.flush()
+                return False
+            n = self._ring.push(data[pos:pos + WRITE_CHUNK])
+            if n == 0:
+                time.sleep(_POLL)
+            pos += n
+        return True
+
+    def drain(self, stop_event: threading.Event) -> bool:
+        """Wartet bis der Ring leer ist (plus Device-Latenz); False bei Barge-in."""
+        self._draining = True
+        # Rest der SRC-Vorausschau ausgeben
+        if self._src is not None:
+            tail, self._src = self._src.finish(), None
+            if not self._push(tail, stop_event):
+                return False
+        while self._ring.available() > 0:
+            if stop_event.is_set():
+                self.flush()
+                return False
+            time.sleep(_POLL)
+        tail = self._sink.latency if self._started else 0.0
+        if tail > 0 and stop_event.wait(tail):
+            self.flush()
+            return False
+        self._end_utterance()
+        return True
+
+    def flush(self) -> None:
+        """Barge-in: verwirft alles noch nicht Ausgegebene."""
+        self._ring.discard()
+        self._src = None
+        self._end_utterance()
+        logger.info("TTS Barge-in: Ausgabe-Puffer verworfen.")
+
+    def _end_utterance(self) -> None:
+        self._draining = False
+        if self._playing:
+            self._playing = False
+            self._mark_pos = -1
+            self._emit_stats()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "rate": self.rate,
+            "block": self.block,
+            "sink": type(self._sink).__name__,
+            "device_latency_ms": round(self._sink.latency * 1000.0, 1) if self._started else None,
+            "buffered_ms": round(self._ring.available() * 1000.0 / self.rate, 1),
+            "last_latency_ms": None if self.last_latency_ms is None
+                               else round(self.last_latency_ms, 1),
+            "underruns": self.underruns,
+        }
+
+    def _emit_stats(self) -> None:
+        try:
+            from core.event_bus import EventBus
+            EventBus.get().emit("audio", "output_stats", self.stats())
+        except Exception:
+            pass
+
+    def close(self) -> None:
+        if self._started:
+            self._sink.stop()
+            self._started = False
+
+
+_output: AudioOutput | None = None
+_output_lock = threading.Lock()
+
+
+def get_audio_output() -> AudioOutput:
+    """Prozessweit geteilter Ausgabestrom (lazy gestartet beim ersten write)."""
+    global _output
+    with _output_lock:
+        if _output is None:
+            _output = AudioOutput()
+        return _output
@@ -6,7 +6,7 @@ Koordiniert STTHandler und TTSHandler für den vollständigen Voice-Loop:
   listen() → [Mikrofon] → Silero VAD → Faster-Whisper → Text
   speak()  → Text → Kokoro-82M → [Lautsprecher]
                ↕ (gleichzeitig)
-           Barge-in Monitor: VAD überwacht Mikrofon während TTS spielt
+           Barge-in: Abonnent des Mikrofon-Hubs (audio/mic_hub.py)
            Wenn Spieler spricht → stop_event gesetzt → TTS stoppt sofort
 
 Latenz-Budget (schneller lokaler Rechner):
@@ -20,10 +20,10 @@ Latenz-Budget (schneller lokaler Rechner):
 from __future__ import annotations
 
 import logging
-import queue
 import threading
 from typing import TYPE_CHECKING, Iterator
 
+from audio.mic_hub import MicBlock, MicSubscription
 from audio.stt_handler import STTHandler
 from audio.tts_handler import TTSHandler
 
@@ -52,9 +52,8 @@ class VoicePipeline:
     Der Orchestrator ruft listen() und speak() auf.
 
     Barge-in Mechanismus (optional, barge_in=True):
-      speak() startet parallel einen Barge-in-Monitor-Thread.
-      Dieser Thread öffnet einen zweiten InputStream auf dem Mikrofon
-      und prüft jeden Chunk mit Silero VAD.
+      speak() abonniert den gemeinsamen Mikrofon-Hub des STTHandlers
+      (ein dauerhaft offener InputStream, eine VAD-Inferenz pro Block).
       Bei Sprach-Erkennung > BARGEIN_VAD_THRESHOLD (2 consecutive Chunks)
       wird _barge_in_event gesetzt.
       Das TTS-Handler-speak() prüft das Event zwischen Playback-Chunks.
@@ -95,31 +94,19 @@ class VoicePipeline:
 
         Bei barge_in=True:
           - TTS-Wiedergabe (Hauptthread blockiert)
-          - Barge-in-Monitor (Daemon-Thread überwacht Mikrofon)
+          - Barge-in-Detektor hängt am Mikrofon-Hub (kein eigener Thread)
         Bei barge_in=False:
           - Nur TTS-Wiedergabe, kein Mikrofon-Monitoring
 
         Returns True wenn vollständig abgespielt, False wenn unterbrochen.
         """
         self._barge_in_event.clear()
-
-        monitor = None
-        if self._barge_in:
-            monitor = threading.Thread(
-                target=self._run_barge_in_monitor,
-                daemon=True,
-                name="ars-bargein-monitor",
-            )
-            monitor.start()
-
+        monitor = self._start_barge_in_monitor()
         try:
-            completed = self.tts.speak(text, stop_event=self._barge_in_event)
+            return self.tts.speak(text, stop_event=self._barge_in_event)
         finally:
             if monitor is not None:
-                self._barge_in_event.set()
-                monitor.join(timeout=1.0)
-
-        return completed
+                monitor.close()
 
     def speak_streaming(self, text_iter: Iterator[str]) -> bool:
         """
@@ -127,116 +114,57 @@ class VoicePipeline:
         Startet TTS sobald erster vollständiger Satz vorliegt.
         """
         self._barge_in_event.clear()
-
-        monitor = None
-        if self._barge_in:
-            monitor = threading.Thread(
-                target=self._run_barge_in_monitor,
-                daemon=True,
-                name="ars-bargein-monitor",
-            )
-            monitor.start()
-
+        monitor = self._start_barge_in_monitor()
         try:
-            completed = self.tts.speak_streaming(text_iter, stop_event=self._barge_in_event)
+            return self.tts.speak_streaming(text_iter, stop_event=self._barge_in_event)
         finally:
             if monitor is not None:
-                self._barge_in_event.set()
-                monitor.join(timeout=1.0)
-
-        return completed
+                monitor.close()
 
     # ------------------------------------------------------------------
-    # Barge-in Monitor (Daemon-Thread)
+    # Barge-in Monitor (Abonnent des Mikrofon-Hubs)
     # ------------------------------------------------------------------
 
-    def _run_barge_in_monitor(self) -> None:
+    def _start_barge_in_monitor(self) -> MicSubscription | None:
         """
-        Öffnet einen separaten InputStream und überwacht das Mikrofon mit
-        Silero VAD während die TTS-Wiedergabe läuft.
-
-        Beendet sich wenn _barge_in_event gesetzt wird (durch TTS-Ende
-        oder eigene Sprach-Erkennung).
+        Hängt einen Barge-in-Detektor an den gemeinsamen Mikrofon-Hub des
+        STTHandlers: gleicher Stream, gleiche VAD-Inferenz wie listen().
         """
-        if self.tts._backend == "stub":
+        if not self._barge_in or self.tts._backend == "stub":
             # Im Stub-Modus kein Audio-Device vorhanden
-            return
-
-        try:
-            import sounddevice as sd
-            import torch
-        except ImportError:
-            logger.debug("Barge-in Monitor: sounddevice/torch nicht verfügbar.")
-            return
+            return None
+        hub = self.stt.capture_hub()
+        if hub is None:
+            logger.debug("Barge-in Monitor: kein Mikrofon-Hub verfügbar.")
+            return None
+        return hub.subscribe(callback=_BargeInDetector(self._barge_in_event))
 
-        # VAD-Modell laden (nutzt torch-Cache, kein erneuter Download)
-        try:
-            if self.stt._vad_model is not None:
-                vad_model = self.stt._vad_model
-            else:
-                try:
-                    from silero_vad import load_silero_vad  # type: ignore[import]
-                    vad_model = load_silero_vad()
-                except ImportError:
-                    vad_model, _ = torch.hub.load(
-                        "snakers4/silero-vad",
-                        "silero_vad",
-                        force_reload=False,
-                        trust_repo=True,
-                    )
-                vad_model.eval()
-        except Exception as exc:
-            logger.warning("Barge-in Monitor: VAD konnte nicht geladen werden: %s", exc)
-            return
 
-        audio_queue: queue.Queue = queue.Queue(maxsize=50)
-        SAMPLE_RATE = 16_000
-        CHUNK = 512
+class _BargeInDetector:
+    """
+    Callback im Hub-Thread: setzt das Stop-Event nach BARGEIN_CONSECUTIVE
+    Blöcken mit VAD-Konfidenz >= BARGEIN_VAD_THRESHOLD.
+    """
 
-        def _callback(indata, frames, time, status) -> None:
-            if not audio_queue.full():
-                audio_queue.put_nowait(indata.copy())
+    def __init__(self, event: threading.Event) -> None:
+        self._event = event
+        self._seen = 0
+        self._consecutive = 0
 
-        try:
-            with sd.InputStream(
-                samplerate=SAMPLE_RATE,
-                channels=1,
-                dtype="float32",
-                blocksize=CHUNK,
-                callback=_callback,
-            ):
-                logger.debug("Barge-in Monitor gestartet.")
-                chunk_index = 0
-                consecutive_speech = 0
-                while not self._barge_in_event.is_set():
-                    try:
-                        chunk = audio_queue.get(timeout=0.1)
-                    except queue.Empty:
-                        continue
-
-                    chunk_index += 1
-
-                    # Cooldown: Restsignal nach STT-Phase ignorieren
-                    if chunk_index <= COOLDOWN_CHUNKS:
-                        continue
-
-                    tensor = torch.from_numpy(chunk.flatten()).unsqueeze(0)
-                    with torch.no_grad():
-                        confidence: float = vad_model(tensor, SAMPLE_RATE).item()
-
-                    if confidence >= BARGEIN_VAD_THRESHOLD:
-                        consecutive_speech += 1
-                        if consecutive_speech >= BARGEIN_CONSECUTIVE:
-                            logger.info(
-                                "Barge-in erkannt! VAD-Konfidenz: %.2f (%dx) — TTS gestoppt.",
-                                confidence, consecutive_speech,
-                            )
-                            self._barge_in_event.set()
-                            break
-                    else:
-                        consecutive_speech = 0
-
-        except Exception as exc:
-            logger.warning("Barge-in Monitor Fehler: %s", exc)
-
-        logger.debug("Barge-in Monitor beendet.")
+    def __call__(self, block: MicBlock) -> None:
+        if self._event.is_set():
+            return
+        self._seen += 1
+        # Cooldown: Restsignal nach STT-Phase ignorieren
+        if self._seen <= COOLDOWN_CHUNKS:
+            return
+        if block.vad >= BARGEIN_VAD_THRESHOLD:
+            self._consecutive += 1
+            if self._consecutive >= BARGEIN_CONSECUTIVE:
+                logger.info(
+                    "Barge-in erkannt! VAD-Konfidenz: %.2f (%dx) — TTS gestoppt.",
+                    block.vad, self._consecutive,
+                )
+                self._event.set()
+        else:
+            self._consecutive = 0
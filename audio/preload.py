@@ -0,0 +1,205 @@
+"""
+audio/preload.py — Vorladen und Aufwaermen der Sprachmodelle
+
+STTHandler und TTSHandler laden ihre Modelle lazy: das erste listen()
+zahlte Whisper + VAD, der erste Satz jeder neuen Stimme ([STIMME:...])
+das Laden des Piper-Modells — mehrere Sekunden mitten in der Sitzung.
+
+VoicePreloader (gestartet von SimulatorEngine.enable_voice):
+  - "ars-preload-stt": Whisper + Silero VAD laden, je eine Leer-Inferenz
+    (ONNX/CTranslate2 initialisieren Kernel und Puffer beim ersten Aufruf)
+  - "ars-preload-tts": alle Stimmen aus Keeper-/Party-Konfiguration laden
+    und mit einem kurzen Satz aufwaermen, Keeper zuerst
+  - Fortschritt als EventBus-Events:
+      audio.preload      {"component", "status": loading|ready|failed, "seconds"}
+      audio.voice_ready  {"stt", "tts", "voices", "seconds"}
+
+ModelLRU: geladene Piper-Stimmen (je 60-120 MB) als LRU mit Speicherlimit
+statt unbegrenztem Dict; das Vorladen stoppt, sobald das Limit erreicht ist.
+
+Konfiguration via .env:
+  VOICE_PRELOAD=1               # 0 = nichts vorladen (altes Lazy-Verhalten)
+  VOICE_PRELOAD_ROLES=          # zusaetzliche Rollen, kommagetrennt ("all" = alle)
+  PIPER_CACHE_MB=512            # Speicherlimit geladener Piper-Stimmen
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Iterable
+
+if TYPE_CHECKING:
+    from audio.stt_handler import STTHandler
+    from audio.tts_handler import TTSHandler
+
+logger = logging.getLogger("ARS.audio.preload")
+
+VOICE_PRELOAD       = os.getenv("VOICE_PRELOAD", "1") != "0"
+VOICE_PRELOAD_ROLES = os.getenv("VOICE_PRELOAD_ROLES", "")
+PIPER_CACHE_MB      = float(os.getenv("PIPER_CACHE_MB", "512"))
+
+
+class ModelLRU:
+    """
+    LRU geladener Modelle, begrenzt in (geschaetzten) Bytes (thread-safe).
+    Der zuletzt eingefuegte Eintrag wird nie verdraengt — auch ein einzelnes
+    Modell ueber dem Limit bleibt nutzbar.
+    """
+
+    def __init__(self, max_bytes: int = int(PIPER_CACHE_MB * 1_000_000)) -> None:
+        self.max_bytes = max_bytes
+        self._items: OrderedDict[str, tuple[Any, int]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is None:
+                return None
+            self._items.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: str, model: Any, nbytes: int) -> None:
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._items[key] = (model, nbytes)
+            self._bytes += nbytes
+            while self._bytes > self.max_bytes and len(self._items) > 1:
+                evicted, (_, size) = self._items.popitem(last=False)
+                self._bytes -= size
+                self.evictions += 1
+                logger.info("Modell-LRU: '%s' entladen (%d MB frei).", evicted, size // 1_000_000)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._items
+
+    @property
+    def full(self) -> bool:
+        return self._bytes >= self.max_bytes
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "models": list(self._items),
+                "mb": round(self._bytes / 1_000_000, 1),
+                "limit_mb": round(self.max_bytes / 1_000_000, 1),
+                "evictions": self.evictions,
+            }
+
+
+def preload_roles(
+    keeper: dict[str, Any] | None = None,
+    party_members: Iterable[dict[str, Any]] | None = None,
+) -> list[str]:
+    """
+    Rollen in Vorlade-Reihenfolge: Standard-Erzaehler, Keeper-Stimme,
+    "voice" der Party-Mitglieder, dann VOICE_PRELOAD_ROLES. Ohne Duplikate;
+    unbekannte Rollen filtert TTSHandler.preload().
+    """
+    from audio.tts_handler import DEFAULT_VOICE, VOICE_REGISTRY
+
+    roles = [DEFAULT_VOICE]
+    if keeper and keeper.get("voice"):
+        roles.append(str(keeper["voice"]))
+    for member in party_members or ():
+        if isinstance(member, dict) and member.get("voice"):
+            roles.append(str(member["voice"]))
+    extra = [r.strip() for r in VOICE_PRELOAD_ROLES.split(",") if r.strip()]
+    if "all" in extra:
+        extra = list(VOICE_REGISTRY)
+    roles.extend(extra)
+    return list(dict.fromkeys(roles))
+
+
+class VoicePreloader:
+    """Laedt STT und TTS-Stimmen im Hintergrund und meldet Bereitschaft."""
+
+    def __init__(self, stt: STTHandler, tts: TTSHandler, roles: list[str]) -> None:
+        self._stt = stt
+        self._tts = tts
+        self._roles = roles
+        self._threads: list[threading.Thread] = []
+        self._done = threading.Event()
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._started = 0.0
+        self.stt_ready = False
+        self.voices: list[str] = []
+
+    def start(self) -> None:
+        """Startet die Lade-Threads (nicht blockierend)."""
+        self._started = time.monotonic()
+        jobs = [("stt", self._load_stt), ("tts", self._load_tts)]
+        self._pending = len(jobs)
+        for name, target in jobs:
+            thread = threading.Thread(
+                target=self._run, args=(name, target), daemon=True,
+                name=f"ars-preload-{name}",
+            )
+            self._threads.append(thread)
+            thread.start()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Blockiert bis alles geladen ist; True wenn fertig."""
+        return self._done.wait(timeout)
+
+    @property
+    def ready(self) -> bool:
+        return self._done.is_set()
+
+    # ------------------------------------------------------------------
+    # Lade-Jobs
+    # ------------------------------------------------------------------
+
+    def _run(self, name: str, target: Any) -> None:
+        t0 = time.monotonic()
+        _emit("preload", {"component": name, "status": "loading"})
+        try:
+            target()
+            status = "ready"
+        except Exception as exc:
+            logger.warning("Vorladen '%s' fehlgeschlagen: %s", name, exc)
+            status = "failed"
+        seconds = round(time.monotonic() - t0, 2)
+        _emit("preload", {"component": name, "status": status, "seconds": seconds})
+        with self._lock:
+            self._pending -= 1
+            last = self._pending == 0
+        if last:
+            self._finish()
+
+    def _load_stt(self) -> None:
+        self.stt_ready = self._stt.preload()
+
+    def _load_tts(self) -> None:
+        self.voices = self._tts.preload(self._roles)
+
+    def _finish(self) -> None:
+        seconds = round(time.monotonic() - self._started, 2)
+        logger.info(
+            "Sprachmodelle bereit nach %.1fs — STT: %s | Stimmen: %s",
+            seconds, "ja" if self.stt_ready else "nein", ", ".join(self.voices) or "-",
+        )
+        self._done.set()
+        _emit("voice_ready", {
+            "stt": self.stt_ready,
+            "tts": bool(self.voices),
+            "voices": list(self.voices),
+            "seconds": seconds,
+        })
+
+
+def _emit(event: str, data: dict[str, Any]) -> None:
+    try:
+        from core.event_bus import EventBus
+        EventBus.get().emit("audio", event, data)
+    except Exception:
+        pass
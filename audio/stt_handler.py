@@ -6,12 +6,22 @@ Backend-Hierarchie (auto-detected):
   2. "stub"            — stdin-Eingabe                (kein Mikrofon / Dev)
 
 Silero VAD erkennt automatisch das Ende der Sprache (kein Tastendruck nötig).
+VAD-Stufe (audio/vad.py): RMS/ZCR-Vorfilter, Stapelverarbeitung im
+Mikrofon-Hub, ONNX Runtime (Default, ohne torch) oder torch.
 Faster-Whisper transkribiert auf CPU mit int8-Quantisierung (~5-10x schneller
 als original Whisper).
 
+Streaming (audio/stt_stream.py): Während der Spieler noch spricht, laufen
+schnelle Zwischen-Transkriptionen über überlappende Fenster (stt.partial
+Events); am Sprechende wird nur noch der unbestätigte Rest transkribiert.
+
 Konfiguration via .env:
   WHISPER_MODEL=base   # tiny | base | small | medium | large-v3
   STT_LANGUAGE=de      # ISO-639-1 Sprachcode
+  STT_STREAMING=1      # Zwischen-Transkription während der Aufnahme
+  STT_BEAM_SIZE=5      # Beam-Breite der finalen Transkription
+  VAD_BACKEND=auto     # auto | onnx | torch
+  VAD_THREADS=1        # CPU-Threads der VAD-Inferenz
 """
 
 from __future__ import annotations
@@ -19,14 +29,15 @@ from __future__ import annotations
 import logging
 import math
 import os
-import queue
 import threading
 from typing import Any
 
+from audio.mic_hub import CHUNK_SIZE, SAMPLE_RATE, MicCaptureHub
+from audio.stt_stream import STT_BEAM_SIZE, STT_STREAMING, Segment, StreamingTranscriber
+from audio.vad import load_vad, vad_available
+
 logger = logging.getLogger("ARS.audio.stt")
 
-SAMPLE_RATE = 16_000      # Hz — Silero VAD und Whisper Standard
-CHUNK_SIZE  = 512         # Samples pro Chunk ~32ms bei 16kHz (Silero VAD Pflicht)
 VAD_THRESHOLD     = 0.5   # Konfidenz ab der Sprache erkannt wird
 MAX_SILENCE_CHUNKS = 25   # ~800ms Stille = Äußerung beendet
 MAX_SPEECH_SECONDS = 30   # Sicherheits-Timeout gegen endlose Aufnahme
@@ -40,6 +51,7 @@ class STTHandler:
     Öffentliche API:
       listen()          → Blockiert bis Sprache erkannt + transkribiert (str | None)
       transcribe_file() → Transkribiert Audio-Datei direkt
+      preload()         → Lädt + wärmt Whisper und VAD vorab (Hintergrund-Thread)
     """
 
     def __init__(self) -> None:
@@ -47,6 +59,11 @@ class STTHandler:
         self._language:   str = os.getenv("STT_LANGUAGE", "de")
         self._whisper:    Any = None
         self._vad_model:  Any = None
+        self._beam_size:  int = STT_BEAM_SIZE
+        self._streaming:  bool = STT_STREAMING
+        self._hub:        MicCaptureHub | None = None
+        self._hub_lock = threading.Lock()
+        self._load_lock = threading.RLock()   # Vorlade-Thread vs. erstes listen()
         self._backend:    str = self._detect_backend()
         logger.info("STT initialisiert — Backend: %s | Modell: %s", self._backend, self._model_size)
 
@@ -86,99 +103,119 @@ class STTHandler:
     def _vad_listen(self) -> str | None:
         """
         Kernlogik:
-          1. Öffnet Mikrofon-Stream (non-blocking callback)
-          2. Schiebt 512-Sample-Chunks in eine Queue
-          3. Silero VAD prüft jeden Chunk auf Sprache
-          4. Puffert Sprach-Audio; stoppt nach MAX_SILENCE_CHUNKS stiller Chunks
-          5. Faster-Whisper transkribiert den Puffer
+          1. Abonniert den gemeinsamen Mikrofon-Hub (audio/mic_hub.py) —
+             Stream, RMS und Silero VAD laufen dort einmal pro Block
+          2. Puffert Sprach-Audio; stoppt nach MAX_SILENCE_CHUNKS stiller Chunks
+          3. Faster-Whisper transkribiert den Puffer — im Streaming-Modus
+             bereits während der Aufnahme, am Ende nur noch den Rest
         """
         try:
-            import sounddevice as sd
             import numpy as np
-            import torch
         except ImportError as exc:
             logger.error("Abhaengigkeit fehlt: %s", exc)
             return None
 
         self._ensure_models_loaded()
-
-        audio_queue: queue.Queue = queue.Queue()
-
-        def _callback(indata: Any, frames: int, time: Any, status: Any) -> None:
-            if status:
-                logger.debug("sd.InputStream Status: %s", status)
-            audio_queue.put(indata.copy())
+        hub = self.capture_hub()
+        if hub is None:
+            return None
 
         speech_chunks: list[Any] = []
+        stream: StreamingTranscriber | None = None
+        if self._streaming:
+            stream = StreamingTranscriber(
+                self._segments, SAMPLE_RATE, on_partial=self._emit_stt_partial,
+                final_beam=self._beam_size,
+            )
         in_speech = False
         silence_count = 0
         max_chunks = MAX_SPEECH_SECONDS * SAMPLE_RATE // CHUNK_SIZE
 
         logger.info("Hoere zu...")
 
+        sub = hub.subscribe()
         try:
-            with sd.InputStream(
-                samplerate=SAMPLE_RATE,
-                channels=1,
-                dtype="float32",
-                blocksize=CHUNK_SIZE,
-                callback=_callback,
-            ):
-                chunk_count = 0
-                while chunk_count < max_chunks:
-                    try:
-                        chunk = audio_queue.get(timeout=1.0)
-                    except queue.Empty:
-                        continue
-
-                    chunk_flat = chunk.flatten()
-                    chunk_count += 1
-
-                    # Noise-Gate: RMS-Check vor VAD (spart CPU bei Stille)
-                    rms = float(np.sqrt(np.mean(chunk_flat ** 2)))
-                    if rms < RMS_NOISE_GATE and not in_speech:
-                        # Unter Noise-Gate und nicht bereits in Sprachaufnahme
-                        db = max(20 * math.log10(rms + 1e-10), -60)
-                        level_pct = min(max((db + 60) / 60 * 100, 0), 100)
-                        self._emit_mic_level(level_pct, 0.0, False)
-                        continue
-
-                    # Silero VAD Konfidenz
-                    tensor = torch.from_numpy(chunk_flat).unsqueeze(0)
-                    with torch.no_grad():
-                        confidence: float = self._vad_model(tensor, SAMPLE_RATE).item()
-
-                    # Mic-Level via EventBus fuer GUI
-                    rms = float(np.sqrt(np.mean(chunk_flat ** 2)))
-                    db = max(20 * math.log10(rms + 1e-10), -60)
-                    level_pct = min(max((db + 60) / 60 * 100, 0), 100)
-                    self._emit_mic_level(level_pct, confidence, in_speech)
-
-                    is_speech = confidence >= VAD_THRESHOLD
-
-                    if is_speech:
-                        speech_chunks.append(chunk_flat)
-                        in_speech = True
-                        silence_count = 0
-                    elif in_speech:
-                        speech_chunks.append(chunk_flat)
-                        silence_count += 1
-                        if silence_count >= MAX_SILENCE_CHUNKS:
-                            logger.debug("Stille erkannt — Aufnahme beendet.")
-                            break
-
-        except Exception as exc:
-            logger.error("Mikrofon-Fehler: %s", exc)
-            return None
+            chunk_count = 0
+            while chunk_count < max_chunks:
+                block = sub.get(timeout=1.0)
+                if block is None:
+                    if not hub.running:
+                        logger.error("Mikrofon-Hub beendet — Aufnahme abgebrochen.")
+                        return None
+                    continue
+                chunk_count += 1
+
+                # Mic-Level via EventBus fuer GUI
+                db = max(20 * math.log10(block.rms + 1e-10), -60)
+                level_pct = min(max((db + 60) / 60 * 100, 0), 100)
+
+                # Noise-Gate: unter RMS_NOISE_GATE und nicht bereits in Sprachaufnahme
+                if block.rms < RMS_NOISE_GATE and not in_speech:
+                    self._emit_mic_level(level_pct, 0.0, False)
+                    continue
+
+                self._emit_mic_level(level_pct, block.vad, in_speech)
+                is_speech = block.vad >= VAD_THRESHOLD
+
+                if is_speech or in_speech:
+                    # Zeile der Stapel-Kopie des Hubs, gehoert dem Block (read-only)
+                    chunk = block.samples
+                    speech_chunks.append(chunk)
+                    if stream is not None:
+                        stream.append(chunk)
+                if is_speech:
+                    in_speech = True
+                    silence_count = 0
+                elif in_speech:
+                    silence_count += 1
+                    if silence_count >= MAX_SILENCE_CHUNKS:
+                        logger.debug("Stille erkannt — Aufnahme beendet.")
+                        break
+        finally:
+            sub.close()
 
         if not speech_chunks:
             logger.info("Keine Sprache erkannt.")
             self._emit_mic_level(0, 0, False)
             return None
 
+        if stream is not None:
+            return self._finish_text(stream.finish())
+
         audio = np.concatenate(speech_chunks)
         return self._transcribe(audio)
 
+    # ------------------------------------------------------------------
+    # Mikrofon-Hub + VAD
+    # ------------------------------------------------------------------
+
+    def capture_hub(self) -> MicCaptureHub | None:
+        """
+        Gemeinsamer, dauerhaft laufender Mikrofon-Hub (STT + Barge-in).
+        Lädt bei Bedarf Silero VAD und öffnet das Mikrofon einmalig.
+        """
+        if self._backend != "faster_whisper":
+            return None
+        with self._hub_lock:
+            if self._hub is not None and self._hub.running:
+                return self._hub
+            try:
+                self._ensure_vad_loaded()
+                hub = MicCaptureHub(self._vad_model)
+                hub.start()
+            except Exception as exc:
+                logger.error("Mikrofon-Fehler: %s", exc)
+                return None
+            self._hub = hub
+            return hub
+
+    def close(self) -> None:
+        """Schließt den Mikrofon-Hub."""
+        with self._hub_lock:
+            hub, self._hub = self._hub, None
+        if hub is not None:
+            hub.close()
+
     # ------------------------------------------------------------------
     # EventBus Emitters
     # ------------------------------------------------------------------
@@ -202,6 +239,19 @@ class STTHandler:
         except Exception:
             pass
 
+    @staticmethod
+    def _emit_stt_partial(committed: str, tail: str) -> None:
+        """Sendet einen Zwischenstand (bestätigt + offen) während der Aufnahme."""
+        try:
+            from core.event_bus import EventBus
+            EventBus.get().emit("stt", "partial", {
+                "text": f"{committed} {tail}".strip(),
+                "committed": committed,
+                "tail": tail,
+            })
+        except Exception:
+            pass
+
     @staticmethod
     def _emit_stt_text(text: str) -> None:
         """Sendet erkannten STT-Text an die GUI."""
@@ -218,51 +268,70 @@ class STTHandler:
     def _transcribe(self, audio: Any) -> str | None:
         """Ruft Faster-Whisper auf einem numpy-Float32-Array auf."""
         try:
-            segments, info = self._whisper.transcribe(
-                audio,
-                language=self._language,
-                beam_size=5,
-                vad_filter=False,   # eigenes VAD bereits erfolgt
-            )
-            text = " ".join(s.text for s in segments).strip()
-            logger.info("STT: '%s'", text[:80])
-            if text:
-                self._emit_stt_text(text)
-            return text or None
+            segments = self._segments(audio, self._beam_size)
         except Exception as exc:
             logger.error("Faster-Whisper Transkriptionsfehler: %s", exc)
             return None
+        return self._finish_text(" ".join(text for _, _, text in segments))
+
+    def _segments(self, audio: Any, beam_size: int, prompt: str = "") -> list[Segment]:
+        """Whisper-Segmente (start, end, text) für ein Audio-Fenster."""
+        segments, _ = self._whisper.transcribe(
+            audio,
+            language=self._language,
+            beam_size=beam_size,
+            vad_filter=False,   # eigenes VAD bereits erfolgt
+            initial_prompt=prompt or None,
+            condition_on_previous_text=False,
+        )
+        return [(s.start, s.end, s.text.strip()) for s in segments]
+
+    def _finish_text(self, text: str) -> str | None:
+        text = text.strip()
+        logger.info("STT: '%s'", text[:80])
+        if text:
+            self._emit_stt_text(text)
+        return text or None
 
     # ------------------------------------------------------------------
     # Model-Lazy-Loading
     # ------------------------------------------------------------------
 
-    def _ensure_models_loaded(self) -> None:
-        if self._whisper is None:
-            from faster_whisper import WhisperModel  # type: ignore[import]
-            logger.info("Lade Faster-Whisper '%s' (CPU int8)...", self._model_size)
-            self._whisper = WhisperModel(
-                self._model_size, device="cpu", compute_type="int8"
-            )
-            logger.info("Faster-Whisper bereit.")
+    def preload(self) -> bool:
+        """
+        Lädt Whisper + VAD vorab und wärmt beide mit einer Leer-Inferenz
+        auf (audio/preload.py). True wenn STT danach einsatzbereit ist.
+        """
+        if self._backend != "faster_whisper":
+            return False
+        import numpy as np
 
-        if self._vad_model is None:
-            import torch  # type: ignore[import]
-            logger.info("Lade Silero VAD...")
-            try:
-                # Primär: silero-vad pip-Paket
-                from silero_vad import load_silero_vad  # type: ignore[import]
-                self._vad_model = load_silero_vad()
-            except ImportError:
-                # Fallback: torch.hub
-                self._vad_model, _ = torch.hub.load(
-                    "snakers4/silero-vad",
-                    "silero_vad",
-                    force_reload=False,
-                    trust_repo=True,
+        self._ensure_models_loaded()
+        with self._hub_lock:
+            # Der laufende Hub besitzt den VAD-Zustand — dann nicht anfassen
+            if self._hub is None:
+                self._vad_model.probs(np.zeros((2, CHUNK_SIZE), dtype=np.float32))
+                self._vad_model.reset()
+        self._segments(np.zeros(SAMPLE_RATE, dtype=np.float32), beam_size=1)
+        logger.info("STT aufgewärmt.")
+        return True
+
+    def _ensure_models_loaded(self) -> None:
+        with self._load_lock:
+            if self._whisper is None:
+                from faster_whisper import WhisperModel  # type: ignore[import]
+                logger.info("Lade Faster-Whisper '%s' (CPU int8)...", self._model_size)
+                self._whisper = WhisperModel(
+                    self._model_size, device="cpu", compute_type="int8"
                 )
-            self._vad_model.eval()
-            logger.info("Silero VAD bereit.")
+                logger.info("Faster-Whisper bereit.")
+            self._ensure_vad_loaded()
+
+    def _ensure_vad_loaded(self) -> None:
+        with self._load_lock:
+            if self._vad_model is None:
+                logger.info("Lade Silero VAD...")
+                self._vad_model = load_vad()
 
     # ------------------------------------------------------------------
     # Backend-Erkennung & Stub
@@ -271,16 +340,18 @@ class STTHandler:
     def _detect_backend(self) -> str:
         try:
             import faster_whisper  # type: ignore[import]  # noqa: F401
-            import torch           # type: ignore[import]  # noqa: F401
             import sounddevice     # type: ignore[import]  # noqa: F401
-            return "faster_whisper"
+            # VAD: onnxruntime (kommt mit faster-whisper) oder torch
+            if vad_available():
+                return "faster_whisper"
         except ImportError:
-            logger.warning(
-                "faster-whisper / torch / sounddevice nicht installiert — "
-                "STT laeuft im Stub-Modus. "
-                "Installation: pip install faster-whisper torch sounddevice"
-            )
-            return "stub"
+            pass
+        logger.warning(
+            "faster-whisper / sounddevice / VAD-Backend nicht installiert — "
+            "STT laeuft im Stub-Modus. "
+            "Installation: pip install faster-whisper sounddevice silero-vad"
+        )
+        return "stub"
 
     def _stub_listen(self) -> str | None:
         """Stub: liest Text von stdin (Dev/Test ohne Mikrofon)."""
@@ -0,0 +1,181 @@
+"""
+audio/stt_stream.py — Inkrementelle Transkription waehrend der Spieler spricht
+
+Bisher wurde die ganze Aeusserung gepuffert und erst nach der VAD-Stille
+einmal mit beam_size=5 transkribiert — die volle Whisper-Laufzeit kam nach
+dem Sprechende obendrauf. StreamingTranscriber transkribiert schon waehrend
+der Aufnahme:
+
+  - Alle STT_PARTIAL_INTERVAL Sekunden neuen Audios laeuft im Hintergrund
+    ein schneller Durchlauf (STT_PARTIAL_BEAM, default greedy) ueber das
+    noch nicht bestaetigte Fenster [committed_at, jetzt].
+  - Segmente, die mindestens COMMIT_MARGIN Sekunden vor dem Fensterende
+    enden, gelten als stabil: ihr Text wird bestaetigt und committed_at
+    rueckt auf ihr Ende-Zeitstempel vor (Stitching ueber Whisper-
+    Segmentzeiten). Das letzte Segment bleibt immer offen, da es an der
+    Fenstergrenze abgeschnitten sein kann. Die Fenster ueberlappen so
+    automatisch um den offenen Rest.
+  - Jeder Durchlauf meldet bestaetigten Text + offenen Rest als Partial.
+  - Am Sprechende wird nur noch der offene Rest mit voller Beam-Breite
+    (STT_BEAM_SIZE) transkribiert.
+
+Konfiguration via .env:
+  STT_STREAMING=1            # 0 = klassisch: erst am Ende transkribieren
+  STT_BEAM_SIZE=5            # Beam-Breite fuer das Finale
+  STT_PARTIAL_BEAM=1         # Beam-Breite fuer Zwischenstaende
+  STT_PARTIAL_INTERVAL=1.0   # Sekunden neuen Audios pro Zwischenlauf
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from typing import Callable
+
+import numpy as np
+
+logger = logging.getLogger("ARS.audio.stt_stream")
+
+STT_STREAMING        = os.getenv("STT_STREAMING", "1") != "0"
+STT_BEAM_SIZE        = max(1, int(os.getenv("STT_BEAM_SIZE", "5")))
+STT_PARTIAL_BEAM     = max(1, int(os.getenv("STT_PARTIAL_BEAM", "1")))
+STT_PARTIAL_INTERVAL = float(os.getenv("STT_PARTIAL_INTERVAL", "1.0"))
+
+COMMIT_MARGIN   = 1.0     # Sekunden Abstand zum Fensterende fuer stabile Segmente
+MIN_WINDOW      = 1.0     # Sekunden — kuerzere Fenster lohnen keinen Zwischenlauf
+MIN_TAIL        = 0.1     # Sekunden — kuerzerer Rest wird am Ende nicht transkribiert
+PROMPT_CHARS    = 200     # bestaetigter Text als initial_prompt fuer den naechsten Lauf
+
+# (start_s, end_s, text) relativ zum uebergebenen Fenster
+Segment = tuple[float, float, str]
+# transcribe(audio, beam_size, prompt) -> Segmente
+TranscribeFn = Callable[[np.ndarray, int, str], "list[Segment]"]
+# on_partial(bestaetigt, offen)
+PartialFn = Callable[[str, str], None]
+
+
+class StreamingTranscriber:
+    """
+    Sammelt die Sprach-Chunks einer Aeusserung und transkribiert
+    ueberlappende Fenster im Hintergrund (ein Worker, kein Rueckstau).
+    """
+
+    def __init__(
+        self,
+        transcribe: TranscribeFn,
+        sample_rate: int,
+        on_partial: PartialFn | None = None,
+        *,
+        interval: float = STT_PARTIAL_INTERVAL,
+        partial_beam: int = STT_PARTIAL_BEAM,
+        final_beam: int = STT_BEAM_SIZE,
+    ) -> None:
+        self._transcribe = transcribe
+        self._rate = sample_rate
+        self._on_partial = on_partial
+        self._interval = int(interval * sample_rate)
+        self._partial_beam = partial_beam
+        self._final_beam = final_beam
+
+        self._buf = np.empty(sample_rate * 8, dtype=np.float32)
+        self._total = 0                   # Samples gesamt
+        self._committed_at = 0            # Sample-Offset: bis hier ist Text bestaetigt
+        self._committed: list[str] = []
+        self._tail = ""
+        self._last_run_at = 0             # _total beim letzten Zwischenlauf
+        self._lock = threading.Lock()
+        self._worker: threading.Thread | None = None
+        self.partial_runs = 0
+
+    @property
+    def committed_text(self) -> str:
+        with self._lock:
+            return " ".join(self._committed)
+
+    # ------------------------------------------------------------------
+    # Aufnahme-Seite
+    # ------------------------------------------------------------------
+
+    def append(self, chunk: np.ndarray) -> None:
+        """Haengt einen Sprach-Chunk an; startet ggf. einen Zwischenlauf."""
+        n = len(chunk)
+        if self._total + n > len(self._buf):
+            grown = np.empty(max(2 * len(self._buf), self._total + n), dtype=np.float32)
+            grown[:self._total] = self._buf[:self._total]
+            self._buf = grown
+        self._buf[self._total:self._total + n] = chunk
+        self._total += n
+
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._lock:
+            start = self._committed_at
+        if (self._total - self._last_run_at < self._interval
+                or self._total - start < MIN_WINDOW * self._rate):
+            return
+        self._last_run_at = self._total
+        window = self._buf[start:self._total].copy()
+        self._worker = threading.Thread(
+            target=self._run_partial, args=(window, start),
+            daemon=True, name="ars-stt-partial",
+        )
+        self._worker.start()
+
+    def finish(self) -> str:
+        """Wartet den laufenden Zwischenlauf ab und transkribiert nur den offenen Rest."""
+        if self._worker is not None:
+            self._worker.join()
+        with self._lock:
+            start = self._committed_at
+            committed = list(self._committed)
+        if self._total - start >= MIN_TAIL * self._rate:
+            try:
+                segments = self._transcribe(
+                    self._buf[start:self._total], self._final_beam,
+                    " ".join(committed)[-PROMPT_CHARS:],
+                )
+                committed.extend(text for _, _, text in segments if text)
+            except Exception as exc:
+                logger.error("STT Final-Transkription fehlgeschlagen: %s", exc)
+                if self._tail:
+                    committed.append(self._tail)
+        logger.debug(
+            "STT-Stream: %.1f s Audio, %d Zwischenlaeufe, Rest %.1f s",
+            self._total / self._rate, self.partial_runs, (self._total - start) / self._rate,
+        )
+        return " ".join(committed).strip()
+
+    # ------------------------------------------------------------------
+    # Worker
+    # ------------------------------------------------------------------
+
+    def _run_partial(self, window: np.ndarray, offset: int) -> None:
+        prompt = self.committed_text[-PROMPT_CHARS:]
+        try:
+            segments = self._transcribe(window, self._partial_beam, prompt)
+        except Exception as exc:
+            logger.debug("STT Zwischenlauf fehlgeschlagen: %s", exc)
+            return
+        self.partial_runs += 1
+
+        # Stabil: alle Segmente vor dem letzten, die frueh genug enden
+        stable_until = len(window) / self._rate - COMMIT_MARGIN
+        n_stable = 0
+        for _, end, _ in segments[:-1]:
+            if end > stable_until:
+                break
+            n_stable += 1
+
+        with self._lock:
+            if n_stable:
+                self._committed.extend(text for _, _, text in segments[:n_stable] if text)
+                self._committed_at = offset + int(segments[n_stable - 1][1] * self._rate)
+            self._tail = " ".join(text for _, _, text in segments[n_stable:] if text)
+            committed, tail = " ".join(self._committed), self._tail
+
+        if self._on_partial is not None:
+            try:
+                self._on_partial(committed, tail)
+            except Exception as exc:
+                logger.debug("STT Partial-Callback: %s", exc)
@@ -0,0 +1,290 @@
+"""
+audio/tts_cache.py — Phrasen-Cache fuer synthetisiertes TTS-Audio
+
+Spielleiter-Ausgaben wiederholen sich: Wurf-Narrationen, Kampfrunden-Koepfe,
+"Was tust du?"-Hooks, NPC-Sprueche. Statt jeden Satz neu durch Piper,
+Kokoro oder Edge zu schicken, wird das Ergebnis content-adressiert abgelegt:
+
+  Schluessel = sha1(normalisierter Satz | Backend | Stimme | Tempo)
+  RAM:   LRU (OrderedDict) ueber float32-Samples, begrenzt in Bytes
+  Disk:  data/tts_cache/<ab>/<schluessel>.npz — int16-PCM, komprimiert;
+         aelteste Dateien (mtime) fliegen bei Ueberschreiten des Budgets
+
+Gecacht wird das trockene Signal (vor den Effekten): Effekte laufen als
+EffectStream mit Zustand ueber Satzgrenzen (audio/effects.py) und werden
+beim Abspielen live angewandt — ein Preset-Wechsel braucht keinen neuen
+Eintrag.
+
+Konfiguration via .env:
+  TTS_CACHE_ENABLED=1       # 0 = aus
+  TTS_CACHE_MEM_MB=32       # RAM-Budget
+  TTS_CACHE_DISK_MB=256     # Disk-Budget
+  TTS_CACHE_MAX_CHARS=240   # laengere Saetze werden nicht gecacht
+
+Usage:
+    cache = get_phrase_cache()
+    key = phrase_key(satz, "piper", "de_DE-thorsten-high", 1.0)
+    hit = cache.get(key)            # (samples, sample_rate) | None
+    cache.put(key, samples, 22050)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Iterable
+
+import numpy as np
+
+logger = logging.getLogger("ARS.audio.tts_cache")
+
+TTS_CACHE_DIR = Path(__file__).parent.parent / "data" / "tts_cache"
+
+TTS_CACHE_ENABLED   = os.getenv("TTS_CACHE_ENABLED", "1") != "0"
+TTS_CACHE_MEM_MB    = float(os.getenv("TTS_CACHE_MEM_MB", "32"))
+TTS_CACHE_DISK_MB   = float(os.getenv("TTS_CACHE_DISK_MB", "256"))
+TTS_CACHE_MAX_CHARS = int(os.getenv("TTS_CACHE_MAX_CHARS", "240"))
+
+_PRUNE_TO = 0.9           # nach dem Aufraeumen: 90% des Disk-Budgets
+
+# Standard-Phrasen fuer --tts-prewarm (Rolle, Text)
+PREWARM_PHRASES: list[tuple[str, str]] = [
+    ("keeper", "Was tust du?"),
+    ("keeper", "Wohin gehst du?"),
+    ("keeper", "Wie reagierst du?"),
+    ("keeper", "Was machst du?"),
+    ("keeper", "Wuerfle bitte."),
+    ("keeper", "Der Kampf beginnt!"),
+    ("keeper", "Der Kampf ist vorbei."),
+    ("keeper", "Ein kritischer Erfolg!"),
+    ("keeper", "Ein kritischer Fehlschlag!"),
+    ("keeper", "Erfolg."),
+    ("keeper", "Fehlschlag."),
+]
+
+
+def normalize_phrase(text: str) -> str:
+    """Whitespace-normalisierter Satz (nach _preprocess_german)."""
+    return " ".join(text.split())
+
+
+def phrase_key(text: str, *parts: Any) -> str:
+    """Content-Adresse fuer Satz + Stimmenparameter."""
+    raw = "\x1f".join([normalize_phrase(text), *(str(p) for p in parts)])
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def load_phrase_file(path: str | Path, default_role: str = "keeper") -> list[tuple[str, str]]:
+    """
+    Liest Phrasen fuer den Pre-Warm: eine pro Zeile, optional mit Rolle
+    als Praefix ("[commander] Zu den Waffen!"). Leerzeilen und #-Kommentare
+    werden uebersprungen.
+    """
+    phrases: list[tuple[str, str]] = []
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        role = default_role
+        if line.startswith("[") and "]" in line:
+            role, line = line[1:line.index("]")].strip(), line[line.index("]") + 1:].strip()
+        if line:
+            phrases.append((role, line))
+    return phrases
+
+
+class PhraseCache:
+    """RAM-LRU + komprimierter Disk-Store fuer Satz-PCM (thread-safe)."""
+
+    def __init__(
+        self,
+        directory: Path = TTS_CACHE_DIR,
+        mem_bytes: int = int(TTS_CACHE_MEM_MB * 1_000_000),
+        disk_bytes: int = int(TTS_CACHE_DISK_MB * 1_000_000),
+    ) -> None:
+        self._dir = directory
+        self._mem_limit = mem_bytes
+        self._disk_limit = disk_bytes
+        self._mem: OrderedDict[str, tuple[np.ndarray, int]] = OrderedDict()
+        self._mem_bytes = 0
+        self._disk_bytes: int | None = None      # lazy beim ersten put()
+        self._lock = threading.Lock()
+        self.mem_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> Path:
+        return self._dir / key[:2] / f"{key}.npz"
+
+    # ------------------------------------------------------------------
+    # Lesen
+    # ------------------------------------------------------------------
+
+    def get(self, key: str) -> tuple[np.ndarray, int] | None:
+        """(samples, sample_rate) fuer key, sonst None. Disk-Treffer landen im RAM."""
+        with self._lock:
+            entry = self._mem.get(key)
+            if entry is not None:
+                self._mem.move_to_end(key)
+                self.mem_hits += 1
+                return entry
+
+        path = self._path(key)
+        try:
+            with np.load(path) as data:
+                pcm = data["pcm"]
+                sample_rate = int(data["rate"])
+            os.utime(path)                       # Disk-LRU: zuletzt benutzt
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        except Exception as exc:
+            logger.debug("TTS-Cache: '%s' unlesbar (%s) — verworfen", path.name, exc)
+            path.unlink(missing_ok=True)
+            with self._lock:
+                self.misses += 1
+            return None
+
+        samples = pcm.astype(np.float32) / 32767.0
+        with self._lock:
+            self.disk_hits += 1
+            self._remember(key, samples, sample_rate)
+        return samples, sample_rate
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and (key in self._mem or self._path(key).exists())
+
+    # ------------------------------------------------------------------
+    # Schreiben
+    # ------------------------------------------------------------------
+
+    def put(self, key: str, samples: Any, sample_rate: int) -> None:
+        """Legt einen Satz in RAM und auf Disk ab (kopiert die Samples)."""
+        self._store(key, np.array(samples, dtype=np.float32).reshape(-1), sample_rate)
+
+    def put_blocks(self, key: str, blocks: Iterable[tuple[Any, int]]) -> None:
+        """Fuegt die Bloecke eines Satzes zusammen; gemischte Raten werden nicht gecacht."""
+        blocks = list(blocks)
+        rates = {rate for _, rate in blocks}
+        if len(rates) != 1:
+            return
+        self._store(key, np.concatenate([np.asarray(s, dtype=np.float32).reshape(-1)
+                                         for s, _ in blocks]), rates.pop())
+
+    def _store(self, key: str, samples: np.ndarray, sample_rate: int) -> None:
+        """RAM + Disk (atomar via tmp + replace); samples gehoeren danach dem Cache."""
+        if not samples.size:
+            return
+        with self._lock:
+            self._remember(key, samples, sample_rate)
+
+        pcm = (np.clip(samples, -1.0, 1.0) * 32767.0).astype(np.int16)
+        path = self._path(key)
+        tmp = path.with_suffix(".tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "wb") as f:
+                np.savez_compressed(f, pcm=pcm, rate=np.int32(sample_rate))
+            os.replace(tmp, path)
+            size = path.stat().st_size
+        except OSError as exc:
+            logger.debug("TTS-Cache: Schreiben fehlgeschlagen: %s", exc)
+            tmp.unlink(missing_ok=True)
+            return
+        with self._lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = self._scan_disk()
+            else:
+                self._disk_bytes += size
+            over = self._disk_bytes > self._disk_limit
+        if over:
+            self._prune_disk()
+
+    def _remember(self, key: str, samples: np.ndarray, sample_rate: int) -> None:
+        """RAM-LRU einfuegen (Lock gehalten). Samples sind read-only geteilt."""
+        old = self._mem.pop(key, None)
+        if old is not None:
+            self._mem_bytes -= old[0].nbytes
+        if samples.nbytes > self._mem_limit:
+            return
+        samples.flags.writeable = False
+        self._mem[key] = (samples, sample_rate)
+        self._mem_bytes += samples.nbytes
+        while self._mem_bytes > self._mem_limit:
+            _, (evicted, _) = self._mem.popitem(last=False)
+            self._mem_bytes -= evicted.nbytes
+
+    # ------------------------------------------------------------------
+    # Disk-Budget
+    # ------------------------------------------------------------------
+
+    def _scan_disk(self) -> int:
+        return sum(p.stat().st_size for p in self._dir.glob("*/*.npz"))
+
+    def _prune_disk(self) -> None:
+        """Loescht die am laengsten unbenutzten Dateien bis unter _PRUNE_TO * Budget."""
+        try:
+            files = sorted(
+                ((p.stat().st_mtime, p.stat().st_size, p) for p in self._dir.glob("*/*.npz")),
+                key=lambda t: t[0],
+            )
+        except OSError:
+            return
+        total = sum(size for _, size, _ in files)
+        target = int(self._disk_limit * _PRUNE_TO)
+        removed = 0
+        for _, size, path in files:
+            if total <= target:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        with self._lock:
+            self._disk_bytes = total
+        logger.info("TTS-Cache: %d Dateien entfernt (%.1f MB auf Disk)", removed, total / 1e6)
+
+    # ------------------------------------------------------------------
+    # Verwaltung
+    # ------------------------------------------------------------------
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._mem),
+                "mem_mb": round(self._mem_bytes / 1e6, 2),
+                "disk_mb": round(self._disk_bytes / 1e6, 2) if self._disk_bytes is not None else None,
+                "mem_hits": self.mem_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+            }
+
+    def clear(self, disk: bool = False) -> None:
+        """Leert den RAM-Cache, optional auch den Disk-Store."""
+        with self._lock:
+            self._mem.clear()
+            self._mem_bytes = 0
+        if disk:
+            for path in self._dir.glob("*/*.npz"):
+                path.unlink(missing_ok=True)
+            with self._lock:
+                self._disk_bytes = 0
+
+
+_cache: PhraseCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_phrase_cache() -> PhraseCache | None:
+    """Prozessweiter Phrasen-Cache (None wenn TTS_CACHE_ENABLED=0)."""
+    global _cache
+    if not TTS_CACHE_ENABLED:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = PhraseCache()
+        return _cache
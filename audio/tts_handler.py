@@ -10,18 +10,34 @@ Backend-Hierarchie (auto-detected):
 
 Features:
   - Sentence-Streaming: Sprachausgabe startet sobald der erste Satz fertig ist
+  - Chunk-Streaming: Piper-Chunks / Kokoro-Stream spielen ab dem ersten Block
+  - Pipeline: Satz N+1 wird synthetisiert waehrend Satz N spielt
+    (audio/tts_pipeline.py) in einen persistenten Ausgabestrom mit
+    Ring-Buffer (audio/output_stream.py)
   - Barge-in: threading.Event stoppt die Wiedergabe sofort wenn gesetzt
   - speak_streaming(): nimmt LLM-Text-Chunks entgegen, puffert bis Satzgrenze
+  - Edge: persistenter asyncio-Loop, inkrementelle MP3-Dekodierung und
+    Vorab-Anfragen fuer Folgesaetze (audio/edge_client.py)
+  - Phrasen-Cache: wiederkehrende Saetze ohne Synthese (audio/tts_cache.py),
+    vorab fuellbar via prewarm() / main.py --tts-prewarm
+  - Vorladen: Stimmen aus Keeper-/Party-Konfiguration werden beim
+    Aktivieren von Voice im Hintergrund geladen und aufgewaermt; geladene
+    Piper-Modelle liegen in einem LRU mit Speicherlimit (audio/preload.py)
   - Audio-Effekte: Reverb, Distortion, Filter etc. via pedalboard (optional)
   - 18 Stimmenrollen: 10 Piper (offline) + 8 Edge (online, neural)
 
 Konfiguration via .env:
   PIPER_VOICE=de_DE-thorsten-medium  # Piper Stimmen-ID
   PIPER_SPEED=1.0                    # Sprechgeschwindigkeit
+  PIPER_CACHE_MB=512                 # Speicherlimit geladener Piper-Stimmen
   KOKORO_VOICE=af_heart              # Kokoro Stimmen-ID (Englisch-Fallback)
   KOKORO_SPEED=1.0                   # Sprechgeschwindigkeit
   TTS_LANG=en-us                     # Sprach-Code fuer kokoro-onnx
   EDGE_TTS_ENABLED=1                 # Edge TTS aktivieren (default: 1)
+  EDGE_TTS_PREFETCH=2                # Max. vorab angefragte Edge-Saetze
+  TTS_PIPELINE_DEPTH=8               # Max. vorsynthetisierte Audio-Bloecke
+  TTS_OUTPUT_SINK=device             # device | null | file:<pfad>
+  TTS_CACHE_ENABLED=1                # Phrasen-Cache (RAM-LRU + data/tts_cache/)
 """
 
 from __future__ import annotations
@@ -32,12 +48,15 @@ import re
 import threading
 import unicodedata
 from pathlib import Path
-from typing import Any, Iterator
+from typing import Any, Iterable, Iterator, NamedTuple
+
+from audio.preload import ModelLRU
+from audio.tts_cache import TTS_CACHE_MAX_CHARS, get_phrase_cache, phrase_key
+from audio.tts_pipeline import SpeechPipeline
 
 logger = logging.getLogger("ARS.audio.tts")
 
 KOKORO_SAMPLE_RATE = 24_000   # Hz — Kokoro-82M Output
-PLAYBACK_CHUNK     = 2048     # Samples pro Playback-Iteration (Barge-in Granularitaet)
 
 # Piper Model-Cache Verzeichnis
 PIPER_MODEL_DIR = Path(__file__).parent.parent / "data" / "models" / "piper"
@@ -157,11 +176,50 @@ def _preprocess_german(text: str) -> str:
     return text
 
 
+def _iter_async(agen: Any) -> Iterator[Any]:
+    """Treibt einen Async-Generator synchron (eigener Loop im Worker-Thread)."""
+    import asyncio
+
+    loop = asyncio.new_event_loop()
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(agen.__anext__())
+            except StopAsyncIteration:
+                return
+    finally:
+        try:
+            loop.run_until_complete(agen.aclose())
+        finally:
+            loop.close()
+
+
 def split_sentences(text: str) -> list[str]:
     """Zerlegt Text in Saetze fuer Streaming-TTS."""
     return [s.strip() for s in SENTENCE_PATTERN.split(text) if s.strip()]
 
 
+_Pcm = tuple[Any, int]     # (float32-mono samples, sample_rate)
+
+# Backend-Marker: Satz unvollstaendig oder per Fallback synthetisiert —
+# nicht in den Phrasen-Cache schreiben (wird vor der Pipeline gefiltert)
+_NO_CACHE: Any = object()
+
+_WARMUP_TEXT = "Hallo."    # Aufwaermsatz fuer preload() (wird nicht abgespielt)
+
+
+class _Voice(NamedTuple):
+    """Stimmen-Snapshot beim Einreihen eines Satzes.
+
+    Die Synthese laeuft der Wiedergabe voraus; ein [STIMME:...]-Wechsel
+    mitten im Stream darf bereits eingereihte Saetze nicht umfaerben.
+    """
+    role: str
+    piper_voice_id: str
+    edge_voice: str
+    preset: str
+
+
 class TTSHandler:
     """
     Multi-Backend TTS mit Sentence-Streaming, Barge-in und Audio-Effekten.
@@ -171,6 +229,8 @@ class TTSHandler:
       speak_streaming(iter, stop_event)-> Nimmt Text-Chunks vom LLM entgegen
       set_voice(role)                  -> Wechselt Stimme + Effekt-Preset
       set_effect(preset)               -> Wechselt Effekt-Preset manuell
+      prewarm(phrases)                 -> Fuellt den Phrasen-Cache vorab
+      preload(roles)                   -> Laedt + waermt Stimmen vorab (audio/preload.py)
       stop()                           -> Unterbricht sofort
     """
 
@@ -186,14 +246,15 @@ class TTSHandler:
         # Piper config
         self._piper_voice_id: str = VOICE_REGISTRY[DEFAULT_VOICE]
         self._piper_speed: float = float(os.getenv("PIPER_SPEED", "1.0"))
-        self._piper_models: dict[str, Any] = {}  # Cache fuer geladene Modelle
-        self._active_piper: Any = None            # Aktuell genutztes Modell
+        self._piper_models = ModelLRU()           # geladene Modelle (LRU, PIPER_CACHE_MB)
+        self._piper_locks: dict[str, threading.Lock] = {}  # ein Ladevorgang pro Stimme
         self._piper_sample_rate: int = 22050
         self._piper_failed_voices: set[str] = set()  # Per-Voice Tracking
 
         # Edge TTS config
         self._edge_available: bool | None = None
         self._current_edge_voice: str = "de-DE-ConradNeural"
+        self._edge_inflight: Any = None   # EdgeRequest des Synthese-Workers
 
         # Kokoro config
         self._voice:    str = os.getenv("KOKORO_VOICE", "af_heart")
@@ -201,6 +262,7 @@ class TTSHandler:
         self._lang:     str = os.getenv("TTS_LANG", "en-us")
         self._kokoro:   Any = None          # kokoro_onnx.Kokoro Instanz
         self._kokoro_load_failed: bool = False
+        self._kokoro_lock = threading.Lock()
         self._engine:   Any = None          # pyttsx3
         self._stop_event = threading.Event()
 
@@ -208,6 +270,9 @@ class TTSHandler:
         self._current_preset: str = "clean"
         self._effects: Any = None
         self._effects_loaded: bool = False
+        # EffectStream der laufenden Aeusserung (nur Synthese-Worker)
+        self._fx_stream: Any = None
+        self._fx_key: tuple[str, int] | None = None
 
         # Aktive Rolle (fuer Backend-Routing)
         self._current_role: str = DEFAULT_VOICE
@@ -228,14 +293,27 @@ class TTSHandler:
                 self._effects = None
         return self._effects
 
-    def _apply_effects(self, samples, sample_rate: int):
-        """Wendet das aktive Effekt-Preset auf Samples an."""
-        if self._current_preset == "clean":
-            return samples
-        fx = self._ensure_effects()
-        if fx is None:
-            return samples
-        return fx.apply(samples, sample_rate, self._current_preset)
+    def _effect_blocks(self, samples, sample_rate: int, preset: str) -> Iterator[_Pcm]:
+        """
+        Schickt einen Block durch den EffectStream der Aeusserung. Wechselt
+        Preset oder Sample-Rate, klingt der bisherige Stream erst aus.
+        """
+        if self._fx_key != (preset, sample_rate):
+            yield from self._effect_tail()
+            self._fx_key = (preset, sample_rate)
+            fx = self._ensure_effects() if preset != "clean" else None
+            self._fx_stream = fx.stream(preset, sample_rate) if fx is not None else None
+        if self._fx_stream is None:
+            yield samples, sample_rate
+        else:
+            yield self._fx_stream.process(samples), sample_rate
+
+    def _effect_tail(self) -> Iterator[_Pcm]:
+        """Ausklang (Hall/Delay) des aktuellen EffectStream; danach ist keiner aktiv."""
+        stream, self._fx_stream, self._fx_key = self._fx_stream, None, None
+        if stream is not None:
+            for block in stream.tail():
+                yield block, stream.sample_rate
 
     # ------------------------------------------------------------------
     # Oeffentliche API
@@ -245,7 +323,8 @@ class TTSHandler:
         """
         Spricht den gesamten Text.
 
-        Intern: zerlegt in Saetze, synthesisiert + spielt jeden sofort.
+        Intern: zerlegt in Saetze und reicht alle an die Pipeline; die
+        Synthese laeuft der Wiedergabe einen Satz voraus.
         Returns True wenn vollstaendig, False wenn durch stop_event unterbrochen.
         """
         if not text.strip():
@@ -258,14 +337,14 @@ class TTSHandler:
         if not sentences:
             sentences = [text.strip()]
 
+        pipe = self._open_pipeline(evt)
         for sentence in sentences:
-            if evt.is_set():
-                logger.info("TTS unterbrochen vor Satz: '%s...'", sentence[:40])
-                return False
-            if not self._speak_sentence(sentence, evt):
-                return False
-
-        return True
+            self._feed(pipe, sentence)
+        completed = pipe.finish()
+        if not completed:
+            self._cancel_prefetch()
+            logger.info("TTS unterbrochen: '%s...'", text[:40])
+        return completed
 
     def set_voice(self, role: str) -> bool:
         """
@@ -320,205 +399,341 @@ class TTSHandler:
         Nimmt LLM-Text-Chunks entgegen und spricht Satz fuer Satz sobald
         eine Satzgrenze erkannt wird.
 
-        Ermoeglicht < 500ms First-Audio-Latenz beim Streaming-LLM.
+        Ermoeglicht < 500ms First-Audio-Latenz beim Streaming-LLM. Das
+        Einlesen der Chunks blockiert nicht auf die Wiedergabe: fertige
+        Saetze werden in die Pipeline gereicht und dort parallel
+        synthetisiert bzw. abgespielt.
         """
         evt = stop_event or self._stop_event
         evt.clear()
 
-        buffer = ""
-        for chunk in text_iter:
-            if evt.is_set():
-                return False
-
-            buffer += chunk
-
-            # Pruefe auf vollstaendige Saetze im Puffer
-            parts = SENTENCE_PATTERN.split(buffer)
-            if len(parts) > 1:
-                # Alle vollstaendigen Saetze aussprechen (letzter Teil ist Reste-Puffer)
-                for sentence in parts[:-1]:
-                    sentence = sentence.strip()
-                    if sentence:
-                        if not self._speak_sentence(sentence, evt):
-                            return False
-                buffer = parts[-1]  # Rest fuer naechsten Chunk aufheben
-
-        # Restlichen Puffer sprechen
-        remainder = buffer.strip()
-        if remainder and not evt.is_set():
-            self._speak_sentence(remainder, evt)
-
-        return not evt.is_set()
+        pipe = self._open_pipeline(evt)
+        try:
+            buffer = ""
+            for chunk in text_iter:
+                if evt.is_set():
+                    return False
+
+                buffer += chunk
+
+                # Pruefe auf vollstaendige Saetze im Puffer
+                parts = SENTENCE_PATTERN.split(buffer)
+                if len(parts) > 1:
+                    # Alle vollstaendigen Saetze einreihen (letzter Teil ist Reste-Puffer)
+                    for sentence in parts[:-1]:
+                        sentence = sentence.strip()
+                        if sentence:
+                            self._feed(pipe, sentence)
+                    buffer = parts[-1]  # Rest fuer naechsten Chunk aufheben
+
+            # Restlichen Puffer einreihen
+            remainder = buffer.strip()
+            if remainder:
+                self._feed(pipe, remainder)
+        finally:
+            completed = pipe.finish()
+            if not completed:
+                self._cancel_prefetch()
+
+        return completed
 
     def stop(self) -> None:
         """Unterbricht laufende TTS-Ausgabe sofort."""
         self._stop_event.set()
+        self._cancel_prefetch()
         logger.info("TTS gestoppt.")
 
+    def _cancel_synthesis(self) -> None:
+        """Barge-in: bricht die laufende Edge-Anfrage des Synthese-Workers ab."""
+        request = self._edge_inflight
+        if request is not None:
+            request.cancel()
+
+    def _cancel_prefetch(self) -> None:
+        if self._edge_available:
+            from audio.edge_client import get_edge_client
+            get_edge_client().cancel_prefetched()
+
     # ------------------------------------------------------------------
-    # Satz-Synthese + Wiedergabe
+    # Satz-Synthese (Pipeline-Stufe 1)
     # ------------------------------------------------------------------
 
-    def _speak_sentence(self, sentence: str, stop_event: threading.Event) -> bool:
-        """
-        Synthetisiert einen Satz und spielt ihn ab.
-        Prueft stop_event zwischen Playback-Chunks (Barge-in Granularitaet).
-        Returns True wenn vollstaendig abgespielt.
-        """
+    def _open_pipeline(self, stop_event: threading.Event) -> SpeechPipeline:
+        # Neue Aeusserung: ein abgebrochener Stream klingt nicht nach,
+        # vorab angefragte Edge-Saetze einer abgebrochenen Aeusserung verfallen
+        self._fx_stream, self._fx_key = None, None
+        self._cancel_prefetch()
+        return SpeechPipeline(
+            self._synthesize_sentence, self._speak_direct, stop_event,
+            tail=self._effect_tail, cancel=self._cancel_synthesis,
+        )
+
+    def _feed(self, pipe: SpeechPipeline, sentence: str) -> None:
+        """Bereitet einen Satz auf und reiht ihn mit der aktuellen Stimme ein."""
         sentence = _preprocess_german(sentence)
         logger.debug("TTS: '%s...'", sentence[:50])
+        voice = self._voice_snapshot()
+        # Erst anfragen, dann einreihen: der Synthese-Worker findet die Anfrage vor
+        self._prefetch(sentence, voice)
+        pipe.feed(sentence, voice)
+
+    def _voice_snapshot(self) -> _Voice:
+        return _Voice(
+            self._current_role, self._piper_voice_id,
+            self._current_edge_voice, self._current_preset,
+        )
 
-        # Edge-Routing: wenn aktive Stimme eine Edge-Stimme ist
-        voice_id = VOICE_REGISTRY.get(self._current_role, "")
-        if voice_id.startswith("edge:") and self._is_edge_available():
-            return self._edge_speak(sentence, stop_event)
-
+    def _synthesize_sentence(self, sentence: str, voice: _Voice) -> Iterator[_Pcm | None]:
+        """
+        Synthetisiert einen Satz blockweise inkl. Effekten (Synthese-Worker).
+        Yieldet (samples, sample_rate) sobald ein Block fertig ist, bzw.
+        einmal None fuer Backends ohne PCM (pyttsx3/Stub) — die spricht der
+        Wiedergabe-Worker direkt.
+        """
+        for pcm in self._dry_stream(sentence, voice):
+            if pcm is None:
+                yield None
+                return
+            yield from self._effect_blocks(pcm[0], pcm[1], voice.preset)
+
+    def _route(self, voice: _Voice) -> tuple[str, str, float]:
+        """(Backend, Stimmen-ID, Tempo) fuer einen Satz mit dieser Stimme."""
+        # Edge-Routing: wenn die Stimme der Rolle eine Edge-Stimme ist
+        registry_id = VOICE_REGISTRY.get(voice.role, "")
+        if registry_id.startswith("edge:") and self._is_edge_available():
+            return "edge", voice.edge_voice, 1.0
         if self._backend == "piper":
-            return self._piper_speak(sentence, stop_event)
-        elif self._backend == "edge":
-            return self._edge_speak(sentence, stop_event)
-        elif self._backend == "kokoro_onnx":
-            return self._kokoro_speak(sentence, stop_event)
-        elif self._backend == "pyttsx3":
-            if stop_event.is_set():
-                return False
-            self._pyttsx3_speak(sentence)
-            return True
-        else:
-            if stop_event.is_set():
-                return False
-            print(f"[TTS] {sentence}")
-            return True
-
-    def _playback_with_effects(
-        self, samples, sample_rate: int, stop_event: threading.Event
-    ) -> bool:
-        """Wendet Effekte an und spielt Audio mit Barge-in Check ab."""
-        import sounddevice as sd
-        import time
-
-        # Effekte anwenden
-        samples = self._apply_effects(samples, sample_rate)
-
-        if stop_event.is_set():
-            return False
+            return "piper", voice.piper_voice_id, self._piper_speed
+        if self._backend == "edge":
+            return "edge", voice.edge_voice, 1.0
+        if self._backend == "kokoro_onnx":
+            return "kokoro_onnx", self._voice, self._speed
+        return self._backend, "", 1.0
+
+    def _dry_stream(self, sentence: str, voice: _Voice) -> Iterator[_Pcm | None]:
+        """
+        PCM eines Satzes ohne Effekte: aus dem Phrasen-Cache, sonst vom
+        Backend. Vollstaendig und ohne Fallback synthetisierte Saetze werden
+        danach gecacht (ein abgebrochener Generator schreibt nichts).
+        """
+        backend, voice_id, speed = self._route(voice)
+        if backend not in ("edge", "piper", "kokoro_onnx"):
+            yield None
+            return
 
-        # Non-blocking play + poll fuer Barge-in
-        sd.play(samples, samplerate=sample_rate, blocking=False)
-        while sd.get_stream().active:
-            if stop_event.is_set():
-                sd.stop()
-                logger.info("TTS Barge-in: Wiedergabe gestoppt.")
-                return False
-            time.sleep(0.02)  # 20ms Poll-Intervall
+        cache = get_phrase_cache() if len(sentence) <= TTS_CACHE_MAX_CHARS else None
+        key = phrase_key(sentence, backend, voice_id, speed)
+        if cache is not None:
+            hit = cache.get(key)
+            if hit is not None:
+                yield hit
+                return
+
+        if backend == "edge":
+            blocks = self._edge_stream(sentence, voice)
+        elif backend == "piper":
+            blocks = self._piper_stream(sentence, voice_id)
+        else:
+            blocks = self._kokoro_stream(sentence)
+
+        collected: list[_Pcm] | None = [] if cache is not None else None
+        for pcm in blocks:
+            if pcm is _NO_CACHE:
+                collected = None
+                continue
+            if pcm is None:
+                yield None
+                return
+            if collected is not None:
+                collected.append(pcm)
+            yield pcm
+        if collected:
+            cache.put_blocks(key, collected)
+
+    def prewarm(self, phrases: Iterable[tuple[str, str]]) -> int:
+        """
+        Synthetisiert bekannte Phrasen (Rolle, Text) vorab in den
+        Phrasen-Cache, ohne sie abzuspielen. Gibt die Anzahl neu
+        gecachter Saetze zurueck.
+        """
+        cache = get_phrase_cache()
+        if cache is None:
+            logger.warning("TTS-Cache deaktiviert (TTS_CACHE_ENABLED=0) — kein Pre-Warm.")
+            return 0
+        added = 0
+        for role, text in phrases:
+            voice = self._voice_for_role(role)
+            for sentence in split_sentences(text):
+                sentence = _preprocess_german(sentence)
+                key = phrase_key(sentence, *self._route(voice))
+                if key in cache:
+                    continue
+                for _ in self._dry_stream(sentence, voice):
+                    pass
+                added += key in cache
+        logger.info("TTS-Cache Pre-Warm: %d neue Saetze (%s)", added, cache.stats())
+        return added
+
+    def preload(self, roles: Iterable[str]) -> list[str]:
+        """
+        Laedt die Modelle der Rollen vorab und waermt sie mit einem kurzen
+        Satz auf (Vorlade-Thread, audio/preload.py). Piper-Stimmen nur bis
+        PIPER_CACHE_MB. Gibt die bereiten Stimmen-IDs zurueck.
+        """
+        ready: list[str] = []
+        seen: set[tuple[str, str]] = set()
+        for role in roles:
+            if role not in VOICE_REGISTRY:
+                logger.warning("Vorladen: unbekannte Rolle '%s' uebersprungen.", role)
+                continue
+            backend, voice_id, _ = self._route(self._voice_for_role(role))
+            if (backend, voice_id) in seen:
+                continue
+            seen.add((backend, voice_id))
+            if backend == "piper":
+                if voice_id not in self._piper_models and self._piper_models.full:
+                    logger.info("Vorladen: PIPER_CACHE_MB erreicht — '%s' bleibt lazy.", voice_id)
+                    continue
+                piper_voice = self._ensure_piper_loaded(voice_id)
+                if piper_voice is None:
+                    continue
+                for _ in piper_voice.synthesize(_WARMUP_TEXT):
+                    pass
+            elif backend == "kokoro_onnx":
+                self._ensure_kokoro_loaded()
+                if self._kokoro is None:
+                    continue
+                self._kokoro.create(_WARMUP_TEXT, voice=voice_id, speed=self._speed, lang=self._lang)
+            elif backend == "edge":
+                # Online: nur den persistenten Loop starten, keine Anfrage
+                from audio.edge_client import get_edge_client
+                get_edge_client()
+            else:
+                continue
+            ready.append(voice_id)
+            logger.info("Stimme vorgeladen: %s (%s, Rolle '%s')", voice_id, backend, role)
+        if self._backend in ("piper", "edge", "kokoro_onnx"):
+            self._ensure_effects()
+        return ready
+
+    def _voice_for_role(self, role: str) -> _Voice:
+        """Stimmen-Snapshot fuer eine Rolle, ohne die aktive Stimme zu aendern."""
+        if role not in VOICE_REGISTRY:
+            role = DEFAULT_VOICE
+        target_id = VOICE_REGISTRY[role]
+        if target_id.startswith("edge:"):
+            return _Voice(role, EDGE_FALLBACK.get(role, self._piper_voice_id), target_id[5:], "clean")
+        return _Voice(role, target_id, self._current_edge_voice, "clean")
 
-        return True
+    def _speak_direct(self, sentence: str) -> None:
+        """Ausgabe ohne PCM (pyttsx3 bzw. Stub), im Wiedergabe-Worker."""
+        if self._backend == "stub":
+            print(f"[TTS] {sentence}")
+        else:
+            self._pyttsx3_speak(sentence)
 
-    def _piper_speak(self, sentence: str, stop_event: threading.Event) -> bool:
-        """Piper TTS Synthese + non-blocking Wiedergabe mit Barge-in Check."""
+    def _piper_stream(self, sentence: str, voice_id: str) -> Iterator[_Pcm | None]:
+        """Piper TTS: reicht jeden AudioChunk sofort weiter (Downgrade zu Kokoro)."""
+        yielded = False
         try:
-            import numpy as np
-
-            self._ensure_piper_loaded(self._piper_voice_id)
-            if self._active_piper is None:
+            piper_voice = self._ensure_piper_loaded(voice_id)
+            if piper_voice is None:
                 # Downgrade zu Kokoro
-                return self._kokoro_speak(sentence, stop_event)
+                yield _NO_CACHE
+                yield from self._kokoro_stream(sentence)
+                return
 
-            chunks = list(self._active_piper.synthesize(sentence))
-            if not chunks:
-                return True
-
-            samples = np.concatenate([c.audio_float_array for c in chunks])
-            sample_rate = chunks[0].sample_rate
-
-            return self._playback_with_effects(samples, sample_rate, stop_event)
+            for chunk in piper_voice.synthesize(sentence):
+                yielded = True
+                yield chunk.audio_float_array, chunk.sample_rate
 
         except Exception as exc:
-            logger.error("Piper Wiedergabe-Fehler: %s — Downgrade zu Kokoro", exc)
-            return self._kokoro_speak(sentence, stop_event)
+            if yielded:
+                logger.error("Piper Synthese-Fehler mitten im Satz: %s — Rest verworfen", exc)
+                yield _NO_CACHE
+                return
+            logger.error("Piper Synthese-Fehler: %s — Downgrade zu Kokoro", exc)
+            yield _NO_CACHE
+            yield from self._kokoro_stream(sentence)
+
+    def _edge_stream(self, sentence: str, voice: _Voice) -> Iterator[_Pcm | None]:
+        """
+        Edge TTS ueber den persistenten Loop (audio/edge_client.py): MP3-Chunks
+        werden inkrementell dekodiert und blockweise weitergereicht.
+        """
+        from audio.edge_client import EdgeCancelled, Mp3Decoder, get_edge_client
 
-    def _edge_speak(self, sentence: str, stop_event: threading.Event) -> bool:
-        """Edge TTS Synthese (async) + non-blocking Wiedergabe."""
+        request = None
+        yielded = False
         try:
-            import asyncio
-            import io
-            import numpy as np
-            import soundfile as sf  # type: ignore[import]
-
-            async def _synthesize() -> bytes:
-                import edge_tts  # type: ignore[import]
-                communicate = edge_tts.Communicate(
-                    sentence, self._current_edge_voice
-                )
-                audio_bytes = b""
-                async for chunk in communicate.stream():
-                    if chunk["type"] == "audio":
-                        audio_bytes += chunk["data"]
-                return audio_bytes
-
-            # Event-Loop: async Bridge
-            try:
-                loop = asyncio.get_running_loop()
-            except RuntimeError:
-                loop = None
-
-            if loop and loop.is_running():
-                # Innerhalb eines laufenden Loops: neuen Thread nutzen
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
-                    mp3_bytes = pool.submit(
-                        lambda: asyncio.run(_synthesize())
-                    ).result(timeout=30)
-            else:
-                mp3_bytes = asyncio.run(_synthesize())
-
-            if not mp3_bytes or stop_event.is_set():
-                return not stop_event.is_set()
-
-            # MP3 → numpy float32
-            audio_buf = io.BytesIO(mp3_bytes)
-            samples, sample_rate = sf.read(audio_buf, dtype="float32")
-
-            # Stereo → Mono falls noetig
-            if samples.ndim > 1:
-                samples = samples.mean(axis=1)
-
-            return self._playback_with_effects(samples, sample_rate, stop_event)
-
+            request = get_edge_client().take(sentence, voice.edge_voice)
+            self._edge_inflight = request
+            decoder = Mp3Decoder()
+            for data in request.chunks():
+                pcm = decoder.feed(data)
+                if pcm is not None:
+                    yielded = True
+                    yield pcm
+            pcm = decoder.finish()
+            if pcm is not None:
+                yielded = True
+                yield pcm
+        except EdgeCancelled:
+            # Barge-in: Satz verworfen, kein Fallback und kein Cache-Eintrag
+            yield _NO_CACHE
         except Exception as exc:
+            if yielded:
+                logger.error("Edge TTS Fehler mitten im Satz: %s — Rest verworfen", exc)
+                yield _NO_CACHE
+                return
             logger.error("Edge TTS Fehler: %s — Fallback auf Piper", exc)
             # Fallback auf Piper mit Edge-Fallback-Stimme
-            if self._current_role in EDGE_FALLBACK:
-                old_voice = self._piper_voice_id
-                self._piper_voice_id = EDGE_FALLBACK[self._current_role]
-                result = self._piper_speak(sentence, stop_event)
-                self._piper_voice_id = old_voice
-                return result
-            return self._piper_speak(sentence, stop_event)
-
-    def _kokoro_speak(self, sentence: str, stop_event: threading.Event) -> bool:
-        """Kokoro-82M (kokoro-onnx) Synthese + non-blocking Wiedergabe."""
-        try:
-            import numpy as np
+            fallback = EDGE_FALLBACK.get(voice.role, voice.piper_voice_id)
+            yield _NO_CACHE
+            yield from self._piper_stream(sentence, fallback)
+        finally:
+            # Barge-in: Generator geschlossen -> Anfrage abbrechen
+            if request is not None:
+                self._edge_inflight = None
+                request.cancel()
+
+    def _prefetch(self, sentence: str, voice: _Voice) -> None:
+        """Fragt Edge-Saetze schon beim Einreihen an (nicht bei Cache-Treffern)."""
+        backend, voice_id, speed = self._route(voice)
+        if backend != "edge":
+            return
+        cache = get_phrase_cache()
+        if (cache is not None and len(sentence) <= TTS_CACHE_MAX_CHARS
+                and phrase_key(sentence, backend, voice_id, speed) in cache):
+            return
+        from audio.edge_client import get_edge_client
+        get_edge_client().prefetch(sentence, voice_id)
 
+    def _kokoro_stream(self, sentence: str) -> Iterator[_Pcm | None]:
+        """Kokoro-82M: create_stream() blockweise, sonst create(); None -> pyttsx3."""
+        yielded = False
+        try:
             self._ensure_kokoro_loaded()
             if self._kokoro is None:
-                self._pyttsx3_speak(sentence)
-                return True
-
-            samples, sample_rate = self._kokoro.create(
-                sentence,
-                voice=self._voice,
-                speed=self._speed,
-                lang=self._lang,
-            )
-
-            return self._playback_with_effects(samples, sample_rate, stop_event)
+                yield None
+                return
+
+            kwargs = {"voice": self._voice, "speed": self._speed, "lang": self._lang}
+            create_stream = getattr(self._kokoro, "create_stream", None)
+            if create_stream is None:
+                yielded = True
+                yield self._kokoro.create(sentence, **kwargs)
+                return
+            for samples, sample_rate in _iter_async(create_stream(sentence, **kwargs)):
+                yielded = True
+                yield samples, sample_rate
 
         except Exception as exc:
-            logger.error("Kokoro-ONNX Wiedergabe-Fehler: %s", exc)
-            self._pyttsx3_speak(sentence)
-            return True
+            logger.error("Kokoro-ONNX Synthese-Fehler: %s", exc)
+            if not yielded:
+                yield None
+            else:
+                yield _NO_CACHE
 
     def _pyttsx3_speak(self, text: str) -> None:
         try:
@@ -554,30 +769,41 @@ class TTSHandler:
             return False
         try:
             import edge_tts  # type: ignore[import]  # noqa: F401
-            import soundfile  # type: ignore[import]  # noqa: F401
-            self._edge_available = True
+            from audio.edge_client import Mp3Decoder
+            self._edge_available = Mp3Decoder.available()
         except ImportError:
             self._edge_available = False
-            logger.info("edge-tts/soundfile nicht installiert — Edge Stimmen deaktiviert.")
+        if not self._edge_available:
+            logger.info("edge-tts bzw. PyAV/soundfile nicht installiert — Edge Stimmen deaktiviert.")
         return self._edge_available
 
     # ------------------------------------------------------------------
     # Model-Lazy-Loading
     # ------------------------------------------------------------------
 
-    def _ensure_piper_loaded(self, voice_id: str) -> None:
+    def _ensure_piper_loaded(self, voice_id: str) -> Any:
         """
-        Laedt ein spezifisches Piper TTS Modell (lazy).
-        Wechselt self._active_piper auf das angeforderte Modell.
+        Laedt ein spezifisches Piper TTS Modell (lazy) und gibt es zurueck,
+        None wenn die Stimme nicht ladbar ist. Geladene Modelle liegen im
+        LRU (PIPER_CACHE_MB); parallele Anfragen derselben Stimme
+        (Vorladen + Synthese) laden nur einmal.
         """
         if voice_id in self._piper_failed_voices:
-            return
+            return None
 
         # Check Cache
-        if voice_id in self._piper_models:
-            self._active_piper = self._piper_models[voice_id]
-            return
-
+        cached = self._piper_models.get(voice_id)
+        if cached is not None:
+            return cached
+
+        lock = self._piper_locks.setdefault(voice_id, threading.Lock())
+        with lock:
+            cached = self._piper_models.get(voice_id)
+            if cached is None and voice_id not in self._piper_failed_voices:
+                cached = self._load_piper(voice_id)
+        return cached
+
+    def _load_piper(self, voice_id: str) -> Any:
         try:
             import urllib.request
             from piper import PiperVoice  # type: ignore[import]
@@ -617,7 +843,11 @@ class TTSHandler:
                 if not fpath.exists():
                     url = BASE_URL + fname
                     logger.info("Lade Piper-Datei '%s' von HuggingFace...", fname)
-                    urllib.request.urlretrieve(url, fpath)
+                    # Atomar: ein abgebrochener Download (z.B. Vorlade-Thread
+                    # beim Beenden) hinterlaesst keine halbe Datei
+                    tmp = fpath.with_name(fpath.name + ".part")
+                    urllib.request.urlretrieve(url, tmp)
+                    os.replace(tmp, fpath)
                     size_mb = fpath.stat().st_size // 1_000_000
                     logger.info("'%s' heruntergeladen (%d MB).", fname, size_mb)
                 else:
@@ -625,13 +855,15 @@ class TTSHandler:
 
             # Laden und Cachen
             voice = PiperVoice.load(str(model_path), config_path=str(config_path))
-            self._piper_models[voice_id] = voice
-            self._active_piper = voice
+            # Speicherbedarf ~ Groesse der ONNX-Gewichte
+            self._piper_models.put(voice_id, voice, model_path.stat().st_size)
             logger.info("Piper Stimme geladen: %s", voice_id)
+            return voice
 
         except Exception as exc:
             logger.warning("Piper Laden fuer '%s' fehlgeschlagen: %s", voice_id, exc)
             self._piper_failed_voices.add(voice_id)
+            return None
 
     def _ensure_kokoro_loaded(self) -> None:
         """
@@ -639,6 +871,11 @@ class TTSHandler:
         """
         if self._kokoro is not None or self._kokoro_load_failed:
             return
+        with self._kokoro_lock:
+            if self._kokoro is None and not self._kokoro_load_failed:
+                self._load_kokoro()
+
+    def _load_kokoro(self) -> None:
         try:
             import urllib.request
 
@@ -665,7 +902,9 @@ class TTSHandler:
                         fname,
                         "300 MB" if "onnx" in fname else "10 MB",
                     )
-                    urllib.request.urlretrieve(url, fpath)
+                    tmp = fpath.with_name(fpath.name + ".part")
+                    urllib.request.urlretrieve(url, tmp)
+                    os.replace(tmp, fpath)
                     size_mb = fpath.stat().st_size // 1_000_000
                     logger.info("'%s' heruntergeladen (%d MB).", fname, size_mb)
                 else:
@@ -0,0 +1,311 @@
+"""
+audio/tts_pipeline.py — Zweistufige TTS-Pipeline (Synthese || Wiedergabe)
+
+Bisher lief pro Satz: synthetisieren -> abspielen -> naechster Satz. Die
+Synthesezeit des Folgesatzes war als Pause hoerbar. Die Pipeline trennt
+beide Stufen:
+
+  feed(satz) -> [Eingangs-Queue] -> Synthese-Worker -> [Ready-Queue, begrenzt]
+             -> Wiedergabe-Worker -> AudioOutput (persistenter Ring-Buffer-Stream)
+
+Waehrend Satz N spielt, wird Satz N+1 bereits synthetisiert. Die Synthese
+liefert Bloecke (Piper-Chunks, Kokoro-Stream), die sofort weitergereicht
+werden — der erste Block eines Satzes spielt, bevor der Satz fertig
+synthetisiert ist. Die Ready-Queue ist begrenzt (TTS_PIPELINE_DEPTH Bloecke),
+damit die Synthese nicht beliebig weit vorausrennt (Speicher, Stimmwechsel).
+
+Effekt-Ausklang: der optionale tail-Callback liefert nach dem letzten Satz
+noch PCM-Bloecke (Hall/Delay des EffectStream), bevor die Ausgabe drainiert.
+
+Metriken pro Satz (SentenceMetrics): Zeit bis zum ersten synthetisierten
+Block, Synthesedauer, Audiodauer und Time-to-First-Audio (Einreihen bis
+Uebergabe an die Ausgabe). Nach finish() als audio/tts_metrics publiziert.
+
+Barge-in: Das stop_event wird von beiden Workern zwischen Bloecken geprueft;
+beim Setzen werden beide Queues geleert und der Ausgabe-Ring per flush()
+verworfen (kein Ausklingen gepufferter Samples).
+
+Lebensende: finish() setzt das pipeline-eigene closed-Event, bricht ueber
+den cancel-Callback eine haengende Backend-Anfrage ab (z.B. Edge) und
+wartet ohne Timeout auf den Synthese-Worker. Das stop_event wird vom
+Aufrufer fuer die naechste Aeusserung wiederverwendet (clear()) — ein
+Worker darf die eigene Pipeline daher nicht ueberleben.
+
+Verwendung:
+    pipe = SpeechPipeline(synthesize, speak_direct, stop_event)
+    pipe.feed("Erster Satz.", voice)
+    pipe.feed("Zweiter Satz.", voice)
+    completed = pipe.finish()
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable
+
+from audio.output_stream import AudioOutput, get_audio_output
+
+logger = logging.getLogger("ARS.audio.tts_pipeline")
+
+# Max. fertig synthetisierte Audio-Bloecke, die auf Wiedergabe warten
+TTS_PIPELINE_DEPTH = max(1, int(os.getenv("TTS_PIPELINE_DEPTH", "8")))
+
+_POLL = 0.05              # Sekunden — Queue-Timeouts fuer stop_event-Checks
+
+_END = object()           # Sentinel: Eingabe abgeschlossen
+
+# synthesize(satz, voice) -> Iterator ueber (samples, sample_rate) | None
+# (ein None-Block heisst: diesen Satz direkt sprechen, z.B. pyttsx3)
+SynthesizeFn = Callable[[str, Any], "Iterable[tuple[Any, int] | None]"]
+
+
+@dataclass
+class SentenceMetrics:
+    """Zeitstempel (time.monotonic) eines Satzes durch die Pipeline."""
+    text: str
+    fed_at: float
+    synth_start: float = 0.0
+    first_chunk: float = 0.0
+    synth_end: float = 0.0
+    first_output: float = 0.0
+    audio_s: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        def ms(a: float, b: float) -> float | None:
+            return round((b - a) * 1000.0, 1) if a and b else None
+
+        synth_ms = ms(self.synth_start, self.synth_end)
+        return {
+            "chars": len(self.text),
+            "first_chunk_ms": ms(self.synth_start, self.first_chunk),
+            "synth_ms": synth_ms,
+            "ttfa_ms": ms(self.fed_at, self.first_output),
+            "audio_ms": round(self.audio_s * 1000.0, 1),
+            "rtf": round(synth_ms / (self.audio_s * 1000.0), 3)
+                   if synth_ms and self.audio_s else None,
+        }
+
+
+class SpeechPipeline:
+    """
+    Synthese-Worker + begrenzte PCM-Queue + Wiedergabe-Worker.
+
+    synthesize laeuft ausschliesslich im Synthese-Thread, speak_direct
+    (pyttsx3/Stub, kein PCM) ausschliesslich im Wiedergabe-Thread; die
+    Satzreihenfolge bleibt in beiden Faellen erhalten.
+    """
+
+    def __init__(
+        self,
+        synthesize: SynthesizeFn,
+        speak_direct: Callable[[str], None],
+        stop_event: threading.Event,
+        depth: int = TTS_PIPELINE_DEPTH,
+        output: AudioOutput | None = None,
+        tail: Callable[[], "Iterable[tuple[Any, int]]"] | None = None,
+        cancel: Callable[[], None] | None = None,
+    ) -> None:
+        self._synthesize = synthesize
+        self._tail = tail
+        self._cancel = cancel
+        self._speak_direct = speak_direct
+        self._stop = stop_event
+        self._closed = threading.Event()     # nur diese Pipeline, nie zurueckgesetzt
+        self._pending: queue.Queue = queue.Queue()
+        self._ready: queue.Queue = queue.Queue(maxsize=depth)
+        self._output = output or get_audio_output()
+        self._output_failed = False
+        self._fallback_spoken: SentenceMetrics | None = None
+        self.metrics: list[SentenceMetrics] = []
+        self._synth_thread = threading.Thread(
+            target=self._run_synthesis, daemon=True, name="ars-tts-synth",
+        )
+        self._play_thread = threading.Thread(
+            target=self._run_playback, daemon=True, name="ars-tts-play",
+        )
+        self._synth_thread.start()
+        self._play_thread.start()
+
+    # ------------------------------------------------------------------
+    # Oeffentliche API
+    # ------------------------------------------------------------------
+
+    def feed(self, sentence: str, voice: Any = None) -> None:
+        """Reiht einen Satz ein (kehrt sofort zurueck)."""
+        if not self._stop.is_set():
+            m = SentenceMetrics(sentence, time.monotonic())
+            self.metrics.append(m)
+            self._pending.put((m, voice))
+
+    def finish(self) -> bool:
+        """
+        Schliesst die Eingabe und wartet bis alles gespielt ist.
+        Returns True wenn vollstaendig, False bei Barge-in.
+        """
+        self._pending.put(_END)
+        # Join mit Timeout, damit stop_event auch hier sofort greift
+        while self._play_thread.is_alive():
+            self._play_thread.join(timeout=_POLL)
+            if self._stop.is_set():
+                self._flush()
+        completed = not self._stop.is_set()
+        # Synthese-Worker beenden, bevor der Aufrufer stop_event zuruecksetzt
+        self._closed.set()
+        if not completed and self._cancel is not None:
+            try:
+                self._cancel()
+            except Exception as exc:
+                logger.debug("TTS Synthese abbrechen: %s", exc)
+        self._flush()
+        self._synth_thread.join()
+        self._emit_metrics(completed)
+        return completed
+
+    def _aborted(self) -> bool:
+        return self._stop.is_set() or self._closed.is_set()
+
+    def _emit_metrics(self, completed: bool) -> None:
+        sentences = [m.as_dict() for m in self.metrics if m.synth_start]
+        if not sentences:
+            return
+        first = sentences[0]
+        logger.debug(
+            "TTS: %d Saetze, erster Block %s ms, TTFA %s ms",
+            len(sentences), first["first_chunk_ms"], first["ttfa_ms"],
+        )
+        try:
+            from core.event_bus import EventBus
+            EventBus.get().emit("audio", "tts_metrics", {
+                "completed": completed,
+                "ttfa_ms": first["ttfa_ms"],
+                "sentences": sentences,
+            })
+        except Exception:
+            pass
+
+    # ------------------------------------------------------------------
+    # Worker
+    # ------------------------------------------------------------------
+
+    def _run_synthesis(self) -> None:
+        while not self._aborted():
+            try:
+                item = self._pending.get(timeout=_POLL)
+            except queue.Empty:
+                continue
+            if item is _END:
+                if self._emit_tail():
+                    self._put_ready(_END)
+                return
+            metrics, voice = item
+            if not self._synthesize_one(metrics, voice):
+                return
+        self._flush()
+
+    def _synthesize_one(self, metrics: SentenceMetrics, voice: Any) -> bool:
+        """Reicht die Bloecke eines Satzes weiter; False bei Barge-in."""
+        metrics.synth_start = time.monotonic()
+        chunks = None
+        try:
+            chunks = iter(self._synthesize(metrics.text, voice))
+            for pcm in chunks:
+                if not metrics.first_chunk:
+                    metrics.first_chunk = time.monotonic()
+                if pcm is not None:
+                    metrics.audio_s += len(pcm[0]) / pcm[1]
+                if not self._put_ready((metrics, pcm)):
+                    return False
+        except Exception as exc:
+            logger.error("TTS Synthese-Fehler: %s", exc)
+        finally:
+            metrics.synth_end = time.monotonic()
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                close()
+        return True
+
+    def _emit_tail(self) -> bool:
+        """Reicht den Effekt-Ausklang nach dem letzten Satz weiter; False bei Barge-in."""
+        if self._tail is None or not self.metrics:
+            return True
+        last = self.metrics[-1]
+        try:
+            for pcm in self._tail():
+                if not self._put_ready((last, pcm)):
+                    return False
+        except Exception as exc:
+            logger.debug("TTS Effekt-Ausklang: %s", exc)
+        return True
+
+    def _put_ready(self, item: Any) -> bool:
+        """Blockiert bei voller Ready-Queue, bricht aber bei stop_event/closed ab."""
+        while not self._aborted():
+            try:
+                self._ready.put(item, timeout=_POLL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _run_playback(self) -> None:
+        try:
+            while not self._aborted():
+                try:
+                    item = self._ready.get(timeout=_POLL)
+                except queue.Empty:
+                    continue
+                if item is _END:
+                    return
+                metrics, pcm = item
+                if pcm is not None and len(pcm[0]) == 0:
+                    continue
+                if not metrics.first_output:
+                    metrics.first_output = time.monotonic()
+                if pcm is None:
+                    self._speak_direct(metrics.text)
+                    continue
+                if not self._play(metrics, pcm[0], pcm[1]):
+                    return
+        finally:
+            try:
+                if self._stop.is_set():
+                    self._output.flush()
+                else:
+                    self._output.drain(self._stop)
+            except Exception as exc:
+                logger.debug("TTS Ausgabe abschliessen: %s", exc)
+            if self._stop.is_set():
+                self._flush()
+
+    def _play(self, metrics: SentenceMetrics, samples: Any, sample_rate: int) -> bool:
+        if self._output_failed:
+            self._speak_fallback(metrics)
+            return True
+        try:
+            return self._output.write(samples, sample_rate, self._stop)
+        except Exception as exc:
+            # Kein Audio-Device / PortAudio-Fehler: Rest der Aeusserung als Text
+            logger.error("TTS Wiedergabe-Fehler: %s", exc)
+            self._output_failed = True
+            self._speak_fallback(metrics)
+            return True
+
+    def _speak_fallback(self, metrics: SentenceMetrics) -> None:
+        """Direktausgabe ohne Device — pro Satz nur einmal (nicht pro Block)."""
+        if self._fallback_spoken is not metrics:
+            self._fallback_spoken = metrics
+            self._speak_direct(metrics.text)
+
+    def _flush(self) -> None:
+        """Verwirft alle wartenden Saetze und PCM-Puffer (Barge-in)."""
+        for q in (self._pending, self._ready):
+            while True:
+                try:
+                    q.get_nowait()
+                except queue.Empty:
+                    break
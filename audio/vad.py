@@ -0,0 +1,267 @@
+"""
+audio/vad.py — VAD-Stufe: Energie-Vorfilter + Silero (ONNX Runtime oder torch)
+
+Bisher lief jeder 32ms-Block einzeln durch torch-Silero
+(torch.from_numpy(...).unsqueeze(0) + Forward), auch bei offensichtlicher
+Stille. Auf reinen CPU-Rechnern kostete das einen Kern — in Konkurrenz zu
+Whisper und Piper.
+
+  PreGate     — RMS + Nulldurchgangsrate pro Block (vektorisiert ueber
+                einen ganzen Rueckstau). Nur Bloecke mit Energie und
+                sprachtypischer ZCR gehen an Silero; nach einem Treffer
+                bleibt das Tor HANGOVER_BLOCKS offen, damit Zischlaute und
+                Silbenenden das (zustandsbehaftete) Modell weiter erreichen.
+  SileroVad   — probs(bloecke) verarbeitet einen Rueckstau (k, 512) in
+                einem Aufruf: ein Tensor/Array fuer alle Bloecke, ein
+                no_grad-Kontext bzw. eine enge numpy-Schleife. Der
+                RNN-Zustand laeuft ueber die Bloecke weiter (Silero ist
+                zeitlich sequenziell, kein Batch ueber die Zeitachse).
+      "onnx"  — silero_vad.onnx via onnxruntime, ohne torch,
+                intra/inter-op Threads = VAD_THREADS. Optional dynamisch
+                int8-quantisiert (VAD_QUANTIZE=1, einmalig auf Disk).
+      "torch" — silero-vad JIT (pip-Paket bzw. torch.hub),
+                torch.set_num_threads(VAD_THREADS).
+
+Konfiguration via .env:
+  VAD_BACKEND=auto        # auto (onnx wenn moeglich) | onnx | torch
+  VAD_THREADS=1           # CPU-Threads fuer die VAD-Inferenz
+  VAD_ONNX_MODEL=         # eigener Modellpfad (sonst silero-vad Paketdaten)
+  VAD_QUANTIZE=0          # 1 = int8-dynamisch quantisiertes ONNX-Modell
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+
+import numpy as np
+
+logger = logging.getLogger("ARS.audio.vad")
+
+SAMPLE_RATE = 16_000
+CHUNK_SIZE  = 512
+
+VAD_BACKEND    = os.getenv("VAD_BACKEND", "auto").lower()
+VAD_THREADS    = max(1, int(os.getenv("VAD_THREADS", "1")))
+VAD_ONNX_MODEL = os.getenv("VAD_ONNX_MODEL", "")
+VAD_QUANTIZE   = os.getenv("VAD_QUANTIZE", "0") == "1"
+
+RMS_GATE        = 0.01    # darunter: Stille
+ZCR_MAX         = 0.45    # darueber (bei wenig Energie): Rauschen/Luefter
+ZCR_LOUD_FACTOR = 4.0     # ab RMS_GATE * Faktor zaehlt die ZCR nicht mehr
+HANGOVER_BLOCKS = 8       # ~256ms offen nach dem letzten Treffer
+
+_MODEL_DIR = Path(__file__).parent.parent / "data" / "models"
+_ONNX_URL = (
+    "https://github.com/snakers4/silero-vad/raw/master/"
+    "src/silero_vad/data/silero_vad.onnx"
+)
+_CONTEXT = 64             # Silero v5: Samples Kontext aus dem Vorblock (16 kHz)
+
+
+def block_features(blocks: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """RMS und Nulldurchgangsrate fuer (k, 512)-Bloecke in einem Durchgang."""
+    rms = np.sqrt(np.einsum("ij,ij->i", blocks, blocks) / blocks.shape[1])
+    signs = np.signbit(blocks)
+    zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / (blocks.shape[1] - 1)
+    return rms, zcr
+
+
+class PreGate:
+    """Energie/ZCR-Vorfilter mit Nachlauf (zustandsbehaftet, ein Strom)."""
+
+    def __init__(
+        self,
+        rms_gate: float = RMS_GATE,
+        zcr_max: float = ZCR_MAX,
+        hangover: int = HANGOVER_BLOCKS,
+    ) -> None:
+        self._rms_gate = rms_gate
+        self._zcr_max = zcr_max
+        self._hangover = hangover
+        self._open_for = 0
+        self.passed = 0
+        self.skipped = 0
+
+    def __call__(self, rms: np.ndarray, zcr: np.ndarray) -> np.ndarray:
+        """Maske (k,) der Bloecke, die an Silero gehen."""
+        hit = (rms >= self._rms_gate) & (
+            (zcr <= self._zcr_max) | (rms >= self._rms_gate * ZCR_LOUD_FACTOR)
+        )
+        mask = np.empty(len(hit), dtype=bool)
+        for i, h in enumerate(hit):
+            if h:
+                self._open_for = self._hangover
+                mask[i] = True
+            elif self._open_for > 0:
+                self._open_for -= 1
+                mask[i] = True
+            else:
+                mask[i] = False
+        n = int(mask.sum())
+        self.passed += n
+        self.skipped += len(mask) - n
+        return mask
+
+
+class SileroVad:
+    """Gemeinsame Schnittstelle der Silero-Backends."""
+
+    backend = ""
+
+    def probs(self, blocks: np.ndarray) -> np.ndarray:
+        """Sprach-Konfidenz (k,) fuer aufeinanderfolgende (k, 512)-Bloecke."""
+        raise NotImplementedError
+
+    def reset(self) -> None:
+        """Setzt den RNN-Zustand zurueck."""
+
+
+class _OnnxSilero(SileroVad):
+    backend = "onnx"
+
+    def __init__(self, model_path: Path, threads: int) -> None:
+        import onnxruntime as ort  # type: ignore[import]
+
+        opts = ort.SessionOptions()
+        opts.intra_op_num_threads = threads
+        opts.inter_op_num_threads = 1
+        opts.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        self._session = ort.InferenceSession(
+            str(model_path), sess_options=opts, providers=["CPUExecutionProvider"],
+        )
+        self._sr = np.array(SAMPLE_RATE, dtype=np.int64)
+        self._input = np.zeros((1, _CONTEXT + CHUNK_SIZE), dtype=np.float32)
+        self.reset()
+
+    def reset(self) -> None:
+        self._state = np.zeros((2, 1, 128), dtype=np.float32)
+        self._input[:] = 0.0
+
+    def probs(self, blocks: np.ndarray) -> np.ndarray:
+        out = np.empty(len(blocks), dtype=np.float32)
+        buf = self._input
+        for i, block in enumerate(blocks):
+            # Kontext = letzte 64 Samples des Vorblocks, dann der neue Block
+            buf[0, :_CONTEXT] = buf[0, -_CONTEXT:]
+            buf[0, _CONTEXT:] = block
+            prob, self._state = self._session.run(
+                None, {"input": buf, "state": self._state, "sr": self._sr},
+            )
+            out[i] = prob[0, 0]
+        return out
+
+
+class _TorchSilero(SileroVad):
+    backend = "torch"
+
+    def __init__(self, threads: int) -> None:
+        import torch  # type: ignore[import]
+
+        torch.set_num_threads(threads)
+        try:
+            # Primär: silero-vad pip-Paket
+            from silero_vad import load_silero_vad  # type: ignore[import]
+            self._model = load_silero_vad()
+        except ImportError:
+            # Fallback: torch.hub
+            self._model, _ = torch.hub.load(
+                "snakers4/silero-vad",
+                "silero_vad",
+                force_reload=False,
+                trust_repo=True,
+            )
+        self._model.eval()
+        self._torch = torch
+
+    def reset(self) -> None:
+        reset = getattr(self._model, "reset_states", None)
+        if reset is not None:
+            reset()
+
+    def probs(self, blocks: np.ndarray) -> np.ndarray:
+        torch = self._torch
+        out = np.empty(len(blocks), dtype=np.float32)
+        tensor = torch.from_numpy(np.ascontiguousarray(blocks, dtype=np.float32))
+        with torch.no_grad():
+            for i in range(len(blocks)):
+                out[i] = self._model(tensor[i:i + 1], SAMPLE_RATE).item()
+        return out
+
+
+def _onnx_model_path() -> Path | None:
+    """VAD_ONNX_MODEL, sonst silero-vad Paketdaten, sonst Download nach data/models/."""
+    if VAD_ONNX_MODEL:
+        path = Path(VAD_ONNX_MODEL)
+        return path if path.is_file() else None
+    try:
+        from importlib.resources import files
+        packaged = Path(str(files("silero_vad") / "data" / "silero_vad.onnx"))
+        if packaged.is_file():
+            return packaged
+    except Exception:
+        pass
+    local = _MODEL_DIR / "silero_vad.onnx"
+    if not local.is_file():
+        import urllib.request
+        _MODEL_DIR.mkdir(parents=True, exist_ok=True)
+        logger.info("Lade Silero VAD (ONNX) von GitHub...")
+        tmp = local.with_suffix(".tmp")
+        urllib.request.urlretrieve(_ONNX_URL, tmp)
+        os.replace(tmp, local)
+    return local
+
+
+def _quantized(model_path: Path) -> Path:
+    """int8-dynamisch quantisierte Kopie (einmalig erzeugt), sonst das Original."""
+    target = _MODEL_DIR / f"{model_path.stem}.int8.onnx"
+    if target.is_file() and target.stat().st_mtime >= model_path.stat().st_mtime:
+        return target
+    try:
+        from onnxruntime.quantization import QuantType, quantize_dynamic  # type: ignore[import]
+        _MODEL_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_suffix(".tmp.onnx")
+        quantize_dynamic(str(model_path), str(tmp), weight_type=QuantType.QInt8)
+        os.replace(tmp, target)
+        logger.info("Silero VAD int8-quantisiert: %s", target.name)
+        return target
+    except Exception as exc:
+        logger.warning("VAD-Quantisierung fehlgeschlagen (%s) — nutze fp32.", exc)
+        return model_path
+
+
+def load_vad(backend: str = VAD_BACKEND, threads: int = VAD_THREADS) -> SileroVad:
+    """
+    Laedt Silero im gewuenschten Backend. "auto": ONNX Runtime wenn
+    importierbar (kommt mit faster-whisper), sonst torch.
+    """
+    if backend in ("auto", "onnx"):
+        try:
+            path = _onnx_model_path()
+            if path is None:
+                raise FileNotFoundError(f"VAD_ONNX_MODEL nicht gefunden: {VAD_ONNX_MODEL}")
+            if VAD_QUANTIZE:
+                path = _quantized(path)
+            vad = _OnnxSilero(path, threads)
+            logger.info("Silero VAD bereit (ONNX Runtime, %d Thread(s), %s).", threads, path.name)
+            return vad
+        except Exception as exc:
+            if backend == "onnx":
+                raise
+            logger.info("Silero VAD via ONNX nicht verfuegbar (%s) — nutze torch.", exc)
+    vad = _TorchSilero(threads)
+    logger.info("Silero VAD bereit (torch, %d Thread(s)).", threads)
+    return vad
+
+
+def vad_available() -> bool:
+    """True wenn ein VAD-Backend (onnxruntime oder torch) importierbar ist."""
+    for name in ("onnxruntime", "torch"):
+        try:
+            __import__(name)
+            return True
+        except ImportError:
+            continue
+    return False
+
@@ -15,18 +15,97 @@ Kopplung:
 Konfiguration:
   - Adventure-JSON muss locations[], flags{} enthalten
   - Schema: modules/adventures/schema.json
+
+Bedingungen (requires_flag / condition) werden beim Laden einmal zu
+Closures kompiliert. Ein Rueckwaerts-Index Flag -> Clues/Locations sorgt
+dafuer, dass set_flag() nur betroffene Bedingungen neu auswertet; die
+Menge sichtbarer Clues bleibt dadurch stets aktuell.
 """
 
 from __future__ import annotations
 
 import copy
+import json
 import logging
-from typing import Any
+from collections.abc import Mapping
+from typing import Any, Callable, NamedTuple
 
+from core.adventure_store import AdventureStore, LazyCollection
 from core.event_bus import EventBus
 
 logger = logging.getLogger("ARS.adventure")
 
+_COND_MEMO_LIMIT = 512
+
+
+class CompiledCondition(NamedTuple):
+    """Kompilierte Flag-Bedingung: test(flags) + gelesene Flag-Namen."""
+    test: Callable[[dict[str, Any]], bool]
+    flags: frozenset[str]
+
+
+_ALWAYS = CompiledCondition(lambda flags: True, frozenset())
+_NEVER = CompiledCondition(lambda flags: False, frozenset())
+
+
+def compile_condition(condition: Any) -> CompiledCondition:
+    """
+    Kompiliert eine Flag-Bedingung (Syntax siehe
+    AdventureManager.evaluate_condition) in eine Closure ueber das Flag-Dict.
+    Unbekannte Typen/Operatoren werden einmalig gewarnt und ergeben False.
+    """
+    if condition is None or condition is True:
+        return _ALWAYS
+    if condition is False:
+        return _NEVER
+
+    # Einfacher String: Flag truthy?
+    if isinstance(condition, str):
+        name = condition
+        return CompiledCondition(lambda flags: bool(flags.get(name)), frozenset((name,)))
+
+    if not isinstance(condition, dict):
+        logger.warning("Unbekannter Condition-Typ: %s", type(condition))
+        return _NEVER
+
+    for op in ("AND", "OR"):
+        if op in condition:
+            sub = condition[op]
+            if not isinstance(sub, list):
+                sub = [sub]
+            parts = [compile_condition(c) for c in sub]
+            tests = tuple(p.test for p in parts)
+            deps = frozenset().union(*(p.flags for p in parts))
+            if op == "AND":
+                return CompiledCondition(lambda flags: all(t(flags) for t in tests), deps)
+            return CompiledCondition(lambda flags: any(t(flags) for t in tests), deps)
+
+    if "NOT" in condition:
+        inner = compile_condition(condition["NOT"])
+        inner_test = inner.test
+        return CompiledCondition(lambda flags: not inner_test(flags), inner.flags)
+
+    # Equality check: {"flag": "name", "eq": value}
+    if "flag" in condition:
+        name = condition["flag"]
+        if "eq" in condition:
+            expected = condition["eq"]
+            return CompiledCondition(
+                lambda flags: flags.get(name) == expected, frozenset((name,)),
+            )
+        return CompiledCondition(lambda flags: bool(flags.get(name)), frozenset((name,)))
+
+    logger.warning("Unbekannter Condition-Operator: %s", list(condition.keys()))
+    return _NEVER
+
+
+def _peek(collection: Mapping[str, Any], key: str, field: str, default: Any = None) -> Any:
+    """Feld eines Eintrags — Lazy-Kollektionen lesen es aus dem Index."""
+    if isinstance(collection, LazyCollection):
+        return collection.peek(key, field, default)
+    entry = collection.get(key)
+    return entry.get(field, default) if isinstance(entry, dict) else default
+
 
 class AdventureManager:
     """
@@ -45,20 +124,28 @@ class AdventureManager:
       get_npc(id)                 — NPC-Dict nach ID
       get_clue(id)                — Clue-Dict nach ID
       get_available_clues()       — Clues am aktuellen Ort
+      locations_for_flag(key)     — Orte mit Hinweisen, die vom Flag abhaengen
       list_locations()            — Alle Location-IDs + Namen
       list_npcs()                 — Alle NPC-IDs + Namen
     """
 
     def __init__(self) -> None:
-        self._data: dict[str, Any] = {}
-        self._locations: dict[str, dict] = {}
-        self._npcs: dict[str, dict] = {}
-        self._clues: dict[str, dict] = {}
+        self._data: Mapping[str, Any] = {}
+        self._locations: Mapping[str, dict] = {}
+        self._npcs: Mapping[str, dict] = {}
+        self._clues: Mapping[str, dict] = {}
         self._flags: dict[str, Any] = {}
         self._initial_flags: dict[str, Any] = {}
         self._current_location_id: str | None = None
         self._loaded = False
         self._archivist = None  # Referenz fuer SQLite-Persistenz
+        # Kompilierte Clue-Bedingungen + Rueckwaerts-Index (siehe _index_conditions)
+        self._clue_conditions: dict[str, CompiledCondition] = {}
+        self._flag_clues: dict[str, set[str]] = {}
+        self._flag_locations: dict[str, set[str]] = {}
+        self._clue_locations: dict[str, set[str]] = {}
+        self._visible_clues: set[str] = set()
+        self._cond_memo: dict[str, CompiledCondition] = {}
 
     @property
     def loaded(self) -> bool:
@@ -72,13 +159,58 @@ class AdventureManager:
     # Laden
     # ------------------------------------------------------------------
 
-    def load(self, data: dict[str, Any]) -> None:
+    def load(self, data: dict[str, Any] | AdventureStore) -> None:
         """Laedt Abenteuer-Daten und indiziert Locations/NPCs/Clues.
 
-        WICHTIG: Die Daten werden tief kopiert (deep-copy) damit externe
+        Ein AdventureStore wird direkt verwendet: Locations/NPCs/Clues sind
+        dessen Lazy-Kollektionen, Objekte werden erst beim Zugriff gelesen.
+
+        WICHTIG: Ein dict wird tief kopiert (deep-copy) damit externe
         Mutationen (z.B. durch ai_backend._load_and_merge_lore) die intern
         indizierten Strukturen nicht korrumpieren koennen.
         """
+        if isinstance(data, AdventureStore):
+            self._data = data.view()
+            self._locations = data.locations
+            self._npcs = data.npcs
+            self._clues = data.clues
+        else:
+            self._load_dict(data)
+        data = self._data
+
+        # Flags initialisieren — nur aus echtem dict
+        raw_flags = data.get("flags", {})
+        if not isinstance(raw_flags, dict):
+            logger.warning(
+                "adventure['flags'] ist kein dict (sondern %s) — Flags zurueckgesetzt.",
+                type(raw_flags).__name__,
+            )
+            raw_flags = {}
+        self._initial_flags = dict(raw_flags)
+        self._flags = dict(self._initial_flags)
+        self._index_conditions()
+
+        # Start-Location setzen
+        self._current_location_id = data.get("start_location")
+        if not self._current_location_id and self._locations:
+            self._current_location_id = next(iter(self._locations))
+
+        self._loaded = True
+        EventBus.get().emit("adventure", "loaded", {
+            "title": self.title,
+            "locations": len(self._locations),
+            "npcs": len(self._npcs),
+            "clues": len(self._clues),
+            "flags": len(self._flags),
+        })
+        logger.info(
+            "Abenteuer geladen: '%s' — %d Locations, %d NPCs, %d Clues, %d Flags",
+            self.title, len(self._locations), len(self._npcs),
+            len(self._clues), len(self._flags),
+        )
+
+    def _load_dict(self, data: dict[str, Any]) -> None:
+        """Dict-Pfad: tief kopieren und Locations/NPCs/Clues indizieren."""
         # Deep-copy schutzt gegen shared-mutable-state Korrumption:
         # ai_backend._load_and_merge_lore() mutiert das adventure-Dict in-place
         # NACHDEM AdventureManager.load() bereits indiziert hat.  Ohne deep-copy
@@ -140,36 +272,6 @@ class AdventureManager:
             if isinstance(clue, dict) and "id" in clue
         }
 
-        # Flags initialisieren — nur aus echtem dict
-        raw_flags = data.get("flags", {})
-        if not isinstance(raw_flags, dict):
-            logger.warning(
-                "adventure['flags'] ist kein dict (sondern %s) — Flags zurueckgesetzt.",
-                type(raw_flags).__name__,
-            )
-            raw_flags = {}
-        self._initial_flags = dict(raw_flags)
-        self._flags = dict(self._initial_flags)
-
-        # Start-Location setzen
-        self._current_location_id = data.get("start_location")
-        if not self._current_location_id and self._locations:
-            self._current_location_id = next(iter(self._locations))
-
-        self._loaded = True
-        EventBus.get().emit("adventure", "loaded", {
-            "title": self.title,
-            "locations": len(self._locations),
-            "npcs": len(self._npcs),
-            "clues": len(self._clues),
-            "flags": len(self._flags),
-        })
-        logger.info(
-            "Abenteuer geladen: '%s' — %d Locations, %d NPCs, %d Clues, %d Flags",
-            self.title, len(self._locations), len(self._npcs),
-            len(self._clues), len(self._flags),
-        )
-
     # ------------------------------------------------------------------
     # Location-Tracking
     # ------------------------------------------------------------------
@@ -207,13 +309,17 @@ class AdventureManager:
     def list_locations(self) -> list[tuple[str, str]]:
         """Gibt Liste von (id, name) Tupeln zurueck."""
         result = []
-        for loc_id, loc in self._locations.items():
+        for loc_id in self._locations:
             # Nur Top-Level und Sub-Locations mit _parent kennzeichnen
-            parent = loc.get("_parent", "")
+            parent = self.peek_location(loc_id, "_parent", "")
             prefix = f"  > " if parent else ""
-            result.append((loc_id, f"{prefix}{loc.get('name', loc_id)}"))
+            result.append((loc_id, f"{prefix}{self.peek_location(loc_id, 'name', loc_id)}"))
         return result
 
+    def peek_location(self, location_id: str, field: str, default: Any = None) -> Any:
+        """Einzelnes Location-Feld; beim Store ohne Materialisierung (Index)."""
+        return _peek(self._locations, location_id, field, default)
+
     # ------------------------------------------------------------------
     # KI-Kontext
     # ------------------------------------------------------------------
@@ -251,12 +357,10 @@ class AdventureManager:
         clue_ids = loc.get("clues_available", [])
         if clue_ids:
             clue_lines = []
+            visible = self._visible_clues
             for cid in clue_ids:
                 clue = self._clues.get(cid)
-                if clue:
-                    req = clue.get("requires_flag") or clue.get("condition")
-                    if req and not self.evaluate_condition(req):
-                        continue
+                if clue and cid in visible:
                     probe = clue.get("probe_required", "frei")
                     clue_lines.append(f"  - {clue.get('name', cid)} (Probe: {probe})")
             if clue_lines:
@@ -266,10 +370,10 @@ class AdventureManager:
         exits = loc.get("exits", {})
         if exits:
             if isinstance(exits, dict):
-                exit_lines = [f"  - {self._locations.get(eid, {}).get('name', eid)}: {desc}"
+                exit_lines = [f"  - {self.peek_location(eid, 'name', eid)}: {desc}"
                               for eid, desc in exits.items()]
             else:
-                exit_lines = [f"  - {self._locations.get(eid, {}).get('name', eid)}"
+                exit_lines = [f"  - {self.peek_location(eid, 'name', eid)}"
                               for eid in exits]
             parts.append("Ausgaenge:\n" + "\n".join(exit_lines))
 
@@ -296,6 +400,7 @@ class AdventureManager:
         """Setzt einen Flag-Wert und persistiert ihn via Archivist in SQLite."""
         old = self._flags.get(key, "(neu)")
         self._flags[key] = value
+        self._refresh_clues(self._flag_clues.get(key, ()), trigger=key)
         EventBus.get().emit("adventure", "flag_changed", {
             "key": key, "value": value, "old": old,
         })
@@ -311,6 +416,7 @@ class AdventureManager:
     def reset_flags(self) -> None:
         """Setzt alle Flags auf Initialwerte zurueck."""
         self._flags = dict(self._initial_flags)
+        self._refresh_clues(self._clue_conditions)
         logger.info("Flags zurueckgesetzt auf Initialwerte (%d Flags).", len(self._flags))
 
     def merge_flags_from_world_state(self, world_state: dict[str, Any]) -> None:
@@ -326,11 +432,13 @@ class AdventureManager:
                 type(world_state).__name__,
             )
             return
+        affected: set[str] = set()
         for key, val in world_state.items():
             if key.startswith("flag:"):
-                self._flags[key[5:]] = val
-            else:
-                self._flags[key] = val
+                key = key[5:]
+            self._flags[key] = val
+            affected.update(self._flag_clues.get(key, ()))
+        self._refresh_clues(affected)
 
     def flags_as_world_state(self) -> dict[str, Any]:
         """Exportiert Flags als WorldState-Dict (fuer Archivist)."""
@@ -354,46 +462,82 @@ class AdventureManager:
         Verschachtelung ist erlaubt:
           {"AND": [{"NOT": "door_locked"}, {"OR": ["has_key", "has_lockpick"]}]}
         """
-        if condition is None or condition is True:
-            return True
-        if condition is False:
-            return False
+        return self._compiled(condition).test(self._flags)
 
-        # Einfacher String: Flag truthy?
+    def _compiled(self, condition: Any) -> CompiledCondition:
+        """Kompilierte Form einer Ad-hoc-Bedingung (memoisiert nach Inhalt)."""
         if isinstance(condition, str):
-            return bool(self._flags.get(condition))
-
-        if not isinstance(condition, dict):
-            logger.warning("Unbekannter Condition-Typ: %s", type(condition))
-            return False
-
-        # AND
-        if "AND" in condition:
-            sub = condition["AND"]
-            if not isinstance(sub, list):
-                sub = [sub]
-            return all(self.evaluate_condition(c) for c in sub)
-
-        # OR
-        if "OR" in condition:
-            sub = condition["OR"]
-            if not isinstance(sub, list):
-                sub = [sub]
-            return any(self.evaluate_condition(c) for c in sub)
-
-        # NOT
-        if "NOT" in condition:
-            return not self.evaluate_condition(condition["NOT"])
-
-        # Equality check: {"flag": "name", "eq": value}
-        if "flag" in condition:
-            flag_val = self._flags.get(condition["flag"])
-            if "eq" in condition:
-                return flag_val == condition["eq"]
-            return bool(flag_val)
+            key = condition
+        else:
+            try:
+                key = json.dumps(condition, sort_keys=True, default=str)
+            except (TypeError, ValueError):
+                return compile_condition(condition)
+        compiled = self._cond_memo.get(key)
+        if compiled is None:
+            if len(self._cond_memo) >= _COND_MEMO_LIMIT:
+                self._cond_memo.clear()
+            compiled = compile_condition(condition)
+            self._cond_memo[key] = compiled
+        return compiled
+
+    def _index_conditions(self) -> None:
+        """Kompiliert alle Clue-Bedingungen und baut Flag -> Clues/Locations."""
+        self._clue_conditions = {}
+        self._flag_clues = {}
+        self._flag_locations = {}
+        self._clue_locations = {}
+        self._cond_memo = {}
+        for loc_id in self._locations:
+            for cid in self.peek_location(loc_id, "clues_available") or []:
+                if isinstance(cid, str):
+                    self._clue_locations.setdefault(cid, set()).add(loc_id)
+        for cid in self._clues:
+            req = (_peek(self._clues, cid, "requires_flag")
+                   or _peek(self._clues, cid, "condition"))
+            if not req:
+                continue
+            compiled = self._compiled(req)
+            self._clue_conditions[cid] = compiled
+            locs = self._clue_locations.get(cid, ())
+            for flag in compiled.flags:
+                self._flag_clues.setdefault(flag, set()).add(cid)
+                self._flag_locations.setdefault(flag, set()).update(locs)
+        flags = self._flags
+        self._visible_clues = {
+            cid for cid in self._clues
+            if cid not in self._clue_conditions or self._clue_conditions[cid].test(flags)
+        }
 
-        logger.warning("Unbekannter Condition-Operator: %s", list(condition.keys()))
-        return False
+    def _refresh_clues(self, clue_ids: Any, trigger: str | None = None) -> None:
+        """Wertet nur die Bedingungen der betroffenen Clues neu aus."""
+        if not clue_ids:
+            return
+        flags = self._flags
+        visible = self._visible_clues
+        changed: list[str] = []
+        for cid in clue_ids:
+            now = self._clue_conditions[cid].test(flags)
+            if now != (cid in visible):
+                changed.append(cid)
+                if now:
+                    visible.add(cid)
+                else:
+                    visible.discard(cid)
+        if changed:
+            locations = sorted({
+                loc for cid in changed for loc in self._clue_locations.get(cid, ())
+            })
+            EventBus.get().emit("adventure", "clues_changed", {
+                "flag": trigger,
+                "clues": sorted(changed),
+                "locations": locations,
+            })
+            logger.debug("Clue-Sichtbarkeit geaendert: %s (Orte: %s)", changed, locations)
+
+    def locations_for_flag(self, key: str) -> set[str]:
+        """Locations, deren Hinweise von diesem Flag abhaengen."""
+        return set(self._flag_locations.get(key, ()))
 
     # ------------------------------------------------------------------
     # NPC / Clue Zugriff
@@ -407,6 +551,8 @@ class AdventureManager:
 
     def list_npcs(self) -> list[tuple[str, str]]:
         """Gibt Liste von (id, name) Tupeln zurueck."""
+        if isinstance(self._npcs, LazyCollection):
+            return self._npcs.names()
         return [(nid, npc.get("name", nid)) for nid, npc in self._npcs.items()]
 
     def get_available_clues(self) -> list[dict[str, Any]]:
@@ -414,12 +560,9 @@ class AdventureManager:
         loc = self.get_current_location()
         if not loc:
             return []
-        result = []
-        for cid in loc.get("clues_available", []):
-            clue = self._clues.get(cid)
-            if clue:
-                req = clue.get("requires_flag") or clue.get("condition")
-                if req and not self.evaluate_condition(req):
-                    continue
-                result.append(clue)
-        return result
+        visible = self._visible_clues
+        return [
+            self._clues[cid]
+            for cid in loc.get("clues_available", [])
+            if cid in visible
+        ]
@@ -0,0 +1,580 @@
+"""
+core/adventure_store.py — Lazy, indizierter Zugriff auf Adventure-JSONs
+
+Grosse (konvertierte) Kampagnen werden nicht mehr komplett geparst.
+Beim ersten Oeffnen entsteht ein Index in data/adventure_index/:
+
+  - meta:        alle Top-Level-Felder ausser locations/npcs/clues (inline)
+  - Kollektionen: pro Eintrag Byte-Span in der Quelldatei, id, name und
+                 wenige Schluesselfelder (clues_available, npcs_present,
+                 exits, requires_flag, condition, has_map, Karten-Ausgaenge,
+                 Sub-Locations)
+  - Prompt-Auszug: fuer alle drei Kollektionen die Felder, die Keeper-Prompt
+                 und Lore-Adapter lesen — auf deren Laenge gekuerzt
+
+Spaeteres Oeffnen liest nur den Index (mtime/size-validiert); Objekte
+werden beim ersten Zugriff per seek+read aus der Quelldatei dekodiert und
+gecacht. Der Speicherbedarf waechst damit mit den besuchten Orten.
+
+Ein Store pro Datei wird prozessweit geteilt (AdventureManager,
+GridEngine, world_stitcher). Aendert sich die Datei, liefert
+open_adventure_store einen neuen Store; der alte bleibt fuer seine Halter
+gueltig, solange sein Handle die indizierte Datei haelt (atomares
+Ersetzen). Passt die Datei nicht mehr zum Index, meldet der Zugriff
+AdventureChangedError statt falsche Byte-Spans zu dekodieren. Materialisierte Objekte sind geteilt und
+gelten als read-only; wer mutieren will (z.B. Lore-Merge im AI-Backend),
+holt sich mit prompt_dict() (Meta + Prompt-Auszuege, ohne die Quelldatei
+zu lesen) oder to_dict() (frisch geparst) eine unabhaengige Kopie.
+
+Verwendung:
+    store = open_adventure_store("goblin_cave")
+    store.get("title")
+    store.locations["cave_entrance"]       # materialisiert bei Bedarf
+    store.view()                            # Mapping wie das Original-Dict
+    store.locations.links()                 # Raum-Topologie aus dem Index
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger("ARS.adventure_store")
+
+_PROJECT_ROOT = Path(__file__).parent.parent
+ADVENTURES_DIR = _PROJECT_ROOT / "modules" / "adventures"
+INDEX_DIR = _PROJECT_ROOT / "data" / "adventure_index"
+
+# Format-Version der Index-Dateien
+_INDEX_FORMAT = 2
+
+INDEXED_COLLECTIONS = ("locations", "npcs", "clues")
+
+# Felder, die ohne Materialisierung im Index verfuegbar sind
+_PEEK_FIELDS: dict[str, tuple[str, ...]] = {
+    "locations": ("clues_available", "npcs_present", "exits"),
+    "npcs": (),
+    "clues": ("requires_flag", "condition"),
+}
+
+# Prompt-Auszug: Felder, die AIBackend._build_adventure_block und
+# core.lore_adapter lesen. Zeichenlimit = groesster Ausschnitt, den einer
+# der beiden verwendet (None = ungekuerzt).
+_PROMPT_FIELDS: dict[str, dict[str, int | None]] = {
+    "locations": {"atmosphere": 150, "keeper_notes": 200, "clues": None},
+    "npcs": {
+        "role": None, "occupation": None, "personality": 200, "description": 200,
+        "traits": 200, "secrets": None, "secret": None, "dialogue_hints": None,
+        "summary": 200, "raw_text": 200,
+    },
+    "clues": {"information": 150, "probe_required": None, "sanity_loss": None},
+}
+_PROMPT_MECHANICS = (
+    "service_group", "class", "archetype", "level", "trait", "personality",
+    "secret_society", "mutation", "hidden_agenda", "use_in_play", "play_hook",
+)
+
+# Index-interne Record-Felder (nicht Teil der Original-Eintraege)
+_INDEX_ONLY = ("span", "prompt", "subs", "map_exits", "has_map")
+
+_WS = re.compile(r"[ \t\n\r]*")
+_BOM = "﻿"
+
+
+
+class AdventureChangedError(RuntimeError):
+    """Quelldatei wurde seit dem Indizieren veraendert (Spans ungueltig)."""
+
+
+# ---------------------------------------------------------------------------
+# Index-Aufbau
+# ---------------------------------------------------------------------------
+
+def _scan_top_level(
+    text: str,
+) -> tuple[list[str], dict[str, Any], dict[str, list[tuple[int, int, Any]]]]:
+    """
+    Zerlegt das Top-Level-Objekt: Schluesselreihenfolge, Meta-Werte
+    dekodiert, Eintraege der indizierten Kollektionen als
+    (start, ende, wert) in Zeichen-Offsets.
+    """
+    decoder = json.JSONDecoder()
+    ws = _WS.match
+
+    def expect(pos: int, char: str) -> int:
+        pos = ws(text, pos).end()
+        if text[pos:pos + 1] != char:
+            raise ValueError(f"'{char}' erwartet an Position {pos}")
+        return ws(text, pos + 1).end()
+
+    order: dict[str, None] = {}
+    meta: dict[str, Any] = {}
+    items: dict[str, list[tuple[int, int, Any]]] = {}
+    pos = expect(0, "{")
+    if text[pos:pos + 1] == "}":
+        return [], meta, items
+    while True:
+        key, pos = decoder.raw_decode(text, pos)
+        order[key] = None
+        pos = expect(pos, ":")
+        if key in INDEXED_COLLECTIONS and text[pos:pos + 1] == "[":
+            entries: list[tuple[int, int, Any]] = []
+            pos = ws(text, pos + 1).end()
+            if text[pos:pos + 1] == "]":
+                pos += 1
+            else:
+                while True:
+                    start = pos
+                    value, pos = decoder.raw_decode(text, pos)
+                    entries.append((start, pos, value))
+                    pos = ws(text, pos).end()
+                    if text[pos:pos + 1] == ",":
+                        pos = ws(text, pos + 1).end()
+                        continue
+                    if text[pos:pos + 1] == "]":
+                        pos += 1
+                        break
+                    raise ValueError(f"',' oder ']' erwartet an Position {pos}")
+            items[key] = entries
+            meta.pop(key, None)
+        else:
+            value, pos = decoder.raw_decode(text, pos)
+            meta[key] = value
+            items.pop(key, None)
+        pos = ws(text, pos).end()
+        if text[pos:pos + 1] == ",":
+            pos = ws(text, pos + 1).end()
+            continue
+        if text[pos:pos + 1] == "}":
+            return list(order), meta, items
+        raise ValueError(f"',' oder '}}' erwartet an Position {pos}")
+
+
+def _prompt_excerpt(collection: str, value: dict[str, Any]) -> dict[str, Any]:
+    """Prompt-relevante Felder eines Eintrags, auf die genutzte Laenge gekuerzt."""
+    excerpt: dict[str, Any] = {}
+    for field, limit in _PROMPT_FIELDS.get(collection, {}).items():
+        if field in value:
+            v = value[field]
+            excerpt[field] = v[:limit] if limit is not None and isinstance(v, str) else v
+    mech = value.get("mechanics")
+    if collection == "npcs" and isinstance(mech, dict):
+        picked = {k: mech[k] for k in _PROMPT_MECHANICS if k in mech}
+        if picked:
+            excerpt["mechanics"] = picked
+    return excerpt
+
+
+def _entry_record(collection: str, value: Any) -> dict[str, Any]:
+    """Index-Eintrag fuer ein Kollektions-Element (ohne Span)."""
+    if not isinstance(value, dict):
+        return {"id": None}
+    rec: dict[str, Any] = {"id": value.get("id") if isinstance(value.get("id"), str) else None}
+    if isinstance(value.get("name"), str):
+        rec["name"] = value["name"]
+    for field in _PEEK_FIELDS[collection]:
+        if field in value:
+            rec[field] = value[field]
+    excerpt = _prompt_excerpt(collection, value)
+    if excerpt:
+        rec["prompt"] = excerpt
+    if collection == "locations":
+        m = value.get("map")
+        rec["has_map"] = bool(m) and isinstance(m, dict) and "terrain" in m
+        # GridEngine.build_room_grid nimmt bei vorhandener Karte deren Ausgaenge
+        if m and isinstance(m, dict):
+            rec["map_exits"] = list(m.get("exits") or ())
+        subs = value.get("sub_locations")
+        if isinstance(subs, list):
+            sub_recs = [
+                _entry_record(collection, sub) for sub in subs
+                if isinstance(sub, dict) and isinstance(sub.get("id"), str)
+            ]
+            for sub_rec in sub_recs:
+                for field in ("has_map", "map_exits", "subs", "prompt"):
+                    sub_rec.pop(field, None)
+            if sub_recs:
+                rec["subs"] = sub_recs
+    return rec
+
+
+def build_index(raw: bytes) -> dict[str, Any]:
+    """Baut den Index aus dem Datei-Inhalt (einmaliger Vollscan)."""
+    text = raw.decode("utf-8")
+    bom = 0
+    if text.startswith(_BOM):
+        text = text[1:]
+        bom = len(_BOM.encode("utf-8"))
+    order, meta, items = _scan_top_level(text)
+
+    collections: dict[str, Any] = {}
+    for name, entries in items.items():
+        # Zeichen- in Byte-Offsets umrechnen (inkrementell, Spans aufsteigend)
+        records: list[dict[str, Any]] = []
+        byte_pos, last = bom, 0
+        for start, end, value in entries:
+            byte_pos += len(text[last:start].encode("utf-8"))
+            length = len(text[start:end].encode("utf-8"))
+            rec = _entry_record(name, value)
+            rec["span"] = [byte_pos, length]
+            records.append(rec)
+            byte_pos += length
+            last = end
+        collections[name] = records
+    return {"format": _INDEX_FORMAT, "order": order, "meta": meta, "collections": collections}
+
+
+def _index_path(source: Path) -> Path:
+    digest = hashlib.sha1(str(source.resolve()).encode("utf-8")).hexdigest()[:10]
+    return INDEX_DIR / f"{source.stem}-{digest}.json"
+
+
+def _load_or_build_index(source: Path, st: os.stat_result) -> dict[str, Any]:
+    path = _index_path(source)
+    try:
+        with path.open("r", encoding="utf-8") as fh:
+            data = json.load(fh)
+        if (data.get("format") == _INDEX_FORMAT
+                and data.get("mtime") == st.st_mtime_ns
+                and data.get("size") == st.st_size):
+            return data
+    except (OSError, json.JSONDecodeError):
+        pass
+
+    data = build_index(source.read_bytes())
+    data["mtime"] = st.st_mtime_ns
+    data["size"] = st.st_size
+    try:
+        INDEX_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        with tmp.open("w", encoding="utf-8") as fh:
+            json.dump(data, fh, ensure_ascii=False, separators=(",", ":"))
+        os.replace(str(tmp), str(path))
+    except OSError as exc:
+        logger.warning("Adventure-Index nicht speicherbar (%s): %s", path, exc)
+    logger.info("Adventure-Index gebaut: %s", source.name)
+    return data
+
+
+# ---------------------------------------------------------------------------
+# Lazy-Kollektionen
+# ---------------------------------------------------------------------------
+
+class LazyCollection(Mapping):
+    """
+    Mapping id -> Objekt ueber eine indizierte Kollektion. Objekte werden
+    beim ersten Zugriff dekodiert; Eintraege ohne id bleiben nur ueber
+    all() erreichbar (wie im Original-Array).
+    """
+
+    def __init__(self, store: AdventureStore, name: str, records: list[dict[str, Any]]) -> None:
+        self._store = store
+        self.name = name
+        self._records = records
+        self._objs: dict[int, Any] = {}
+        # Letzter Eintrag gewinnt, Reihenfolge des ersten (dict-Semantik)
+        self._pos: dict[str, int] = {}
+        for i, rec in enumerate(records):
+            if rec["id"] is not None:
+                self._pos[rec["id"]] = i
+
+    def _at(self, i: int) -> Any:
+        obj = self._objs.get(i)
+        if obj is None:
+            obj = self._store._read(*self._records[i]["span"])
+            self._objs[i] = obj
+        return obj
+
+    def __getitem__(self, key: str) -> Any:
+        return self._at(self._pos[key])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._pos)
+
+    def __len__(self) -> int:
+        return len(self._pos)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._pos
+
+    def all(self) -> list[Any]:
+        """Alle Eintraege in Dateireihenfolge (materialisiert alles)."""
+        return [self._at(i) for i in range(len(self._records))]
+
+    def peek(self, key: str, field: str, default: Any = None) -> Any:
+        """Index-Feld ohne Materialisierung (sonst: Objekt lesen)."""
+        i = self._pos.get(key)
+        if i is None:
+            return default
+        return self._peek_record(self._records[i], lambda: self._at(i), field, default)
+
+    def _peek_record(self, rec: dict[str, Any], load: Any, field: str, default: Any) -> Any:
+        if field == "name" or field in _PEEK_FIELDS[self.name]:
+            return rec.get(field, default)
+        obj = load()
+        return obj.get(field, default) if isinstance(obj, dict) else default
+
+    def names(self) -> list[tuple[str, str]]:
+        """(id, name) aller Eintraege mit id — direkt aus dem Index."""
+        return [(key, self._records[i].get("name", key)) for key, i in self._pos.items()]
+
+    def prompt_entries(self) -> list[dict[str, Any]]:
+        """
+        Eigenstaendige Dicts (id, name, Index-Felder, Prompt-Auszug) aller
+        Eintraege in Dateireihenfolge — ohne Materialisierung.
+        """
+        # Tiefe Kopie: reine JSON-Werte, Round-Trip ist schneller als deepcopy
+        return json.loads(json.dumps(self._prompt_records()))
+
+    def _prompt_records(self) -> list[dict[str, Any]]:
+        entries = []
+        for rec in self._records:
+            entry = {k: v for k, v in rec.items() if k not in _INDEX_ONLY}
+            if entry.get("id") is None:
+                entry.pop("id")
+            entry.update(rec.get("prompt", {}))
+            entries.append(entry)
+        return entries
+
+    @property
+    def materialized(self) -> int:
+        return len(self._objs)
+
+
+class LazyLocations(LazyCollection):
+    """Locations inklusive Sub-Locations (mit _parent), wie AdventureManager."""
+
+    def __init__(self, store: AdventureStore, records: list[dict[str, Any]]) -> None:
+        super().__init__(store, "locations", records)
+        self._subs: dict[str, tuple[str, dict[str, Any]]] = {}   # sub_id -> (parent, rec)
+        self._sub_objs: dict[str, dict[str, Any]] = {}           # sub_id -> Kopie mit _parent
+        order: dict[str, None] = {}
+        for key, i in self._pos.items():
+            order[key] = None
+            for sub_rec in self._records[i].get("subs", ()):
+                self._subs[sub_rec["id"]] = (key, sub_rec)
+                order[sub_rec["id"]] = None
+        self._order = list(order)
+
+    def __getitem__(self, key: str) -> Any:
+        entry = self._subs.get(key)
+        if entry is None:
+            return super().__getitem__(key)
+        obj = self._sub_objs.get(key)
+        if obj is None:
+            parent_id = entry[0]
+            found = None
+            for sub in super().__getitem__(parent_id).get("sub_locations", []):
+                if isinstance(sub, dict) and sub.get("id") == key:
+                    found = sub
+            if found is None:
+                raise KeyError(key)
+            # Flache Kopie: sub_locations des (geteilten) Parents bleiben unveraendert
+            obj = {**found, "_parent": parent_id}
+            self._sub_objs[key] = obj
+        return obj
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._order)
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._pos or key in self._subs
+
+    def peek(self, key: str, field: str, default: Any = None) -> Any:
+        entry = self._subs.get(key)
+        if entry is None:
+            return default if field == "_parent" else super().peek(key, field, default)
+        if field == "_parent":
+            return entry[0]
+        return self._peek_record(entry[1], lambda: self[key], field, default)
+
+    def names(self) -> list[tuple[str, str]]:
+        """(id, name) inklusive Sub-Locations — direkt aus dem Index."""
+        return [(key, self.peek(key, "name", key)) for key in self._order]
+
+    def top_level_names(self) -> list[tuple[str, str]]:
+        """(id, name) nur der Top-Level-Locations; fehlender Name -> ''."""
+        return [(key, self._records[i].get("name", "")) for key, i in self._pos.items()]
+
+    def links(self) -> dict[str, list[str]]:
+        """
+        Ausgaenge je Top-Level-Location aus dem Index, wie build_room_grid
+        sie setzt (Karten-Ausgaenge, sonst exits).
+        """
+        links: dict[str, list[str]] = {}
+        for key, i in self._pos.items():
+            rec = self._records[i]
+            exits = rec.get("map_exits")
+            if exits is None:
+                exits = rec.get("exits") or ()
+            links[key] = [e for e in exits if isinstance(e, str)]
+        return links
+
+    def with_maps(self) -> list[str]:
+        """IDs der Top-Level-Locations mit map.terrain (aus dem Index)."""
+        return [key for key, i in self._pos.items() if self._records[i].get("has_map")]
+
+
+# ---------------------------------------------------------------------------
+# Store
+# ---------------------------------------------------------------------------
+
+class AdventureStore:
+    """Indizierte, lazy materialisierte Sicht auf eine Adventure-Datei."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        st = self.path.stat()
+        self._stamp = (st.st_mtime_ns, st.st_size)
+        index = _load_or_build_index(self.path, st)
+        self.meta: dict[str, Any] = index["meta"]
+        self.keys: list[str] = index["order"]
+        cols = index["collections"]
+        self._lock = threading.Lock()
+        self._fh = None
+        self.locations = LazyLocations(self, cols.get("locations", []))
+        self.npcs = LazyCollection(self, "npcs", cols.get("npcs", []))
+        self.clues = LazyCollection(self, "clues", cols.get("clues", []))
+        self._present = set(cols)
+
+    def _read(self, offset: int, length: int) -> Any:
+        with self._lock:
+            if self._fh is None:
+                self._fh = self.path.open("rb")
+            # Handle muss auf die indizierte Fassung zeigen (sonst falsche Spans)
+            st = os.fstat(self._fh.fileno())
+            if (st.st_mtime_ns, st.st_size) != self._stamp:
+                self._fh.close()
+                self._fh = None
+                raise AdventureChangedError(
+                    f"{self.path.name} wurde seit dem Indizieren geaendert — "
+                    "Abenteuer neu laden"
+                )
+            self._fh.seek(offset)
+            raw = self._fh.read(length)
+        return json.loads(raw.decode("utf-8"))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+
+    # -- Dict-aehnlicher Zugriff -------------------------------------------
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Top-Level-Feld; Kollektionen werden als Liste materialisiert."""
+        if key in INDEXED_COLLECTIONS:
+            if key not in self._present:
+                return default
+            return self.collection(key).all()
+        return self.meta.get(key, default)
+
+    def collection(self, key: str) -> LazyCollection:
+        return {"locations": self.locations, "npcs": self.npcs, "clues": self.clues}[key]
+
+    @property
+    def title(self) -> str:
+        return self.meta.get("title", self.meta.get("name", self.path.stem))
+
+    @property
+    def has_map(self) -> bool:
+        return bool(self.locations.with_maps())
+
+    def view(self) -> AdventureView:
+        return AdventureView(self)
+
+    def prompt_dict(self) -> dict[str, Any]:
+        """
+        Mutierbare Kopie fuer den Keeper-Prompt: Meta-Felder plus
+        Prompt-Auszuege aller Kollektionen aus dem Index. Liest die
+        Quelldatei nicht.
+        """
+        data: dict[str, Any] = {}
+        for key in self.keys:
+            if key in INDEXED_COLLECTIONS and key in self._present:
+                data[key] = self.collection(key)._prompt_records()
+            elif key in self.meta:
+                data[key] = self.meta[key]
+        return json.loads(json.dumps(data))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Unabhaengige Vollkopie (frisch geparst) fuer mutierende Nutzer."""
+        with self.path.open("r", encoding="utf-8-sig") as fh:
+            return json.load(fh)
+
+    def is_current(self) -> bool:
+        try:
+            st = self.path.stat()
+        except OSError:
+            return False
+        return (st.st_mtime_ns, st.st_size) == self._stamp
+
+    def __repr__(self) -> str:
+        return f"<AdventureStore {self.path.name} locations={len(self.locations)}>"
+
+
+class AdventureView(Mapping):
+    """Read-only Mapping im Format des Original-Dicts (Listen lazy)."""
+
+    def __init__(self, store: AdventureStore) -> None:
+        self.store = store
+        self._keys = store.keys
+
+    def __getitem__(self, key: str) -> Any:
+        if key in INDEXED_COLLECTIONS and key in self.store._present:
+            return self.store.collection(key).all()
+        return self.store.meta[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+_stores: dict[Path, AdventureStore] = {}
+_stores_lock = threading.Lock()
+
+
+def resolve_adventure_path(name_or_path: str | Path) -> Path:
+    """Pfad direkt oder Name/Dateiname in modules/adventures/."""
+    path = Path(name_or_path)
+    if path.is_file():
+        return path
+    path = ADVENTURES_DIR / Path(name_or_path).name
+    if path.suffix != ".json":
+        path = path.with_name(path.name + ".json")
+    return path
+
+
+def open_adventure_store(name_or_path: str | Path) -> AdventureStore | None:
+    """Prozessweit geteilter Store; None wenn die Datei fehlt oder defekt ist."""
+    path = resolve_adventure_path(name_or_path)
+    if not path.is_file():
+        logger.warning("Adventure nicht gefunden: %s", path)
+        return None
+    key = path.resolve()
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is not None and store.is_current():
+            return store
+        try:
+            store = AdventureStore(path)
+        except (OSError, ValueError, UnicodeDecodeError) as exc:
+            logger.error("Adventure-Fehler: %s: %s", path, exc)
+            return None
+        # Alten Store nicht schliessen: AdventureManager/GridEngine halten ihn
+        # noch, sein offenes Handle zeigt weiter auf die indizierte Fassung.
+        _stores[key] = store
+        return store
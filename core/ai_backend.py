@@ -254,6 +254,15 @@ class GeminiBackend:
         logger.debug("Würfelergebnis injiziert: %s", roll_msg)
         yield from self.chat_stream(roll_msg)
 
+    def inject_round_result(self, title: str, lines: list[str]) -> Iterator[str]:
+        """
+        Injiziert die Würfe einer Kampfrunde (eine Zeile pro Angriff) und
+        holt eine gemeinsame narrative Reaktion des GM (gestreamt).
+        """
+        roll_msg = f"[WÜRFELERGEBNIS: {title}]\n" + "\n".join(f"  {line}" for line in lines)
+        logger.debug("Rundenergebnis injiziert: %s", roll_msg)
+        yield from self.chat_stream(roll_msg)
+
     @property
     def _effective_max_sentences(self) -> int:
         """Max Prosa-Saetze: 15 im Party-Modus, 3 im Einzel-Modus."""
@@ -597,16 +606,29 @@ class GeminiBackend:
             if subdir.split("/")[0] not in _exclude_dirs
         }
 
+        # Namen je Adventure-Key einmal sammeln und beim Anhaengen pflegen —
+        # so greift die Deduplizierung auch ueber mehrere Subdirs desselben
+        # Keys (z.B. locations + locations/regional) und innerhalb eines Dirs.
+        names_by_key: dict[str, set[str]] = {}
         for subdir, key in filtered_map.items():
             if key not in adventure:
                 adventure[key] = []
 
             new_items = _load_from_dir(lore_root / subdir)
             if new_items:
-                existing_names = {item.get("name") for item in adventure.get(key, []) if item.get("name")}
+                existing_names = names_by_key.get(key)
+                if existing_names is None:
+                    existing_names = {
+                        item.get("name") for item in adventure[key]
+                        if isinstance(item, dict) and item.get("name")
+                    }
+                    names_by_key[key] = existing_names
                 for item in new_items:
-                    if item.get("name") not in existing_names:
+                    name = item.get("name")
+                    if name not in existing_names:
                         adventure[key].append(item)
+                        if name:
+                            existing_names.add(name)
 
         # Lore-Adapter: Raw-Felder → Engine-kompatible Felder (R2)
         adapt_lore(adventure, system_id)
@@ -1717,8 +1739,9 @@ ATEM_WAFFE — Atemwaffenangriff:
   Emittiere bei jedem Atemwaffenangriff (Drachen, Chimera, Wyvern etc.).
   Typ (genau): Feuer | Kaelte | Blitz | Gift | Saeure | Gas
   Schaden: Wuerfelausdruck (z.B. 10d10, 3d8).
-  Betroffene Spieler erhalten automatisch [RETTUNGSWURF: Drachenodem | <Zielwert>].
-  Bei Erfolg: halber Schaden. Bei Misserfolg: voller Schaden.
+  Das System wuerfelt fuer jedes Ziel selbst einen Rettungswurf gegen Atemwaffe
+  und zieht den Schaden ab (Erfolg: halber, Misserfolg: voller Schaden).
+  Setze dafuer KEINEN eigenen [RETTUNGSWURF: Drachenodem] und KEIN [HP_VERLUST].
   Beispiele:
     [ATEM_WAFFE: Roter Drache | Feuer | 10d10]
     [ATEM_WAFFE: Chimera | Blitz | 3d8]
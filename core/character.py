@@ -299,25 +299,26 @@ def extract_inventory_changes(text: str) -> list[tuple[str, str]]:
 
 def extract_combat_tags(text: str) -> list[tuple[str, Any]]:
     """
-    Parst alle Kampf-Tags aus dem GM-Text (AD&D 2e).
+    Parst alle Kampf-Tags aus dem GM-Text (AD&D 2e), in Textreihenfolge.
     Returns list of (tag_type, data) tuples.
       ("ANGRIFF", {"weapon": str, "thac0": int, "target_ac": int, "modifiers": int})
       ("RETTUNGSWURF", {"category": str, "target": int})
     """
-    results: list[tuple[str, Any]] = []
+    found: list[tuple[int, str, Any]] = []
     for m in ANGRIFF_PATTERN.finditer(text):
-        results.append(("ANGRIFF", {
+        found.append((m.start(), "ANGRIFF", {
             "weapon": m.group(1).strip(),
             "thac0": int(m.group(2)),
             "target_ac": int(m.group(3)),
             "modifiers": int(m.group(4)),
         }))
     for m in RETTUNGSWURF_PATTERN.finditer(text):
-        results.append(("RETTUNGSWURF", {
+        found.append((m.start(), "RETTUNGSWURF", {
             "category": m.group(1).strip(),
             "target": int(m.group(2)),
         }))
-    return results
+    found.sort(key=lambda f: f[0])
+    return [(tag_type, data) for _, tag_type, data in found]
 
 
 def extract_time_changes(text: str) -> list[tuple[str, str | tuple[int, int]]]:
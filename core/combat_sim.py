@@ -0,0 +1,433 @@
+"""
+core/combat_sim.py — Vektorisierter Monte-Carlo-Kampfsimulator (AD&D 2e)
+
+Wertet Angriffs-, Rettungs-, Schadens- und Moralwuerfe als NumPy-Batches
+aus (ein PRNG-Aufruf pro Batch statt ein Syscall pro Wuerfel) und spielt
+komplette Begegnungen Party vs. Monsterliste parallel ueber viele
+Durchlaeufe. Die Regeln entsprechen MechanicsEngine / CombatTracker:
+
+  - Angriff:   d20 + Mod >= THAC0 - AC, Nat 20 trifft, Nat 1 verfehlt
+  - Rettung:   d20 + Mod >= Ziel, Nat 20 / Nat 1 automatisch
+  - Moral:     2d6 <= Moral + Mod (auf 2..20 begrenzt)
+  - Schaden:   Wuerfelausdruck (core/dice_expr, wie roll_damage, nie negativ)
+  - Runde:     Gruppen-Initiative d10, Speed-Factor als Tie-Breaker,
+               attacks_per_round wie CombatTracker.get_max_attacks
+
+Verwendung:
+    sim = CombatSimulator(mechanics, seed=42)
+    hits = sim.attack_rolls(thac0=15, target_ac=5, n=1_000_000)
+    hits.success_rate
+    result = sim.simulate_encounter(party, monsters, trials=10_000)
+    result.summary()  -> {win_rate, ttk_mean, ttk_p90, ...}
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Iterable
+
+from core.combat_tracker import Combatant, CombatTracker, max_attacks
+from core.dice_expr import compile_expression
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+if TYPE_CHECKING:
+    from core.mechanics import MechanicsEngine
+
+logger = logging.getLogger("ARS.combat_sim")
+
+_WEAPON_DAMAGE_RE = re.compile(r"(\d+d\d+(?:[+-]\d+)?)")
+_APR_RE = re.compile(r"^\s*(\d+)(?:\s*/\s*(\d+))?")
+
+# Ausgang einer simulierten Begegnung
+OUTCOME_TIMEOUT = 0
+OUTCOME_WIN = 1
+OUTCOME_LOSS = 2
+OUTCOME_ROUT = 3
+
+
+# ---------------------------------------------------------------------------
+# Ergebnis-Dataclasses
+# ---------------------------------------------------------------------------
+
+@dataclass
+class RollBatch:
+    """Ergebnis vieler gleichartiger Wuerfe (Arrays gleicher Form)."""
+    roll: "np.ndarray"          # Naturwurf (d20) bzw. 2d6-Summe
+    is_success: "np.ndarray"    # bool
+
+    @property
+    def n(self) -> int:
+        return int(self.roll.size)
+
+    @property
+    def success_rate(self) -> float:
+        return float(self.is_success.mean()) if self.n else 0.0
+
+    def rate_of(self, value: int) -> float:
+        """Anteil der Wuerfe mit genau diesem Naturwurf (z.B. 20)."""
+        return float((self.roll == value).mean()) if self.n else 0.0
+
+
+@dataclass
+class EncounterResult:
+    """Verteilungen ueber alle Durchlaeufe einer Begegnung."""
+    outcome: "np.ndarray"            # OUTCOME_* je Durchlauf
+    rounds: "np.ndarray"             # Runden bis Kampfende
+    damage_to_party: "np.ndarray"    # Summe gewuerfelter Treffer-Schaden
+    damage_to_monsters: "np.ndarray"
+    party_deaths: "np.ndarray"       # Tote Party-Mitglieder je Durchlauf
+    death_rate: dict[str, float]     # Name -> Anteil Durchlaeufe mit Tod
+
+    @property
+    def trials(self) -> int:
+        return int(self.outcome.size)
+
+    @property
+    def win_rate(self) -> float:
+        won = (self.outcome == OUTCOME_WIN) | (self.outcome == OUTCOME_ROUT)
+        return float(won.mean())
+
+    def ttk_histogram(self) -> dict[int, int]:
+        """Runden bis zum Sieg -> Anzahl Durchlaeufe (nur gewonnene)."""
+        won = (self.outcome == OUTCOME_WIN) | (self.outcome == OUTCOME_ROUT)
+        values, counts = np.unique(self.rounds[won], return_counts=True)
+        return {int(v): int(c) for v, c in zip(values, counts)}
+
+    def summary(self) -> dict[str, Any]:
+        won = (self.outcome == OUTCOME_WIN) | (self.outcome == OUTCOME_ROUT)
+        ttk = self.rounds[won]
+
+        def _pct(arr: "np.ndarray", q: float) -> float:
+            return float(np.percentile(arr, q)) if arr.size else 0.0
+
+        return {
+            "trials": self.trials,
+            "win_rate": self.win_rate,
+            "loss_rate": float((self.outcome == OUTCOME_LOSS).mean()),
+            "rout_rate": float((self.outcome == OUTCOME_ROUT).mean()),
+            "timeout_rate": float((self.outcome == OUTCOME_TIMEOUT).mean()),
+            "ttk_mean": float(ttk.mean()) if ttk.size else 0.0,
+            "ttk_p50": _pct(ttk, 50),
+            "ttk_p90": _pct(ttk, 90),
+            "rounds_mean": float(self.rounds.mean()),
+            "party_damage_mean": float(self.damage_to_party.mean()),
+            "party_damage_p90": _pct(self.damage_to_party, 90),
+            "monster_damage_mean": float(self.damage_to_monsters.mean()),
+            "party_deaths_mean": float(self.party_deaths.mean()),
+            "tpk_rate": float((self.outcome == OUTCOME_LOSS).mean()),
+            "death_rate": dict(self.death_rate),
+        }
+
+
+# ---------------------------------------------------------------------------
+# Eingabe-Helfer
+# ---------------------------------------------------------------------------
+
+def _normalize_apr(value: Any) -> str:
+    """'2 (Two-Weapon Fighting)' -> '2/1', '3/2' -> '3/2', '1' -> '1/1'."""
+    m = _APR_RE.match(str(value))
+    if not m:
+        return "1/1"
+    return f"{m.group(1)}/{m.group(2) or 1}"
+
+
+def player_stats_from_character(
+    char: dict[str, Any], mechanics: MechanicsEngine | None = None,
+) -> dict[str, Any]:
+    """
+    Baut player_stats (Format von CombatTracker.start_combat) aus einem
+    Charakter-JSON (modules/characters/*.json).
+
+    Waffe und Schaden stammen aus dem ersten Ausruestungs-Eintrag mit
+    Wuerfelangabe, z.B. 'Battle Axe +1 (1d8+1, ...)'.
+    """
+    derived = char.get("derived_stats", {})
+    stats: dict[str, Any] = {
+        "name": char.get("name", "Spieler"),
+        "hp": derived.get("HP", 10),
+        "hp_max": derived.get("HP", 10),
+        "ac": derived.get("AC", 10),
+        "thac0": derived.get("THAC0", 20),
+        "movement": derived.get("Movement", 12),
+        "level": char.get("level", 1),
+        "weapon": "Waffe",
+        "damage": "1d6",
+        "attacks_per_round": _normalize_apr(derived.get("Attacks_per_Round", "1/1")),
+        "class_group": "warrior",
+        "speed_factor": 5,
+        "armor": "",
+    }
+    for item in char.get("equipment", []):
+        if not isinstance(item, str):
+            continue
+        m = _WEAPON_DAMAGE_RE.search(item)
+        if m:
+            stats["weapon"] = item.split("(")[0].strip()
+            stats["damage"] = m.group(1)
+            break
+
+    if mechanics is not None:
+        cg = mechanics.lookup_class_group(char.get("class", "fighter"))
+        stats["class_group"] = cg
+        stats["speed_factor"] = mechanics.lookup_speed_factor(stats["weapon"])
+        if "Attacks_per_Round" not in derived:
+            stats["attacks_per_round"] = mechanics.lookup_attacks_per_round(
+                cg, stats["level"],
+            )
+    return stats
+
+
+def party_from_stats(
+    party_stats: Iterable[dict[str, Any]], mechanics: MechanicsEngine | None = None,
+) -> list[Combatant]:
+    """player_stats-Dicts -> Party-Combatants (ueber CombatTracker gebaut)."""
+    tracker = CombatTracker()
+    if mechanics is not None:
+        tracker.set_mechanics(mechanics)
+    return [
+        tracker.make_player_combatant(stats, combatant_id=f"party_{i}")
+        for i, stats in enumerate(party_stats)
+    ]
+
+
+def monsters_from_npcs(
+    npcs: Iterable[dict[str, Any]], mechanics: MechanicsEngine | None = None,
+) -> list[Combatant]:
+    """Adventure-NPC-Dicts -> Monster-Combatants.
+
+    Akzeptiert sowohl {'stats': {...}} als auch flache NPCs mit hp/ac/thac0
+    auf oberster Ebene (wie in den Stress-Adventures). Freitext-Schaden
+    wie '1d8+8 Klaue / 3d10+8 Biss' wertet der tolerante Ausdrucks-Parser
+    als ersten Wuerfelausdruck.
+    """
+    tracker = CombatTracker()
+    if mechanics is not None:
+        tracker.set_mechanics(mechanics)
+    monsters: list[Combatant] = []
+    for npc in npcs:
+        monsters.append(
+            tracker.make_npc_combatant(npc if "stats" in npc else {**npc, "stats": npc})
+        )
+    return monsters
+
+
+# ---------------------------------------------------------------------------
+# CombatSimulator
+# ---------------------------------------------------------------------------
+
+class CombatSimulator:
+    """
+    Batch-Wuerfel und Begegnungs-Simulation mit seedbarem NumPy-PRNG.
+
+    API:
+      attack_rolls(thac0, target_ac, modifiers, n)   -> RollBatch
+      saving_throws(target, modifiers, n)            -> RollBatch
+      morale_checks(morale_value, modifiers, n)      -> RollBatch
+      damage_rolls(expr, n)                          -> ndarray
+      simulate_encounter(party, monsters, trials)    -> EncounterResult
+    """
+
+    def __init__(
+        self, mechanics: MechanicsEngine | None = None, seed: int | None = None,
+    ) -> None:
+        if not HAS_NUMPY:
+            raise RuntimeError("CombatSimulator benoetigt numpy.")
+        self.mechanics = mechanics
+        self.rng = np.random.default_rng(seed)
+
+    # ------------------------------------------------------------------
+    # Wuerfel
+    # ------------------------------------------------------------------
+
+    def dice(self, faces: int, shape: int | tuple[int, ...]) -> np.ndarray:
+        """Array von Wuerfen 1..faces."""
+        return self.rng.integers(1, faces + 1, size=shape, dtype=np.int32)
+
+    def damage_rolls(self, expr: str, n: int | tuple[int, ...]) -> np.ndarray:
+        """n Schadenswuerfe fuer expr (wie MechanicsEngine.roll_damage)."""
+        shape = (n,) if isinstance(n, int) else tuple(n)
+        compiled = compile_expression(expr.strip())
+        if compiled is None:
+            logger.warning("Unbekannter Schadenswurf '%s' -- nehme 1 an.", expr)
+            return np.ones(shape, dtype=np.int32)
+        total = compiled.roll_many(math.prod(shape), self.rng).reshape(shape)
+        if compiled.is_constant:
+            return total.astype(np.int32)
+        return np.maximum(total, 0).astype(np.int32)
+
+    @staticmethod
+    def _shape(n: int, *params: Any) -> tuple[int, ...]:
+        return (n,) + np.broadcast(*[np.asarray(p) for p in params]).shape
+
+    def attack_rolls(
+        self, thac0: Any, target_ac: Any, modifiers: Any = 0, n: int = 1,
+    ) -> RollBatch:
+        """n Angriffswuerfe; Parameter duerfen Arrays sein (Broadcasting)."""
+        roll = self.dice(20, self._shape(n, thac0, target_ac, modifiers))
+        needed = np.asarray(thac0) - np.asarray(target_ac)
+        hit = (roll == 20) | ((roll != 1) & (roll + np.asarray(modifiers) >= needed))
+        return RollBatch(roll=roll, is_success=hit)
+
+    def saving_throws(self, target: Any, modifiers: Any = 0, n: int = 1) -> RollBatch:
+        """n Rettungswuerfe (roll-high)."""
+        roll = self.dice(20, self._shape(n, target, modifiers))
+        ok = (roll == 20) | ((roll != 1) & (roll + np.asarray(modifiers) >= np.asarray(target)))
+        return RollBatch(roll=roll, is_success=ok)
+
+    def morale_checks(self, morale_value: Any, modifiers: Any = 0, n: int = 1) -> RollBatch:
+        """n Moral-Proben (2d6 <= Moral, Moral auf 2..20 begrenzt)."""
+        shape = self._shape(n, morale_value, modifiers)
+        roll = self.dice(6, shape) + self.dice(6, shape)
+        effective = np.clip(np.asarray(morale_value) + np.asarray(modifiers), 2, 20)
+        return RollBatch(roll=roll, is_success=roll <= effective)
+
+    # ------------------------------------------------------------------
+    # Begegnungen
+    # ------------------------------------------------------------------
+
+    def simulate_encounter(
+        self,
+        party: list[Combatant],
+        monsters: list[Combatant],
+        trials: int = 10_000,
+        max_rounds: int = 50,
+        monster_morale: int | None = None,
+        regeneration: dict[str, int] | None = None,
+    ) -> EncounterResult:
+        """
+        Spielt die Begegnung trials-mal parallel durch.
+
+        Party-Mitglieder schlagen den ersten lebenden Gegner (Fokus wie
+        CombatTracker.find_target), Monster waehlen ein zufaelliges lebendes
+        Party-Mitglied. Mit monster_morale wird eine Moral-Probe faellig,
+        sobald die Haelfte der Monster gefallen ist; Misserfolg = Flucht.
+        regeneration: Monster-Name -> HP pro Runde (Rundenbeginn).
+        """
+        fighters = list(party) + list(monsters)
+        n_party = len(party)
+        count = len(fighters)
+        if not party or not monsters:
+            raise ValueError("simulate_encounter braucht Party und Monster.")
+
+        is_party = [i < n_party for i in range(count)]
+        hp_max = np.array([max(1, c.hp_max) for c in fighters], dtype=np.int32)[:, None]
+        ac = np.array([c.ac for c in fighters], dtype=np.int32)
+        speed = np.array([c.speed_factor for c in fighters], dtype=np.int32)[:, None]
+        regen = np.array(
+            [(regeneration or {}).get(c.name, 0) for c in fighters], dtype=np.int32,
+        )[:, None]
+        slots = np.arange(count)[:, None]
+        big = np.int32(1 << 20)
+
+        # Ergebnis-Arrays ueber alle Durchlaeufe
+        outcome = np.full(trials, OUTCOME_TIMEOUT, dtype=np.int8)
+        rounds = np.full(trials, max_rounds, dtype=np.int32)
+        dmg_party = np.zeros(trials, dtype=np.int32)
+        dmg_monsters = np.zeros(trials, dtype=np.int32)
+        final_hp = np.zeros((count, trials), dtype=np.int32)
+
+        # Arbeits-Arrays nur fuer laufende Durchlaeufe: [Combatant, Durchlauf]
+        ids = np.arange(trials)
+        hp = np.repeat(np.array([c.hp for c in fighters], dtype=np.int32)[:, None], trials, axis=1)
+        d_party = np.zeros(trials, dtype=np.int32)
+        d_monsters = np.zeros(trials, dtype=np.int32)
+        morale_done = np.zeros(trials, dtype=bool)
+
+        # Reihenfolge innerhalb einer Seite: Speed-Factor aufsteigend
+        order = sorted(range(count), key=lambda i: fighters[i].speed_factor)
+
+        for rnd in range(1, max_rounds + 1):
+            live = ids.size
+            if regen.any():
+                hp = np.where(hp > 0, np.minimum(hp + regen, hp_max), hp)
+
+            # Gruppen-Initiative, Tie-Breaker ueber niedrigsten Speed
+            alive = hp > 0
+            p_init = self.dice(10, live)
+            m_init = self.dice(10, live)
+            p_speed = np.where(alive[:n_party], speed[:n_party], big).min(axis=0)
+            m_speed = np.where(alive[n_party:], speed[n_party:], big).min(axis=0)
+            party_first = (p_init < m_init) | ((p_init == m_init) & (p_speed <= m_speed))
+
+            for first_phase in (True, False):
+                for i in order:
+                    side_acts = party_first if is_party[i] == first_phase else ~party_first
+                    for _ in range(max_attacks(fighters[i].attacks_per_round, rnd)):
+                        acting = side_acts & (hp[i] > 0)
+                        if is_party[i]:
+                            # Erster lebender Gegner (kleine Schleife statt argmax)
+                            foes = hp[n_party:] > 0
+                            target = np.full(live, count - 1, dtype=np.intp)
+                            for k in range(count - 1, n_party - 1, -1):
+                                target[foes[k - n_party]] = k
+                        else:
+                            # Zufaelliges lebendes Party-Mitglied
+                            foes = hp[:n_party] > 0
+                            pick = (self.rng.random(live) * foes.sum(axis=0)).astype(np.int32)
+                            target = np.zeros(live, dtype=np.intp)
+                            seen = np.zeros(live, dtype=np.int32)
+                            for k in range(n_party):
+                                target[foes[k] & (seen == pick)] = k
+                                seen += foes[k]
+                        acting &= foes.any(axis=0)
+                        if not acting.any():
+                            break
+                        hit = self.attack_rolls(fighters[i].thac0, ac[target]).is_success[0]
+                        dmg = np.where(acting & hit, self.damage_rolls(fighters[i].damage, live), 0)
+                        hp -= (target == slots) * dmg
+                        np.maximum(hp, 0, out=hp)
+                        if is_party[i]:
+                            d_monsters += dmg
+                        else:
+                            d_party += dmg
+
+            alive = hp > 0
+            party_alive = alive[:n_party].any(axis=0)
+            monsters_alive = alive[n_party:].sum(axis=0)
+
+            result = np.full(live, -1, dtype=np.int8)
+            result[monsters_alive == 0] = OUTCOME_WIN
+            result[(result < 0) & ~party_alive] = OUTCOME_LOSS
+            if monster_morale is not None:
+                check = (result < 0) & ~morale_done & (monsters_alive * 2 <= len(monsters))
+                if check.any():
+                    morale_done |= check
+                    fled = check & ~self.morale_checks(monster_morale, n=live).is_success
+                    result[fled] = OUTCOME_ROUT
+
+            ended = result >= 0
+            if rnd == max_rounds:
+                ended[:] = True
+                result[result < 0] = OUTCOME_TIMEOUT
+            if ended.any():
+                done = ids[ended]
+                outcome[done] = result[ended]
+                rounds[done] = rnd
+                dmg_party[done] = d_party[ended]
+                dmg_monsters[done] = d_monsters[ended]
+                final_hp[:, done] = hp[:, ended]
+                # Beendete Durchlaeufe aus den Arbeits-Arrays entfernen
+                keep = ~ended
+                ids, hp = ids[keep], hp[:, keep]
+                d_party, d_monsters = d_party[keep], d_monsters[keep]
+                morale_done = morale_done[keep]
+            if not ids.size:
+                break
+
+        dead = final_hp <= 0
+        return EncounterResult(
+            outcome=outcome,
+            rounds=rounds,
+            damage_to_party=dmg_party,
+            damage_to_monsters=dmg_monsters,
+            party_deaths=dead[:n_party].sum(axis=0),
+            death_rate={c.name: float(dead[i].mean()) for i, c in enumerate(fighters)},
+        )
@@ -9,6 +9,12 @@ Der CombatTracker stellt sicher, dass NPCs erst sterben wenn ihre
 HP tatsaechlich 0 erreichen — nicht wenn die KI es willkuerlich
 entscheidet.
 
+Zustand als Struct-of-Arrays (CombatState): HP, AC, THAC0, Initiative,
+Angriffe, Bewegung usw. liegen in parallelen Listen mit ID- und
+Namens-Index. Rundenoperationen (Reset, Regeneration, Flaechenschaden)
+laufen ueber ganze Spalten; Combatant-Objekte bleiben als Sicht auf
+ihren Slot erhalten.
+
 Initiative-System (AD&D 2e):
   - Gruppen-Initiative: d10 pro Seite, niedriger handelt zuerst
   - Waffen-Speed-Factor als Tie-Breaker
@@ -18,39 +24,328 @@ Initiative-System (AD&D 2e):
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass, field
+from collections.abc import Callable, Container, Iterator, MutableMapping
 from typing import Any
 
+from core.name_resolver import NameResolver
+
 logger = logging.getLogger("ARS.combat_tracker")
 
 
-@dataclass
+def max_attacks(attacks_per_round: str, round_no: int) -> int:
+    """
+    Angriffe in Runde round_no fuer eine attacks_per_round-Angabe.
+
+    "1/1" -> immer 1
+    "3/2" -> abwechselnd 1 und 2 (ungerade Runde=1, gerade=2)
+    "2/1" -> immer 2
+    """
+    if attacks_per_round == "2/1":
+        return 2
+    if attacks_per_round == "3/2":
+        return 2 if round_no % 2 == 0 else 1
+    return 1  # "1/1" oder unbekannt
+
+
+# Felder, die im Tracker als Spalten (eine Liste pro Feld) gehalten werden
+_STATE_FIELDS: tuple[str, ...] = (
+    "hp", "hp_max", "ac", "thac0", "movement", "is_alive", "is_player",
+    "initiative", "speed_factor", "attacks_per_round", "attacks_this_round",
+    "level", "reach", "movement_used",
+)
+# Flags, deren Aenderung den Zaehler lebender Feinde beeinflusst
+_COUNTED_FIELDS = frozenset({"is_alive", "is_player"})
+
+
 class Combatant:
-    """Ein Kampfteilnehmer (Spieler oder NPC)."""
-
-    id: str
-    name: str
-    hp: int
-    hp_max: int
-    ac: int
-    thac0: int
-    weapon: str
-    damage: str          # Schadenswuerfel, z.B. "1d6", "1d10"
-    movement: int        # Bewegungsrate (Felder/Runde)
-    position: str        # z.B. "Nahkampf", "Plattform (Fernkampf)"
-    is_alive: bool = True
-    is_player: bool = False
-    # Initiative-System
-    initiative: int = 0         # Aktueller Initiative-Wurf
-    speed_factor: int = 5       # Waffen-Speed (2=Dolch, 7=Streitaxt)
-    attacks_per_round: str = "1/1"  # "1/1", "3/2", "2/1"
-    attacks_this_round: int = 0     # Zaehler: wie oft angegriffen
-    level: int = 1
-    class_group: str = "warrior"    # warrior/priest/rogue/wizard
-    # Bewegungs- und Reichweiten-Bridge (Task #14)
-    reach: int = 1               # Nahkampf-Reichweite in Feldern (1=Standard, 2=Stangenwaffe, 3=Lanze)
-    movement_used: int = 0       # Verbrauchte Bewegung in dieser Runde
-    armor_name: str = ""         # Ruestungsname fuer Bewegungsmalus-Lookup
+    """
+    Ein Kampfteilnehmer (Spieler oder NPC).
+
+    Ungebunden haelt der Combatant seine Werte selbst. Nach dem Einfuegen in
+    einen CombatState liegen die numerischen Felder (_STATE_FIELDS) in dessen
+    Spalten; Attributzugriffe lesen und schreiben dann direkt dort.
+    """
+
+    __slots__ = (
+        "id", "name", "weapon", "damage", "position", "class_group", "armor_name",
+        "_state", "_slot", "_local",
+    )
+
+    def __init__(
+        self,
+        id: str,
+        name: str,
+        hp: int,
+        hp_max: int,
+        ac: int,
+        thac0: int,
+        weapon: str,
+        damage: str,                    # Schadenswuerfel, z.B. "1d6", "1d10"
+        movement: int,                  # Bewegungsrate (Felder/Runde)
+        position: str,                  # z.B. "Nahkampf", "Plattform (Fernkampf)"
+        is_alive: bool = True,
+        is_player: bool = False,
+        # Initiative-System
+        initiative: int = 0,            # Aktueller Initiative-Wurf
+        speed_factor: int = 5,          # Waffen-Speed (2=Dolch, 7=Streitaxt)
+        attacks_per_round: str = "1/1", # "1/1", "3/2", "2/1"
+        attacks_this_round: int = 0,    # Zaehler: wie oft angegriffen
+        level: int = 1,
+        class_group: str = "warrior",   # warrior/priest/rogue/wizard
+        # Bewegungs- und Reichweiten-Bridge (Task #14)
+        reach: int = 1,                 # Nahkampf-Reichweite (1=Standard, 2=Stangenwaffe, 3=Lanze)
+        movement_used: int = 0,         # Verbrauchte Bewegung in dieser Runde
+        armor_name: str = "",           # Ruestungsname fuer Bewegungsmalus-Lookup
+    ) -> None:
+        self.id = id
+        self.name = name
+        self.weapon = weapon
+        self.damage = damage
+        self.position = position
+        self.class_group = class_group
+        self.armor_name = armor_name
+        self._state: CombatState | None = None
+        self._slot = -1
+        self._local: dict[str, Any] | None = {
+            "hp": hp, "hp_max": hp_max, "ac": ac, "thac0": thac0,
+            "movement": movement, "is_alive": bool(is_alive), "is_player": bool(is_player),
+            "initiative": initiative, "speed_factor": speed_factor,
+            "attacks_per_round": attacks_per_round,
+            "attacks_this_round": attacks_this_round, "level": level,
+            "reach": reach, "movement_used": movement_used,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"Combatant(id={self.id!r}, name={self.name!r}, hp={self.hp}/{self.hp_max}, "
+            f"ac={self.ac}, thac0={self.thac0}, alive={self.is_alive})"
+        )
+
+
+def _state_field(name: str) -> property:
+    def fget(self: Combatant) -> Any:
+        state = self._state
+        if state is None:
+            return self._local[name]  # type: ignore[index]
+        return state.cols[name][self._slot]
+
+    def fset(self: Combatant, value: Any) -> None:
+        state = self._state
+        if state is None:
+            self._local[name] = value  # type: ignore[index]
+        elif name in _COUNTED_FIELDS:
+            state.set_flag(self._slot, name, bool(value))
+        else:
+            state.cols[name][self._slot] = value
+
+    return property(fget, fset)
+
+
+for _field_name in _STATE_FIELDS:
+    setattr(Combatant, _field_name, _state_field(_field_name))
+del _field_name
+
+
+class CombatState(MutableMapping):
+    """
+    Kampfzustand als Struct-of-Arrays: eine Liste pro Feld, Slot = Index.
+
+    Verhaelt sich wie das fruehere dict {id: Combatant} (Einfuegen,
+    Nachschlagen, Iteration in Einfuegereihenfolge), bietet aber
+    Rundenoperationen ueber ganze Spalten und einen Namens-Index.
+    Jeder Combatant wird beim Einfuegen an seinen Slot gebunden.
+    """
+
+    def __init__(self) -> None:
+        self.cols: dict[str, list[Any]] = {f: [] for f in _STATE_FIELDS}
+        # Direkte Spalten-Referenzen fuer die Batch-Operationen
+        self.hp = self.cols["hp"]
+        self.hp_max = self.cols["hp_max"]
+        self.ac = self.cols["ac"]
+        self.thac0 = self.cols["thac0"]
+        self.alive = self.cols["is_alive"]
+        self.player = self.cols["is_player"]
+        self.speed = self.cols["speed_factor"]
+        self.attacks_used = self.cols["attacks_this_round"]
+        self.movement_used = self.cols["movement_used"]
+        self.ids: list[str] = []
+        self.objs: list[Combatant] = []
+        self.index: dict[str, int] = {}        # id -> Slot
+        self.names: NameResolver[int] = NameResolver()  # Name -> erster Slot
+        self.enemies_alive = 0
+
+    # -- Mapping-Schnittstelle ---------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.ids)
+
+    def __contains__(self, cid: object) -> bool:
+        return cid in self.index
+
+    def __getitem__(self, cid: str) -> Combatant:
+        return self.objs[self.index[cid]]
+
+    def get(self, cid: str, default: Any = None) -> Any:
+        slot = self.index.get(cid)
+        return default if slot is None else self.objs[slot]
+
+    def values(self) -> list[Combatant]:  # type: ignore[override]
+        return list(self.objs)
+
+    def items(self) -> list[tuple[str, Combatant]]:  # type: ignore[override]
+        return list(zip(self.ids, self.objs))
+
+    def __setitem__(self, cid: str, combatant: Combatant) -> None:
+        slot = self.index.get(cid)
+        if slot is not None:
+            self._unbind(slot)
+            self._bind(slot, combatant)
+            self.objs[slot] = combatant
+            self._rebuild_names()
+            return
+        if combatant._state is not None:
+            combatant._state._unbind(combatant._slot)
+        slot = len(self.ids)
+        local = combatant._local
+        for f, col in self.cols.items():
+            col.append(local[f])  # type: ignore[index]
+        self.ids.append(cid)
+        self.objs.append(combatant)
+        self.index[cid] = slot
+        self.names.add(combatant.name, slot)
+        combatant._state, combatant._slot, combatant._local = self, slot, None
+        if local["is_alive"] and not local["is_player"]:  # type: ignore[index]
+            self.enemies_alive += 1
+
+    def __delitem__(self, cid: str) -> None:
+        # Selten (kein Pfad im Kampf) — Slots neu aufbauen statt Luecken
+        if cid not in self.index:
+            raise KeyError(cid)
+        keep = [(i, c) for i, c in zip(self.ids, self.objs) if i != cid]
+        for slot in range(len(self.objs)):
+            self._unbind(slot)
+        self.clear()
+        for other_id, c in keep:
+            self[other_id] = c
+
+    def clear(self) -> None:
+        for col in self.cols.values():
+            col.clear()
+        self.ids.clear()
+        self.objs.clear()
+        self.index.clear()
+        self.names.clear()
+        self.enemies_alive = 0
+
+    def _bind(self, slot: int, combatant: Combatant) -> None:
+        if combatant._state is not None:
+            combatant._state._unbind(combatant._slot)
+        local = combatant._local
+        for f, col in self.cols.items():
+            col[slot] = local[f]  # type: ignore[index]
+        combatant._state, combatant._slot, combatant._local = self, slot, None
+        self.enemies_alive = sum(
+            1 for a, p in zip(self.alive, self.player) if a and not p
+        )
+
+    def _unbind(self, slot: int) -> None:
+        """Kopiert die Spaltenwerte zurueck in den Combatant (z.B. vor Entfernen)."""
+        c = self.objs[slot]
+        if c._state is self:
+            c._local = {f: col[slot] for f, col in self.cols.items()}
+            c._state, c._slot = None, -1
+
+    def _rebuild_names(self) -> None:
+        self.names.rebuild((c.name, slot) for slot, c in enumerate(self.objs))
+
+    def set_flag(self, slot: int, name: str, value: bool) -> None:
+        """Setzt is_alive / is_player und haelt den Feind-Zaehler aktuell."""
+        col = self.cols[name]
+        was_enemy = self.alive[slot] and not self.player[slot]
+        col[slot] = bool(value)
+        is_enemy = self.alive[slot] and not self.player[slot]
+        self.enemies_alive += int(is_enemy) - int(was_enemy)
+
+    # -- Abfragen ----------------------------------------------------------
+
+    def find_by_name(self, name: str) -> Combatant | None:
+        """Exakter Name, sonst Teilstring-Match (case-insensitive, NameResolver)."""
+        slot = self.names.resolve(name)
+        return self.objs[slot] if slot is not None else None
+
+    def living_slots(self, players: bool) -> list[int]:
+        player = self.player
+        return [i for i, a in enumerate(self.alive) if a and player[i] is players]
+
+    def first_enemy_slot(
+        self, ac: int | None = None, exclude: Container[int] = (),
+    ) -> int | None:
+        """Erster lebender NPC (optional mit passender AC, ohne exclude-Slots)."""
+        alive, player = self.alive, self.player
+        if ac is None:
+            for i, a in enumerate(alive):
+                if a and not player[i] and i not in exclude:
+                    return i
+            return None
+        for i, c_ac in enumerate(self.ac):
+            if c_ac == ac and alive[i] and not player[i] and i not in exclude:
+                return i
+        return None
+
+    def min_enemy_speed(self, default: int = 5) -> int:
+        speeds = [s for a, p, s in zip(self.alive, self.player, self.speed) if a and not p]
+        return min(speeds) if speeds else default
+
+    # -- Rundenoperationen -------------------------------------------------
+
+    def reset_round(self) -> None:
+        """Angriffs- und Bewegungszaehler aller Teilnehmer auf 0."""
+        n = len(self.ids)
+        self.attacks_used[:] = [0] * n
+        self.movement_used[:] = [0] * n
+
+    def damage_slots(
+        self, slots: list[int], amounts: list[int],
+    ) -> list[tuple[int, int, int, int, bool]]:
+        """Schaden auf mehrere Slots: [(slot, schaden, hp_alt, hp_neu, getoetet)].
+
+        Tote Slots werden uebersprungen; ein Slot darf mehrfach vorkommen.
+        """
+        hp, alive, player = self.hp, self.alive, self.player
+        out: list[tuple[int, int, int, int, bool]] = []
+        for slot, amount in zip(slots, amounts):
+            if not alive[slot]:
+                continue
+            old = hp[slot]
+            new = old - amount
+            if new < 0:
+                new = 0
+            hp[slot] = new
+            killed = new <= 0
+            if killed:
+                alive[slot] = False
+                if not player[slot]:
+                    self.enemies_alive -= 1
+            out.append((slot, amount, old, new, killed))
+        return out
+
+    def heal_slots(
+        self, slots: list[int], amounts: list[int],
+    ) -> list[tuple[int, int, int]]:
+        """Heilung bis hp_max auf lebende Slots: [(slot, hp_alt, hp_neu)]."""
+        hp, hp_max, alive = self.hp, self.hp_max, self.alive
+        out: list[tuple[int, int, int]] = []
+        for slot, amount in zip(slots, amounts):
+            if not alive[slot]:
+                continue
+            old = hp[slot]
+            new = min(hp_max[slot], old + amount)
+            hp[slot] = new
+            out.append((slot, old, new))
+        return out
 
 
 class CombatTracker:
@@ -59,8 +354,14 @@ class CombatTracker:
 
     API:
       start_combat(location, npcs, player_stats)  -> Kampf initialisieren
+      make_player_combatant(player_stats)          -> Spieler-Combatant bauen
+      make_npc_combatant(npc)                      -> NPC-Combatant bauen
       start_new_round(mechanics)                   -> Runde starten + Initiative
       apply_damage(target_id, amount)              -> Schaden anwenden
+      apply_damage_many(target_ids, amounts)       -> Schaden auf viele Ziele
+      apply_breath_weapon(source, total, mechanics, targets) -> Flaechenschaden mit Rettungswurf
+      living_ids(players)                          -> lebende Teilnehmer einer Seite
+      resolve_attack_round(intents, mechanics)     -> alle Angriffe einer Runde gebuendelt
       find_target(target_ac, attacker)             -> Ziel ermitteln
       can_attack(combatant_id)                     -> Angriffe uebrig?
       register_attack(combatant_id)                -> Angriff zaehlen
@@ -73,7 +374,7 @@ class CombatTracker:
     """
 
     def __init__(self) -> None:
-        self._combatants: dict[str, Combatant] = {}
+        self._combatants = CombatState()
         self._round: int = 0
         self._active: bool = False
         self._log: list[str] = []
@@ -121,6 +422,11 @@ class CombatTracker:
         Returns: Liste von Meldungsstrings fuer jede Heilung.
         """
         messages: list[str] = []
+        if not self._regenerating:
+            return messages
+        state = self._combatants
+        slots: list[int] = []
+        amounts: list[int] = []
         for name, hp_per_round in list(self._regenerating.items()):
             # Combatant per Name suchen (case-insensitive)
             target = self._find_combatant_by_name(name)
@@ -129,13 +435,13 @@ class CombatTracker:
                 if target and not target.is_alive:
                     del self._regenerating[name]
                 continue
-            old_hp = target.hp
-            target.hp = min(target.hp_max, target.hp + hp_per_round)
-            healed = target.hp - old_hp
-            if healed > 0:
+            slots.append(target._slot)
+            amounts.append(hp_per_round)
+        for slot, old_hp, new_hp in state.heal_slots(slots, amounts):
+            if new_hp > old_hp:
                 msg = (
-                    f"[REGENERATION] {target.name} regeneriert +{healed} HP "
-                    f"({old_hp} -> {target.hp}/{target.hp_max})"
+                    f"[REGENERATION] {state.objs[slot].name} regeneriert +{new_hp - old_hp} HP "
+                    f"({old_hp} -> {new_hp}/{state.hp_max[slot]})"
                 )
                 self._log.append(msg)
                 logger.info(msg)
@@ -149,16 +455,7 @@ class CombatTracker:
 
     def _find_combatant_by_name(self, name: str) -> "Combatant | None":
         """Sucht Combatant per Name (case-insensitive, Teilstring-Match)."""
-        name_lower = name.strip().lower()
-        # Exakter Match
-        for c in self._combatants.values():
-            if c.name.lower() == name_lower:
-                return c
-        # Teilstring-Match
-        for c in self._combatants.values():
-            if name_lower in c.name.lower() or c.name.lower() in name_lower:
-                return c
-        return None
+        return self._combatants.find_by_name(name)
 
     # ------------------------------------------------------------------
     # Kampf starten
@@ -182,7 +479,25 @@ class CombatTracker:
         self._active = True
         self._log.clear()
 
-        # Spieler hinzufuegen
+        self._combatants["player"] = self.make_player_combatant(player_stats)
+        for npc in npcs:
+            c = self.make_npc_combatant(npc)
+            self._combatants[c.id] = c
+
+        loc_name = location.get("name", "Unbekannt")
+        participant_names = [c.name for c in self._combatants.values()]
+        logger.info(
+            "Kampf gestartet in '%s': %s",
+            loc_name, ", ".join(participant_names),
+        )
+        self._log.append(
+            f"Kampf begonnen in {loc_name}"
+        )
+
+    def make_player_combatant(
+        self, player_stats: dict[str, Any], combatant_id: str = "player",
+    ) -> Combatant:
+        """Baut einen Spieler-Combatant aus player_stats (siehe start_combat)."""
         p_weapon = player_stats.get("weapon", "Waffe")
         p_armor = player_stats.get("armor", "")
         p_reach = 1
@@ -191,8 +506,8 @@ class CombatTracker:
             p_reach = self._mechanics.lookup_weapon_reach(p_weapon)
             p_movement = self._mechanics.get_effective_movement(p_movement, p_armor)
 
-        self._combatants["player"] = Combatant(
-            id="player",
+        return Combatant(
+            id=combatant_id,
             name=player_stats.get("name", "Spieler"),
             hp=player_stats.get("hp", 10),
             hp_max=player_stats.get("hp_max", 10),
@@ -211,52 +526,42 @@ class CombatTracker:
             armor_name=p_armor,
         )
 
-        # NPCs hinzufuegen
-        for npc in npcs:
-            npc_id = npc.get("id", "unknown")
-            stats = npc.get("stats", {})
-            # Position aus Beschreibung ableiten
-            desc = npc.get("description", "").lower()
-            behavior = npc.get("behavior", "").lower()
-            if any(kw in desc or kw in behavior for kw in
-                   ("bogen", "fernkampf", "plattform", "distanz", "schiesst")):
-                position = "Fernkampf"
-            else:
-                position = "Nahkampf"
-
-            # NPC Hit Dice -> Level-Approximation fuer attacks_per_round
-            hd = stats.get("hd", 1)
-            n_weapon = stats.get("weapon", "Waffe")
-            n_reach = 1
-            if self._mechanics:
-                n_reach = self._mechanics.lookup_weapon_reach(n_weapon)
-
-            self._combatants[npc_id] = Combatant(
-                id=npc_id,
-                name=npc.get("name", npc_id),
-                hp=stats.get("hp", 4),
-                hp_max=stats.get("hp", 4),
-                ac=stats.get("ac", 10),
-                thac0=stats.get("thac0", 20),
-                weapon=n_weapon,
-                damage=stats.get("damage", "1d6"),
-                movement=stats.get("movement", 9),
-                position=position,
-                speed_factor=stats.get("speed_factor", 5),
-                level=hd,
-                class_group="warrior",
-                attacks_per_round="1/1",  # Monster: default 1
-                reach=n_reach,
-            )
+    def make_npc_combatant(self, npc: dict[str, Any]) -> Combatant:
+        """Baut einen NPC-Combatant aus einem Adventure-NPC-Dict."""
+        npc_id = npc.get("id", "unknown")
+        stats = npc.get("stats", {})
+        # Position aus Beschreibung ableiten
+        desc = npc.get("description", "").lower()
+        behavior = npc.get("behavior", "").lower()
+        if any(kw in desc or kw in behavior for kw in
+               ("bogen", "fernkampf", "plattform", "distanz", "schiesst")):
+            position = "Fernkampf"
+        else:
+            position = "Nahkampf"
 
-        loc_name = location.get("name", "Unbekannt")
-        participant_names = [c.name for c in self._combatants.values()]
-        logger.info(
-            "Kampf gestartet in '%s': %s",
-            loc_name, ", ".join(participant_names),
-        )
-        self._log.append(
-            f"Kampf begonnen in {loc_name}"
+        # NPC Hit Dice -> Level-Approximation fuer attacks_per_round
+        hd = stats.get("hd", 1)
+        n_weapon = stats.get("weapon", "Waffe")
+        n_reach = 1
+        if self._mechanics:
+            n_reach = self._mechanics.lookup_weapon_reach(n_weapon)
+
+        return Combatant(
+            id=npc_id,
+            name=npc.get("name", npc_id),
+            hp=stats.get("hp", 4),
+            hp_max=stats.get("hp", 4),
+            ac=stats.get("ac", 10),
+            thac0=stats.get("thac0", 20),
+            weapon=n_weapon,
+            damage=stats.get("damage", "1d6"),
+            movement=stats.get("movement", 9),
+            position=position,
+            speed_factor=stats.get("speed_factor", 5),
+            level=hd,
+            class_group="warrior",
+            attacks_per_round="1/1",  # Monster: default 1
+            reach=n_reach,
         )
 
     # ------------------------------------------------------------------
@@ -273,10 +578,8 @@ class CombatTracker:
         """
         self._round += 1
 
-        # Attack-Zaehler + Bewegung reset
-        for c in self._combatants.values():
-            c.attacks_this_round = 0
-            c.movement_used = 0
+        # Attack-Zaehler + Bewegung reset (ganze Spalten)
+        self._combatants.reset_round()
 
         # Gruppen-Initiative: d10, niedriger = zuerst
         self._player_initiative = mechanics.initiative_roll(0)
@@ -287,12 +590,7 @@ class CombatTracker:
             player = self._combatants.get("player")
             p_speed = player.speed_factor if player else 5
             # Niedrigster NPC-Speed
-            m_speeds = [
-                c.speed_factor for c in self._combatants.values()
-                if not c.is_player and c.is_alive
-            ]
-            m_speed = min(m_speeds) if m_speeds else 5
-            self._player_first = p_speed <= m_speed
+            self._player_first = p_speed <= self._combatants.min_enemy_speed()
         else:
             self._player_first = self._player_initiative < self._monster_initiative
 
@@ -331,14 +629,7 @@ class CombatTracker:
         c = self._combatants.get(combatant_id)
         if not c:
             return 0
-
-        apr = c.attacks_per_round
-        if apr == "2/1":
-            return 2
-        if apr == "3/2":
-            # Ungerade Runde: 1 Angriff, gerade: 2 Angriffe
-            return 2 if self._round % 2 == 0 else 1
-        return 1  # "1/1" oder unbekannt
+        return max_attacks(c.attacks_per_round, self._round)
 
     def can_attack(self, combatant_id: str) -> bool:
         """Prueft ob Combatant noch Angriffe uebrig hat."""
@@ -378,6 +669,10 @@ class CombatTracker:
                     "range_mod": 0, "reason": "Keine Grid-Engine — kein Distanz-Check"}
 
         distance = self._grid_engine.get_distance(attacker_id, target_id)
+        return self._range_check(attacker, distance)
+
+    def _range_check(self, attacker: Combatant, distance: int) -> dict[str, Any]:
+        """Reichweiten-Entscheidung fuer eine bekannte Grid-Distanz."""
         if distance >= 999:
             return {"valid": True, "distance": 0, "reach": attacker.reach,
                     "range_mod": 0, "reason": "Entities nicht auf Grid"}
@@ -435,17 +730,12 @@ class CombatTracker:
         Sortierte Reihenfolge: gewinnende Seite zuerst,
         innerhalb einer Seite nach speed_factor aufsteigend.
         """
-        players = [c for c in self._combatants.values()
-                    if c.is_player and c.is_alive]
-        monsters = [c for c in self._combatants.values()
-                    if not c.is_player and c.is_alive]
-
-        players.sort(key=lambda c: c.speed_factor)
-        monsters.sort(key=lambda c: c.speed_factor)
-
-        if self._player_first:
-            return players + monsters
-        return monsters + players
+        state = self._combatants
+        speed = state.speed
+        players = sorted(state.living_slots(True), key=speed.__getitem__)
+        monsters = sorted(state.living_slots(False), key=speed.__getitem__)
+        order = players + monsters if self._player_first else monsters + players
+        return [state.objs[i] for i in order]
 
     def is_player_side(self, thac0: int, weapon: str = "") -> bool:
         """Prueft ob ein ANGRIFF-Tag vom Spieler stammt (fuer Sortierung)."""
@@ -469,37 +759,13 @@ class CombatTracker:
         Returns:
             {target, damage, hp_old, hp_new, hp_max, killed}
         """
-        combatant = self._combatants.get(target_id)
-        if not combatant or not combatant.is_alive:
+        state = self._combatants
+        slot = state.index.get(target_id)
+        if slot is None or not state.alive[slot]:
             return {"target": target_id, "damage": 0, "hp_old": 0,
                     "hp_new": 0, "hp_max": 0, "killed": False}
-
-        hp_old = combatant.hp
-        combatant.hp = max(0, combatant.hp - amount)
-        killed = combatant.hp <= 0
-        if killed:
-            combatant.is_alive = False
-
-        result = {
-            "target": combatant.name,
-            "target_id": target_id,
-            "damage": amount,
-            "hp_old": hp_old,
-            "hp_new": combatant.hp,
-            "hp_max": combatant.hp_max,
-            "killed": killed,
-        }
-
-        log_entry = (
-            f"  {combatant.name}: -{amount} HP "
-            f"({hp_old} -> {combatant.hp}/{combatant.hp_max})"
-        )
-        if killed:
-            log_entry += " [TOT]"
-        self._log.append(log_entry)
-        logger.info(log_entry.strip())
-
-        return result
+        (hit,) = state.damage_slots([slot], [amount])
+        return self._damage_result(*hit)
 
     def heal(self, target_id: str, amount: int) -> dict[str, Any]:
         """Heilt ein Ziel (bis hp_max)."""
@@ -519,12 +785,236 @@ class CombatTracker:
             "hp_max": combatant.hp_max,
         }
 
+    def apply_damage_many(
+        self, target_ids: list[str], amounts: list[int],
+    ) -> list[dict[str, Any]]:
+        """
+        Wendet Schaden auf mehrere Ziele in einem Durchlauf an.
+
+        Returns: Ergebnisse wie apply_damage (nur fuer lebende Ziele).
+        """
+        state = self._combatants
+        slots: list[int] = []
+        valid: list[int] = []
+        for tid, amount in zip(target_ids, amounts):
+            slot = state.index.get(tid)
+            if slot is not None:
+                slots.append(slot)
+                valid.append(amount)
+        return [self._damage_result(*hit) for hit in state.damage_slots(slots, valid)]
+
+    def apply_breath_weapon(
+        self,
+        source_name: str,
+        total: int,
+        mechanics: Any = None,
+        targets: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Flaechenschaden einer Atemwaffe ([ATEM_WAFFE]) mit einem
+        Rettungswurf gegen Atemwaffe pro Ziel (Tabelle 60, Spalte 3);
+        gelungen = halber Schaden.
+
+        Ziele:
+          targets angegeben -> genau diese Teilnehmer (IDs oder Namen)
+          Quelle im Kampf   -> alle lebenden Gegner der Quelle
+          sonst             -> keine (Quelle unbekannt, z.B. Falle: der
+                               Aufrufer muss die Ziele explizit nennen)
+
+        Returns: Ergebnisse wie apply_damage, zusaetzlich 'saved' (bool)
+                 und 'player' (bool, Spielerseite).
+        """
+        state = self._combatants
+        if targets is not None:
+            slots = []
+            for ref in targets:
+                slot = state.index.get(ref)
+                if slot is None:
+                    found = state.find_by_name(ref)
+                    slot = state.index.get(found.id) if found else None
+                if slot is not None and state.alive[slot] and slot not in slots:
+                    slots.append(slot)
+        else:
+            source = self._find_combatant_by_name(source_name) if source_name else None
+            if source is None:
+                logger.warning(
+                    "Atemwaffe '%s': Quelle nicht im Kampf und keine Ziele angegeben — ignoriert",
+                    source_name,
+                )
+                return []
+            slots = state.living_slots(not source.is_player)
+
+        mech = mechanics or self._mechanics
+        level_col = state.cols["level"]
+        saved: list[bool] = []
+        amounts: list[int] = []
+        for slot in slots:
+            ok = False
+            if mech is not None:
+                target = mech.lookup_saving_throw(
+                    state.objs[slot].class_group, int(level_col[slot] or 1), 3,
+                )
+                ok = mech.saving_throw(target).is_success
+            saved.append(ok)
+            amounts.append(total // 2 if ok else total)
+
+        saved_by_slot = dict(zip(slots, saved))
+        results: list[dict[str, Any]] = []
+        for hit in state.damage_slots(slots, amounts):
+            result = self._damage_result(*hit)
+            result["saved"] = saved_by_slot[hit[0]]
+            result["player"] = bool(state.player[hit[0]])
+            results.append(result)
+        logger.info(
+            "Atemwaffe '%s': %d Schaden auf %d Ziele (%d Rettungswuerfe gelungen)",
+            source_name, total, len(results), sum(saved),
+        )
+        return results
+
+    def living_ids(self, players: bool) -> list[str]:
+        """IDs der lebenden Teilnehmer einer Seite (z.B. als Atemwaffen-Ziele)."""
+        state = self._combatants
+        return [state.ids[slot] for slot in state.living_slots(players)]
+
+    def resolve_attack_round(
+        self,
+        intents: list[dict[str, Any]],
+        mechanics: Any = None,
+        precheck: Callable[[dict[str, Any], Combatant], bool] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Loest alle ANGRIFF-Tags einer Runde in einem Durchlauf auf.
+
+        intents:  ANGRIFF-Daten {weapon, thac0, target_ac, modifiers}
+                  in Initiative-Reihenfolge
+        precheck: optionaler Filter fuer Spieler-Angriffe (Inventar,
+                  Munition); False verwirft den Angriff
+
+        Alle d20 werden als ein Batch gewuerfelt, Grid-Positionen einmal
+        gelesen. Ziele werden gegen den vorausberechneten HP-Stand gewaehlt
+        (in dieser Runde bereits getoetete Teilnehmer scheiden aus), der
+        Schaden am Ende in einem einzigen Update angewendet.
+
+        Returns: pro Intent {status, attacker, target, weapon, thac0,
+                 target_ac, modifiers, roll, reason, damage_detail,
+                 dmg_result}; status: ok | precheck | range | limit
+        """
+        mech = mechanics or self._mechanics
+        if mech is None or not intents:
+            return []
+        state = self._combatants
+        d20s = mech.roll_dice(len(intents), 20)
+        positions = self._grid_engine.get_positions() if self._grid_engine else None
+
+        projected: dict[int, int] = {}
+        dead: set[int] = set()
+        outcomes: list[dict[str, Any]] = []
+        hit_slots: list[int] = []
+        hit_amounts: list[int] = []
+        hit_outcomes: list[dict[str, Any]] = []
+
+        player_slot = state.index.get("player")
+        for data, d20 in zip(intents, d20s):
+            if player_slot is not None and player_slot in dead:
+                break  # Spieler gefallen — restliche Angriffe entfallen
+            thac0 = data["thac0"]
+            target_ac = data["target_ac"]
+            modifiers = data.get("modifiers", 0)
+            out: dict[str, Any] = {
+                "status": "ok", "attacker": None, "target": None,
+                "weapon": data["weapon"], "thac0": thac0, "target_ac": target_ac,
+                "modifiers": modifiers, "roll": None, "reason": "",
+                "damage_detail": "", "dmg_result": None,
+            }
+            outcomes.append(out)
+
+            attacker = self.get_attacker(thac0, data["weapon"], dead)
+            if attacker and attacker.is_player and precheck and not precheck(data, attacker):
+                out["status"] = "precheck"
+                continue
+            target = self.find_target(target_ac, attacker, dead)
+            out["attacker"], out["target"] = attacker, target
+
+            if attacker and target and positions is not None:
+                a_pos = positions.get(attacker.id)
+                t_pos = positions.get(target.id)
+                distance = (
+                    max(abs(a_pos[0] - t_pos[0]), abs(a_pos[1] - t_pos[1]))
+                    if a_pos and t_pos else 999
+                )
+                check = self._range_check(attacker, distance)
+                if not check["valid"]:
+                    out["status"], out["reason"] = "range", check["reason"]
+                    continue
+                modifiers += check["range_mod"]
+                out["modifiers"] = modifiers
+
+            if attacker:
+                if state.index[attacker.id] in dead or not self.can_attack(attacker.id):
+                    out["status"] = "limit"
+                    continue
+                self.register_attack(attacker.id)
+                thac0 = attacker.thac0
+                out["thac0"] = thac0
+
+            result = mech.attack_roll(
+                thac0=thac0,
+                target_ac=target.ac if target else target_ac,
+                modifiers=modifiers,
+                roll=d20,
+            )
+            out["roll"] = result
+            if not (result.is_success and target and attacker):
+                continue
+
+            damage, out["damage_detail"] = mech.roll_damage(attacker.damage)
+            slot = state.index[target.id]
+            hp_left = projected.get(slot, state.hp[slot]) - damage
+            projected[slot] = hp_left
+            if hp_left <= 0:
+                dead.add(slot)
+            hit_slots.append(slot)
+            hit_amounts.append(damage)
+            hit_outcomes.append(out)
+
+        # Vorausberechnung garantiert: kein Treffer landet auf einem toten Slot
+        for out, hit in zip(hit_outcomes, state.damage_slots(hit_slots, hit_amounts)):
+            out["dmg_result"] = self._damage_result(*hit)
+        logger.info(
+            "Kampfrunde %d: %d Angriffe, %d Treffer, %d getoetet",
+            self._round, len(intents), len(hit_outcomes), len(dead),
+        )
+        return outcomes
+
+    def _damage_result(
+        self, slot: int, amount: int, hp_old: int, hp_new: int, killed: bool,
+    ) -> dict[str, Any]:
+        """Ergebnis-Dict + Log-Eintrag fuer einen Schadens-Slot."""
+        state = self._combatants
+        name = state.objs[slot].name
+        hp_max = state.hp_max[slot]
+        log_entry = f"  {name}: -{amount} HP ({hp_old} -> {hp_new}/{hp_max})"
+        if killed:
+            log_entry += " [TOT]"
+        self._log.append(log_entry)
+        logger.info(log_entry.strip())
+        return {
+            "target": name,
+            "target_id": state.ids[slot],
+            "damage": amount,
+            "hp_old": hp_old,
+            "hp_new": hp_new,
+            "hp_max": hp_max,
+            "killed": killed,
+        }
+
     # ------------------------------------------------------------------
     # Ziel-Ermittlung
     # ------------------------------------------------------------------
 
     def find_target(
         self, target_ac: int, attacker: Combatant | None,
+        exclude: Container[int] = (),
     ) -> Combatant | None:
         """
         Ermittelt das Ziel eines Angriffs.
@@ -533,34 +1023,30 @@ class CombatTracker:
         - Angreifer ist Spieler -> Ziel ist NPC (AC-Match, dann Fallback)
         - Angreifer ist NPC     -> Ziel ist Spieler
         - Angreifer unbekannt   -> Spieler als Fallback
+
+        exclude: Slots, die als tot gelten (Rundenaufloesung).
         """
-        player = self._combatants.get("player")
+        state = self._combatants
+        player = state.get("player")
         if not player:
             return None
 
-        if attacker:
-            if attacker.is_player:
-                # Spieler greift NPC an — nach AC matchen
-                candidates = [
-                    c for c in self._combatants.values()
-                    if not c.is_player and c.is_alive and c.ac == target_ac
-                ]
-                if candidates:
-                    return candidates[0]
-                # Fallback: erster lebender NPC
-                for c in self._combatants.values():
-                    if not c.is_player and c.is_alive:
-                        return c
-                return None
-            else:
-                # NPC greift Spieler an
-                return player if player.is_alive else None
+        if attacker and attacker.is_player:
+            # Spieler greift NPC an — nach AC matchen,
+            # Fallback: erster lebender NPC
+            slot = state.first_enemy_slot(target_ac, exclude)
+            if slot is None:
+                slot = state.first_enemy_slot(exclude=exclude)
+            return state.objs[slot] if slot is not None else None
 
-        # Kein Angreifer bekannt — Fallback: Spieler als Ziel
-        return player if player.is_alive else None
+        # NPC greift Spieler an / kein Angreifer bekannt — Spieler als Ziel
+        if not player.is_alive or state.index["player"] in exclude:
+            return None
+        return player
 
     def get_attacker(
         self, attacker_thac0: int, weapon: str = "",
+        exclude: Container[int] = (),
     ) -> Combatant | None:
         """
         Ermittelt den Angreifer.
@@ -569,28 +1055,33 @@ class CombatTracker:
           1. Exakter THAC0-Match (Spieler oder NPC)
           2. Waffen-Name Match (robust gegen AI-THAC0-Abweichung)
           3. Wenn THAC0 != Spieler -> erster lebender NPC (Fallback)
+
+        exclude: NPC-Slots, die als tot gelten (Rundenaufloesung).
         """
         player = self._combatants.get("player")
         if player and player.thac0 == attacker_thac0:
             return player
 
         # NPC mit exaktem THAC0
-        for c in self._combatants.values():
-            if not c.is_player and c.is_alive and c.thac0 == attacker_thac0:
-                return c
+        state = self._combatants
+        for i, (a, p, t) in enumerate(zip(state.alive, state.player, state.thac0)):
+            if a and not p and t == attacker_thac0 and i not in exclude:
+                return state.objs[i]
 
         # Fallback: Waffen-Name matchen
         if weapon:
             weapon_lower = weapon.lower()
-            for c in self._combatants.values():
-                if not c.is_player and c.is_alive and c.weapon.lower() in weapon_lower:
+            alive, is_player = state.alive, state.player
+            for i, c in enumerate(state.objs):
+                if (alive[i] and not is_player[i] and i not in exclude
+                        and c.weapon.lower() in weapon_lower):
                     return c
 
         # Letzter Fallback: THAC0 != Spieler -> irgendein lebender NPC
         if player and attacker_thac0 != player.thac0:
-            for c in self._combatants.values():
-                if not c.is_player and c.is_alive:
-                    return c
+            slot = state.first_enemy_slot(exclude=exclude)
+            if slot is not None:
+                return state.objs[slot]
         return None
 
     # ------------------------------------------------------------------
@@ -604,22 +1095,29 @@ class CombatTracker:
             who = "Spieler" if self._player_first else "Monster"
             init_str = f" | Init: {self._player_initiative} vs {self._monster_initiative} ({who})"
         lines = [f"=== KAMPF (Runde {self._round}{init_str}) ==="]
-        for c in self._combatants.values():
-            if c.is_player:
+        state = self._combatants
+        cols = state.cols
+        for i, c in enumerate(state.objs):
+            alive = state.alive[i]
+            if state.player[i]:
                 prefix = "[SPIELER]"
-            elif c.is_alive:
+            elif alive:
                 prefix = "[FEIND]  "
             else:
                 prefix = "[TOT]    "
 
-            if c.is_alive:
-                atk_info = f"{c.attacks_this_round}/{self.get_max_attacks(c.id)}"
-                mv_info = f"Bew: {c.movement - c.movement_used}/{c.movement}"
-                reach_info = f"Rw: {c.reach}" if c.reach > 1 else ""
-                extra = f" | {reach_info}" if reach_info else ""
+            if alive:
+                reach = cols["reach"][i]
+                movement = cols["movement"][i]
+                atk_info = (
+                    f"{state.attacks_used[i]}/"
+                    f"{max_attacks(cols['attacks_per_round'][i], self._round)}"
+                )
+                mv_info = f"Bew: {movement - state.movement_used[i]}/{movement}"
+                extra = f" | Rw: {reach}" if reach > 1 else ""
                 lines.append(
-                    f"{prefix} {c.name} | HP: {c.hp}/{c.hp_max} | "
-                    f"AC: {c.ac} | {c.weapon} (Spd {c.speed_factor}) | "
+                    f"{prefix} {c.name} | HP: {state.hp[i]}/{state.hp_max[i]} | "
+                    f"AC: {state.ac[i]} | {c.weapon} (Spd {state.speed[i]}) | "
                     f"Angriffe: {atk_info} | {mv_info}{extra} | {c.position}"
                 )
             else:
@@ -655,11 +1153,7 @@ class CombatTracker:
 
     def is_combat_over(self) -> bool:
         """Prueft ob alle Feinde tot sind."""
-        return all(
-            not c.is_alive
-            for c in self._combatants.values()
-            if not c.is_player
-        )
+        return self._combatants.enemies_alive == 0
 
     def next_round(self) -> None:
         """Naechste Kampfrunde (Legacy — nutze start_new_round)."""
@@ -693,7 +1187,7 @@ class CombatTracker:
         return self._player_first
 
     @property
-    def combatants(self) -> dict[str, Combatant]:
+    def combatants(self) -> CombatState:
         return self._combatants
 
     @property
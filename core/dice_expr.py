@@ -0,0 +1,450 @@
+"""
+core/dice_expr.py — Compiler fuer Wuerfelausdruecke mit LRU-Cache
+
+Ausdruecke werden einmal geparst (AST), in Closures uebersetzt und pro
+Quelltext gecacht. roll_expression / roll_damage der MechanicsEngine und der
+Kampfsimulator (combat_sim) laufen ueber diesen Pfad.
+
+Grammatik (Leerzeichen und Gross-/Kleinschreibung egal):
+  expr   := term (('+' | '-') term)*
+  term   := unary (('*' | 'x' | '/') unary)*       '/' rundet ab
+  unary  := ('-' | '+') unary | atom
+  atom   := zahl | wuerfel | '(' expr ')'
+  wuerfel:= [N] 'd' (S | '%' | 'F') [mods]          S Seiten, F = Fudge (-1/0/+1)
+  mods   := 'kh' N | 'kl' N | 'k' N                 hoechste/niedrigste N behalten
+          | 'dh' N | 'dl' N                          hoechste/niedrigste N verwerfen
+          | '!' [N]                                  explodierend (ab N, Standard S;
+                                                     nicht bei dF)
+
+Beispiele: '2d4+2', '4d6kh3', '1d6!', '3d6x10', '(1d8+2)*2', 'd%', '4dF', '+3'
+
+Im toleranten Modus (Standard) wird der laengste gueltige Praefix benutzt:
+'1d8+8 Klaue / 3d10+8 Biss' -> '1d8+8'. Detail-Strings entsprechen dem
+bisherigen roll_damage-Format ('1d8+2: [5]+2 = 7'); verworfene Wuerfel
+stehen in Klammern, explodierte tragen ein '!'.
+
+Verwendung:
+    expr = compile_expression("4d6kh3+1")
+    total, detail = expr.roll(rng)          # rng: RNGProvider / random.Random
+    values = expr.roll_many(10_000, gen)    # NumPy-Batch (gen: np.random.Generator)
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable
+
+logger = logging.getLogger("ARS.dice_expr")
+
+_MAX_DICE = 1000          # Obergrenze Wuerfel pro Term
+_MAX_FACES = 10000
+_MAX_EXPLODE = 50         # Obergrenze Explosionen pro Wuerfel
+_CACHE_SIZE = 512
+
+
+class DiceSyntaxError(ValueError):
+    """Wuerfelausdruck nicht parsebar."""
+
+
+# ---------------------------------------------------------------------------
+# AST
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class Const:
+    value: int
+
+
+@dataclass(frozen=True)
+class Dice:
+    count: int
+    faces: int
+    keep: int | None = None         # Anzahl behaltener Wuerfel
+    keep_high: bool = True
+    explode_at: int | None = None   # Wurf >= explode_at explodiert
+    fudge: bool = False             # dF: faces=3, Augen -1/0/+1
+
+
+@dataclass(frozen=True)
+class BinOp:
+    op: str                         # '+', '-', '*', '/'
+    left: Any
+    right: Any
+
+
+@dataclass(frozen=True)
+class Neg:
+    operand: Any
+
+
+# ---------------------------------------------------------------------------
+# Parser
+# ---------------------------------------------------------------------------
+
+class _Parser:
+    def __init__(self, text: str) -> None:
+        self.s = text
+        self.pos = 0
+
+    def peek(self, n: int = 1) -> str:
+        return self.s[self.pos:self.pos + n]
+
+    def number(self) -> int | None:
+        start = self.pos
+        while self.pos < len(self.s) and self.s[self.pos].isdigit():
+            self.pos += 1
+        return int(self.s[start:self.pos]) if self.pos > start else None
+
+    def expr(self) -> Any:
+        node = self.term()
+        while self.peek() in ("+", "-"):
+            save = self.pos
+            op = self.s[self.pos]
+            self.pos += 1
+            try:
+                right = self.term()
+            except DiceSyntaxError:
+                self.pos = save
+                break
+            node = BinOp(op, node, right)
+        return node
+
+    def term(self) -> Any:
+        node = self.unary()
+        while self.peek() in ("*", "x", "/"):
+            save = self.pos
+            op = "/" if self.s[self.pos] == "/" else "*"
+            self.pos += 1
+            try:
+                right = self.unary()
+            except DiceSyntaxError:
+                self.pos = save
+                break
+            node = BinOp(op, node, right)
+        return node
+
+    def unary(self) -> Any:
+        if self.peek() == "-":
+            self.pos += 1
+            operand = self.unary()
+            return Const(-operand.value) if isinstance(operand, Const) else Neg(operand)
+        if self.peek() == "+":
+            self.pos += 1
+            return self.unary()
+        return self.atom()
+
+    def atom(self) -> Any:
+        if self.peek() == "(":
+            save = self.pos
+            self.pos += 1
+            node = self.expr()
+            if self.peek() != ")":
+                self.pos = save
+                raise DiceSyntaxError(f"')' erwartet an Position {self.pos}")
+            self.pos += 1
+            return node
+
+        save = self.pos
+        count = self.number()
+        if self.peek() == "d":
+            self.pos += 1
+            fudge = False
+            if self.peek() == "%":
+                self.pos += 1
+                faces: int | None = 100
+            elif self.peek() == "f":
+                self.pos += 1
+                faces, fudge = 3, True
+            else:
+                faces = self.number()
+            if not faces:
+                self.pos = save
+                raise DiceSyntaxError(f"Wuerfelseiten erwartet an Position {self.pos}")
+            count = 1 if count is None else count
+            if count > _MAX_DICE or faces > _MAX_FACES:
+                raise DiceSyntaxError(f"Zu viele Wuerfel: {count}d{faces}")
+            return self.dice_mods(count, faces, fudge)
+        if count is None:
+            raise DiceSyntaxError(f"Zahl oder Wuerfel erwartet an Position {self.pos}")
+        return Const(count)
+
+    def dice_mods(self, count: int, faces: int, fudge: bool = False) -> Dice:
+        keep: int | None = None
+        keep_high = True
+        explode_at: int | None = None
+        while True:
+            save = self.pos
+            tag = self.peek(2)
+            if keep is None and tag in ("kh", "kl", "dh", "dl"):
+                self.pos += 2
+                n = self.number()
+                if n is None:
+                    self.pos = save
+                    break
+                n = min(n, count)
+                if tag[0] == "k":
+                    keep, keep_high = n, tag == "kh"
+                else:
+                    keep, keep_high = count - n, tag == "dl"
+            elif keep is None and self.peek() == "k" and self.peek(2)[1:].isdigit():
+                self.pos += 1
+                keep = min(self.number() or 0, count)
+            elif explode_at is None and not fudge and self.peek() == "!":
+                self.pos += 1
+                n = self.number()
+                explode_at = n if n is not None else faces
+                if explode_at <= 1:
+                    self.pos = save
+                    raise DiceSyntaxError("Explosion ab <= 1 wuerde nie enden")
+            else:
+                break
+        return Dice(count, faces, keep, keep_high, explode_at, fudge)
+
+
+def parse(text: str, lenient: bool = True) -> tuple[Any, str]:
+    """Parst text -> (AST, tatsaechlich benutzter Ausdruck).
+
+    lenient=True: nachfolgender Freitext wird ignoriert, solange ein
+    gueltiger Praefix existiert.
+    """
+    norm = "".join(text.lower().split())
+    if not norm:
+        raise DiceSyntaxError("Leerer Ausdruck")
+    p = _Parser(norm)
+    node = p.expr()
+    if p.pos != len(norm):
+        if not lenient:
+            raise DiceSyntaxError(f"Unerwartetes Zeichen '{norm[p.pos]}' an Position {p.pos}")
+        logger.debug("Wuerfelausdruck '%s': Rest '%s' ignoriert", text, norm[p.pos:])
+    return node, norm[:p.pos]
+
+
+# ---------------------------------------------------------------------------
+# Auswertung
+# ---------------------------------------------------------------------------
+
+def _roll_die_list(rng: Any, count: int, faces: int) -> list[int]:
+    randints = getattr(rng, "randints", None)
+    if randints is not None:
+        return randints(1, faces, count)
+    return [rng.randint(1, faces) for _ in range(count)]
+
+
+def _eval_dice(node: Dice, rng: Any, parts: list[str] | None) -> int:
+    rolls = _roll_die_list(rng, node.count, node.faces)
+    if node.fudge:
+        rolls = [r - 2 for r in rolls]
+    # Explosionen: jeder Wuerfel ist eine Kette (erster Wurf + Nachwuerfe)
+    chains: list[list[int]] = [[r] for r in rolls]
+    if node.explode_at is not None:
+        for chain in chains:
+            while chain[-1] >= node.explode_at and len(chain) <= _MAX_EXPLODE:
+                chain.append(rng.randint(1, node.faces))
+    totals = [sum(c) for c in chains]
+
+    kept = set(range(len(totals)))
+    if node.keep is not None and node.keep < len(totals):
+        order = sorted(range(len(totals)), key=lambda i: totals[i], reverse=node.keep_high)
+        kept = set(order[:node.keep])
+    total = sum(totals[i] for i in kept)
+
+    if parts is not None:
+        shown = []
+        for i, chain in enumerate(chains):
+            txt = "+".join(
+                f"{v}!" if j < len(chain) - 1 else str(v) for j, v in enumerate(chain)
+            )
+            shown.append(txt if i in kept else f"({txt})")
+        parts.append(f"[{', '.join(shown)}]")
+    return total
+
+
+def _compile(node: Any) -> Callable[[Any, list[str] | None], int]:
+    """AST -> Closure(rng, parts) -> int. parts sammelt den Detail-String."""
+    if isinstance(node, Const):
+        value = node.value
+
+        def _const(rng: Any, parts: list[str] | None) -> int:
+            if parts is not None:
+                parts.append(str(value))
+            return value
+        return _const
+
+    if isinstance(node, Dice):
+        if node.keep is None and node.explode_at is None and not node.fudge:
+            count, faces = node.count, node.faces
+
+            def _plain(rng: Any, parts: list[str] | None) -> int:
+                rolls = _roll_die_list(rng, count, faces)
+                if parts is not None:
+                    parts.append(f"[{', '.join(str(r) for r in rolls)}]")
+                return sum(rolls)
+            return _plain
+
+        def _dice(rng: Any, parts: list[str] | None) -> int:
+            return _eval_dice(node, rng, parts)
+        return _dice
+
+    if isinstance(node, Neg):
+        inner = _compile(node.operand)
+
+        def _neg(rng: Any, parts: list[str] | None) -> int:
+            if parts is not None:
+                parts.append("-")
+            return -inner(rng, parts)
+        return _neg
+
+    left = _compile(node.left)
+    right = _compile(node.right)
+    op = node.op
+    paren_l = isinstance(node.left, BinOp) and op in "*/" and node.left.op in "+-"
+    paren_r = isinstance(node.right, BinOp) and (op in "*/" or op == "-")
+
+    def _binop(rng: Any, parts: list[str] | None) -> int:
+        if parts is not None and paren_l:
+            parts.append("(")
+        a = left(rng, parts)
+        if parts is not None:
+            parts.append(")" + op if paren_l else op)
+            if paren_r:
+                parts.append("(")
+        b = right(rng, parts)
+        if parts is not None and paren_r:
+            parts.append(")")
+        if op == "+":
+            return a + b
+        if op == "-":
+            return a - b
+        if op == "*":
+            return a * b
+        return a // b if b else 0
+    return _binop
+
+
+def _numpy() -> Any:
+    """NumPy erst beim ersten Batch-Wurf laden (haelt Importe leicht)."""
+    try:
+        import numpy
+    except ImportError as exc:
+        raise RuntimeError("roll_many benoetigt numpy.") from exc
+    return numpy
+
+
+def _batch(node: Any, gen: Any, n: int, np: Any) -> Any:
+    """Vektorisierte Auswertung: n unabhaengige Wuerfe als int64-Array."""
+    if isinstance(node, Const):
+        return np.full(n, node.value, dtype=np.int64)
+    if isinstance(node, Neg):
+        return -_batch(node.operand, gen, n, np)
+    if isinstance(node, Dice):
+        rolls = gen.integers(1, node.faces + 1, size=(n, node.count), dtype=np.int64)
+        if node.fudge:
+            rolls -= 2
+        if node.explode_at is not None:
+            last = rolls
+            for _ in range(_MAX_EXPLODE):
+                mask = last >= node.explode_at
+                if not mask.any():
+                    break
+                last = np.where(mask, gen.integers(1, node.faces + 1, size=rolls.shape), 0)
+                rolls = rolls + last
+        if node.keep is not None and node.keep < node.count:
+            rolls = np.sort(rolls, axis=1)
+            rolls = rolls[:, node.count - node.keep:] if node.keep_high else rolls[:, :node.keep]
+        return rolls.sum(axis=1)
+    a = _batch(node.left, gen, n, np)
+    b = _batch(node.right, gen, n, np)
+    if node.op == "+":
+        return a + b
+    if node.op == "-":
+        return a - b
+    if node.op == "*":
+        return a * b
+    return np.where(b != 0, a // np.where(b != 0, b, 1), 0)
+
+
+def _bounds(node: Any) -> tuple[int, int | None]:
+    """(Minimum, Maximum) — Maximum None bei explodierenden Wuerfeln."""
+    if isinstance(node, Const):
+        return node.value, node.value
+    if isinstance(node, Dice):
+        n = node.keep if node.keep is not None else node.count
+        if node.fudge:
+            return -n, n
+        return n, (None if node.explode_at is not None else n * node.faces)
+    if isinstance(node, Neg):
+        lo, hi = _bounds(node.operand)
+        return (-hi if hi is not None else -(1 << 62)), -lo
+    (alo, ahi), (blo, bhi) = _bounds(node.left), _bounds(node.right)
+    if node.op == "+":
+        return alo + blo, (ahi + bhi if ahi is not None and bhi is not None else None)
+    if node.op == "-":
+        return alo - (bhi if bhi is not None else 1 << 62), (ahi - blo if ahi is not None else None)
+    if ahi is None or bhi is None:
+        return min(alo * blo, 0), None
+    if node.op == "*":
+        c = [alo * blo, alo * bhi, ahi * blo, ahi * bhi]
+    else:
+        divs = [d for d in (blo, bhi) if d] or [1]
+        c = [x // d for x in (alo, ahi) for d in divs]
+    return min(c), max(c)
+
+
+# ---------------------------------------------------------------------------
+# Kompilierter Ausdruck
+# ---------------------------------------------------------------------------
+
+class DiceExpression:
+    """Kompilierter, wiederverwendbarer Wuerfelausdruck."""
+
+    __slots__ = ("source", "text", "ast", "is_constant", "_fn")
+
+    def __init__(self, source: str, ast: Any, text: str) -> None:
+        self.source = source        # Originaltext
+        self.text = text            # Normalisierter, benutzter Teil
+        self.ast = ast
+        self.is_constant = isinstance(ast, Const)
+        self._fn = _compile(ast)
+
+    def roll_total(self, rng: Any) -> int:
+        """Nur das Ergebnis (ohne Detail-String)."""
+        return self._fn(rng, None)
+
+    def roll(self, rng: Any) -> tuple[int, str]:
+        """(Ergebnis, Detail-String) im roll_damage-Format."""
+        parts: list[str] = []
+        total = self._fn(rng, parts)
+        if self.is_constant:
+            return total, str(total)
+        return total, f"{self.text}: {''.join(parts)} = {total}"
+
+    def roll_many(self, n: int, gen: Any = None) -> Any:
+        """n Wuerfe als NumPy-Array (gen: np.random.Generator oder Seed)."""
+        np = _numpy()
+        if not isinstance(gen, np.random.Generator):
+            gen = np.random.default_rng(gen)
+        return _batch(self.ast, gen, n, np)
+
+    @property
+    def bounds(self) -> tuple[int, int | None]:
+        return _bounds(self.ast)
+
+    def __repr__(self) -> str:
+        return f"DiceExpression({self.text!r})"
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def compile_expression(text: str, lenient: bool = True) -> DiceExpression | None:
+    """Parst und kompiliert text (gecacht). None wenn nicht parsebar."""
+    try:
+        ast, used = parse(text, lenient=lenient)
+    except DiceSyntaxError:
+        return None
+    return DiceExpression(text, ast, used)
+
+
+def is_dice_expression(text: str) -> bool:
+    """True wenn text vollstaendig ein gueltiger Ausdruck ist."""
+    return compile_expression(text, lenient=False) is not None
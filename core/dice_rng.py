@@ -0,0 +1,300 @@
+"""
+core/dice_rng.py — Austauschbare Zufallsquellen fuer die MechanicsEngine
+
+Alle Provider bieten dieselbe Schnittstelle wie random.Random (randint,
+choice, random) plus randints() fuer Batches. Jeder Zufallswert laeuft
+ueber randint(), damit Aufzeichnung und Replay alles erfassen.
+
+  - SystemRNG:    CSPRNG (os.urandom pro Aufruf) — Standard im Live-Spiel
+  - PooledRNG:    CSPRNG aus vorab gezogenem Entropie-Block (ein Syscall
+                  pro 4 KiB statt pro Wuerfel), unverzerrt per Rejection
+  - SeededRNG:    schneller, seedbarer PRNG fuer Simulationen und Tests
+  - ScriptedRNG:  feste Wertefolge (Regeltests)
+  - RecordingRNG: schreibt jeden Wurf (a, b, wert) in eine Log-Datei
+  - ReplayRNG:    spielt ein solches Log bit-genau wieder ab
+
+Verwendung:
+    rng = make_rng("pool")                 # oder "system", "seeded:42"
+    rng = make_rng()                       # ARS_RNG / ARS_RNG_RECORD / ARS_RNG_REPLAY
+    mech = MechanicsEngine(dice_config, tables, rng=rng)
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import random
+import threading
+from pathlib import Path
+from typing import Any, Sequence
+
+logger = logging.getLogger("ARS.dice_rng")
+
+_POOL_BYTES = 4096
+_FLOAT_BITS = 53
+
+
+class RNGReplayError(RuntimeError):
+    """Replay weicht vom aufgezeichneten Wurf-Log ab oder ist erschoepft."""
+
+
+# ---------------------------------------------------------------------------
+# Basis
+# ---------------------------------------------------------------------------
+
+class RNGProvider:
+    """Gemeinsame Schnittstelle; Unterklassen implementieren randint()."""
+
+    name = "base"
+
+    def randint(self, a: int, b: int) -> int:
+        raise NotImplementedError
+
+    def randints(self, a: int, b: int, count: int) -> list[int]:
+        """count Werte in [a, b] (Batch-Pfad fuer roll_dice)."""
+        return [self.randint(a, b) for _ in range(count)]
+
+    def choice(self, seq: Sequence[Any]) -> Any:
+        if not seq:
+            raise IndexError("choice() aus leerer Sequenz")
+        return seq[self.randint(0, len(seq) - 1)]
+
+    def random(self) -> float:
+        """Float in [0, 1) mit 53 Bit Aufloesung."""
+        return self.randint(0, (1 << _FLOAT_BITS) - 1) / (1 << _FLOAT_BITS)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.name}>"
+
+
+# ---------------------------------------------------------------------------
+# Provider
+# ---------------------------------------------------------------------------
+
+class SystemRNG(RNGProvider):
+    """Kryptographisch sicher, ein os.urandom-Aufruf pro Wurf."""
+
+    name = "system"
+
+    def __init__(self) -> None:
+        self._rng = random.SystemRandom()
+        self.randint = self._rng.randint  # type: ignore[method-assign]
+
+
+class SeededRNG(RNGProvider):
+    """Mersenne Twister mit festem Seed — reproduzierbar, kein Syscall."""
+
+    name = "seeded"
+
+    def __init__(self, seed: int | None = None) -> None:
+        self.seed = seed
+        self._rng = random.Random(seed)
+        self.randint = self._rng.randint  # type: ignore[method-assign]
+
+    def randints(self, a: int, b: int, count: int) -> list[int]:
+        rint = self._rng.randint
+        return [rint(a, b) for _ in range(count)]
+
+
+class PooledRNG(RNGProvider):
+    """CSPRNG mit Entropie-Pool: os.urandom blockweise, Rejection-Sampling."""
+
+    name = "pool"
+
+    def __init__(self, block: int = _POOL_BYTES) -> None:
+        self._block = max(64, block)
+        self._buf = b""
+        self._pos = 0
+        self._lock = threading.Lock()
+        self._limits: dict[int, tuple[int, int]] = {}   # span -> (nbytes, limit)
+        self.refills = 0
+
+    def _span_info(self, span: int) -> tuple[int, int]:
+        info = self._limits.get(span)
+        if info is None:
+            nbytes = ((span - 1).bit_length() + 7) >> 3
+            # Groesstes Vielfaches von span unterhalb 256^nbytes: kein Modulo-Bias
+            info = (nbytes, ((1 << (8 * nbytes)) // span) * span)
+            self._limits[span] = info
+        return info
+
+    def randint(self, a: int, b: int) -> int:
+        span = b - a + 1
+        if span <= 0:
+            raise ValueError(f"Leerer Bereich fuer randint({a}, {b})")
+        if span == 1:
+            return a
+        nbytes, limit = self._span_info(span)
+        with self._lock:
+            while True:
+                pos = self._pos
+                if pos + nbytes > len(self._buf):
+                    self._buf = os.urandom(self._block)
+                    self.refills += 1
+                    pos = 0
+                self._pos = pos + nbytes
+                if nbytes == 1:
+                    v = self._buf[pos]
+                else:
+                    v = int.from_bytes(self._buf[pos:pos + nbytes], "little")
+                if v < limit:
+                    return a + v % span
+
+    def randints(self, a: int, b: int, count: int) -> list[int]:
+        span = b - a + 1
+        if span <= 0:
+            raise ValueError(f"Leerer Bereich fuer randints({a}, {b})")
+        nbytes, limit = self._span_info(span)
+        if nbytes != 1 or span == 1:
+            return [self.randint(a, b) for _ in range(count)]
+        out: list[int] = []
+        with self._lock:
+            while len(out) < count:
+                if self._pos >= len(self._buf):
+                    self._buf = os.urandom(self._block)
+                    self.refills += 1
+                    self._pos = 0
+                # Ein Byte-Slice fuer alle noch fehlenden Wuerfe
+                need = count - len(out)
+                chunk = self._buf[self._pos:self._pos + need]
+                self._pos += len(chunk)
+                out.extend(a + v % span for v in chunk if v < limit)
+        return out
+
+
+class ScriptedRNG(RNGProvider):
+    """Gibt vorgegebene Werte zyklisch zurueck (ignoriert die Grenzen)."""
+
+    name = "scripted"
+
+    def __init__(self, values: Sequence[int]) -> None:
+        if not values:
+            raise ValueError("ScriptedRNG braucht mindestens einen Wert")
+        self._vals = list(values)
+        self._idx = 0
+
+    def randint(self, a: int, b: int) -> int:
+        v = self._vals[self._idx % len(self._vals)]
+        self._idx += 1
+        return v
+
+
+# ---------------------------------------------------------------------------
+# Aufzeichnung / Replay
+# ---------------------------------------------------------------------------
+
+class RecordingRNG(RNGProvider):
+    """Delegiert an inner und protokolliert jeden Wurf als 'a b wert'-Zeile."""
+
+    def __init__(self, inner: RNGProvider, path: str | Path | None = None) -> None:
+        self.inner = inner
+        self.name = f"record({inner.name})"
+        self.log: list[tuple[int, int, int]] = []
+        self._path = Path(path) if path else None
+        self._fh = None
+        self._lock = threading.Lock()
+        if self._path:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._fh = self._path.open("a", encoding="ascii")
+            atexit.register(self.close)
+
+    def randint(self, a: int, b: int) -> int:
+        v = self.inner.randint(a, b)
+        with self._lock:
+            self.log.append((a, b, v))
+            if self._fh:
+                self._fh.write(f"{a} {b} {v}\n")
+        return v
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._fh:
+                self._fh.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._fh:
+                self._fh.close()
+                self._fh = None
+
+
+class ReplayRNG(RNGProvider):
+    """Spielt ein Wurf-Log ab; jede Abweichung der Grenzen ist ein Fehler."""
+
+    name = "replay"
+
+    def __init__(self, rolls: Sequence[tuple[int, int, int]]) -> None:
+        self._rolls = list(rolls)
+        self._idx = 0
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> ReplayRNG:
+        rolls: list[tuple[int, int, int]] = []
+        with Path(path).open("r", encoding="ascii") as fh:
+            for line in fh:
+                parts = line.split()
+                if len(parts) == 3:
+                    a, b, v = (int(p) for p in parts)
+                    rolls.append((a, b, v))
+        logger.info("Wurf-Log geladen: %s (%d Wuerfe)", path, len(rolls))
+        return cls(rolls)
+
+    @property
+    def remaining(self) -> int:
+        return len(self._rolls) - self._idx
+
+    def randint(self, a: int, b: int) -> int:
+        if self._idx >= len(self._rolls):
+            raise RNGReplayError(f"Wurf-Log erschoepft nach {self._idx} Wuerfen")
+        ra, rb, v = self._rolls[self._idx]
+        if (ra, rb) != (a, b):
+            raise RNGReplayError(
+                f"Replay divergiert bei Wurf {self._idx}: "
+                f"erwartet randint({ra}, {rb}), erhalten randint({a}, {b})"
+            )
+        self._idx += 1
+        return v
+
+
+# ---------------------------------------------------------------------------
+# Factory
+# ---------------------------------------------------------------------------
+
+def make_rng(
+    spec: str | None = None,
+    record_path: str | None = None,
+    replay_path: str | None = None,
+) -> RNGProvider:
+    """
+    Baut einen Provider aus einer Spezifikation.
+
+    spec: "system" | "pool" | "seeded" | "seeded:<seed>"
+          (Standard: Umgebungsvariable ARS_RNG, sonst "system")
+    record_path: Wurf-Log schreiben (Standard: ARS_RNG_RECORD)
+    replay_path: Wurf-Log abspielen (Standard: ARS_RNG_REPLAY) — hat Vorrang
+    """
+    replay_path = replay_path or os.getenv("ARS_RNG_REPLAY") or None
+    if replay_path:
+        return ReplayRNG.from_file(replay_path)
+
+    spec = (spec or os.getenv("ARS_RNG", "system")).strip().lower()
+    kind, _, arg = spec.partition(":")
+    if kind == "pool":
+        rng: RNGProvider = PooledRNG()
+    elif kind == "seeded":
+        try:
+            rng = SeededRNG(int(arg) if arg else None)
+        except ValueError:
+            logger.warning("Ungueltiger Seed '%s' — nutze zufaelligen Seed.", arg)
+            rng = SeededRNG()
+    else:
+        if kind != "system":
+            logger.warning("Unbekannter RNG '%s' — nutze 'system'.", spec)
+        rng = SystemRNG()
+
+    record_path = record_path or os.getenv("ARS_RNG_RECORD") or None
+    if record_path:
+        rng = RecordingRNG(rng, record_path)
+        logger.info("Wurf-Aufzeichnung aktiv: %s", record_path)
+    return rng
@@ -150,7 +150,9 @@ class SimulatorEngine:
         self.party_state = None  # PartyStateManager (aktiv im Party-Modus)
         self.grid_engine = None   # GridEngine (Tile-basierte Bewegung)
         self.rules_engine = None
+        self.rng = None           # RNGProvider (core/dice_rng.py), Session-weit
         self._voice_enabled = False
+        self._voice_preloader = None  # VoicePreloader (audio/preload.py)
         self._orchestrator = None
 
     # -- ruleset helpers -----------------------------------------------------
@@ -177,6 +179,11 @@ class SimulatorEngine:
         self.ruleset.setdefault("metadata", {})["module_name"] = self.module_name
         self.dice_config = ModuleLoader.get_dice_config(self.ruleset)
 
+        # Session-weite Zufallsquelle (ARS_RNG / ARS_RNG_RECORD / ARS_RNG_REPLAY)
+        from core.dice_rng import make_rng
+        self.rng = make_rng()
+        logger.info("Zufallsquelle: %s", self.rng.name)
+
         # Lookup-Tabellen laden (z.B. add_2e_tables.json fuer THAC0, Saves)
         tables_file = self.ruleset.get("metadata", {}).get("tables_file")
         if tables_file:
@@ -370,9 +377,12 @@ class SimulatorEngine:
         if not path.exists():
             logger.warning("Adventure file not found: %s — starting sandbox session.", path)
             return
-        with path.open(encoding="utf-8-sig") as fh:
-            adventure_data = json.load(fh)
-        self._orchestrator.set_adventure(adventure_data)
+        from core.adventure_store import open_adventure_store
+        store = open_adventure_store(path)
+        if store is None:
+            logger.warning("Adventure not readable: %s — starting sandbox session.", path)
+            return
+        self._orchestrator.set_adventure(store)
         logger.info("Adventure loaded: %s", adventure_name)
 
     def enable_voice(self, barge_in: bool = True) -> None:
@@ -387,6 +397,15 @@ class SimulatorEngine:
             self._voice_pipeline.stt._backend,
             self._voice_pipeline.tts._backend,
         )
+        # Whisper, VAD und die Stimmen aus Keeper/Party im Hintergrund laden
+        from audio.preload import VOICE_PRELOAD, VoicePreloader, preload_roles
+        if VOICE_PRELOAD:
+            self._voice_preloader = VoicePreloader(
+                self._voice_pipeline.stt,
+                self._voice_pipeline.tts,
+                preload_roles(self.keeper_data, self.party_members),
+            )
+            self._voice_preloader.start()
 
     def run(self) -> None:
         if self._orchestrator is None:
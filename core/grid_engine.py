@@ -4,6 +4,7 @@ core/grid_engine.py — Grid-basierte Bewegungs-Engine
 Verwaltet ein tilebasiertes Raumgitter fuer raeumliche Mechaniken:
   - Raum-Generierung aus Adventure-Daten (heuristisch)
   - BFS-Pathfinding (8 Richtungen)
+  - Raumuebergreifendes Routing via WorldGraph (core/world_graph.py)
   - Formations-Placement aus Party-JSON
   - Bewegungs-Inferenz (Event-Driven, Combat-Tags, Narrative Keywords)
   - Distanzberechnung, Reichweitenpruefung, Nahkampf-Check
@@ -18,9 +19,12 @@ import logging
 import re
 from collections import deque
 from dataclasses import dataclass, field
+from collections.abc import Mapping
 from typing import Any
 
+from core.adventure_store import AdventureStore
 from core.event_bus import EventBus
+from core.name_resolver import NameResolver
 
 logger = logging.getLogger("ARS.grid_engine")
 
@@ -64,6 +68,7 @@ class RoomGrid:
         ]
         self.entities: dict[str, GridEntity] = {}
         self.exits: dict[str, tuple[int, int]] = {}  # exit_id -> (x, y)
+        self.names: NameResolver[str] = NameResolver()  # Name -> entity_id
 
     def in_bounds(self, x: int, y: int) -> bool:
         return 0 <= x < self.width and 0 <= y < self.height
@@ -74,17 +79,27 @@ class RoomGrid:
         return self.cells[y][x].walkable
 
     def place_entity(self, entity: GridEntity) -> None:
+        replaced = entity.entity_id in self.entities
         self.entities[entity.entity_id] = entity
+        if replaced:
+            self._rebuild_names()
+        else:
+            self.names.add(entity.name, entity.entity_id)
         if self.in_bounds(entity.x, entity.y):
             self.cells[entity.y][entity.x].entity_ids.append(entity.entity_id)
 
     def remove_entity(self, entity_id: str) -> None:
         ent = self.entities.pop(entity_id, None)
+        if ent:
+            self._rebuild_names()
         if ent and self.in_bounds(ent.x, ent.y):
             ids = self.cells[ent.y][ent.x].entity_ids
             if entity_id in ids:
                 ids.remove(entity_id)
 
+    def _rebuild_names(self) -> None:
+        self.names.rebuild((e.name, eid) for eid, e in self.entities.items())
+
     def move_entity_to(self, entity_id: str, x: int, y: int) -> None:
         ent = self.entities.get(entity_id)
         if not ent:
@@ -125,6 +140,11 @@ _DIR_MAP: dict[str, tuple[int, int]] = {
     "vorn": (0, -1), "vorwaerts": (0, -1), "zurueck": (0, 1),
 }
 
+# Explizite Richtung als ganzes Wort ("nach Norden", nicht "Nordturm")
+_DIR_WORD = re.compile(r"\b(" + "|".join(
+    sorted((k for k, v in _DIR_MAP.items() if v != (0, 0)), key=len, reverse=True)
+) + r")\b")
+
 # Klassen-Symbole (Duplikat aus tab_dungeon_view fuer Standalone-Faehigkeit)
 _CLS_SYM: dict[str, str] = {
     "fighter": "F", "kaempfer": "F", "mage": "M", "magier": "M", "wizard": "M",
@@ -241,6 +261,8 @@ class GridEngine:
       - grid.entity_moved  — Entity hat sich bewegt
       - grid.combat_move   — Kampfbewegung (zu Gegner)
       - grid.formation_placed — Party aufgestellt
+      - grid.route_planned — Route ueber mehrere Raeume geplant
+      - grid.terrain_changed — einzelne Zelle geaendert (Tuer, Einsturz)
     """
 
     def __init__(self) -> None:
@@ -249,21 +271,34 @@ class GridEngine:
         self._party_members: dict[str, GridEntity] = {}  # entity_id -> GridEntity
         self._bus = EventBus.get()
         self._formation_text: str = ""  # Raw-Formation aus Party-JSON
-        self._adventure_data: dict = {}
-        self._npc_index: dict[str, dict] = {}  # npc_id -> npc_data
+        self._adventure_data: Mapping[str, Any] = {}
+        self._store: AdventureStore | None = None
+        self._npc_index: Mapping[str, dict] = {}  # npc_id -> npc_data
         self._map_spawns: dict[str, list[int]] = {}  # npc_id -> [x, y]
+        self._world_graph: Any = None  # WorldGraph (lazy, raumuebergreifendes Routing)
 
     # ------------------------------------------------------------------
     # Setup
     # ------------------------------------------------------------------
 
-    def set_adventure(self, adventure_data: dict) -> None:
-        """Adventure-Daten setzen fuer NPC-Lookup."""
+    def set_adventure(self, adventure_data: dict | AdventureStore) -> None:
+        """Adventure-Daten setzen fuer NPC-Lookup.
+
+        Ein AdventureStore wird geteilt: NPCs werden erst beim Platzieren
+        gelesen, Location-Namen kommen aus dem Index.
+        """
+        self._world_graph = None
+        if isinstance(adventure_data, AdventureStore):
+            self._store = adventure_data
+            self._adventure_data = adventure_data.view()
+            self._npc_index = adventure_data.npcs
+            return
+        self._store = None
         self._adventure_data = adventure_data
-        self._npc_index.clear()
-        for npc in adventure_data.get("npcs", []):
-            if isinstance(npc, dict) and "id" in npc:
-                self._npc_index[npc["id"]] = npc
+        self._npc_index = {
+            npc["id"]: npc for npc in adventure_data.get("npcs", [])
+            if isinstance(npc, dict) and "id" in npc
+        }
 
     def set_formation(self, formation_text: str) -> None:
         """Formation aus Party-JSON setzen."""
@@ -288,6 +323,33 @@ class GridEngine:
         if map_data:
             return self._setup_from_map(map_data, rid, location)
 
+        room = self._build_generated_room(location, rid)
+        self._rooms_cache[rid] = room
+        self._current_room = room
+
+        self._bus.emit("grid", "room_setup", {
+            "room_id": rid,
+            "width": room.width,
+            "height": room.height,
+            "exits": dict(room.exits),
+        })
+        logger.info("Grid-Raum generiert: %s (%dx%d, %d Exits)",
+                     rid, room.width, room.height, len(room.exits))
+        return room
+
+    def build_room_grid(self, location: dict, room_id: str = "") -> RoomGrid:
+        """Baut ein RoomGrid ohne Cache, Events oder Raumwechsel.
+
+        Wird vom WorldGraph fuer seine Raeume genutzt (eager oder bei Bedarf).
+        """
+        rid = room_id or location.get("id", "unknown")
+        map_data = location.get("map")
+        if map_data:
+            return self._build_map_room(map_data, rid)
+        return self._build_generated_room(location, rid)
+
+    def _build_generated_room(self, location: dict, rid: str) -> RoomGrid:
+        """Heuristisches RoomGrid aus Beschreibung, NPC- und Exit-Anzahl."""
         # NPCs und Exits zaehlen
         npc_ids = location.get("npcs_present", [])
         exits = location.get("exits", {})
@@ -321,18 +383,6 @@ class GridEngine:
         desc = (location.get("description", "") + " " +
                 location.get("atmosphere", "")).lower()
         self._apply_terrain_deco(room, desc)
-
-        self._rooms_cache[rid] = room
-        self._current_room = room
-
-        self._bus.emit("grid", "room_setup", {
-            "room_id": rid,
-            "width": w,
-            "height": h,
-            "exits": dict(room.exits),
-        })
-        logger.info("Grid-Raum generiert: %s (%dx%d, %d Exits)",
-                     rid, w, h, len(room.exits))
         return room
 
     def _calc_door_positions(
@@ -402,6 +452,27 @@ class GridEngine:
 
     def _setup_from_map(self, map_data: dict, rid: str, location: dict) -> RoomGrid:
         """Baut RoomGrid aus vordefiniertem Map-Feld (Hybrid-Map-Support)."""
+        room = self._build_map_room(map_data, rid)
+        w, h = room.width, room.height
+
+        # Spawns merken (fuer place_npcs)
+        self._map_spawns: dict[str, list[int]] = map_data.get("spawns", {})
+
+        self._rooms_cache[rid] = room
+        self._current_room = room
+
+        self._bus.emit("grid", "room_setup", {
+            "room_id": rid,
+            "width": w,
+            "height": h,
+            "exits": dict(room.exits),
+        })
+        logger.info("Grid-Raum aus Map geladen: %s (%dx%d, %d Exits)",
+                     rid, w, h, len(room.exits))
+        return room
+
+    def _build_map_room(self, map_data: dict, rid: str) -> RoomGrid:
+        """RoomGrid aus Terrain, Exits und Deko eines Map-Felds."""
         terrain_grid = map_data.get("terrain", [])
         h = len(terrain_grid)
         w = len(terrain_grid[0]) if terrain_grid else 15
@@ -425,20 +496,6 @@ class GridEngine:
             if room.in_bounds(dx, dy):
                 room.cells[dy][dx].terrain = deco.get("type", "floor")
 
-        # Spawns merken (fuer place_npcs)
-        self._map_spawns: dict[str, list[int]] = map_data.get("spawns", {})
-
-        self._rooms_cache[rid] = room
-        self._current_room = room
-
-        self._bus.emit("grid", "room_setup", {
-            "room_id": rid,
-            "width": w,
-            "height": h,
-            "exits": dict(room.exits),
-        })
-        logger.info("Grid-Raum aus Map geladen: %s (%dx%d, %d Exits)",
-                     rid, w, h, len(room.exits))
         return room
 
     # ------------------------------------------------------------------
@@ -702,7 +759,23 @@ class GridEngine:
         # ── Richtungs-Bewegung ────────────────────────────────────
         if _PLAYER_MOVE_VERBS.search(user_input):
             direction: tuple[int, int] | None = None
+
+            # Explizite Richtung ("nach Norden") hat Vorrang vor Namens-Treffern
+            m = _DIR_WORD.search(text_lower)
+            if m:
+                direction = _DIR_MAP[m.group(1)]
+
+            # Ziel-Raum genannt ("gehe zum Thronsaal") → Route ueber WorldGraph
+            dest_id = None if direction else self._find_location_in_text(text_lower)
+            if dest_id:
+                route = self.plan_route_to(dest_id)
+                if route and route.next_exit in room.exits:
+                    ex, ey = room.exits[route.next_exit]
+                    direction = self._direction_to_point(ex, ey)
+
             for keyword, dvec in _DIR_MAP.items():
+                if direction:
+                    break
                 if keyword in text_lower:
                     if dvec == (0, 0):
                         direction = self._direction_to_nearest_exit()
@@ -1227,6 +1300,108 @@ class GridEngine:
 
         return room
 
+    def set_terrain(self, x: int, y: int, terrain: str) -> bool:
+        """Aendert das Terrain einer Zelle im aktuellen Raum (Tuer geoeffnet, Einsturz).
+
+        Haelt den WorldGraph aktuell und emittiert grid.terrain_changed,
+        damit Renderer nur den betroffenen Bereich neu zeichnen.
+        """
+        room = self._current_room
+        if not room or not room.in_bounds(x, y):
+            return False
+        cell = room.cells[y][x]
+        if cell.terrain == terrain:
+            return False
+        cell.terrain = terrain
+        cell.walkable = terrain not in ("wall", "obstacle")
+        if self._world_graph is not None:
+            self._world_graph.invalidate_room(room.room_id, room)
+        self._bus.emit("grid", "terrain_changed", {
+            "room_id": room.room_id,
+            "x": x,
+            "y": y,
+            "terrain": terrain,
+        })
+        return True
+
+    # ------------------------------------------------------------------
+    # Raumuebergreifendes Routing (WorldGraph)
+    # ------------------------------------------------------------------
+
+    def get_world_graph(self) -> Any:
+        """Gibt den WorldGraph des Adventures zurueck (lazy gebaut).
+
+        Mit AdventureStore kommt die Topologie aus dem Index; Raeume werden
+        erst gebaut (und Locations gelesen), wenn eine Route sie erreicht.
+        """
+        if self._world_graph is None:
+            from core.world_graph import WorldGraph
+
+            def builder(loc: dict, rid: str) -> RoomGrid:
+                return self._rooms_cache.get(rid) or self.build_room_grid(loc, rid)
+
+            if self._store is not None:
+                links = self._store.locations.links()
+                if not links:
+                    return None
+                self._world_graph = WorldGraph.lazy(
+                    links, self._store.locations.__getitem__, builder,
+                )
+            else:
+                locations = self._adventure_data.get("locations", [])
+                if not locations:
+                    return None
+                self._world_graph = WorldGraph.build(locations, builder)
+        return self._world_graph
+
+    def plan_route_to(self, location_id: str, goal_pos: tuple[int, int] | None = None) -> Any:
+        """Plant eine Route vom Party-Leader im aktuellen Raum zur Ziel-Location.
+
+        Gibt eine WorldRoute zurueck (rooms, hops, cost) oder None.
+        """
+        room = self._current_room
+        graph = self.get_world_graph()
+        if not room or not graph:
+            return None
+        leader = self._get_party_leader()
+        start = (leader.x, leader.y) if leader else (room.width // 2, room.height // 2)
+        route = graph.plan_route(room.room_id, start, location_id, goal_pos)
+        if route:
+            self._bus.emit("grid", "route_planned", {
+                "from": room.room_id,
+                "to": location_id,
+                "rooms": list(route.rooms),
+                "cost": route.cost,
+            })
+            logger.debug("Route %s -> %s: %s (Kosten %d)",
+                         room.room_id, location_id, " > ".join(route.rooms), route.cost)
+        return route
+
+    def _find_location_in_text(self, text_lower: str) -> str | None:
+        """Findet eine genannte Location (ID oder Namens-Wort) im Spieler-Input."""
+        room = self._current_room
+        best_id: str | None = None
+        best_score = 0
+        if self._store is not None:
+            named = self._store.locations.top_level_names()
+        else:
+            named = [
+                (loc["id"], loc.get("name", ""))
+                for loc in self._adventure_data.get("locations", [])
+                if isinstance(loc, dict) and "id" in loc
+            ]
+        for lid, name in named:
+            if room and lid == room.room_id:
+                continue
+            if lid.lower().replace("_", " ") in text_lower:
+                return lid
+            words = re.findall(r"\w{5,}", name.lower())
+            score = sum(1 for w in words if w in text_lower)
+            if score > best_score:
+                best_score = score
+                best_id = lid
+        return best_id
+
     # ------------------------------------------------------------------
     # Distanz & Reichweite
     # ------------------------------------------------------------------
@@ -1242,6 +1417,13 @@ class GridEngine:
             return 999
         return max(abs(a.x - b.x), abs(a.y - b.y))
 
+    def get_positions(self) -> dict[str, tuple[int, int]]:
+        """Snapshot aller Entity-Positionen {id: (x, y)} fuer Batch-Distanzen."""
+        room = self._current_room
+        if not room:
+            return {}
+        return {eid: (e.x, e.y) for eid, e in room.entities.items()}
+
     def get_entities_in_range(
         self, origin: tuple[int, int], radius: int,
     ) -> list[GridEntity]:
@@ -1426,16 +1608,8 @@ class GridEngine:
         room = self._current_room
         if not room:
             return None
-        name_lower = name.lower().strip()
-        # Exakt
-        for ent in room.entities.values():
-            if ent.name.lower() == name_lower:
-                return ent
-        # Teilstring
-        for ent in room.entities.values():
-            if name_lower in ent.name.lower() or ent.name.lower() in name_lower:
-                return ent
-        return None
+        eid = room.names.resolve(name)
+        return room.entities.get(eid) if eid is not None else None
 
     def _find_nearest_enemy(
         self, entity: GridEntity, entity_type: str = "monster",
@@ -1491,6 +1665,16 @@ class GridEngine:
         if not best_exit:
             return None
 
-        dx = 1 if best_exit[0] > avg_x else -1 if best_exit[0] < avg_x else 0
-        dy = 1 if best_exit[1] > avg_y else -1 if best_exit[1] < avg_y else 0
+        return self._direction_to_point(*best_exit)
+
+    def _direction_to_point(self, x: int, y: int) -> tuple[int, int] | None:
+        """Richtungsvektor vom Party-Mittelpunkt zu (x, y)."""
+        alive = [e for e in self._party_members.values() if e.alive]
+        if not alive:
+            return None
+        avg_x = sum(e.x for e in alive) / len(alive)
+        avg_y = sum(e.y for e in alive) / len(alive)
+
+        dx = 1 if x > avg_x else -1 if x < avg_x else 0
+        dy = 1 if y > avg_y else -1 if y < avg_y else 0
         return (dx, dy)
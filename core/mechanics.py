@@ -9,15 +9,22 @@ Implementiert die regelkonforme Auswertung von:
   - Rettungswuerfe (AD&D 2e, d20 roll-high)
   - Initiative (AD&D 2e, d10 niedrig = besser)
   - Tabellen-Lookups (THAC0, Saving Throws nach Klasse/Level)
+  - Schatzwuerfe (Tabellen aus dem Ruleset, z.B. add_2e_treasure_tables.json)
 """
 
 from __future__ import annotations
 
-import random
-import re
+import json
 import logging
+import re
+import threading
+from bisect import bisect_left
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable
+
+from core.dice_expr import DiceExpression, compile_expression
+from core.dice_rng import RNGProvider, SystemRNG
 
 if TYPE_CHECKING:
     from core.engine import DiceConfig
@@ -40,6 +47,216 @@ class RollResult:
     raw_rolls: list[int] = field(default_factory=list)  # Bei Bonus-/Strafwürfen alle Teilergebnisse
 
 
+# ---------------------------------------------------------------------------
+# Tabellen-Kompilierung
+# ---------------------------------------------------------------------------
+
+_ITEMS_DIR = Path(__file__).parent.parent / "data" / "lore" / "add_2e" / "items"
+_item_speed_index: _NameIndex | None = None
+_NAME_MEMO_LIMIT = 1024
+
+
+def _norm_name(name: str) -> str:
+    """'Long_Sword +1' -> 'long sword' (Kleinschrift, ohne Verzauberung)."""
+    name = re.sub(r"\s*[+-]\d+\s*$", "", name.lower().replace("_", " "))
+    return " ".join(name.replace("+", "").split())
+
+
+class _NameIndex:
+    """
+    Normalisierter Name -> Wert in O(1).
+
+    Exakte Treffer kommen aus einer Hash-Map; fuer Freitext ('Langschwert
+    des Lichts (Long Sword)') wird der bisherige Teilstring-Abgleich einmal
+    gerechnet. Jede Anfrage wird unter ihrem Rohtext memoisiert.
+    """
+
+    __slots__ = ("_entries", "_exact", "_memo")
+
+    def __init__(self, entries: Iterable[tuple[str, Any]]) -> None:
+        self._entries = [(_norm_name(n), v) for n, v in entries if n]
+        self._exact: dict[str, Any] = {}
+        for key, value in self._entries:
+            self._exact.setdefault(key, value)
+        self._memo: dict[str, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, name: str) -> Any | None:
+        try:
+            return self._memo[name]
+        except KeyError:
+            pass
+        key = _norm_name(name)
+        hit = self._exact.get(key)
+        if hit is None and key:
+            for entry_name, value in self._entries:
+                if entry_name in key or key in entry_name:
+                    hit = value
+                    break
+        if len(self._memo) >= _NAME_MEMO_LIMIT:
+            self._memo.clear()
+        self._memo[name] = hit
+        return hit
+
+
+def _compile_level_table(ranges: Iterable[tuple[str, Any]]) -> tuple[list[Any], Any]:
+    """
+    Level-Bereiche ('1-2', '3-4', '17+') -> (dichte Liste pro Level, Auslaufwert).
+
+    dense[level] ist der Wert des ersten passenden Bereichs (Reihenfolge wie
+    in der Tabelle); Level jenseits der Liste bekommen den ersten 'N+'-Wert.
+    """
+    parsed: list[tuple[int, int | None, Any]] = []
+    for key, value in ranges:
+        if key.startswith("_"):
+            continue
+        try:
+            if "+" in key:
+                parsed.append((int(key.replace("+", "")), None, value))
+            elif "-" in key:
+                lo, hi = key.split("-", 1)
+                parsed.append((int(lo), int(hi), value))
+        except ValueError:
+            logger.warning("Ungueltiger Level-Bereich '%s' in Tabelle", key)
+    top = max([lo for lo, _, _ in parsed] + [hi for _, hi, _ in parsed if hi] + [0])
+    dense: list[Any] = [None] * (top + 1)
+    tail: Any = None
+    for lo, hi, value in parsed:
+        for lvl in range(max(lo, 0), (top if hi is None else hi) + 1):
+            if dense[lvl] is None:
+                dense[lvl] = value
+        if hi is None and tail is None:
+            tail = value
+    return dense, tail
+
+
+def _level_value(table: tuple[list[Any], Any], level: int) -> Any:
+    dense, tail = table
+    if level < 0:
+        return None
+    return dense[level] if level < len(dense) else tail
+
+
+def _load_item_speed_index() -> _NameIndex:
+    """Speed-Factors aus data/lore/add_2e/items/*.json (einmal pro Prozess)."""
+    global _item_speed_index
+    if _item_speed_index is None:
+        entries: list[tuple[str, Any]] = []
+        if _ITEMS_DIR.exists():
+            for json_file in sorted(_ITEMS_DIR.glob("*.json")):
+                try:
+                    data = json.loads(json_file.read_text(encoding="utf-8"))
+                except Exception:
+                    continue
+                if "speed_factor" not in data:
+                    continue
+                entries.append((json_file.stem, data["speed_factor"]))
+                if data.get("name"):
+                    entries.append((data["name"], data["speed_factor"]))
+        _item_speed_index = _NameIndex(entries)
+    return _item_speed_index
+
+
+_RULESETS_DIR = Path(__file__).parent.parent / "modules" / "rulesets"
+_DEFAULT_TREASURE_FILE = "add_2e_treasure_tables.json"
+_COIN_TYPES = ("cp", "sp", "ep", "gp", "pp")
+_treasure_cache: dict[str, TreasureTables] = {}
+_treasure_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class TreasureType:
+    """Ein Schatztyp (DMG Table 84) mit vorkompilierten Wuerfelausdruecken."""
+    coins: tuple[tuple[str, DiceExpression, int], ...]    # (muenze, menge, chance)
+    gems: tuple[DiceExpression, int] | None               # (anzahl, chance)
+    jewelry: tuple[DiceExpression, int] | None
+    magic: tuple[DiceExpression, int] | None
+
+
+class TreasureTables:
+    """
+    Schatztabellen aus Ruleset-Daten, kompiliert fuer schnelles Ziehen.
+
+    d100-Tabellen (Edelsteine, Kunst, Magie-Kategorien) liegen als
+    aufsteigende Schwellenlisten vor; pick() findet den Eintrag per bisect
+    statt linearer Suche. Mengen-/Anzahl-Ausdruecke sind vorab kompiliert.
+    """
+
+    def __init__(self, data: dict[str, Any], source: str = "") -> None:
+        self.source = source
+        self.types: dict[str, TreasureType] = {
+            key.upper(): self._compile_type(key, entry)
+            for key, entry in data.get("treasure_types", {}).items()
+            if not key.startswith("_")
+        }
+        gems = data.get("gem_values", [])
+        self.gem_bounds = [g["max_roll"] for g in gems]
+        self.gems: list[tuple[int, str, list[str]]] = [
+            (g["base_gp"], g["tier"], g.get("examples", [])) for g in gems
+        ]
+        art = data.get("art_objects", [])
+        self.art_bounds = [a["max_roll"] for a in art]
+        self.art: list[tuple[int, int]] = [(a["min_gp"], a["max_gp"]) for a in art]
+        cats = data.get("magic_item_categories", [])
+        self.magic_bounds = [c["max_roll"] for c in cats]
+        self.magic_categories: list[str] = [c["category"] for c in cats]
+        self.magic_items: dict[str, list[str]] = {
+            k: v for k, v in data.get("magic_items", {}).items() if not k.startswith("_")
+        }
+        self.gp_values: dict[str, int] = dict(data.get("gp_values", {}))
+
+    @staticmethod
+    def _expr(text: Any, where: str) -> DiceExpression:
+        compiled = compile_expression(str(text), lenient=False)
+        if compiled is None:
+            raise ValueError(f"Ungueltiger Wuerfelausdruck '{text}' in {where}")
+        return compiled
+
+    @classmethod
+    def _compile_type(cls, key: str, entry: dict[str, Any]) -> TreasureType:
+        def counted(field_name: str) -> tuple[DiceExpression, int] | None:
+            spec = entry.get(field_name)
+            if spec is None:
+                return None
+            return cls._expr(spec["count"], f"{key}.{field_name}"), int(spec.get("chance", 100))
+
+        coins = tuple(
+            (coin, cls._expr(entry[coin]["amount"], f"{key}.{coin}"),
+             int(entry[coin].get("chance", 100)))
+            for coin in _COIN_TYPES if coin in entry
+        )
+        return TreasureType(coins, counted("gems"), counted("jewelry"), counted("magic"))
+
+    @staticmethod
+    def pick(bounds: list[int], roll: int) -> int:
+        """Index des ersten Eintrags mit roll <= max_roll (sonst letzter)."""
+        return min(bisect_left(bounds, roll), len(bounds) - 1)
+
+
+def load_treasure_tables(filename: str | None = None) -> TreasureTables:
+    """Laedt und kompiliert eine Schatztabellen-Datei (einmal pro Prozess)."""
+    filename = filename or _DEFAULT_TREASURE_FILE
+    tables = _treasure_cache.get(filename)
+    if tables is not None:
+        return tables
+    with _treasure_lock:
+        tables = _treasure_cache.get(filename)
+        if tables is None:
+            path = _RULESETS_DIR / filename
+            try:
+                with path.open(encoding="utf-8-sig") as fh:
+                    data = json.load(fh)
+            except (OSError, ValueError) as exc:
+                logger.warning("Schatztabellen nicht ladbar (%s): %s", path, exc)
+                data = {}
+            tables = TreasureTables(data, source=filename)
+            _treasure_cache[filename] = tables
+            logger.debug("Schatztabellen geladen: %s (%d Typen)", filename, len(tables.types))
+    return tables
+
+
 # ---------------------------------------------------------------------------
 # MechanicsEngine
 # ---------------------------------------------------------------------------
@@ -54,10 +271,64 @@ class MechanicsEngine:
     können andere Schwellen definieren.
     """
 
-    def __init__(self, dice_config: DiceConfig, tables_data: dict[str, Any] | None = None) -> None:
+    def __init__(
+        self,
+        dice_config: DiceConfig,
+        tables_data: dict[str, Any] | None = None,
+        rng: RNGProvider | None = None,
+    ) -> None:
         self.dice_config = dice_config
         self.tables = tables_data or {}
-        self.rng = random.SystemRandom()  # Kryptographisch sicher, für Fairness
+        # Standard: kryptographisch sicher, für Fairness (siehe core/dice_rng.py)
+        self.rng = rng if rng is not None else SystemRNG()
+        self._treasure: TreasureTables | None = None
+        self._compile_tables()
+
+    def _compile_tables(self) -> None:
+        """
+        Uebersetzt tables_data einmalig in Lookup-Strukturen: dichte Listen
+        pro Level statt Bereichs-Strings, normalisierte Namens-Maps statt
+        linearer Suche. Nach Aenderungen an self.tables erneut aufrufen.
+        """
+        t = self.tables
+        self._thac0 = {
+            g.lower(): v for g, v in t.get("thac0_by_group", {}).items()
+            if not g.startswith("_") and isinstance(v, list)
+        }
+        self._saves = {
+            g.lower(): _compile_level_table(v.items())
+            for g, v in t.get("saving_throws", {}).items()
+            if not g.startswith("_") and isinstance(v, dict)
+        }
+        self._class_groups = {
+            c.lower(): g for c, g in t.get("class_to_group", {}).items()
+            if not c.startswith("_")
+        }
+        self._apr_warrior = _compile_level_table(
+            (e.get("levels", ""), e.get("attacks", "1/1"))
+            for e in t.get("attacks_per_round", {}).get("warrior", [])
+        )
+        melee = t.get("melee_weapons", [])
+        self._reach = _NameIndex((e["name"], e.get("reach", 1)) for e in melee)
+        self._speed = _NameIndex(
+            (e["name"], e["speed"]) for e in melee if e.get("speed") is not None
+        )
+        self._ranges = _NameIndex(
+            (e["name"], {
+                "range_s": e.get("range_s", 0),
+                "range_m": e.get("range_m", 0),
+                "range_l": e.get("range_l", 0),
+                "rof": e.get("rof", "1"),
+            })
+            for e in t.get("missile_weapons", [])
+        )
+        self._armor_penalty = _NameIndex(
+            (e["name"], e.get("movement_penalty", 0)) for e in t.get("armor_catalog", [])
+        )
+        mods = t.get("combat_modifiers", {})
+        self._range_mods = (
+            mods.get("missile_medium_range", -2), mods.get("missile_long_range", -5),
+        )
 
     # ------------------------------------------------------------------
     # Kern-Probe
@@ -154,32 +425,31 @@ class MechanicsEngine:
 
     def roll_dice(self, count: int, faces: int | None = None) -> list[int]:
         """Wirft <count> Wuerfel und gibt alle Einzelergebnisse zurueck."""
-        return [self.roll_die(faces) for _ in range(count)]
+        faces = faces or self.dice_config.faces
+        randints = getattr(self.rng, "randints", None)
+        if randints is not None:
+            return randints(1, faces, count)
+        return [self.rng.randint(1, faces) for _ in range(count)]
 
     def roll_expression(self, expr: str) -> int:
         """
         Wirft einen Wuerfelausdruck wie '1d6', '2d4' oder eine feste Zahl.
         Wird fuer STABILITAET_VERLUST-Tags mit variablen Schadenswuerfen benoetigt.
+        Syntax siehe core/dice_expr.py (Keep, Explosion, Multiplikatoren).
 
         Beispiele:
-          '1d6'  -> wuerfelt 1d6
-          '2d4'  -> wuerfelt 2d4
-          '3'    -> gibt 3 zurueck
+          '1d6'    -> wuerfelt 1d6
+          '2d4'    -> wuerfelt 2d4
+          '4d6kh3' -> 4d6, die hoechsten drei zaehlen
+          '3'      -> gibt 3 zurueck
         """
-        expr = expr.strip().lower()
-        m = re.match(r"^(\d+)d(\d+)([+-]\d+)?$", expr)
-        if m:
-            count = int(m.group(1))
-            faces = int(m.group(2))
-            modifier = int(m.group(3)) if m.group(3) else 0
-            return sum(self.roll_die(faces) for _ in range(count)) + modifier
-        try:
-            return int(expr)
-        except ValueError:
+        compiled = compile_expression(expr.strip())
+        if compiled is None:
             logger.warning(
                 "Unbekannter Wuerfelausdruck '%s' -- nehme Wert 1 an.", expr
             )
             return 1
+        return compiled.roll_total(self.rng)
 
     def roll_damage(self, expr: str) -> tuple[int, str]:
         """
@@ -191,40 +461,36 @@ class MechanicsEngine:
           '1d8+2' -> (7, '1d8+2: [5]+2 = 7')
           '5'     -> (5, '5')
         """
-        expr = expr.strip().lower()
-
-        # NdN+M oder NdN-M Format
-        m = re.match(r"^(\d+)d(\d+)([+-]\d+)?$", expr)
-        if m:
-            count = int(m.group(1))
-            faces = int(m.group(2))
-            modifier = int(m.group(3)) if m.group(3) else 0
-            rolls = [self.roll_die(faces) for _ in range(count)]
-            total = sum(rolls) + modifier
-            rolls_str = ", ".join(str(r) for r in rolls)
-            if modifier > 0:
-                detail = f"{expr}: [{rolls_str}]+{modifier} = {total}"
-            elif modifier < 0:
-                detail = f"{expr}: [{rolls_str}]{modifier} = {total}"
-            else:
-                detail = f"{expr}: [{rolls_str}] = {total}"
-            return max(0, total), detail
-
-        # Feste Zahl
-        try:
-            val = int(expr)
-            return val, str(val)
-        except ValueError:
+        compiled = compile_expression(expr.strip())
+        if compiled is None:
             logger.warning(
                 "Unbekannter Schadenswurf '%s' -- nehme 1 an.", expr
             )
             return 1, "1"
+        total, detail = compiled.roll(self.rng)
+        if compiled.is_constant:
+            return total, detail
+        return max(0, total), detail
+
+    def roll_expression_batch(self, expr: str, n: int) -> Any:
+        """
+        Wirft <expr> n-mal vektorisiert (NumPy-Array) — fuer Simulationen.
+        Der Generator wird aus dem RNG-Provider geseedet, damit Aufzeichnung
+        und Replay reproduzierbar bleiben. None bei unbekanntem Ausdruck.
+        """
+        compiled = compile_expression(expr.strip())
+        if compiled is None:
+            logger.warning("Unbekannter Wuerfelausdruck '%s'.", expr)
+            return None
+        return compiled.roll_many(n, self.rng.randint(0, 2**63 - 1))
 
     # ------------------------------------------------------------------
     # AD&D 2e — THAC0-basierter Kampf
     # ------------------------------------------------------------------
 
-    def attack_roll(self, thac0: int, target_ac: int, modifiers: int = 0) -> RollResult:
+    def attack_roll(
+        self, thac0: int, target_ac: int, modifiers: int = 0, roll: int | None = None,
+    ) -> RollResult:
         """
         AD&D 2e Angriffswurf: d20 + Modifikatoren >= THAC0 - Ziel-AC.
 
@@ -232,12 +498,14 @@ class MechanicsEngine:
             thac0:     THAC0-Wert des Angreifers
             target_ac: Ruestungsklasse des Ziels (10 = ungeruestet, 0 = Vollplatte+Schild)
             modifiers: Summe aller Angriffsmodifikatoren (STR, Magie, Situation)
+            roll:      bereits gewuerfelter d20 (Batch-Pfad), sonst wird gewuerfelt
 
         Returns:
             RollResult mit Trefferergebnis
         """
         needed = thac0 - target_ac
-        roll = self.roll_die(20)
+        if roll is None:
+            roll = self.roll_die(20)
         modified_roll = roll + modifiers
 
         # Natural 20 = Auto-Hit, Natural 1 = Auto-Miss
@@ -339,8 +607,7 @@ class MechanicsEngine:
         Returns:
             THAC0-Wert. Fallback: 20.
         """
-        thac0_table = self.tables.get("thac0_by_group", {})
-        group_data = thac0_table.get(class_group.lower())
+        group_data = self._thac0.get(class_group.lower())
         if not group_data:
             logger.warning("Keine THAC0-Tabelle fuer Gruppe '%s'", class_group)
             return 20
@@ -359,28 +626,16 @@ class MechanicsEngine:
         Returns:
             Rettungswurf-Zielwert. Fallback: 20.
         """
-        save_table = self.tables.get("saving_throws", {})
-        group_data = save_table.get(class_group.lower())
-        if not group_data:
+        group_table = self._saves.get(class_group.lower())
+        if not group_table:
             logger.warning("Keine Save-Tabelle fuer Gruppe '%s'", class_group)
             return 20
 
-        # Level-Range finden (z.B. "1-2", "3-4", "17+")
-        for level_range, values in group_data.items():
-            if level_range.startswith("_"):
-                continue  # Metadaten ueberspringen
-            if "+" in level_range:
-                min_lvl = int(level_range.replace("+", ""))
-                if level >= min_lvl:
-                    return values[save_type] if save_type < len(values) else 20
-            elif "-" in level_range:
-                parts = level_range.split("-")
-                min_lvl, max_lvl = int(parts[0]), int(parts[1])
-                if min_lvl <= level <= max_lvl:
-                    return values[save_type] if save_type < len(values) else 20
-
-        logger.warning("Kein Save-Eintrag fuer %s Level %d", class_group, level)
-        return 20
+        values = _level_value(group_table, level)
+        if values is None:
+            logger.warning("Kein Save-Eintrag fuer %s Level %d", class_group, level)
+            return 20
+        return values[save_type] if save_type < len(values) else 20
 
     def lookup_class_group(self, class_name: str) -> str:
         """
@@ -392,43 +647,24 @@ class MechanicsEngine:
         Returns:
             Klassengruppe: "warrior", "priest", "rogue", "wizard"
         """
-        mapping = self.tables.get("class_to_group", {})
-        return mapping.get(class_name.lower(), "warrior")
+        return self._class_groups.get(class_name.lower(), "warrior")
 
     def lookup_speed_factor(self, weapon_name: str) -> int:
         """
-        Sucht Waffen-Speed-Factor aus den Item-Daten.
+        Sucht den Waffen-Speed-Factor.
 
-        Durchsucht data/lore/add_2e/items/*.json nach passender Waffe.
-        Fallback: 5 (mittlerer Speed).
+        Quelle: data/lore/add_2e/items/*.json (falls vorhanden), sonst die
+        'speed'-Spalte der Nahkampfwaffen-Tabelle. Fallback: 5 (mittel).
         """
-        import json
-        from pathlib import Path
-
         if not weapon_name:
             return 5
-
-        items_dir = Path(__file__).parent.parent / "data" / "lore" / "add_2e" / "items"
-        if not items_dir.exists():
+        sf = _load_item_speed_index().get(weapon_name)
+        if sf is None:
+            sf = self._speed.get(weapon_name)
+        if sf is None:
+            logger.debug("Kein Speed-Factor fuer '%s' — Fallback 5", weapon_name)
             return 5
-
-        weapon_lower = weapon_name.lower().replace("+", "").strip()
-        # Versuche exakten Dateinamen (z.B. "longsword" -> "longsword.json")
-        for json_file in items_dir.glob("*.json"):
-            try:
-                data = json.loads(json_file.read_text(encoding="utf-8"))
-                file_weapon = json_file.stem.replace("_", " ").lower()
-                item_name = data.get("name", file_weapon).lower()
-                # Match: Dateiname oder Name im JSON
-                if file_weapon in weapon_lower or weapon_lower in item_name:
-                    sf = data.get("speed_factor", 5)
-                    logger.debug("Speed-Factor fuer '%s': %d", weapon_name, sf)
-                    return sf
-            except Exception:
-                continue
-
-        logger.debug("Kein Speed-Factor fuer '%s' — Fallback 5", weapon_name)
-        return 5
+        return sf
 
     def lookup_attacks_per_round(self, class_group: str, level: int) -> str:
         """
@@ -439,21 +675,7 @@ class MechanicsEngine:
         """
         if class_group != "warrior":
             return "1/1"
-
-        apr_table = self.tables.get("attacks_per_round", {})
-        warrior_data = apr_table.get("warrior", [])
-        for entry in warrior_data:
-            levels_str = entry.get("levels", "")
-            attacks = entry.get("attacks", "1/1")
-            if "+" in levels_str:
-                min_lvl = int(levels_str.replace("+", ""))
-                if level >= min_lvl:
-                    return attacks
-            elif "-" in levels_str:
-                parts = levels_str.split("-")
-                if int(parts[0]) <= level <= int(parts[1]):
-                    return attacks
-        return "1/1"
+        return _level_value(self._apr_warrior, level) or "1/1"
 
     # ------------------------------------------------------------------
     # Waffen-Reichweite und Ruestungs-Bewegung
@@ -468,11 +690,8 @@ class MechanicsEngine:
         """
         if not weapon_name:
             return 1
-        wn = weapon_name.lower()
-        for entry in self.tables.get("melee_weapons", []):
-            if entry["name"].lower() in wn or wn in entry["name"].lower():
-                return entry.get("reach", 1)
-        return 1
+        reach = self._reach.get(weapon_name)
+        return 1 if reach is None else reach
 
     def lookup_weapon_range(self, weapon_name: str) -> dict | None:
         """
@@ -483,16 +702,8 @@ class MechanicsEngine:
         """
         if not weapon_name:
             return None
-        wn = weapon_name.lower()
-        for entry in self.tables.get("missile_weapons", []):
-            if entry["name"].lower() in wn or wn in entry["name"].lower():
-                return {
-                    "range_s": entry.get("range_s", 0),
-                    "range_m": entry.get("range_m", 0),
-                    "range_l": entry.get("range_l", 0),
-                    "rof": entry.get("rof", "1"),
-                }
-        return None
+        rng = self._ranges.get(weapon_name)
+        return dict(rng) if rng is not None else None
 
     def get_range_modifier(self, weapon_name: str, distance_yards: int) -> int:
         """
@@ -511,9 +722,9 @@ class MechanicsEngine:
         if distance_yards <= rng["range_s"]:
             return 0
         elif distance_yards <= rng["range_m"]:
-            return self.tables.get("combat_modifiers", {}).get("missile_medium_range", -2)
+            return self._range_mods[0]
         elif distance_yards <= rng["range_l"]:
-            return self.tables.get("combat_modifiers", {}).get("missile_long_range", -5)
+            return self._range_mods[1]
         else:
             return -99  # Ausser Reichweite
 
@@ -525,11 +736,8 @@ class MechanicsEngine:
         """
         if not armor_name:
             return 0
-        an = armor_name.lower()
-        for entry in self.tables.get("armor_catalog", []):
-            if entry["name"].lower() in an or an in entry["name"].lower():
-                return entry.get("movement_penalty", 0)
-        return 0
+        penalty = self._armor_penalty.get(armor_name)
+        return 0 if penalty is None else penalty
 
     def get_effective_movement(self, base_movement: int, armor_name: str) -> int:
         """
@@ -752,6 +960,22 @@ class MechanicsEngine:
         5: 5, 6: 6, 7: 7, 8: 8, 10: 9, 11: 10, 13: 11,
     }
 
+    # Unbekannte numerische HD: Obergrenzen -> Spalte (HD <= 1 Skelett, ...)
+    _HD_BOUNDS: tuple[float, ...] = (1, 2, 3, 4, 5, 6, 7, 8, 10)
+    _HD_BOUND_COLUMNS: tuple[int, ...] = (0, 1, 2, 4, 5, 6, 7, 8, 9, 11)
+
+    def _turn_column(self, undead_hd: int | float | str) -> int:
+        """Spalte in _TURN_TABLE: Name/bekannte HD per Map, sonst per bisect."""
+        if isinstance(undead_hd, str):
+            col = self._UNDEAD_COLUMN.get(undead_hd.lower())
+            return 11 if col is None else col  # Unbekannt -> Special
+        col = self._UNDEAD_COLUMN.get(undead_hd)
+        if col is not None:
+            return col
+        if isinstance(undead_hd, (int, float)):
+            return self._HD_BOUND_COLUMNS[bisect_left(self._HD_BOUNDS, undead_hd)]
+        return 11
+
     def turn_undead(self, cleric_level: int, undead_hd: int | float | str) -> dict[str, Any]:
         """
         AD&D 2e Untote vertreiben (PHB Table 61).
@@ -772,39 +996,7 @@ class MechanicsEngine:
         # Tabellen-Zeilenindex (0-13, ab Level 14+ bleibt Zeile 13)
         row_idx = max(0, min(cleric_level - 1, 13))
 
-        # Spalten-Index ermitteln
-        if isinstance(undead_hd, str):
-            col_idx = self._UNDEAD_COLUMN.get(undead_hd.lower())
-        else:
-            col_idx = self._UNDEAD_COLUMN.get(undead_hd)
-
-        if col_idx is None:
-            # Unbekannter Untoten-Typ: Fallback auf numerischen Naherungs-Index
-            if isinstance(undead_hd, (int, float)):
-                # HD <= 1 -> Skelett, HD 2 -> Zombie, etc.
-                if undead_hd <= 1:
-                    col_idx = 0
-                elif undead_hd <= 2:
-                    col_idx = 1
-                elif undead_hd <= 3:
-                    col_idx = 2
-                elif undead_hd <= 4:
-                    col_idx = 4
-                elif undead_hd <= 5:
-                    col_idx = 5
-                elif undead_hd <= 6:
-                    col_idx = 6
-                elif undead_hd <= 7:
-                    col_idx = 7
-                elif undead_hd <= 8:
-                    col_idx = 8
-                elif undead_hd <= 10:
-                    col_idx = 9
-                else:
-                    col_idx = 11
-            else:
-                col_idx = 11  # Unbekannt -> Special
-
+        col_idx = self._turn_column(undead_hd)
         table_value = self._TURN_TABLE[row_idx][col_idx]
 
         # Ergebnis auswerten
@@ -876,434 +1068,14 @@ class MechanicsEngine:
     # AD&D 2e — Schatz wuerfeln (Treasure Roll)
     # ------------------------------------------------------------------
 
-    # Vereinfachte Schatz-Tabelle.
-    # Muenzen-Format: (wuerfelanzahl, wuerfelseiten, multiplikator, prozent_chance)
-    # Gems/Schmuck-Format: (wuerfelanzahl, wuerfelseiten, prozent_chance)
-    # Magie-Format: (anzahl_magische_gegenstaende, prozent_chance)
-    _TREASURE_TYPES: dict[str, dict[str, Any]] = {
-        "A": {
-            "cp":      (1, 6, 1000, 25),
-            "sp":      (1, 6, 1000, 30),
-            "ep":      (1, 6, 1000, 20),
-            "gp":      (1, 10, 1000, 40),
-            "pp":      (1, 4, 100, 25),
-            "gems":    (4, 10, 60),
-            "jewelry": (3, 6, 50),
-            "magic":   (3, 30),
-        },
-        "B": {
-            "cp":      (1, 8, 1000, 50),
-            "sp":      (1, 6, 1000, 25),
-            "ep":      (1, 4, 1000, 25),
-            "gp":      (1, 3, 1000, 25),
-            "gems":    (1, 6, 25),
-            "jewelry": (1, 6, 25),
-            "magic":   (1, 10),
-        },
-        "C": {
-            "cp":      (1, 12, 1000, 20),
-            "sp":      (1, 4, 1000, 30),
-            "ep":      (1, 4, 1000, 10),
-            "gems":    (1, 4, 25),
-            "jewelry": (1, 4, 25),
-            "magic":   (2, 10),
-        },
-        "D": {
-            "cp":      (1, 8, 1000, 10),
-            "sp":      (1, 12, 1000, 15),
-            "gp":      (1, 6, 1000, 60),
-            "gems":    (1, 8, 30),
-            "jewelry": (1, 4, 30),
-            "magic":   (2, 15),
-        },
-        "E": {
-            "cp":      (1, 10, 1000, 5),
-            "sp":      (1, 12, 1000, 30),
-            "ep":      (1, 6, 1000, 25),
-            "gp":      (1, 8, 1000, 25),
-            "gems":    (1, 10, 15),
-            "jewelry": (1, 4, 10),
-            "magic":   (3, 25),
-        },
-        "H": {
-            "cp":      (3, 8, 1000, 25),
-            "sp":      (1, 100, 1000, 40),
-            "ep":      (1, 4, 10000, 40),
-            "gp":      (1, 6, 10000, 55),
-            "pp":      (1, 8, 1000, 25),
-            "gems":    (1, 100, 50),
-            "jewelry": (3, 10, 50),
-            "magic":   (4, 15),
-        },
-        # ── Typ F (DMG Table 84) ──────────────────────────────────────
-        "F": {
-            "sp":      (1, 8, 1000, 10),
-            "ep":      (1, 10, 1000, 15),
-            "gp":      (1, 4, 1000, 40),
-            "pp":      (1, 4, 200, 35),
-            "gems":    (1, 4, 20),
-            "jewelry": (1, 4, 10),
-            "magic":   (1, 15),
-        },
-        # ── Typ G (DMG Table 84) ──────────────────────────────────────
-        "G": {
-            "gp":      (1, 4, 10000, 50),
-            "pp":      (1, 6, 1000, 50),
-            "gems":    (3, 6, 25),
-            "jewelry": (1, 10, 25),
-            "magic":   (4, 30),
-        },
-        # ── Individuelle Typen I–N (pro Monster, DMG Table 84) ───────
-        # Format gleich wie Lair-Typen, nur kleinere Mengen.
-        "I": {
-            "pp":   (3, 8, 1, 30),
-        },
-        "J": {
-            "cp":   (3, 8, 1, 45),
-            "sp":   (3, 8, 1, 45),
-        },
-        "K": {
-            "cp":   (3, 8, 1, 90),
-            "sp":   (3, 8, 1, 90),
-        },
-        "L": {
-            "gems": (1, 4, 50),
-        },
-        "M": {
-            "gp":   (2, 4, 1, 40),
-            "pp":   (4, 6, 1, 50),
-        },
-        "N": {
-            "magic": (2, 4),
-        },
-        # ── Typ O (DMG Table 84) ─────────────────────────────────────
-        "O": {
-            "sp":   (1, 4, 1, 25),
-            "gp":   (1, 4, 1, 25),
-        },
-        # ── Typ P (DMG Table 84) — Potions only ─────────────────────
-        "P": {
-            "magic": (1, 100),
-        },
-        # ── Typ Q (DMG Table 84) — Scrolls only ─────────────────────
-        "Q": {
-            "magic": (1, 100),
-        },
-    }
-
-    # ── DMG Table 85: Gem Base Value ─────────────────────────────────────
-    # Format: (d100_max, base_gp, tier_name, example_stones)
-    # Variation (DMG Table 86) wird in roll_gem() angewendet.
-    _GEM_VALUE_TABLE: list[tuple[int, int, str, list[str]]] = [
-        (25,    10, "Ornamental", [
-            "Azurit", "Banded Achat", "Blauer Quarz", "Augen-Achat",
-            "Haematit", "Lapislazuli", "Malachit", "Moos-Achat",
-            "Obsidian", "Rhodochrosit", "Tigerauge", "Tuerkis",
-        ]),
-        (50,    50, "Halbedelstein", [
-            "Blutstein", "Karneol", "Chalcedon", "Chrysopras",
-            "Citrin", "Jaspis", "Mondstein", "Onyx",
-            "Bergkristall", "Sardonyx", "Rauchquarz", "Rosenquarz", "Zirkon",
-        ]),
-        (70,   100, "Schmuckstein", [
-            "Bernstein", "Alexandrit", "Amethyst", "Chrysoberyll",
-            "Koralle", "Granat", "Jade", "Jet", "Perle",
-        ]),
-        (90,   500, "Edelstein", [
-            "Aquamarin", "Peridot", "Spinell", "Topas", "Turmalin",
-        ]),
-        (99,  1000, "Kostbarer Edelstein", [
-            "Opal", "Orient. Amethyst", "Orient. Topas", "Saphir",
-        ]),
-        (100, 5000, "Juwel", [
-            "Schwarzer Opal", "Schwarzer Saphir", "Diamant",
-            "Smaragd", "Jacinth", "Orient. Smaragd", "Rubin",
-            "Sternrubin", "Sternsaphir",
-        ]),
-    ]
-
-    # ── DMG Table 87: Objects of Art ─────────────────────────────────────
-    # Format: (d100_max, min_gp_value, max_gp_value)
-    _ART_OBJECT_TABLE: list[tuple[int, int, int]] = [
-        (10,    10,    40),
-        (25,    41,   180),
-        (40,   181,   300),
-        (50,   200,  1200),
-        (60,   300,  1800),
-        (70,   400,  2400),
-        (80,   500,  3000),
-        (85,  1000,  4000),
-        (90,  1000,  6000),
-        (95,  2000,  8000),
-        (99,  2000, 12000),
-        (100, 2000, 20000),
-    ]
-
-    # ── DMG Table 88: Magic Item Determination (d100) ─────────────────────
-    # Format: (d100_max, category_name)
-    _MAGIC_ITEM_TABLE: list[tuple[int, str]] = [
-        (20,  "Potions and Oils"),
-        (35,  "Scrolls"),
-        (40,  "Rings"),
-        (41,  "Rods"),
-        (42,  "Staves"),
-        (45,  "Wands"),
-        (46,  "Books and Tomes"),
-        (48,  "Jewels and Jewelry"),
-        (50,  "Cloaks and Robes"),
-        (52,  "Boots and Gloves"),
-        (53,  "Girdles and Helms"),
-        (55,  "Bags and Bottles"),
-        (56,  "Dusts and Stones"),
-        (57,  "Household Items and Tools"),
-        (58,  "Musical Instruments"),
-        (60,  "The Weird Stuff"),
-        (75,  "Armor and Shields"),
-        (100, "Weapons"),
-    ]
+    # Tabellen: modules/rulesets/add_2e_treasure_tables.json (siehe TreasureTables)
 
-    # ── DMG Tables 89-110: Sub-tables per magic item category ─────────────
-    _MAGIC_ITEM_SUBTABLES: dict[str, list[str]] = {
-        "Potions and Oils": [
-            "Potion of Animal Control", "Potion of Clairvoyance", "Potion of Climbing",
-            "Potion of Delusion", "Potion of Diminution", "Potion of ESP",
-            "Potion of Extra-Healing", "Potion of Fire Resistance", "Potion of Flying",
-            "Potion of Gaseous Form", "Potion of Giant Strength", "Potion of Growth",
-            "Potion of Healing", "Potion of Heroism", "Potion of Invisibility",
-            "Potion of Invulnerability", "Potion of Levitation", "Potion of Longevity",
-            "Potion of Speed", "Potion of Super-Heroism",
-            "Oil of Acid Resistance", "Oil of Disenchantment", "Oil of Etherealness",
-            "Oil of Fiery Burning", "Oil of Impact", "Oil of Slipperiness",
-            "Oil of Timelessness", "Philter of Glibness", "Philter of Love",
-            "Philter of Persuasiveness", "Potion of Plant Control",
-            "Potion of Polymorph Self", "Potion of Rainbow Hues",
-            "Potion of Treasure Finding", "Potion of Undead Control",
-            "Potion of Vitality", "Potion of Water Breathing",
-            "Elixir of Health", "Elixir of Madness", "Elixir of Youth",
-        ],
-        "Scrolls": [
-            "Scroll: 1 Zauber (Level 1-4)", "Scroll: 1 Zauber (Level 1-6)",
-            "Scroll: 2 Zauber (Level 1-4)", "Scroll: 2 Zauber (Level 2-9)",
-            "Scroll: 3 Zauber (Level 1-4)", "Scroll: 3 Zauber (Level 2-9)",
-            "Scroll: 4 Zauber (Level 1-6)", "Scroll: 5 Zauber (Level 1-6)",
-            "Scroll: 5 Zauber (Level 4-9)", "Scroll: 7 Zauber (Level 1-8)",
-            "Scroll of Protection from Demons",
-            "Scroll of Protection from Devils",
-            "Scroll of Protection from Elementals",
-            "Scroll of Protection from Lycanthropes",
-            "Scroll of Protection from Magic",
-            "Scroll of Protection from Petrification",
-            "Scroll of Protection from Plants",
-            "Scroll of Protection from Possession",
-            "Scroll of Protection from Undead",
-            "Verfluchter Scroll",
-        ],
-        "Rings": [
-            "Ring of Animal Friendship", "Ring of Contrariness",
-            "Ring of Djinni Summoning", "Ring of Elemental Command",
-            "Ring of Feather Falling", "Ring of Fire Resistance",
-            "Ring of Free Action", "Ring of Human Influence",
-            "Ring of Invisibility", "Ring of Mammal Control",
-            "Ring of Multiple Wishes", "Ring of Protection +1",
-            "Ring of Protection +2", "Ring of Protection +3",
-            "Ring of the Ram", "Ring of Regeneration",
-            "Ring of Shooting Stars", "Ring of Spell Storing",
-            "Ring of Spell Turning", "Ring of Warmth", "Ring of Wizardry",
-        ],
-        "Rods": [
-            "Rod of Absorption", "Rod of Alertness", "Rod of Beguiling",
-            "Rod of Cancellation", "Rod of Flailing", "Rod of Lordly Might",
-            "Rod of Passage", "Rod of Resurrection", "Rod of Rulership",
-            "Rod of Security", "Rod of Smiting", "Rod of Splendor",
-            "Rod of Terror", "Rod of Withering",
-        ],
-        "Staves": [
-            "Staff of Command", "Staff of Curing", "Staff of the Magi",
-            "Staff of Power", "Staff of the Serpent", "Staff of Slinging",
-            "Staff of Striking", "Staff of Swarming Insects",
-            "Staff of Thunder & Lightning", "Staff of Withering",
-            "Staff of the Woodlands",
-        ],
-        "Wands": [
-            "Wand of Conjuration", "Wand of Enemy Detection",
-            "Wand of Fear", "Wand of Fire", "Wand of Flame Extinguishing",
-            "Wand of Frost", "Wand of Illumination", "Wand of Lightning",
-            "Wand of Magic Detection", "Wand of Magic Missiles",
-            "Wand of Metal & Mineral Detection", "Wand of Negation",
-            "Wand of Paralyzation", "Wand of Polymorphing",
-            "Wand of Secret Door & Trap Location",
-            "Wand of Size Alteration", "Wand of Wonder",
-        ],
-        "Books and Tomes": [
-            "Book of Exalted Deeds", "Book of Infinite Spells",
-            "Book of Vile Darkness", "Libram of Gainful Conjuration",
-            "Libram of Silver Magic", "Manual of Bodily Health",
-            "Manual of Gainful Exercise", "Manual of Golems",
-            "Manual of Puissant Skill at Arms",
-            "Manual of Quickness of Action",
-            "Manual of Stealthy Pilfering", "Tome of Clear Thought",
-            "Tome of Leadership and Influence",
-            "Tome of Understanding", "Vacuous Grimoire",
-        ],
-        "Jewels and Jewelry": [
-            "Amulet of Life Protection", "Amulet of the Planes",
-            "Amulet of Proof Against Detection and Location",
-            "Amulet versus Undead", "Brooch of Shielding",
-            "Gem of Brightness", "Gem of Seeing", "Medallion of ESP",
-            "Necklace of Adaptation", "Necklace of Missiles",
-            "Necklace of Prayer Beads", "Necklace of Strangulation",
-            "Periapt of Foul Rotting", "Periapt of Health",
-            "Periapt of Proof Against Poison", "Periapt of Wound Closure",
-            "Phylactery of Faithfulness", "Phylactery of Long Years",
-            "Phylactery of Monstrous Attention", "Scarab of Death",
-            "Scarab of Enraging Enemies", "Scarab of Insanity",
-            "Scarab of Protection", "Scarab Versus Golems",
-            "Talisman of Pure Good", "Talisman of Ultimate Evil",
-            "Talisman of the Sphere", "Talisman of Zagy",
-        ],
-        "Cloaks and Robes": [
-            "Cloak of Arachnida", "Cloak of Displacement",
-            "Cloak of Elvenkind", "Cloak of the Bat",
-            "Cloak of the Manta Ray", "Cloak of Poisonousness",
-            "Cloak of Protection +1", "Cloak of Protection +2",
-            "Cloak of Protection +3", "Robe of the Archmagi",
-            "Robe of Blending", "Robe of Eyes",
-            "Robe of Powerlessness", "Robe of Scintillating Colors",
-            "Robe of Stars", "Robe of Useful Items", "Robe of Vermin",
-        ],
-        "Boots and Gloves": [
-            "Boots of Dancing", "Boots of Elvenkind",
-            "Boots of Levitation", "Boots of Speed",
-            "Boots of Striding and Springing", "Boots of the North",
-            "Boots of Varied Tracks", "Bracers of Archery",
-            "Bracers of Brachiation", "Bracers of Defense",
-            "Bracers of Defenselessness", "Gauntlets of Dexterity",
-            "Gauntlets of Fumbling", "Gauntlets of Ogre Power",
-            "Gauntlets of Swimming and Climbing",
-            "Gloves of Missile Snaring", "Gloves of Thievery",
-        ],
-        "Girdles and Helms": [
-            "Girdle of Dwarvenkind", "Girdle of Femininity/Masculinity",
-            "Girdle of Giant Strength", "Girdle of Many Pouches",
-            "Hat of Disguise", "Hat of Stupidity",
-            "Helm of Brilliance", "Helm of Comprehending Languages",
-            "Helm of Opposite Alignment", "Helm of Telepathy",
-            "Helm of Teleportation", "Helm of Underwater Action",
-        ],
-        "Bags and Bottles": [
-            "Alchemy Jug", "Bag of Beans", "Bag of Devouring",
-            "Bag of Holding", "Bag of Transmuting", "Bag of Tricks",
-            "Beaker of Plentiful Potions", "Bottle of Air",
-            "Bucknard's Everfull Purse", "Candle of Invocation",
-            "Decanter of Endless Water", "Eversmoking Bottle",
-            "Flask of Curses", "Heward's Handy Haversack",
-            "Iron Flask", "Portable Hole",
-        ],
-        "Dusts and Stones": [
-            "Dust of Appearance", "Dust of Disappearance",
-            "Dust of Dryness", "Dust of Illusion",
-            "Dust of Sneezing and Choking", "Dust of Tracelessness",
-            "Ioun Stone", "Keoghtom's Ointment",
-            "Philosopher's Stone",
-            "Stone of Controlling Earth Elementals",
-            "Stone of Good Luck", "Stone of Weight",
-            "Universal Solvent",
-        ],
-        "Household Items and Tools": [
-            "Broom of Animated Attack", "Broom of Flying",
-            "Carpet of Flying", "Crystal Ball",
-            "Crystal Hypnosis Ball", "Cube of Force",
-            "Cube of Frost Resistance", "Eyes of Charming",
-            "Eyes of Minute Seeing", "Eyes of Petrification",
-            "Eyes of the Eagle", "Figurine of Wondrous Power",
-            "Folding Boat", "Horseshoes of a Zephyr",
-            "Horseshoes of Speed", "Lenses of Detection",
-            "Mattock of the Titans", "Maul of the Titans",
-            "Mirror of Life Trapping", "Mirror of Mental Prowess",
-            "Mirror of Opposition", "Murlynd's Spoon",
-            "Nolzur's Marvelous Pigments", "Pearl of Power",
-            "Pearl of the Sirines", "Quaal's Feather Token",
-            "Rope of Climbing", "Rope of Constriction",
-            "Rope of Entanglement", "Rug of Smothering",
-            "Rug of Welcome", "Saw of Mighty Cutting",
-            "Sovereign Glue", "Spade of Colossal Excavation",
-        ],
-        "Musical Instruments": [
-            "Chime of Hunger", "Chime of Opening",
-            "Drums of Deafening", "Drums of Panic",
-            "Harp of Charming", "Horn of Blasting",
-            "Horn of Bubbles", "Horn of Collapsing",
-            "Horn of Goodness (Evil)", "Horn of the Tritons",
-            "Horn of Valhalla", "Lyre of Building",
-            "Pipes of Haunting", "Pipes of Pain",
-            "Pipes of the Sewers",
-        ],
-        "The Weird Stuff": [
-            "Apparatus of Kwalish",
-            "Bowl of Commanding Water Elementals",
-            "Brazier of Commanding Fire Elementals",
-            "Censer of Controlling Air Elementals",
-            "Cubic Gate", "Daern's Instant Fortress",
-            "Deck of Many Things", "Efreeti Bottle",
-            "Sphere of Annihilation", "Well of Many Worlds",
-            "Wind Fan",
-        ],
-        "Armor and Shields": [
-            "Chain Mail +1", "Chain Mail +2", "Chain Mail +3",
-            "Leather Armor +1", "Plate Mail +1", "Plate Mail +2",
-            "Plate Mail +3", "Full Plate +1", "Full Plate +2",
-            "Ring Mail +1", "Scale Mail +1", "Scale Mail +2",
-            "Splint Mail +1", "Studded Leather +1",
-            "Shield +1", "Shield +2", "Shield +3", "Shield +4",
-            "Shield +5", "Armor of Blending",
-            "Armor of Missile Attraction", "Armor of Etherealness",
-            "Armor of Command", "Armor of Vulnerability",
-            "Elven Chain Mail",
-        ],
-        "Weapons": [
-            "Arrow +1 (2d6)", "Arrow +2 (2d4)", "Arrow +3 (1d6)",
-            "Arrow of Slaying", "Axe +1", "Axe +2", "Axe +3",
-            "Battle Axe +1", "Bolt +1 (2d6)", "Bolt +2 (2d4)",
-            "Bow +1", "Crossbow of Accuracy +3", "Crossbow of Distance",
-            "Crossbow of Speed", "Dagger +1", "Dagger +2",
-            "Dagger +2, +3 vs. Larger", "Dagger of Venom",
-            "Dart +1 (1d6)", "Flail +1", "Hammer +1", "Hammer +2",
-            "Hammer +3, Dwarven Thrower", "Hammer of Thunderbolts",
-            "Javelin +2", "Javelin of Lightning", "Javelin of Piercing",
-            "Long Sword +1", "Long Sword +2", "Long Sword +3",
-            "Long Sword +1, +2 vs. Magic-Using",
-            "Long Sword +1, +3 vs. Regenerating",
-            "Long Sword +1, +3 vs. Lycanthropes/Shape-Changers",
-            "Long Sword +1, +4 vs. Reptiles",
-            "Long Sword +1, Flame Tongue",
-            "Long Sword +2, Giant Slayer",
-            "Long Sword +2, Dragon Slayer",
-            "Long Sword +3, Frost Brand",
-            "Long Sword +4, Defender", "Long Sword +5, Defender",
-            "Long Sword +5, Holy Avenger",
-            "Long Sword of Wounding", "Long Sword of Life Stealing",
-            "Long Sword of Sharpness", "Long Sword, Luck Blade",
-            "Long Sword, Nine Lives Stealer", "Long Sword, Vorpal",
-            "Cursed Sword, Berserking", "Cursed Sword -2",
-            "Mace +1", "Mace +2", "Mace +3", "Mace +4",
-            "Mace of Disruption", "Mace of Smiting", "Mace of Terror",
-            "Morning Star +1", "Scimitar +1", "Scimitar +2",
-            "Short Sword +1", "Short Sword +2",
-            "Short Sword of Backstabbing", "Short Sword of Quickness",
-            "Short Sword, Luck Blade", "Spear +1", "Spear +2",
-            "Spear +3", "Spear, Cursed Backbiter",
-            "Trident of Fish Command", "Trident of Submission",
-            "Trident of Warning", "Trident of Yearning",
-            "Two-Handed Sword +1", "Two-Handed Sword +2",
-            "Two-Handed Sword +3", "Two-Handed Sword of Wounding",
-            "War Hammer +1", "War Hammer +2",
-        ],
-    }
-
-    # Fallback-Durchschnittswerte (nur fuer Faelle ohne Detailwurf)
-    _GEM_GP_VALUE = 50
-    _JEWELRY_GP_VALUE = 200
-    _MAGIC_GP_VALUE = 1000
+    @property
+    def treasure(self) -> TreasureTables:
+        """Kompilierte Schatztabellen — beim ersten Schatzwurf geladen."""
+        if self._treasure is None:
+            self._treasure = load_treasure_tables(self.tables.get("treasure_file"))
+        return self._treasure
 
     def roll_gem(self) -> dict[str, Any]:
         """
@@ -1317,16 +1089,9 @@ class MechanicsEngine:
               base_value (int): Basiswert in GP
               actual_value (int): Endwert nach Variation in GP
         """
-        roll = self.rng.randint(1, 100)
-        chosen = self._GEM_VALUE_TABLE[-1]          # Fallback: hoechster Tier
-        tier_index = len(self._GEM_VALUE_TABLE) - 1
-        for i, entry in enumerate(self._GEM_VALUE_TABLE):
-            if roll <= entry[0]:
-                chosen = entry
-                tier_index = i
-                break
-
-        _, base_value, tier_name, examples = chosen
+        tt = self.treasure
+        tier_index = tt.pick(tt.gem_bounds, self.rng.randint(1, 100))
+        base_value, tier_name, examples = tt.gems[tier_index]
         stone_name = self.rng.choice(examples)
 
         # DMG Table 86: Wertschwankung — 10% Chance pro Stein
@@ -1335,8 +1100,8 @@ class MechanicsEngine:
             d6 = self.roll_die(6)
             if d6 == 1:
                 # Aufwertung auf naechsthoehere Tier
-                next_idx = min(tier_index + 1, len(self._GEM_VALUE_TABLE) - 1)
-                actual_value = self._GEM_VALUE_TABLE[next_idx][1]
+                next_idx = min(tier_index + 1, len(tt.gems) - 1)
+                actual_value = tt.gems[next_idx][0]
             elif d6 == 2:
                 actual_value = base_value * 2
             elif d6 == 3:
@@ -1352,7 +1117,7 @@ class MechanicsEngine:
             else:  # d6 == 6
                 # Abwertung auf naechstniedrigere Tier
                 prev_idx = max(tier_index - 1, 0)
-                actual_value = self._GEM_VALUE_TABLE[prev_idx][1]
+                actual_value = tt.gems[prev_idx][0]
         else:
             actual_value = base_value
 
@@ -1377,13 +1142,8 @@ class MechanicsEngine:
               value (int): GP-Wert des Kunstgegenstands
               description (str): Lesbare Beschreibung mit Wert
         """
-        roll = self.rng.randint(1, 100)
-        chosen_min, chosen_max = self._ART_OBJECT_TABLE[-1][1], self._ART_OBJECT_TABLE[-1][2]
-        for max_roll, min_val, max_val in self._ART_OBJECT_TABLE:
-            if roll <= max_roll:
-                chosen_min, chosen_max = min_val, max_val
-                break
-
+        tt = self.treasure
+        chosen_min, chosen_max = tt.art[tt.pick(tt.art_bounds, self.rng.randint(1, 100))]
         value = self.rng.randint(chosen_min, chosen_max)
         logger.debug("Kunstgegenstand: %d GP", value)
         return {
@@ -1401,14 +1161,9 @@ class MechanicsEngine:
               name (str): Name des magischen Gegenstands
               category (str): Kategorie gemaess DMG Table 88
         """
-        roll = self.rng.randint(1, 100)
-        category = self._MAGIC_ITEM_TABLE[-1][1]  # Fallback
-        for max_roll, cat in self._MAGIC_ITEM_TABLE:
-            if roll <= max_roll:
-                category = cat
-                break
-
-        sub_list = self._MAGIC_ITEM_SUBTABLES.get(category, [])
+        tt = self.treasure
+        category = tt.magic_categories[tt.pick(tt.magic_bounds, self.rng.randint(1, 100))]
+        sub_list = tt.magic_items.get(category, [])
         if sub_list:
             item_name = self.rng.choice(sub_list)
         else:
@@ -1445,7 +1200,7 @@ class MechanicsEngine:
               description (str): Lesbare Zusammenfassung mit Einzelnennungen
         """
         tt = treasure_type.upper()
-        table = self._TREASURE_TYPES.get(tt)
+        table = self.treasure.types.get(tt)
 
         coins: dict[str, int] = {"cp": 0, "sp": 0, "ep": 0, "gp": 0, "pp": 0}
         gem_details: list[dict[str, Any]] = []
@@ -1467,42 +1222,27 @@ class MechanicsEngine:
             }
 
         # Muenzen wuerfeln
-        for coin_type in ("cp", "sp", "ep", "gp", "pp"):
-            entry = table.get(coin_type)
-            if entry is None:
-                continue
-            dice_count, dice_faces, multiplier, chance = entry
+        for coin_type, amount_expr, chance in table.coins:
             if self.rng.randint(1, 100) <= chance:
-                amount = sum(self.roll_die(dice_faces) for _ in range(dice_count)) * multiplier
-                coins[coin_type] = amount
+                coins[coin_type] = amount_expr.roll_total(self.rng)
 
-        # Edelsteine wuerfeln (mit Sub-Tabellen)
-        gem_entry = table.get("gems")
-        if gem_entry is not None:
-            dice_count, dice_faces, chance = gem_entry
+        # Edelsteine, Kunstgegenstaende, magische Gegenstaende (mit Sub-Tabellen)
+        if table.gems is not None:
+            count_expr, chance = table.gems
             if self.rng.randint(1, 100) <= chance:
-                count = sum(self.roll_die(dice_faces) for _ in range(dice_count))
-                gem_details = [self.roll_gem() for _ in range(count)]
-
-        # Schmuck/Kunstgegenstaende wuerfeln (mit Sub-Tabellen)
-        jewelry_entry = table.get("jewelry")
-        if jewelry_entry is not None:
-            dice_count, dice_faces, chance = jewelry_entry
+                gem_details = [self.roll_gem() for _ in range(count_expr.roll_total(self.rng))]
+        if table.jewelry is not None:
+            count_expr, chance = table.jewelry
             if self.rng.randint(1, 100) <= chance:
-                count = sum(self.roll_die(dice_faces) for _ in range(dice_count))
-                jewelry_details = [self.roll_art_object() for _ in range(count)]
-
-        # Magische Gegenstaende wuerfeln (mit Sub-Tabellen)
-        magic_entry = table.get("magic")
-        if magic_entry is not None:
-            if len(magic_entry) == 2:
-                count, chance = magic_entry
-                if self.rng.randint(1, 100) <= chance:
-                    magic_item_details = [self.roll_magic_item() for _ in range(count)]
-            else:
-                # Manche Typen (P=Potions, Q=Scrolls) haben 100%-Chance
-                count = magic_entry[0]
-                magic_item_details = [self.roll_magic_item() for _ in range(count)]
+                jewelry_details = [
+                    self.roll_art_object() for _ in range(count_expr.roll_total(self.rng))
+                ]
+        if table.magic is not None:
+            count_expr, chance = table.magic
+            if self.rng.randint(1, 100) <= chance:
+                magic_item_details = [
+                    self.roll_magic_item() for _ in range(count_expr.roll_total(self.rng))
+                ]
 
         # Rueckwaertskompatible Zaehlwerte
         gems = len(gem_details)
@@ -1518,7 +1258,7 @@ class MechanicsEngine:
             + coins["pp"] * 5.0
             + sum(g["actual_value"] for g in gem_details)
             + sum(j["value"] for j in jewelry_details)
-            + magic_items * self._MAGIC_GP_VALUE
+            + magic_items * self.treasure.gp_values.get("magic_item", 1000)
         )
         total_gp = int(gp_value)
 
@@ -1562,6 +1302,120 @@ class MechanicsEngine:
             "description": desc,
         }
 
+    def roll_treasure_many(self, treasure_type: str, n: int) -> dict[str, Any]:
+        """
+        Wuerfelt n Schaetze desselben Typs auf einmal (Hort-Statistik,
+        Balancing, Massenlaeufe) — ohne Einzelnamen, nur Mengen und Werte.
+
+        Mit NumPy vektorisiert (Generator aus self.rng geseedet, damit
+        Aufzeichnung/Replay reproduzierbar bleiben), sonst per roll_treasure.
+
+        Returns:
+            dict mit Arrays (bzw. Listen ohne NumPy) der Laenge n:
+              coins (dict): {cp, sp, ep, gp, pp} -> Mengen
+              gems, jewelry, magic_items: Anzahlen
+              gem_value, jewelry_value: GP-Summen der Edelsteine / Kunst
+              total_gp_value: Gesamtwert in GP (wie roll_treasure)
+        """
+        tt = treasure_type.upper()
+        table = self.treasure.types.get(tt)
+        if table is None:
+            logger.warning("Unbekannter Schatztyp '%s' — leerer Schatz", treasure_type)
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+        if np is None or table is None:
+            results = [self.roll_treasure(tt) for _ in range(n)] if table else []
+            zeros = [0] * n
+            return {
+                "coins": {c: [r["coins"][c] for r in results] or zeros for c in _COIN_TYPES},
+                "gems": [r["gems"] for r in results] or zeros,
+                "jewelry": [r["jewelry"] for r in results] or zeros,
+                "magic_items": [r["magic_items"] for r in results] or zeros,
+                "gem_value": [sum(g["actual_value"] for g in r["gem_details"])
+                              for r in results] or zeros,
+                "jewelry_value": [sum(j["value"] for j in r["jewelry_details"])
+                                  for r in results] or zeros,
+                "total_gp_value": [r["total_gp_value"] for r in results] or zeros,
+            }
+
+        gen = np.random.default_rng(self.rng.randint(0, 2**63 - 1))
+        trs = self.treasure
+
+        def chance_mask(chance: int) -> Any:
+            return gen.integers(1, 101, size=n) <= chance
+
+        def counted(spec: tuple[DiceExpression, int] | None) -> Any:
+            if spec is None:
+                return np.zeros(n, dtype=np.int64)
+            expr, chance = spec
+            return np.where(chance_mask(chance), np.maximum(expr.roll_many(n, gen), 0), 0)
+
+        coins = {c: np.zeros(n, dtype=np.int64) for c in _COIN_TYPES}
+        for coin_type, amount_expr, chance in table.coins:
+            coins[coin_type] = np.where(chance_mask(chance), amount_expr.roll_many(n, gen), 0)
+        gems, jewelry, magic = counted(table.gems), counted(table.jewelry), counted(table.magic)
+
+        # Einzelwerte flach wuerfeln und pro Schatz aufsummieren
+        gem_value = np.zeros(n, dtype=np.int64)
+        total_gems = int(gems.sum())
+        if total_gems and trs.gems:
+            bases = np.array([g[0] for g in trs.gems], dtype=np.int64)
+            last = len(bases) - 1
+            tier = np.minimum(
+                np.searchsorted(trs.gem_bounds, gen.integers(1, 101, size=total_gems)), last,
+            )
+            base = bases[tier]
+            # DMG Table 86: 10% Wertschwankung, d6 bestimmt die Art
+            d6 = gen.integers(1, 7, size=total_gems)
+            up = (base * (1 + gen.integers(1, 7, size=total_gems) * 10 / 100)).astype(np.int64)
+            down = (base * (1 - gen.integers(1, 5, size=total_gems) * 10 / 100)).astype(np.int64)
+            varied = np.select(
+                [d6 == 1, d6 == 2, d6 == 3, d6 == 4, d6 == 5],
+                [bases[np.minimum(tier + 1, last)], base * 2, up, down, base // 2],
+                default=bases[np.maximum(tier - 1, 0)],
+            )
+            value = np.maximum(
+                np.where(gen.integers(1, 101, size=total_gems) <= 10, varied, base), 1,
+            )
+            gem_value = np.bincount(np.repeat(np.arange(n), gems), weights=value,
+                                    minlength=n).astype(np.int64)
+
+        jewelry_value = np.zeros(n, dtype=np.int64)
+        total_art = int(jewelry.sum())
+        if total_art and trs.art:
+            idx = np.minimum(
+                np.searchsorted(trs.art_bounds, gen.integers(1, 101, size=total_art)),
+                len(trs.art) - 1,
+            )
+            lo = np.array([a[0] for a in trs.art], dtype=np.int64)[idx]
+            hi = np.array([a[1] for a in trs.art], dtype=np.int64)[idx]
+            value = gen.integers(lo, hi + 1)
+            jewelry_value = np.bincount(np.repeat(np.arange(n), jewelry), weights=value,
+                                        minlength=n).astype(np.int64)
+
+        total = (
+            coins["cp"] * 0.01 + coins["sp"] * 0.1 + coins["ep"] * 0.5
+            + coins["gp"] * 1.0 + coins["pp"] * 5.0
+            + gem_value + jewelry_value
+            + magic * trs.gp_values.get("magic_item", 1000)
+        ).astype(np.int64)
+
+        logger.debug(
+            "Schatzwuerfe Typ %s x%d: GP-Wert avg=%.0f max=%d",
+            tt, n, float(total.mean()) if n else 0.0, int(total.max()) if n else 0,
+        )
+        return {
+            "coins": coins,
+            "gems": gems,
+            "jewelry": jewelry,
+            "magic_items": magic,
+            "gem_value": gem_value,
+            "jewelry_value": jewelry_value,
+            "total_gp_value": total,
+        }
+
     # ------------------------------------------------------------------
     # AD&D 2e — Wandering-Monster-Probe (Encounter Check)
     # ------------------------------------------------------------------
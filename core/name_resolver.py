@@ -0,0 +1,167 @@
+"""
+core/name_resolver.py — Gemeinsame Namensaufloesung fuer Tag-Namen
+
+Freie Namen aus KI-Tags ("goblin", "Thorg der Starke") werden in mehreren
+heissen Pfaden auf bekannte Eintraege abgebildet: Party-Mitglieder,
+Combatants, Grid-Entities, Skill-Aliase. NameResolver buendelt die
+gemeinsame Suchreihenfolge und haelt dafuer vorberechnete Indizes:
+
+  1. Exakt        — normalisierter Schluessel (lower, Whitespace gefaltet)
+  2. Teilstring   — Anfrage in Name per Trigramm-Index, Name in Anfrage per
+                    Laengenfilter; der frueher eingetragene Name gewinnt
+  3. Fuzzy        — optional difflib.get_close_matches (cutoff)
+
+Ergebnisse inklusive Fehlschlaegen landen in einem LRU-Cache, der bei
+jeder Aenderung der Eintraege verworfen wird (add/rebuild/clear).
+
+Verwendung:
+    names = NameResolver(fuzzy_cutoff=0.5)
+    names.rebuild((m.name, m.name) for m in members)
+    names.resolve("thorg")   # -> "Thorg" oder None
+"""
+
+from __future__ import annotations
+
+import bisect
+import difflib
+from collections import OrderedDict
+from typing import Generic, Iterable, TypeVar
+
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+def normalize_name(name: str) -> str:
+    """'  Thorg  der Starke ' -> 'thorg der starke'."""
+    return " ".join(name.lower().split())
+
+
+def _trigrams(key: str) -> set[str]:
+    return {key[i:i + 3] for i in range(len(key) - 2)}
+
+
+class NameResolver(Generic[V]):
+    """
+    Bildet freie Namen auf Werte ab (exakt -> Teilstring -> optional fuzzy).
+
+    Eintraege behalten ihre Einfuegereihenfolge; bei doppelten Schluesseln
+    gilt der erste. Der Wert ist frei waehlbar (Name, Slot, ID, ...).
+    """
+
+    def __init__(
+        self,
+        entries: Iterable[tuple[str, V]] = (),
+        *,
+        substring: bool = True,
+        fuzzy_cutoff: float | None = None,
+        cache_size: int = 256,
+    ) -> None:
+        self._substring = substring
+        self._fuzzy_cutoff = fuzzy_cutoff
+        self._cache_size = cache_size
+        self._keys: list[str] = []
+        self._values: list[V] = []
+        self._exact: dict[str, int] = {}
+        self._grams: dict[str, set[int]] = {}
+        self._by_len: list[tuple[int, int]] = []   # (len(key), index), sortiert
+        self._cache: OrderedDict[str, object] = OrderedDict()
+        self.rebuild(entries)
+
+    # -- Pflege -------------------------------------------------------------
+
+    def rebuild(self, entries: Iterable[tuple[str, V]]) -> None:
+        """Ersetzt alle Eintraege (z.B. nach Entfernen)."""
+        self.clear()
+        for name, value in entries:
+            self.add(name, value)
+
+    def add(self, name: str, value: V) -> None:
+        """Haengt einen Eintrag an und verwirft den Cache."""
+        key = normalize_name(name)
+        idx = len(self._keys)
+        self._keys.append(key)
+        self._values.append(value)
+        self._exact.setdefault(key, idx)
+        if self._substring:
+            for gram in _trigrams(key):
+                self._grams.setdefault(gram, set()).add(idx)
+            bisect.insort(self._by_len, (len(key), idx))
+        self._cache.clear()
+
+    def clear(self) -> None:
+        self._keys.clear()
+        self._values.clear()
+        self._exact.clear()
+        self._grams.clear()
+        self._by_len.clear()
+        self._cache.clear()
+
+    def invalidate(self) -> None:
+        """Verwirft nur den LRU-Cache (Eintraege bleiben)."""
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    # -- Aufloesung ---------------------------------------------------------
+
+    def resolve(self, query: str) -> V | None:
+        """Wert zum besten Treffer fuer query, sonst None."""
+        key = normalize_name(query)
+        if not key or not self._keys:
+            return None
+        cache = self._cache
+        hit = cache.get(key, _MISSING)
+        if hit is not _MISSING:
+            cache.move_to_end(key)
+            return None if hit is None else self._values[hit]  # type: ignore[index]
+
+        idx = self._lookup(key)
+        cache[key] = idx
+        if len(cache) > self._cache_size:
+            cache.popitem(last=False)
+        return None if idx is None else self._values[idx]
+
+    def _lookup(self, key: str) -> int | None:
+        idx = self._exact.get(key)
+        if idx is not None:
+            return idx
+        if self._substring:
+            idx = self._substring_match(key)
+            if idx is not None:
+                return idx
+        if self._fuzzy_cutoff is not None:
+            matches = difflib.get_close_matches(
+                key, self._exact.keys(), n=1, cutoff=self._fuzzy_cutoff,
+            )
+            if matches:
+                return self._exact[matches[0]]
+        return None
+
+    def _substring_match(self, key: str) -> int | None:
+        """Kleinster Index mit key in name oder name in key."""
+        keys = self._keys
+        best: int | None = None
+
+        # Anfrage in Name: jeder Kandidat enthaelt alle Trigramme der Anfrage
+        grams = _trigrams(key)
+        if grams:
+            postings = sorted((self._grams.get(g, set()) for g in grams), key=len)
+            if postings[0]:
+                candidates = postings[0].intersection(*postings[1:])
+                for idx in sorted(candidates):
+                    if key in keys[idx]:
+                        best = idx
+                        break
+        else:
+            best = next((i for i, k in enumerate(keys) if key in k), None)
+
+        # Name in Anfrage: nur Namen, die nicht laenger als die Anfrage sind
+        limit = len(key)
+        for length, idx in self._by_len:
+            if length > limit:
+                break
+            if (best is None or idx < best) and keys[idx] in key:
+                best = idx
+        return best
@@ -12,13 +12,14 @@ from __future__ import annotations
 import json
 import logging
 import queue
-import random
 import re
 import time as _time
+from itertools import groupby
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from core.adventure_store import AdventureStore
     from core.engine import SimulatorEngine
 
 logger = logging.getLogger("ARS.orchestrator")
@@ -35,6 +36,14 @@ def _extract_monster_moves(text: str) -> list[tuple[str, str]]:
             for m in _RE_MONSTER_MOVE.finditer(text)]
 
 
+# Rettungswurf-Kategorien gegen Atemwaffe (Tabelle 60, Spalte 3)
+_RE_BREATH_SAVE = re.compile(r"atem|drachen|breath", re.I)
+
+
+def _is_breath_save(category: str) -> bool:
+    return bool(_RE_BREATH_SAVE.search(category))
+
+
 class Orchestrator:
     """
     Verbindet alle Subsysteme und führt den Spiel-Loop aus.
@@ -80,29 +89,34 @@ class Orchestrator:
     # Konfigurations-API (wird von Engine aufgerufen)
     # ------------------------------------------------------------------
 
-    def set_adventure(self, adventure_data: dict[str, Any]) -> None:
+    def set_adventure(self, adventure_data: dict[str, Any] | AdventureStore) -> None:
+        # Store: AdventureManager/Grid teilen die Lazy-Sicht, das AI-Backend
+        # bekommt eine eigene Kopie aus Index-Auszuegen (Lore-Merge mutiert
+        # in-place; die Quelldatei wird dafuer nicht geparst)
+        from core.adventure_store import AdventureStore
+        store = adventure_data if isinstance(adventure_data, AdventureStore) else None
+        if store is not None:
+            adventure_data = store.view()
         self._adventure = adventure_data
         # AdventureManager laden (Task 06)
         from core.adventure_manager import AdventureManager
         self._adv_manager = AdventureManager()
-        self._adv_manager.load(adventure_data)
+        self._adv_manager.load(store if store is not None else adventure_data)
         # Engine-Referenz fuer GUI-Zugriff
         self.engine._adv_manager = self._adv_manager
         # Abenteuer auch ans AI-Backend weitergeben
         if self.engine.ai_backend:
-            self.engine.ai_backend.set_adventure(adventure_data)
+            self.engine.ai_backend.set_adventure(
+                store.prompt_dict() if store is not None else adventure_data
+            )
             self.engine.ai_backend.set_adventure_manager(self._adv_manager)
         # Grid-Engine: Adventure-Daten + initialen Raum setzen
         grid = getattr(self.engine, "grid_engine", None)
         if grid:
-            grid.set_adventure(adventure_data)
+            grid.set_adventure(store if store is not None else adventure_data)
             start_loc_id = adventure_data.get("start_location", "")
             if start_loc_id:
-                locations = {
-                    loc["id"]: loc for loc in adventure_data.get("locations", [])
-                    if isinstance(loc, dict) and "id" in loc
-                }
-                start_loc = locations.get(start_loc_id)
+                start_loc = self._adv_manager.get_location(start_loc_id)
                 if start_loc:
                     grid.setup_room(start_loc, start_loc_id)
                     npc_ids = start_loc.get("npcs_present", [])
@@ -391,6 +405,7 @@ class Orchestrator:
         mechanics = MechanicsEngine(
             dice_config=self.engine.dice_config,
             tables_data=tables_data,
+            rng=getattr(self.engine, "rng", None),
         )
 
         # TimeTracker instanziieren und ans AI-Backend koppeln
@@ -569,14 +584,14 @@ class Orchestrator:
             # [HP_VERLUST: Name | N] Tags in _handle_party_tags() verwaltet.
             party_state = getattr(self.engine, "party_state", None)
             combat_tags = extract_combat_tags(gm_response)
-            if not party_state:
-                # Initiative-Sortierung: gewinnende Seite zuerst
-                if self._combat_tracker and self._combat_tracker.active and combat_tags:
-                    combat_tags = self._sort_by_initiative(combat_tags)
-                for tag_type, data in combat_tags:
-                    self._handle_combat(tag_type, data, mechanics)
-                    if not self._active:
-                        break  # Spieler tot — restliche Tags ueberspringen
+            if not party_state and combat_tags:
+                if (any(t == "ANGRIFF" for t, _ in combat_tags)
+                        and not (self._combat_tracker and self._combat_tracker.active)):
+                    self._start_combat()
+                # [ATEM_WAFFE] wuerfelt im aktiven Kampf pro Ziel selbst —
+                # ein Drachenodem-RETTUNGSWURF des Spielleiters waere ein zweiter
+                breath = any(t[0] == "ATEM_WAFFE" for t in extract_stat_changes(gm_response))
+                self._handle_combat_tags(combat_tags, mechanics, breath)
 
             if not self._active:
                 break  # Spieler tot — Game Loop beenden
@@ -818,7 +833,7 @@ class Orchestrator:
                 prozent = int(extra[0]) if extra else 0
             except (ValueError, IndexError):
                 prozent = 0
-            wurf = random.randint(1, 100)
+            wurf = mechanics.roll_die(100)
             if wurf <= prozent:
                 msg = (
                     f"Magieresistenz von {monster_name}: {wurf}% — Zauber scheitert! "
@@ -862,7 +877,7 @@ class Orchestrator:
                 save_success = save_result.is_success
             except Exception:
                 # Fallback: einfacher d20-Wurf gegen 16 + Modifikator
-                roll = random.randint(1, 20)
+                roll = mechanics.roll_die(20)
                 save_success = (roll + save_mod) >= 16
             if not save_success:
                 if gift_typ in ("tod", "toedlich", "death"):
@@ -898,7 +913,7 @@ class Orchestrator:
                 else:
                     level_info = "(Level-Tracking nicht verfuegbar)"
                 # HP-Verlust: 1d8 pro Stufe
-                hp_loss = sum(random.randint(1, 8) for _ in range(stufen))
+                hp_loss = sum(mechanics.roll_dice(stufen, 8))
                 char.update_stat("HP", -hp_loss)
                 msg = (
                     f"[LEVEL_DRAIN] {char_name} verliert {stufen} "
@@ -920,7 +935,7 @@ class Orchestrator:
                 schwelle = int(extra[0]) if extra else 7
             except (ValueError, IndexError):
                 schwelle = 7
-            wurf = random.randint(1, 6) + random.randint(1, 6)
+            wurf = sum(mechanics.roll_dice(2, 6))
             if wurf > schwelle:
                 msg = (
                     f"[MORAL] {monster_name}: Moral-Check 2d6={wurf} > {schwelle} "
@@ -973,7 +988,7 @@ class Orchestrator:
                 total = mechanics.roll_expression(schaden_str)
             except Exception:
                 # Fallback: einfach 1d10
-                total = random.randint(1, 10)
+                total = mechanics.roll_die(10)
             msg = (
                 f"[ATEM_WAFFE] {monster_name} setzt {atem_typ}-Atem ein! "
                 f"Voller Schaden: {total}. Rettungswurf gegen Atemwaffe = "
@@ -981,6 +996,62 @@ class Orchestrator:
             )
             print(f"\n{msg}")
             self._emit_game("combat", msg)
+            self._apply_breath_weapon(monster_name, total, mechanics)
+
+    def _apply_breath_weapon(self, monster_name: str, total: int, mechanics: Any) -> None:
+        """
+        Verteilt Atemwaffen-Schaden im CombatTracker (falls aktiv) auf alle
+        Ziele — ein Rettungswurf pro Ziel, gewuerfelt vom Tracker. Der
+        Spieleranteil wird wie bei ANGRIFF in den CharacterManager
+        uebernommen (inkl. Todes-Check).
+        """
+        ct = self._combat_tracker
+        if not ct or not ct.active:
+            return
+        targets = None
+        if not ct._find_combatant_by_name(monster_name):
+            # Quelle nicht im Kampf (Falle, unsichtbarer Drache): trifft die Spielerseite
+            targets = ct.living_ids(True)
+        results = ct.apply_breath_weapon(monster_name, total, mechanics, targets=targets)
+        player_damage = 0
+        for r in results:
+            status = "gerettet, halber Schaden" if r["saved"] else "voller Schaden"
+            msg = (
+                f"  {r['target']}: -{r['damage']} HP ({status}) "
+                f"[{r['hp_new']}/{r['hp_max']}]"
+            )
+            if r["killed"]:
+                msg += " [TOT]"
+            print(msg)
+            self._emit_game("combat", msg)
+            if r["player"]:
+                player_damage += r["damage"]
+        self._sync_player_damage(player_damage)
+        if self._active and results:
+            self._emit_game("combat_state", ct.get_status_text())
+
+    def _apply_party_breath_weapon(
+        self, monster_name: str, total: int, mechanics: Any, party_state: Any,
+    ) -> None:
+        """
+        Party-Modus (ohne CombatTracker): Atemwaffe trifft alle lebenden
+        Mitglieder, ein Rettungswurf gegen Atemwaffe pro Mitglied (Wert aus
+        dem Charakterbogen, sonst Tabelle 60); gelungen = halber Schaden.
+        """
+        for member in party_state.alive_members():
+            target = member.saving_throws.get("Breath")
+            if target is None:
+                target = mechanics.lookup_saving_throw(
+                    mechanics.lookup_class_group(str(member.archetype)),
+                    int(member.level or 1), 3,
+                )
+            saved = mechanics.saving_throw(int(target)).is_success
+            damage = total // 2 if saved else total
+            status = "gerettet, halber Schaden" if saved else "voller Schaden"
+            msg = f"  {member.name}: Rettungswurf Atemwaffe — {status}"
+            print(msg)
+            self._emit_game("combat", msg)
+            self._apply_party_damage(party_state, member.name, damage)
 
     # ------------------------------------------------------------------
     # Task 05 — Archivist-Methoden
@@ -1024,8 +1095,8 @@ class Orchestrator:
 
         # Fallback: Alle NPCs aus allen Locations durchsuchen
         if not npcs:
-            for loc_data in self._adv_manager._locations.values():
-                for nid in loc_data.get("npcs_present", []):
+            for loc_id in self._adv_manager._locations:
+                for nid in self._adv_manager.peek_location(loc_id, "npcs_present") or []:
                     npc = self._adv_manager.get_npc(nid)
                     if npc and npc not in npcs:
                         npcs.append(npc)
@@ -1040,6 +1111,7 @@ class Orchestrator:
         mech = MechanicsEngine(
             dice_config=self.engine.dice_config,
             tables_data=tables_data,
+            rng=getattr(self.engine, "rng", None),
         )
 
         # Spieler-Stats zusammenbauen
@@ -1227,202 +1299,287 @@ class Orchestrator:
         self._emit_game("system", f"[Keine {ammo_type.title()} im Inventar — Angriff ignoriert]")
         return False
 
+    def _handle_combat_tags(
+        self, combat_tags: list[tuple[str, dict]], mechanics: Any, breath: bool = False,
+    ) -> None:
+        """
+        Loest die Kampf-Tags einer Antwort in Tag-Reihenfolge auf. Nur direkt
+        aufeinander folgende ANGRIFF-Tags werden als Runde gebuendelt
+        (innerhalb nach Initiative); ein RETTUNGSWURF dazwischen wird an
+        seiner Stelle aufgeloest. breath: die Antwort enthaelt [ATEM_WAFFE].
+        """
+        for tag_type, run in groupby(combat_tags, key=lambda t: t[0]):
+            if not self._active:
+                break  # Spieler tot — restliche Tags ueberspringen
+            if tag_type == "ANGRIFF":
+                attacks = [d for _, d in self._sort_by_initiative(list(run))]
+                self._handle_attack_round(attacks, mechanics)
+                continue
+            for _, data in run:
+                if not self._active:
+                    break
+                if (tag_type == "RETTUNGSWURF" and breath
+                        and self._combat_tracker and self._combat_tracker.active
+                        and _is_breath_save(data["category"])):
+                    logger.info(
+                        "RETTUNGSWURF %s uebersprungen — Atemwaffe wuerfelt pro Ziel",
+                        data["category"],
+                    )
+                    continue
+                self._handle_combat(tag_type, data, mechanics)
+
     def _handle_combat(self, tag_type: str, data: dict, mechanics: Any) -> None:
         """Verarbeitet ANGRIFF und RETTUNGSWURF Tags mit CombatTracker."""
         if tag_type == "ANGRIFF":
-            weapon = data["weapon"]
-            thac0 = data["thac0"]
-            target_ac = data["target_ac"]
+            self._handle_attack_round([data], mechanics)
 
-            # CombatTracker starten wenn noch nicht aktiv
-            if not self._combat_tracker or not self._combat_tracker.active:
-                self._start_combat()
+        elif tag_type == "RETTUNGSWURF":
+            category = data["category"]
+            result = mechanics.saving_throw(
+                target=data["target"],
+            )
+            msg = f"[RETTUNGSWURF] {category}: {result.description}"
+            print(f"\n{msg}")
+            self._emit_game("combat", msg)
 
-            # Ziel und Angreifer ermitteln (Waffe als Fallback)
-            attacker = None
-            target = None
-            if self._combat_tracker and self._combat_tracker.active:
-                attacker = self._combat_tracker.get_attacker(thac0, weapon)
-                target = self._combat_tracker.find_target(target_ac, attacker)
-
-                # Waffen-Validierung: Spieler darf nur mit Inventar-Waffen angreifen
-                if attacker and attacker.is_player and self.engine.character:
-                    if not self._player_has_weapon(weapon):
-                        logger.info(
-                            "Angriff ignoriert: Spieler hat '%s' nicht im Inventar",
-                            weapon,
-                        )
-                        self._emit_game(
-                            "system",
-                            f"[Waffe '{weapon}' nicht im Inventar — Angriff ignoriert]",
-                        )
-                        return
-                    # Munitionsverbrauch bei Fernkampf
-                    if not self._consume_ammo(weapon):
-                        return
-
-                # Reichweiten-Validierung (GridEngine-Bridge)
-                if attacker and target:
-                    range_check = self._combat_tracker.validate_attack_range(
-                        attacker.id, target.id,
-                    )
-                    if not range_check["valid"]:
-                        logger.info(
-                            "Angriff ignoriert: %s -> %s (%s)",
-                            attacker.name, target.name, range_check["reason"],
-                        )
-                        self._emit_game(
-                            "system",
-                            f"[Angriff ungueltig: {range_check['reason']}]",
-                        )
-                        return
-                    # Fernkampf-Modifikator auf Modifikatoren addieren
-                    if range_check["range_mod"] != 0:
-                        data["modifiers"] = data.get("modifiers", 0) + range_check["range_mod"]
-                        logger.debug(
-                            "Fernkampf-Modifikator %+d fuer %s (%d Felder)",
-                            range_check["range_mod"], attacker.name, range_check["distance"],
-                        )
-
-                # Angriffslimit pruefen
-                if attacker and not self._combat_tracker.can_attack(attacker.id):
-                    logger.info(
-                        "Angriff ignoriert: %s hat max Angriffe erreicht",
-                        attacker.name,
-                    )
-                    return
-                if attacker:
-                    self._combat_tracker.register_attack(attacker.id)
-
-                # CombatTracker-Stats verwenden statt AI-Werte
-                if attacker:
-                    thac0 = attacker.thac0
-
-            # Wuerfeln (erst nach Validierung)
-            result = mechanics.attack_roll(
-                thac0=thac0,
-                target_ac=target.ac if target else target_ac,
-                modifiers=data["modifiers"],
+            # Ergebnis an KI schicken fuer narrative Reaktion (mit TTS)
+            self._narrate_roll_result(
+                f"Rettungswurf ({category})", result, mechanics,
             )
 
-            # -- Angreifer/Ziel-Namen fuer Anzeige --
-            atk_name = attacker.name if attacker else weapon
-            tgt_name = target.name if target else "?"
-
-            # Bei Treffer: Schaden wuerfeln und anwenden
-            dmg_result = None
-            damage_detail = ""
-            if result.is_success and target and attacker and self._combat_tracker:
-                damage_dice = attacker.damage
-                damage, damage_detail = mechanics.roll_damage(damage_dice)
-                dmg_result = self._combat_tracker.apply_damage(target.id, damage)
-
-                # Spieler-HP auch im CharacterManager aktualisieren
-                if target.is_player and self.engine.character:
-                    stat_result = self.engine.character.update_stat("HP", -damage)
-                    if "error" not in stat_result:
-                        self._emit_game(
-                            "stat",
-                            f"[HP-VERLUST] -{damage} | HP: "
-                            f"{stat_result['old_value']} -> "
-                            f"{stat_result['new_value']}/{stat_result['max_value']}",
-                        )
-                        # Spieler-Tod: Game Loop stoppen
-                        if self.engine.character.is_dead:
-                            self._active = False
-                            from core.event_bus import EventBus
-                            EventBus.get().emit(
-                                "game", "player_dead",
-                                {"message": f"{self.engine.character.name} ist gefallen!"},
-                            )
-
-            # -- Strukturierte Combat-Message --
-            # Zeile 1: Wer -> Wen (Waffe)
-            header = f"{atk_name} -> {tgt_name} ({weapon})"
-            # Zeile 2: Wurf-Details
-            roll_line = (
-                f"  Wurf: d20={result.roll} | "
-                f"Ziel: {result.target} (THAC0 {thac0} vs AC {target_ac})"
+    def _sync_player_hp(self, player_damage: int) -> None:
+        """Uebernimmt Tracker-Schaden am Spieler in den CharacterManager."""
+        if player_damage and self.engine.character:
+            stat_result = self.engine.character.update_stat("HP", -player_damage)
+            if "error" not in stat_result:
+                self._emit_game(
+                    "stat",
+                    f"[HP-VERLUST] -{player_damage} | HP: "
+                    f"{stat_result['old_value']} -> "
+                    f"{stat_result['new_value']}/{stat_result['max_value']}",
+                )
+
+    def _check_player_dead(self, player_damage: int) -> None:
+        """Spieler-Tod nach Tracker-Schaden: Game Loop stoppen."""
+        if player_damage and self.engine.character and self.engine.character.is_dead:
+            self._active = False
+            from core.event_bus import EventBus
+            EventBus.get().emit(
+                "game", "player_dead",
+                {"message": f"{self.engine.character.name} ist gefallen!"},
             )
-            # Zeile 3: Ergebnis
-            if result.is_success:
-                hit_str = "TREFFER"
-                if result.roll == 20:
-                    hit_str = "KRITISCHER TREFFER (Nat 20!)"
-            else:
-                hit_str = "VERFEHLT"
-                if result.roll == 1:
-                    hit_str = "PATZER (Nat 1!)"
-            result_line = f"  Ergebnis: {hit_str}"
-            # Zeile 4: Schaden (nur bei Treffer)
-            dmg_line = ""
-            if dmg_result:
-                dmg_line = (
-                    f"  Schaden: {damage_detail} | "
-                    f"{dmg_result['target']} HP: {dmg_result['hp_old']}"
-                    f" -> {dmg_result['hp_new']}/{dmg_result['hp_max']}"
+
+    def _sync_player_damage(self, player_damage: int) -> None:
+        self._sync_player_hp(player_damage)
+        self._check_player_dead(player_damage)
+
+    def _handle_attack_round(self, intents: list[dict], mechanics: Any) -> None:
+        """
+        Loest alle ANGRIFF-Tags einer Runde gebuendelt auf: ein Wurf-Batch
+        und ein Schadens-Update im CombatTracker, danach ein aggregiertes
+        Kampf-Event, ein Status-Update und eine gemeinsame Narration.
+        """
+        # CombatTracker starten wenn noch nicht aktiv
+        if not self._combat_tracker or not self._combat_tracker.active:
+            self._start_combat()
+        ct = self._combat_tracker
+
+        if ct and ct.active:
+            outcomes = ct.resolve_attack_round(
+                intents, mechanics, precheck=self._precheck_player_attack,
+            )
+        else:
+            # Ohne Tracker: nur wuerfeln, kein Schaden
+            outcomes = [
+                {
+                    "status": "ok", "attacker": None, "target": None,
+                    "weapon": d["weapon"], "thac0": d["thac0"],
+                    "target_ac": d["target_ac"], "modifiers": d["modifiers"],
+                    "roll": mechanics.attack_roll(
+                        thac0=d["thac0"], target_ac=d["target_ac"],
+                        modifiers=d["modifiers"],
+                    ),
+                    "reason": "", "damage_detail": "", "dmg_result": None,
+                }
+                for d in intents
+            ]
+
+        messages: list[str] = []
+        rolled: list[dict] = []
+        player_damage = 0
+        for out in outcomes:
+            if out["status"] == "range":
+                logger.info(
+                    "Angriff ignoriert: %s -> %s (%s)",
+                    out["attacker"].name, out["target"].name, out["reason"],
+                )
+                self._emit_game("system", f"[Angriff ungueltig: {out['reason']}]")
+                continue
+            if out["status"] == "limit":
+                logger.info(
+                    "Angriff ignoriert: %s hat max Angriffe erreicht",
+                    out["attacker"].name,
                 )
-                if dmg_result["killed"]:
-                    dmg_line += " [TOT]"
+                continue
+            if out["status"] != "ok":
+                continue
+            rolled.append(out)
+            messages.append(self._format_attack(out))
+            dmg = out["dmg_result"]
+            if dmg and out["target"].is_player:
+                player_damage += dmg["damage"]
 
-            msg = header + "\n" + roll_line + "\n" + result_line
-            if dmg_line:
-                msg += "\n" + dmg_line
+        if not rolled:
+            return
 
-            print(f"\n{msg}")
-            self._emit_game("combat", msg)
+        # Spieler-HP im CharacterManager einmal pro Runde nachziehen
+        self._sync_player_hp(player_damage)
 
-            # Kampfstatus aktualisieren
-            if self._combat_tracker and self._combat_tracker.active:
-                status = self._combat_tracker.get_status_text()
-                self._emit_game("combat_state", status)
-
-                # Kampf vorbei?
-                if self._combat_tracker.is_combat_over():
-                    self._combat_tracker.end_combat()
-                    end_msg = "[KAMPF ENDE] Alle Gegner besiegt!"
-                    print(f"\n{end_msg}")
-                    self._emit_game("combat", end_msg)
-                    # Tracker vom AI-Backend entfernen
-                    if self.engine.ai_backend:
-                        self.engine.ai_backend.set_combat_tracker(None)
+        msg = "\n\n".join(messages)
+        print(f"\n{msg}")
+        self._emit_game("combat", msg)
 
-            # Ergebnis an KI schicken fuer narrative Reaktion (mit TTS)
+        from core.event_bus import EventBus
+        bus = EventBus.get()
+        bus.emit("game", "combat_round", {
+            "round": ct.round if ct else 0,
+            "attacks": [
+                {
+                    "attacker": o["attacker"].name if o["attacker"] else o["weapon"],
+                    "target": o["target"].name if o["target"] else None,
+                    "weapon": o["weapon"],
+                    "roll": o["roll"].roll,
+                    "needed": o["roll"].target,
+                    "hit": o["roll"].is_success,
+                    "damage": o["dmg_result"]["damage"] if o["dmg_result"] else 0,
+                    "killed": bool(o["dmg_result"] and o["dmg_result"]["killed"]),
+                }
+                for o in rolled
+            ],
+        })
+
+        # Spieler-Tod: Game Loop stoppen
+        self._check_player_dead(player_damage)
+
+        # Kampfstatus aktualisieren
+        if ct and ct.active:
+            self._emit_game("combat_state", ct.get_status_text())
+
+            # Kampf vorbei?
+            if ct.is_combat_over():
+                ct.end_combat()
+                end_msg = "[KAMPF ENDE] Alle Gegner besiegt!"
+                print(f"\n{end_msg}")
+                self._emit_game("combat", end_msg)
+                # Tracker vom AI-Backend entfernen
+                if self.engine.ai_backend:
+                    self.engine.ai_backend.set_combat_tracker(None)
+
+        # Ergebnis an KI schicken fuer narrative Reaktion (mit TTS) —
+        # eine Narration pro Runde, mit der Wurfzeile jedes Angriffs
+        if len(rolled) == 1:
             self._narrate_roll_result(
-                f"Angriff ({weapon})", result, mechanics,
+                f"Angriff ({rolled[0]['weapon']})", rolled[0]["roll"], mechanics,
             )
-
-        elif tag_type == "RETTUNGSWURF":
-            category = data["category"]
-            result = mechanics.saving_throw(
-                target=data["target"],
+        else:
+            self._narrate_roll_result(
+                f"Kampfrunde ({len(rolled)} Angriffe)", None, mechanics,
+                details=[self._attack_roll_line(o) for o in rolled],
             )
-            msg = f"[RETTUNGSWURF] {category}: {result.description}"
-            print(f"\n{msg}")
-            self._emit_game("combat", msg)
 
-            # Ergebnis an KI schicken fuer narrative Reaktion (mit TTS)
-            self._narrate_roll_result(
-                f"Rettungswurf ({category})", result, mechanics,
+    def _precheck_player_attack(self, data: dict, attacker: Any) -> bool:
+        """Spieler darf nur mit Inventar-Waffen angreifen; Fernkampf verbraucht Munition."""
+        if not self.engine.character:
+            return True
+        weapon = data["weapon"]
+        if not self._player_has_weapon(weapon):
+            logger.info(
+                "Angriff ignoriert: Spieler hat '%s' nicht im Inventar", weapon,
+            )
+            self._emit_game(
+                "system", f"[Waffe '{weapon}' nicht im Inventar — Angriff ignoriert]",
             )
+            return False
+        return self._consume_ammo(weapon)
+
+    @staticmethod
+    def _hit_label(result: Any) -> str:
+        if result.is_success:
+            return "KRITISCHER TREFFER (Nat 20!)" if result.roll == 20 else "TREFFER"
+        return "PATZER (Nat 1!)" if result.roll == 1 else "VERFEHLT"
+
+    @classmethod
+    def _attack_roll_line(cls, out: dict) -> str:
+        """Einzeilige Wurfzeile eines Angriffs fuer die Runden-Narration."""
+        result = out["roll"]
+        atk_name = out["attacker"].name if out["attacker"] else out["weapon"]
+        tgt_name = out["target"].name if out["target"] else "?"
+        line = (
+            f"{atk_name} -> {tgt_name} ({out['weapon']}): "
+            f"Wurf {result.roll} | Ziel {result.target} | {cls._hit_label(result)}"
+        )
+        dmg_result = out["dmg_result"]
+        if dmg_result:
+            line += f" | Schaden {dmg_result['damage']}"
+            if dmg_result["killed"]:
+                line += " [TOT]"
+        return line
+
+    @classmethod
+    def _format_attack(cls, out: dict) -> str:
+        """Strukturierte Combat-Message fuer einen aufgeloesten Angriff."""
+        result = out["roll"]
+        atk_name = out["attacker"].name if out["attacker"] else out["weapon"]
+        tgt_name = out["target"].name if out["target"] else "?"
+
+        # Zeile 1: Wer -> Wen (Waffe)
+        header = f"{atk_name} -> {tgt_name} ({out['weapon']})"
+        # Zeile 2: Wurf-Details
+        roll_line = (
+            f"  Wurf: d20={result.roll} | "
+            f"Ziel: {result.target} (THAC0 {out['thac0']} vs AC {out['target_ac']})"
+        )
+        # Zeile 3: Ergebnis
+        hit_str = cls._hit_label(result)
+        msg = header + "\n" + roll_line + "\n" + f"  Ergebnis: {hit_str}"
+        # Zeile 4: Schaden (nur bei Treffer)
+        dmg_result = out["dmg_result"]
+        if dmg_result:
+            msg += (
+                f"\n  Schaden: {out['damage_detail']} | "
+                f"{dmg_result['target']} HP: {dmg_result['hp_old']}"
+                f" -> {dmg_result['hp_new']}/{dmg_result['hp_max']}"
+            )
+            if dmg_result["killed"]:
+                msg += " [TOT]"
+        return msg
 
     def _narrate_roll_result(
         self, skill_name: str, result: Any, mechanics: Any,
+        details: list[str] | None = None,
     ) -> None:
-        """Schickt Wuerfelergebnis an KI und streamt die Narrative mit TTS."""
+        """
+        Schickt Wuerfelergebnis an KI und streamt die Narrative mit TTS.
+        details: eine Wurfzeile pro Wurf (Kampfrunde) statt eines result.
+        """
         if not self.engine.ai_backend:
             return
 
         print("[SPIELLEITER] ", end="", flush=True)
         self._emit_game("stream_start", "")
 
-        narrative_chunks = self.engine.ai_backend.inject_roll_result(
-            skill_name=skill_name,
-            roll=result.roll,
-            target=result.target,
-            success_level=result.success_level,
-            description=result.description,
-        )
+        if details is not None:
+            narrative_chunks = self.engine.ai_backend.inject_round_result(
+                skill_name, details,
+            )
+        else:
+            narrative_chunks = self.engine.ai_backend.inject_roll_result(
+                skill_name=skill_name,
+                roll=result.roll,
+                target=result.target,
+                success_level=result.success_level,
+                description=result.description,
+            )
 
         # Voice: TTS fuer narrativen Text (Tags werden rausgefiltert)
         if self.engine._voice_enabled and hasattr(self.engine, "_voice_pipeline"):
@@ -1467,7 +1624,8 @@ class Orchestrator:
         Sortiert Kampf-Tags nach Initiative-Reihenfolge.
 
         Gewinnende Seite zuerst, innerhalb einer Seite nach Speed-Factor.
-        RETTUNGSWURF-Tags bleiben in Originalreihenfolge am Ende.
+        RETTUNGSWURF-Tags bleiben in Originalreihenfolge am Ende (die
+        Game Loop uebergibt nur zusammenhaengende ANGRIFF-Laeufe).
         """
         ct = self._combat_tracker
         if not ct or not ct.active:
@@ -1603,6 +1761,29 @@ class Orchestrator:
     # Party-Tag-Verarbeitung (Multi-Charakter-Modus)
     # ------------------------------------------------------------------
 
+    def _apply_party_damage(self, party_state: Any, char_name: str, amount: int) -> None:
+        """Schaden an einem Mitglied + Events (state_updated, member_died)."""
+        from core.event_bus import EventBus
+        bus = EventBus.get()
+        msg = party_state.apply_damage(char_name, amount)
+        print(f"\n{msg}")
+        self._emit_game("stat", msg)
+        bus.emit("party", "state_updated", {
+            "action": "damage",
+            "character": char_name,
+            "amount": amount,
+        })
+        # Mitglied-Tod pruefen
+        member = party_state.get_member(char_name)
+        if member and not member.alive:
+            death_msg = f"{member.name} ist gefallen!"
+            print(f"[SYSTEM] {death_msg}")
+            self._emit_game("system", death_msg)
+            bus.emit("party", "member_died", {
+                "name": member.name,
+                "message": death_msg,
+            })
+
     def _handle_party_tags(
         self,
         gm_response: str,
@@ -1628,24 +1809,7 @@ class Orchestrator:
                     amount = int(amount_str)
                 except ValueError:
                     continue
-                msg = party_state.apply_damage(char_name, amount)
-                print(f"\n{msg}")
-                self._emit_game("stat", msg)
-                bus.emit("party", "state_updated", {
-                    "action": "damage",
-                    "character": char_name,
-                    "amount": amount,
-                })
-                # Mitglied-Tod pruefen
-                member = party_state.get_member(char_name)
-                if member and not member.alive:
-                    death_msg = f"{member.name} ist gefallen!"
-                    print(f"[SYSTEM] {death_msg}")
-                    self._emit_game("system", death_msg)
-                    bus.emit("party", "member_died", {
-                        "name": member.name,
-                        "message": death_msg,
-                    })
+                self._apply_party_damage(party_state, char_name, amount)
 
             elif tag_type == "HP_HEILUNG" and len(tag) >= 3:
                 char_name, amount_str = tag[1], tag[2]
@@ -1730,7 +1894,7 @@ class Orchestrator:
                     prozent = int(prozent_str)
                 except ValueError:
                     prozent = 0
-                wurf = random.randint(1, 100)
+                wurf = mechanics.roll_die(100)
                 if wurf <= prozent:
                     msg = f"[MAGIC_RESISTANCE] Magieresistenz von {monster_name}: {wurf}% — Zauber scheitert! (Resistenz: {prozent}%)"
                 else:
@@ -1759,7 +1923,7 @@ class Orchestrator:
                     )
                     save_success = save_result.is_success
                 except Exception:
-                    roll = random.randint(1, 20)
+                    roll = mechanics.roll_die(20)
                     save_success = (roll + save_mod) >= 16
                 if not save_success:
                     if gift_typ in ("tod", "toedlich", "death"):
@@ -1783,7 +1947,7 @@ class Orchestrator:
                     stufen = 1
                 member = party_state.get_member(char_name)
                 if member:
-                    hp_loss = sum(random.randint(1, 8) for _ in range(stufen))
+                    hp_loss = sum(mechanics.roll_dice(stufen, 8))
                     msg_hp = party_state.apply_damage(char_name, hp_loss)
                     msg = (
                         f"[LEVEL_DRAIN] {char_name} verliert {stufen} Erfahrungsstufe(n)! "
@@ -1805,7 +1969,7 @@ class Orchestrator:
                     schwelle = int(schwelle_str)
                 except ValueError:
                     schwelle = 7
-                wurf = random.randint(1, 6) + random.randint(1, 6)
+                wurf = sum(mechanics.roll_dice(2, 6))
                 if wurf > schwelle:
                     msg = f"[MORAL] {monster_name}: Moral-Check 2d6={wurf} > {schwelle} — Monster FLIEHT!"
                 else:
@@ -1844,7 +2008,7 @@ class Orchestrator:
                 try:
                     total = mechanics.roll_expression(schaden_str.strip())
                 except Exception:
-                    total = random.randint(1, 10)
+                    total = mechanics.roll_die(10)
                 msg = (
                     f"[ATEM_WAFFE] {monster_name} setzt {atem_typ}-Atem ein! "
                     f"Voller Schaden: {total}. Rettungswurf gegen Atemwaffe = "
@@ -1852,6 +2016,10 @@ class Orchestrator:
                 )
                 print(f"\n{msg}")
                 self._emit_game("combat", msg)
+                if self._combat_tracker and self._combat_tracker.active:
+                    self._apply_breath_weapon(monster_name, total, mechanics)
+                else:
+                    self._apply_party_breath_weapon(monster_name, total, mechanics, party_state)
 
         # XP aus Standard-Tags (teilen unter lebenden Mitgliedern)
         from core.character import extract_stat_changes
@@ -15,7 +15,6 @@ Tags (per-Character):
 from __future__ import annotations
 
 import copy
-import difflib
 import json
 import logging
 import os
@@ -23,6 +22,8 @@ from dataclasses import dataclass, field, asdict
 from pathlib import Path
 from typing import Any
 
+from core.name_resolver import NameResolver
+
 logger = logging.getLogger("ARS.party_state")
 
 
@@ -54,6 +55,7 @@ class PartyStateManager:
     def __init__(self) -> None:
         self._members: dict[str, PartyMember] = {}  # keyed by char name
         self._turn_log: list[dict] = []
+        self._names: NameResolver[str] = NameResolver(fuzzy_cutoff=0.5)
 
     # ------------------------------------------------------------------
     # Factory
@@ -126,6 +128,7 @@ class PartyStateManager:
                 alive=True,
             )
             mgr._members[name] = member
+            mgr._names.add(name, name)
             logger.info(
                 "PartyMember geladen: %s (%s %d, %s) HP:%d/%d AC:%d",
                 name, archetype, level, race, hp, hp_max, ac,
@@ -143,22 +146,13 @@ class PartyStateManager:
     # ------------------------------------------------------------------
 
     def _fuzzy_match(self, name: str) -> str | None:
-        """Findet den naechsten Mitgliedsnamen via difflib."""
+        """Findet den naechsten Mitgliedsnamen (exakt, Teilstring, difflib)."""
         if not name or not self._members:
             return None
-        # Exakte Treffer (case-insensitive)
-        for member_name in self._members:
-            if member_name.lower() == name.lower():
-                return member_name
-        # Teilstring-Match
-        for member_name in self._members:
-            if name.lower() in member_name.lower() or member_name.lower() in name.lower():
-                return member_name
-        # Fuzzy-Match
-        matches = difflib.get_close_matches(
-            name, self._members.keys(), n=1, cutoff=0.5
-        )
-        return matches[0] if matches else None
+        if len(self._names) != len(self._members):
+            # _members wurde direkt veraendert — Index neu aufbauen
+            self._names.rebuild((n, n) for n in self._members)
+        return self._names.resolve(name)
 
     # ------------------------------------------------------------------
     # HP Management
@@ -15,6 +15,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 from core.event_bus import EventBus
+from core.name_resolver import NameResolver
 
 logger = logging.getLogger("ARS.rules_engine")
 
@@ -239,6 +240,19 @@ SKILL_ALIASES: dict[str, dict[str, str]] = {
     },
 }
 
+_ALIAS_RESOLVERS: dict[str, NameResolver[str]] = {}
+
+
+def _alias_resolver(module_name: str) -> NameResolver[str]:
+    """Case-insensitiver Alias-Index pro Modul (einmal aufgebaut)."""
+    resolver = _ALIAS_RESOLVERS.get(module_name)
+    if resolver is None:
+        resolver = NameResolver(
+            SKILL_ALIASES.get(module_name, {}).items(), substring=False,
+        )
+        _ALIAS_RESOLVERS[module_name] = resolver
+    return resolver
+
 
 class RulesEngine:
     """
@@ -426,14 +440,13 @@ class RulesEngine:
                                skill_name, self._module_name)
                 return skill_name, False
         # Case-insensitive fallback
-        for alias_key, canonical in aliases.items():
-            if alias_key.lower() == skill_name.lower():
-                if canonical:
-                    logger.info("Skill-Alias aufgeloest (fuzzy): '%s' -> '%s'", skill_name, canonical)
-                    return canonical, True
-                else:
-                    logger.warning("Skill '%s' existiert nicht in %s", skill_name, self._module_name)
-                    return skill_name, False
+        canonical = _alias_resolver(self._module_name).resolve(skill_name)
+        if canonical is None:
+            return skill_name, False
+        if canonical:
+            logger.info("Skill-Alias aufgeloest (fuzzy): '%s' -> '%s'", skill_name, canonical)
+            return canonical, True
+        logger.warning("Skill '%s' existiert nicht in %s", skill_name, self._module_name)
         return skill_name, False
 
     def get_stat_names(self) -> set[str]:
@@ -0,0 +1,342 @@
+"""
+core/world_graph.py — Hierarchisches Pathfinding ueber alle Raeume (HPA*-Stil)
+
+GridEngine kennt immer nur den aktuellen RoomGrid. Fuer Reisen ueber
+mehrere Raeume ("gehe zum Thronsaal") wird hier ein abstrakter Graph
+vorberechnet:
+
+  - Portal-Knoten: ein Knoten pro Ausgang (room_id, exit_id)
+  - Intra-Kanten:  BFS-Distanz zwischen Portalen desselben Raums (gecacht)
+  - Inter-Kanten:  Portal A->B zu Portal B->A (Kosten 1 = Raumwechsel)
+
+plan_route() fuegt Start und Ziel nur temporaer ein (je eine BFS im Start-
+und Zielraum) und sucht dann per Dijkstra ueber die Portale — statt
+raumweiser BFS ueber den ganzen Dungeon.
+
+WorldGraph.lazy() kennt vorab nur die Topologie (Ausgaenge je Raum, z.B.
+aus dem Adventure-Index); RoomGrid und Intra-Kosten eines Raums entstehen
+erst, wenn Dijkstra ihn erreicht. Grosse Kampagnen materialisieren so nur
+die Orte entlang der Suche statt aller Locations.
+
+Verwendung:
+    graph = WorldGraph.build(adventure["locations"], grid_engine.build_room_grid)
+    graph = WorldGraph.lazy(store.locations.links(), store.locations.__getitem__,
+                            grid_engine.build_room_grid)
+    route = graph.plan_route("eingangshalle", (3, 5), "thronsaal")
+    route.rooms  -> ["eingangshalle", "fallengang", ..., "thronsaal"]
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable
+
+from core.grid_engine import RoomGrid, _DIRS_8
+
+logger = logging.getLogger("ARS.world_graph")
+
+# Portal-Schluessel: (room_id, exit_id) — exit_id ist die Ziel-Location
+PortalKey = tuple[str, str]
+
+# Kosten fuer das Durchschreiten eines Ausgangs in den Nachbarraum
+_TRANSITION_COST = 1
+
+_START = ("", "__start__")
+_GOAL = ("", "__goal__")
+
+
+@dataclass
+class WorldRoute:
+    """Ergebnis einer raumuebergreifenden Routenplanung."""
+    cost: int
+    rooms: list[str] = field(default_factory=list)        # Raeume in Reihenfolge
+    hops: list[PortalKey] = field(default_factory=list)   # (room_id, exit_id) je Raumwechsel
+    waypoints: list[tuple[str, int, int]] = field(default_factory=list)  # (room_id, x, y)
+
+    @property
+    def next_exit(self) -> str | None:
+        """Ausgang im Startraum, durch den die Route fuehrt."""
+        return self.hops[0][1] if self.hops else None
+
+
+def distance_field(
+    room: RoomGrid, start: tuple[int, int], max_cost: int | None = None,
+) -> dict[tuple[int, int], int]:
+    """BFS-Distanzfeld (8 Richtungen) ab start ueber walkable Zellen."""
+    dist: dict[tuple[int, int], int] = {start: 0}
+    queue: deque[tuple[int, int]] = deque([start])
+    while queue:
+        cx, cy = queue.popleft()
+        d = dist[(cx, cy)] + 1
+        if max_cost is not None and d > max_cost:
+            continue
+        for dx, dy in _DIRS_8:
+            nx, ny = cx + dx, cy + dy
+            if (nx, ny) in dist or not room.is_walkable(nx, ny):
+                continue
+            dist[(nx, ny)] = d
+            queue.append((nx, ny))
+    return dist
+
+
+def nearest_walkable(room: RoomGrid, pos: tuple[int, int]) -> tuple[int, int] | None:
+    """Naechste walkable Zelle zu pos (Chebyshev, dann Manhattan); None wenn keine."""
+    px, py = pos
+    best: tuple[int, int, int, int] | None = None
+    for y in range(room.height):
+        for x in range(room.width):
+            if not room.is_walkable(x, y):
+                continue
+            dx, dy = abs(x - px), abs(y - py)
+            cand = (max(dx, dy), dx + dy, y, x)
+            if best is None or cand < best:
+                best = cand
+    return None if best is None else (best[3], best[2])
+
+
+class WorldGraph:
+    """
+    Vorberechneter Raum-Konnektivitaetsgraph mit Portal-Knoten.
+
+    API:
+      build(locations, room_builder) — Graph aus Adventure-Locations bauen
+      lazy(links, loader, room_builder) — Raeume erst bei Bedarf bauen
+      plan_route(start_room, start_pos, goal_room, goal_pos=None)
+      invalidate_room(room_id)       — Intra-Kosten eines Raums neu berechnen
+      portals(room_id)               — Portale eines Raums mit Position
+    """
+
+    def __init__(
+        self,
+        room_builder: Callable[[dict, str], RoomGrid],
+        loader: Callable[[str], dict] | None = None,
+    ) -> None:
+        self._room_builder = room_builder
+        self._loader = loader                      # room_id -> Location (lazy)
+        self._links: dict[str, list[str]] = {}     # room -> Ausgaenge (Topologie)
+        self._inbound: dict[str, set[str]] = {}    # room -> Raeume mit Ausgang hierher
+        self._locations: dict[str, dict] = {}
+        self._rooms: dict[str, RoomGrid] = {}
+        self._portals: dict[str, dict[str, tuple[int, int]]] = {}  # room -> exit -> pos
+        self._intra: dict[str, dict[PortalKey, dict[PortalKey, int]]] = {}
+
+    @classmethod
+    def build(
+        cls,
+        locations: Iterable[dict[str, Any]],
+        room_builder: Callable[[dict, str], RoomGrid],
+    ) -> WorldGraph:
+        """Baut Raeume, Portale und alle Intra-Raum-Portalkosten vor."""
+        graph = cls(room_builder)
+        for loc in locations:
+            if isinstance(loc, dict) and "id" in loc:
+                graph._locations[loc["id"]] = loc
+
+        rooms = {rid: room_builder(loc, rid) for rid, loc in graph._locations.items()}
+        graph._set_links({rid: list(room.exits) for rid, room in rooms.items()})
+        for rid, room in rooms.items():
+            graph._add_room(rid, room)
+
+        logger.info(
+            "WorldGraph gebaut: %d Raeume, %d Portale",
+            len(graph._rooms), sum(len(p) for p in graph._portals.values()),
+        )
+        return graph
+
+    @classmethod
+    def lazy(
+        cls,
+        links: dict[str, list[str]],
+        loader: Callable[[str], dict],
+        room_builder: Callable[[dict, str], RoomGrid],
+    ) -> WorldGraph:
+        """Graph nur aus der Topologie; Raeume baut erst die Routensuche."""
+        graph = cls(room_builder, loader)
+        graph._set_links(links)
+        return graph
+
+    # ------------------------------------------------------------------
+    # Vorberechnung
+    # ------------------------------------------------------------------
+
+    def _set_links(self, links: dict[str, list[str]]) -> None:
+        self._links = {rid: [e for e in exits if e in links] for rid, exits in links.items()}
+        self._inbound = {rid: set() for rid in links}
+        for rid, exits in self._links.items():
+            for eid in exits:
+                self._inbound[eid].add(rid)
+
+    def _add_room(self, room_id: str, room: RoomGrid) -> None:
+        """Portale (inkl. Gegenportale einseitiger Verbindungen) und Intra-Kosten."""
+        portals = {eid: pos for eid, pos in room.exits.items() if eid in self._links}
+        # Einseitige Verbindungen: Gegenportal am Default-Eingang ergaenzen,
+        # auf die naechste begehbare Zelle gezogen (sonst keine Intra-Pfade)
+        inbound = [src for src in self._inbound.get(room_id, ()) if src not in portals]
+        if inbound:
+            entry = nearest_walkable(room, (min(3, room.width - 1), room.height // 2))
+            if entry is None:
+                logger.warning("Raum %s ohne begehbare Zelle — keine Gegenportale", room_id)
+            else:
+                for src in inbound:
+                    portals[src] = entry
+        self._rooms[room_id] = room
+        self._portals[room_id] = portals
+        self._compute_intra(room_id)
+
+    def _ensure_room(self, room_id: str) -> bool:
+        """Baut einen Raum des Lazy-Graphen beim ersten Erreichen."""
+        if room_id in self._rooms:
+            return True
+        if room_id not in self._links or self._loader is None:
+            return False
+        try:
+            location = self._loader(room_id)
+        except KeyError:
+            return False
+        self._locations[room_id] = location
+        self._add_room(room_id, self._room_builder(location, room_id))
+        return True
+
+    def _compute_intra(self, room_id: str) -> None:
+        """Portal-zu-Portal-Distanzen innerhalb eines Raums (eine BFS je Portal)."""
+        room = self._rooms[room_id]
+        portals = self._portals.get(room_id, {})
+        costs: dict[PortalKey, dict[PortalKey, int]] = {}
+        for eid, pos in portals.items():
+            field_ = distance_field(room, pos)
+            costs[(room_id, eid)] = {
+                (room_id, other): field_[opos]
+                for other, opos in portals.items()
+                if other != eid and opos in field_
+            }
+        self._intra[room_id] = costs
+
+    def invalidate_room(self, room_id: str, room: RoomGrid | None = None) -> None:
+        """Intra-Kosten neu berechnen (z.B. Tuer geoeffnet, Einsturz).
+
+        Ohne room wird der Raum ueber den room_builder neu erzeugt.
+        """
+        if room_id not in self._rooms:
+            return
+        if room is None:
+            room = self._room_builder(self._locations[room_id], room_id)
+        self._rooms[room_id] = room
+        self._compute_intra(room_id)
+
+    # ------------------------------------------------------------------
+    # Abfragen
+    # ------------------------------------------------------------------
+
+    def has_room(self, room_id: str) -> bool:
+        return room_id in self._rooms or room_id in self._links
+
+    @property
+    def built_rooms(self) -> int:
+        """Anzahl bereits gebauter RoomGrids (Lazy-Graph: nur besuchte)."""
+        return len(self._rooms)
+
+    def portals(self, room_id: str) -> dict[str, tuple[int, int]]:
+        """Portale eines Raums: exit_id -> (x, y)."""
+        self._ensure_room(room_id)
+        return dict(self._portals.get(room_id, {}))
+
+    def plan_route(
+        self,
+        start_room: str,
+        start_pos: tuple[int, int],
+        goal_room: str,
+        goal_pos: tuple[int, int] | None = None,
+    ) -> WorldRoute | None:
+        """Plant eine Route ueber den Portal-Graphen.
+
+        goal_pos=None: Ziel ist erreicht, sobald der Zielraum betreten wird.
+        Gibt None zurueck wenn kein Weg existiert.
+        """
+        if not (self._ensure_room(start_room) and self._ensure_room(goal_room)):
+            return None
+
+        start_room_grid = self._rooms[start_room]
+        start_field = distance_field(start_room_grid, start_pos)
+
+        # Temporaere Kanten: Start -> Portale des Startraums
+        start_edges: dict[PortalKey, int] = {}
+        for eid, pos in self._portals[start_room].items():
+            if pos in start_field:
+                start_edges[(start_room, eid)] = start_field[pos]
+
+        # Temporaere Kanten: Portale des Zielraums -> Ziel
+        goal_edges: dict[PortalKey, int] = {}
+        goal_field: dict[tuple[int, int], int] = {}
+        if goal_pos is not None:
+            goal_field = distance_field(self._rooms[goal_room], goal_pos)
+        for eid, pos in self._portals[goal_room].items():
+            if goal_pos is None:
+                goal_edges[(goal_room, eid)] = 0
+            elif pos in goal_field:
+                goal_edges[(goal_room, eid)] = goal_field[pos]
+
+        if start_room == goal_room:
+            direct = 0 if goal_pos is None else start_field.get(goal_pos)
+            if direct is not None:
+                return WorldRoute(cost=direct, rooms=[start_room],
+                                  waypoints=[(start_room, *(goal_pos or start_pos))])
+
+        # Dijkstra ueber Portal-Knoten
+        dist: dict[PortalKey, int] = {_START: 0}
+        prev: dict[PortalKey, PortalKey] = {}
+        heap: list[tuple[int, PortalKey]] = [(0, _START)]
+        while heap:
+            d, node = heapq.heappop(heap)
+            if node == _GOAL:
+                break
+            if d > dist.get(node, d):
+                continue
+            for nxt, cost in self._neighbors(node, start_edges, goal_edges):
+                nd = d + cost
+                if nd < dist.get(nxt, nd + 1):
+                    dist[nxt] = nd
+                    prev[nxt] = node
+                    heapq.heappush(heap, (nd, nxt))
+
+        if _GOAL not in dist:
+            return None
+
+        # Pfad rekonstruieren
+        chain: list[PortalKey] = []
+        node = prev[_GOAL]
+        while node != _START:
+            chain.append(node)
+            node = prev[node]
+        chain.reverse()
+
+        route = WorldRoute(cost=dist[_GOAL], rooms=[start_room])
+        for i, (room_id, exit_id) in enumerate(chain):
+            x, y = self._portals[room_id][exit_id]
+            route.waypoints.append((room_id, x, y))
+            # Portal gefolgt vom Gegenportal = Raumwechsel
+            if i + 1 < len(chain) and chain[i + 1] == (exit_id, room_id):
+                route.hops.append((room_id, exit_id))
+                route.rooms.append(exit_id)
+        return route
+
+    def _neighbors(
+        self,
+        node: PortalKey,
+        start_edges: dict[PortalKey, int],
+        goal_edges: dict[PortalKey, int],
+    ) -> Iterable[tuple[PortalKey, int]]:
+        if node == _START:
+            yield from start_edges.items()
+            return
+        room_id, exit_id = node
+        if node in goal_edges:
+            yield _GOAL, goal_edges[node]
+        # Durch den Ausgang in den Nachbarraum (Lazy: Nachbar jetzt bauen)
+        self._ensure_room(exit_id)
+        if exit_id in self._portals and room_id in self._portals[exit_id]:
+            yield (exit_id, room_id), _TRANSITION_COST
+        # Innerhalb des Raums zu anderen Portalen
+        yield from self._intra.get(room_id, {}).get(node, {}).items()
@@ -4,7 +4,10 @@ gui/pixel_renderer.py — Gemeinsamer Pixel-Art Renderer
 Wiederverwendbare Render-Logik fuer Dungeon-Visualisierung mit 0x72 Tileset:
   - PixelTileset: Laedt und cached alle Tileset-Assets
   - Autotiler: 4-Bit Cardinal Bitmask fuer Floor-zu-Wall-Edge-Auswahl
+  - autotile_masks(): dieselben Masken vektorisiert fuer das ganze Grid
+  - TileAtlas: alle Tiles in einem Atlas-Bild (Quelle fuer Chunk-Renderer)
   - render_terrain_image(): Terrain-2D-Array → PIL Image
+    (mit NumPy ueber gui/terrain_chunks.py, sonst Tile-fuer-Tile)
   - render_room_to_image(): Kompletter Raum (Terrain + Entities + Trails)
 
 Verwendet von:
@@ -14,6 +17,7 @@ Verwendet von:
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
 import random
@@ -29,6 +33,12 @@ try:
 except ImportError:
     HAS_PIL = False
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 # ── Pfade & Konstanten ───────────────────────────────────────────────────────
 
 ASSET_DIR = os.path.join(
@@ -45,6 +55,11 @@ TILE = 16
 SCALE = 2
 FOG_NEAR = 8
 FOG_FAR = 12
+CHUNK = 32          # Tiles pro Chunk-Kante (Chunk-Renderer, Fog-Chunks)
+BG_COLOR = (5, 3, 8, 255)
+
+# Bei sichtbaren Aenderungen am Terrain-Rendering erhoehen (invalidiert gecachte Layer)
+RENDER_VERSION = 2
 
 
 # ── Asset-Loader ─────────────────────────────────────────────────────────────
@@ -81,6 +96,23 @@ def tint(img: "Image.Image", color: tuple[int, int, int],
     return result
 
 
+def tileset_fingerprint(*dirs: str) -> str:
+    """Versions-Hash des Tilesets aus Dateinamen, Groessen und mtimes.
+
+    Ohne Argumente: 0x72-Assets + generated/ (Cave-Tiles, Sprites).
+    """
+    h = hashlib.sha1()
+    for d in dirs or (ASSET_DIR, GENERATED_DIR):
+        if not os.path.isdir(d):
+            continue
+        entries = sorted(
+            (e.name, e.stat().st_size, e.stat().st_mtime_ns)
+            for e in os.scandir(d) if e.name.endswith(".png")
+        )
+        h.update(repr(entries).encode("utf-8"))
+    return h.hexdigest()[:12]
+
+
 # ── Auto-Tiler ──────────────────────────────────────────────────────────────
 
 class Autotiler:
@@ -126,6 +158,187 @@ class Autotiler:
         return "black"
 
 
+# Wall-Varianten aus autotile_masks() (Index = Code)
+WALL_NAMES: tuple[str, ...] = ("black", "Wall_front", "Wall_front_left", "Wall_front_right")
+
+
+def autotile_masks(wall_grid: Any) -> tuple[Any, Any]:
+    """Edge-Masken und Wall-Varianten fuer das ganze Grid auf einmal.
+
+    Ergebnis identisch zu Autotiler.get_edge_mask / get_wall_asset_name
+    (ausserhalb des Grids = Wand), aber ohne Methodenaufruf pro Zelle.
+
+    Args:
+        wall_grid: [y][x] 0/1 (Liste oder NumPy-Array)
+
+    Returns:
+        (edge, kind) — edge: N=8/S=4/E=2/W=1, kind: Index in WALL_NAMES.
+        Mit NumPy als uint8-Arrays, sonst als verschachtelte Listen.
+    """
+    if HAS_NUMPY:
+        wall = np.asarray(wall_grid, dtype=bool)
+        p = np.pad(wall, 1, constant_values=True)
+        n, s = p[:-2, 1:-1], p[2:, 1:-1]
+        e, w = p[1:-1, 2:], p[1:-1, :-2]
+        edge = (n.astype(np.uint8) << 3) | (s.astype(np.uint8) << 2) \
+            | (e.astype(np.uint8) << 1) | w.astype(np.uint8)
+        kind = np.where(
+            ~s,
+            np.where(~w & e, 2, np.where(~e & w, 3, 1)),
+            0,
+        ).astype(np.uint8)
+        return edge, kind
+
+    h = len(wall_grid)
+    w = len(wall_grid[0]) if h else 0
+
+    def is_wall(x: int, y: int) -> bool:
+        return x < 0 or x >= w or y < 0 or y >= h or wall_grid[y][x] == 1
+
+    edge_rows: list[list[int]] = []
+    kind_rows: list[list[int]] = []
+    for y in range(h):
+        erow, krow = [], []
+        for x in range(w):
+            wn, ws = is_wall(x, y - 1), is_wall(x, y + 1)
+            we, ww = is_wall(x + 1, y), is_wall(x - 1, y)
+            erow.append(wn << 3 | ws << 2 | we << 1 | ww)
+            if ws:
+                krow.append(0)
+            elif not ww and we:
+                krow.append(2)
+            elif not we and ww:
+                krow.append(3)
+            else:
+                krow.append(1)
+        edge_rows.append(erow)
+        kind_rows.append(krow)
+    return edge_rows, kind_rows
+
+
+# ── Tile-Atlas ───────────────────────────────────────────────────────────────
+
+class TileAtlas:
+    """Packt alle Terrain-Tiles (TILE x TILE) in ein einziges Atlas-Bild.
+
+    Index 0 ist immer das leere (transparente) Tile. Groessere Bilder
+    (Tuer 32x32, Saeule 16x48) werden per add_sprite() in Tile-Teile
+    zerlegt, die relativ zur Anker-Zelle platziert werden.
+
+    Mit NumPy steht der Atlas zusaetzlich als (N, TILE, TILE, 4)-Array
+    bereit — ein Chunk ist dann ein Gather ueber Tile-Indizes.
+    """
+
+    COLS = 16
+
+    def __init__(self, bg: tuple[int, int, int, int] = BG_COLOR) -> None:
+        self.bg = bg
+        self._tiles: list["Image.Image"] = [Image.new("RGBA", (TILE, TILE), (0, 0, 0, 0))]
+        self._keys: dict[str, int] = {}
+        self._sprites: dict[str, list[tuple[int, int, int]]] = {}
+        self._image: "Image.Image | None" = None
+        self._array: Any = None
+        self._opaque: Any = None
+
+    def __len__(self) -> int:
+        return len(self._tiles)
+
+    def _append(self, key: str, img: "Image.Image") -> int:
+        idx = len(self._tiles)
+        self._tiles.append(img)
+        self._keys[key] = idx
+        self._image = None
+        self._array = None
+        return idx
+
+    def index(self, key: str) -> int | None:
+        return self._keys.get(key)
+
+    def add_tile(self, key: str, img: "Image.Image") -> int:
+        """Registriert ein Overlay-Tile (Alpha bleibt erhalten)."""
+        idx = self._keys.get(key)
+        if idx is not None:
+            return idx
+        tile = img.convert("RGBA")
+        if tile.size != (TILE, TILE):
+            tile = tile.crop((0, 0, TILE, TILE))
+        return self._append(key, tile)
+
+    def add_base(self, key: str, img: "Image.Image") -> int:
+        """Registriert ein Basis-Tile, vorab auf den Hintergrund composited (opak)."""
+        key = f"base:{key}"
+        idx = self._keys.get(key)
+        if idx is not None:
+            return idx
+        tile = Image.new("RGBA", (TILE, TILE), self.bg)
+        if img is not None:
+            src = img.convert("RGBA")
+            tile.paste(src, (0, 0), src)
+        return self._append(key, tile)
+
+    def add_sprite(
+        self, key: str, img: "Image.Image", offset: tuple[int, int] = (0, 0),
+    ) -> list[tuple[int, int, int]]:
+        """Zerlegt ein Bild beliebiger Groesse in Tile-Teile.
+
+        offset: Pixel-Versatz relativ zur Anker-Zelle (z.B. (0, -32) fuer
+        eine 16x48-Saeule, die zwei Zellen nach oben ragt).
+
+        Returns:
+            [(dx, dy, tile_idx)] — leere (voll transparente) Teile entfallen.
+        """
+        parts = self._sprites.get(key)
+        if parts is not None:
+            return parts
+        src = img.convert("RGBA")
+        ox, oy = offset
+        w, h = src.size
+        tx0, ty0 = ox // TILE, oy // TILE
+        tx1, ty1 = -(-(ox + w) // TILE), -(-(oy + h) // TILE)
+        parts = []
+        for ty in range(ty0, ty1):
+            for tx in range(tx0, tx1):
+                tile = Image.new("RGBA", (TILE, TILE), (0, 0, 0, 0))
+                tile.paste(src, (ox - tx * TILE, oy - ty * TILE))
+                if tile.getextrema()[3][1] == 0:
+                    continue
+                parts.append((tx, ty, self._append(f"{key}@{tx},{ty}", tile)))
+        self._sprites[key] = parts
+        return parts
+
+    def tile(self, idx: int) -> "Image.Image":
+        return self._tiles[idx]
+
+    @property
+    def image(self) -> "Image.Image":
+        """Das gepackte Atlas-Bild (COLS Tiles pro Zeile)."""
+        if self._image is None:
+            rows = -(-len(self._tiles) // self.COLS)
+            sheet = Image.new("RGBA", (self.COLS * TILE, rows * TILE), (0, 0, 0, 0))
+            for i, tile in enumerate(self._tiles):
+                sheet.paste(tile, ((i % self.COLS) * TILE, (i // self.COLS) * TILE))
+            self._image = sheet
+        return self._image
+
+    @property
+    def array(self) -> Any:
+        """Atlas als (N, TILE, TILE, 4) uint8-Array (nur mit NumPy)."""
+        if self._array is None and HAS_NUMPY:
+            sheet = np.asarray(self.image)
+            rows = sheet.shape[0] // TILE
+            blocks = sheet.reshape(rows, TILE, self.COLS, TILE, 4).swapaxes(1, 2)
+            self._array = np.ascontiguousarray(
+                blocks.reshape(rows * self.COLS, TILE, TILE, 4)[:len(self._tiles)]
+            )
+            self._opaque = (self._array[..., 3] == 255).all(axis=(1, 2))
+        return self._array
+
+    @property
+    def opaque(self) -> Any:
+        """Bool-Array: Tile ist komplett deckend (Blend = Kopie)."""
+        return self._opaque if self.array is not None else None
+
+
 # ── Entity-zu-Asset-Mapping ─────────────────────────────────────────────────
 
 CLASS_MAP: dict[str, tuple[str, tuple[int, int, int]]] = {
@@ -207,6 +420,7 @@ class PixelTileset:
         self.default_monster: "Image.Image | None" = None
         self.npc_img: "Image.Image | None" = None
         self._loaded = False
+        self._atlas: TileAtlas | None = None
 
     def load(self) -> None:
         """Laedt alle Pixel-Art-Assets einmalig."""
@@ -349,6 +563,13 @@ class PixelTileset:
             return self.wall_front_right
         return self.wall_black
 
+    def atlas(self) -> TileAtlas:
+        """Gemeinsamer Tile-Atlas dieses Tilesets (lazy, waechst bei Bedarf)."""
+        if self._atlas is None:
+            self.load()
+            self._atlas = TileAtlas()
+        return self._atlas
+
 
 # ── Render-Funktionen ────────────────────────────────────────────────────────
 
@@ -385,6 +606,37 @@ def render_terrain_image(
 ) -> "Image.Image":
     """Rendert Terrain-2D-Array als PIL Image (statischer Layer, Source-Aufloesung).
 
+    Mit NumPy ueber den Chunk-Renderer (Atlas-Gather pro Chunk), sonst
+    Tile-fuer-Tile per PIL.paste(). Wer das Terrain spaeter aendert, haelt
+    besser direkt einen TerrainChunkRenderer (nur betroffene Chunks neu).
+
+    Args/Returns: siehe _render_terrain_image_tiles().
+    """
+    if not HAS_PIL:
+        return None
+    if not terrain_2d or not terrain_2d[0]:
+        return None
+    if HAS_NUMPY:
+        from gui.terrain_chunks import TerrainChunkRenderer
+        return TerrainChunkRenderer(
+            terrain_2d, tileset, room_id, biome,
+            tile_to_room=tile_to_room, decorations=decorations,
+        ).render_full()
+    return _render_terrain_image_tiles(
+        terrain_2d, tileset, room_id, biome, tile_to_room, decorations,
+    )
+
+
+def _render_terrain_image_tiles(
+    terrain_2d: list[list[str]],
+    tileset: PixelTileset,
+    room_id: str = "",
+    biome: str = "",
+    tile_to_room: list[list[str | None]] | None = None,
+    decorations: list[dict] | None = None,
+) -> "Image.Image":
+    """Tile-fuer-Tile-Renderer (Fallback ohne NumPy).
+
     Args:
         terrain_2d: [y][x] = "wall"|"floor"|"door"|"obstacle"|"water"|"void"
         tileset: Geladenes PixelTileset
@@ -467,7 +719,7 @@ def render_terrain_image(
     cave_stalactites = [v for k, v in cave.items() if "stalactite" in k]
 
     # Render
-    img = Image.new("RGBA", (w * TILE, h * TILE), (5, 3, 8, 255))
+    img = Image.new("RGBA", (w * TILE, h * TILE), BG_COLOR)
 
     for y in range(h):
         for x in range(w):
@@ -7,17 +7,18 @@ via EventBus und visualisiert Raum, Entities, Kampf und Effekte mit
 
 Reine Viewer-Komponente — keine eigene Spiellogik.
 Input: GridEngine Events (grid.room_setup, grid.entity_moved, grid.combat_move)
-Output: PIL → ImageTk → tkinter Canvas (8 FPS)
+Output: ViewportCompositor (Layer + Dirty-Panels) → ImageTk-Panels → Canvas (8 FPS)
 """
 
 from __future__ import annotations
 
 import logging
-import math
 import os
 import random
+import time
 import tkinter as tk
 import tkinter.ttk as ttk
+import zlib
 from collections import deque
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
@@ -28,14 +29,13 @@ from gui.styles import (
     FONT_NORMAL, FONT_SMALL, FONT_BOLD, PAD, PAD_SMALL,
 )
 from gui.pixel_renderer import (
-    Autotiler as _Autotiler,
-    CLASS_MAP as _CLASS_MAP,
-    MONSTER_MAP as _MONSTER_MAP,
-    load_asset as _load_asset,
-    tint as _tint,
-    ASSET_DIR, TILE, SCALE, FOG_NEAR, FOG_FAR,
-    HAS_PIL,
+    PixelTileset,
+    render_terrain_image,
+    ASSET_DIR, TILE, SCALE,
+    HAS_PIL, HAS_NUMPY,
 )
+from gui.terrain_chunks import TerrainChunkRenderer
+from gui.viewport_compositor import Sprite, ViewportCompositor, fog_from_lights
 
 if TYPE_CHECKING:
     from gui.tech_gui import TechGUI
@@ -45,7 +45,7 @@ logger = logging.getLogger("ARS.gui.dungeon_pixel")
 # ── PIL Import ───────────────────────────────────────────────────────────────
 
 if HAS_PIL:
-    from PIL import Image, ImageDraw, ImageTk
+    from PIL import Image, ImageTk
 
 # ── Lokale Konstanten ────────────────────────────────────────────────────────
 
@@ -87,9 +87,10 @@ class DungeonPixelTab(ttk.Frame):
         self.configure(style="TFrame")
 
         # Rendering-State
-        self._static: "Image.Image | None" = None   # Gecachter statischer Layer
-        self._tk_image: Any = None                   # ImageTk-Referenz (GC-Schutz)
-        self._canvas_img_id: int | None = None
+        self._static: "Image.Image | None" = None   # Vollbild (nur ohne NumPy)
+        self._compositor = ViewportCompositor(scale=SCALE)
+        # Panel-Key -> (ImageTk-Referenz, Canvas-Item)
+        self._panel_items: dict[tuple[int, int], tuple[Any, int]] = {}
         self._room_w: int = 0
         self._room_h: int = 0
 
@@ -114,34 +115,24 @@ class DungeonPixelTab(ttk.Frame):
 
         # Assets
         self._assets_loaded = False
+        self._tileset: PixelTileset | None = None
         self._hero_imgs: dict[str, "Image.Image"] = {}
         self._monster_imgs: dict[str, "Image.Image"] = {}
-        self._edge_tiles: dict[str, "Image.Image"] = {}
-        self._floor_plain: "Image.Image | None" = None
-        self._floor_stains: list["Image.Image"] = []
-        self._wall_front: "Image.Image | None" = None
-        self._wall_front_left: "Image.Image | None" = None
-        self._wall_front_right: "Image.Image | None" = None
-        self._wall_black: "Image.Image | None" = None
-        self._door_img: "Image.Image | None" = None
-        self._column_img: "Image.Image | None" = None
-        self._chest_img: "Image.Image | None" = None
-        self._skull_img: "Image.Image | None" = None
         self._torch_imgs: list["Image.Image"] = []
         self._torch_frame: int = 0
         self._torch_timer: int = 0
         self._default_monster: "Image.Image | None" = None
 
+        # Terrain in Chunks (nur betroffene Chunks bei Terrain-Aenderungen neu)
+        self._terrain: TerrainChunkRenderer | None = None
+
         # Torch-Positionen im aktuellen Raum
         self._torch_positions: list[tuple[int, int]] = []
 
-        # Floor-Variety-Map pro Raum
-        self._floor_map: dict[tuple[int, int], "Image.Image"] = {}
-
         # Render-Timer
         self._after_id: str | None = None
-        self._fog_cache: "Image.Image | None" = None
-        self._fog_hero_pos: list[tuple[int, int]] = []
+        self._fog_key: tuple | None = None      # (Lichter, Kamera) des letzten Fogs
+        self._fog_alpha: bytes = b""
         self._tick_count: int = 0
 
         # Auto-Crawl
@@ -193,6 +184,13 @@ class DungeonPixelTab(ttk.Frame):
         )
         self._crawl_btn.pack(side=tk.LEFT, padx=(2, PAD_SMALL), pady=PAD_SMALL)
 
+        # Frame-Zeiten (Compositor-Statistik)
+        self._fps_var = tk.StringVar(value="")
+        tk.Label(
+            hud, textvariable=self._fps_var, bg=BG_PANEL, fg=FG_MUTED,
+            font=FONT_SMALL, width=16, anchor=tk.W,
+        ).pack(side=tk.LEFT, padx=PAD_SMALL)
+
         # Linke Haelfte: Party HP
         self._hp_frame = tk.Frame(hud, bg=BG_PANEL)
         self._hp_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=PAD_SMALL)
@@ -217,82 +215,26 @@ class DungeonPixelTab(ttk.Frame):
     # ── Asset-Laden ──────────────────────────────────────────────────────────
 
     def _load_assets(self) -> None:
-        """Laedt alle Pixel-Art-Assets einmalig."""
+        """Laedt alle Pixel-Art-Assets einmalig (ueber das gemeinsame PixelTileset)."""
         if self._assets_loaded:
             return
         self._assets_loaded = True
 
-        A = _load_asset
-
-        # Floor Tiles
-        self._floor_plain = A("floor_plain.png")
-        self._floor_stains = [
-            A("floor_stain_1.png"), A("floor_stain_2.png"), A("floor_stain_3.png"),
-        ]
-        self._floor_light = A("floor_light.png")
-
-        # Wall Tiles
-        self._wall_front = A("Wall_front.png")
-        self._wall_front_left = A("Wall_front_left.png")
-        self._wall_front_right = A("Wall_front_right.png")
-        self._wall_black = A("black.png")
-
-        # Edge Tiles (alle 16 Varianten)
-        for name in _Autotiler.EDGE_MAP.values():
-            if name and name not in self._edge_tiles:
-                self._edge_tiles[name] = A(f"{name}.png")
-
-        # Tueren
-        self._door_img = A("door_open.png")
-
-        # Deko
-        self._column_img = A("column.png", fallback_size=(TILE, 32))
-        self._chest_img = A("chest_closed.png")
-        self._skull_img = A("skull.png")
-
-        # Fackeln (8 Frames)
-        self._torch_imgs = [A(f"torch_{i}.png") for i in range(1, 9)]
-
-        # Heroes (hero_basic.png gefaerbt)
-        hero_base = A("hero_basic.png")
-        for sym, (key, color) in _CLASS_MAP.items():
-            self._hero_imgs[sym] = _tint(hero_base, color)
-        # Default Hero (ungefaerbt)
-        self._hero_imgs["?"] = hero_base
+        ts = PixelTileset(ASSET_DIR)
+        ts.load()
+        self._tileset = ts
 
-        # Monster
-        for key, filename in _MONSTER_MAP.items():
-            if filename not in [m for m in self._monster_imgs.values()]:
-                self._monster_imgs[key] = A(filename)
-        self._default_monster = A("monster_imp.png")
-
-        # NPC-Sprites
-        self._npc_img = A("npc_merchant.png")
-
-        # Generierte Sprites (von SpriteExtractor)
-        self._load_generated_sprites()
+        # Sprites fuer den dynamischen Layer; Terrain-Tiles nutzt der Chunk-Renderer
+        self._torch_imgs = ts.torch_imgs
+        self._hero_imgs = ts.hero_imgs
+        self._monster_imgs = ts.monster_imgs
+        self._default_monster = ts.default_monster
+        self._npc_img = ts.npc_img
+        self._generated_sprites = getattr(ts, "_generated_sprites", {})
 
         logger.info("Pixel-Dungeon Assets geladen (%d Heroes, %d Monster, %d generated)",
                      len(self._hero_imgs), len(self._monster_imgs),
-                     len(getattr(self, "_generated_sprites", {})))
-
-    def _load_generated_sprites(self) -> None:
-        """Laedt generierte Sprites aus data/tilesets/generated/."""
-        from gui.pixel_renderer import GENERATED_DIR as _GEN_DIR
-        self._generated_sprites: dict[str, "Image.Image"] = {}
-        if not os.path.isdir(_GEN_DIR):
-            return
-        for fname in os.listdir(_GEN_DIR):
-            if not fname.endswith(".png") or fname.startswith("_"):
-                continue
-            if fname.startswith("sprite_"):
-                sprite_id = fname[len("sprite_"):-len(".png")]
-                self._generated_sprites[sprite_id] = _load_asset(
-                    fname, _GEN_DIR)
-            elif fname.startswith("monster_") and fname.endswith("_01.png"):
-                key = fname[len("monster_"):-len("_01.png")]
-                if key not in self._monster_imgs:
-                    self._monster_imgs[key] = _load_asset(fname, _GEN_DIR)
+                     len(self._generated_sprites))
 
     # ── Event-Handler ────────────────────────────────────────────────────────
 
@@ -407,111 +349,56 @@ class DungeonPixelTab(ttk.Frame):
     def _build_static_layer(self) -> None:
         """Rendert Terrain als gecachtes PIL-Bild (Quelle fuer Viewport-Crop)."""
         room = self._get_room()
-        if not room:
+        if not room or not self._tileset:
             return
 
         w, h = room.width, room.height
         self._room_w = w
         self._room_h = h
 
-        # RoomGrid → 0/1 Wall-Grid fuer Autotiler
-        wall_grid: list[list[int]] = []
-        for y in range(h):
-            row = []
-            for x in range(w):
-                row.append(1 if room.cells[y][x].terrain == "wall" else 0)
-            wall_grid.append(row)
-
-        autotiler = _Autotiler(wall_grid, self._edge_tiles)
-
-        # Floor-Variety-Map (deterministic per room)
-        rng = random.Random(hash(room.room_id))
-        self._floor_map.clear()
-        for y in range(h):
-            for x in range(w):
-                if wall_grid[y][x] == 0:
-                    r = rng.random()
-                    if r < 0.06:
-                        self._floor_map[(x, y)] = rng.choice(self._floor_stains)
-                    elif r < 0.10:
-                        self._floor_map[(x, y)] = self._floor_light
-                    else:
-                        self._floor_map[(x, y)] = self._floor_plain
-
-        # Static Layer rendern
-        src_w = w * TILE
-        src_h = h * TILE
-        self._static = Image.new("RGBA", (src_w, src_h), (5, 3, 8, 255))
-
-        for y in range(h):
-            for x in range(w):
-                px, py = x * TILE, y * TILE
-                terrain = room.cells[y][x].terrain
-
-                if terrain == "wall":
-                    wname = autotiler.get_wall_asset_name(x, y)
-                    if wname == "Wall_front":
-                        wt = self._wall_front
-                    elif wname == "Wall_front_left":
-                        wt = self._wall_front_left
-                    elif wname == "Wall_front_right":
-                        wt = self._wall_front_right
-                    else:
-                        wt = self._wall_black
-                    self._static.paste(wt, (px, py), wt)
-                else:
-                    # Floor-Basis
-                    tile = self._floor_map.get((x, y), self._floor_plain)
-                    self._static.paste(tile, (px, py), tile)
-
-                    # Edge-Overlay
-                    mask = autotiler.get_edge_mask(x, y)
-                    ename = _Autotiler.EDGE_MAP.get(mask)
-                    if ename and ename in self._edge_tiles:
-                        etile = self._edge_tiles[ename]
-                        self._static.paste(etile, (px, py), etile)
-
-                    # Spezial-Terrain
-                    if terrain == "door" and self._door_img:
-                        self._static.paste(self._door_img, (px, py), self._door_img)
-                    elif terrain == "obstacle" and self._column_img:
-                        # Saeulen sind 16x32 — oben ueberlappend
-                        col_h = self._column_img.height
-                        self._static.paste(
-                            self._column_img,
-                            (px, py - (col_h - TILE)),
-                            self._column_img,
-                        )
+        terrain = [[room.cells[y][x].terrain for x in range(w)] for y in range(h)]
+        if HAS_NUMPY:
+            # Chunks werden erst gerendert, wenn der Viewport sie braucht
+            self._terrain = TerrainChunkRenderer(
+                terrain, self._tileset, room.room_id, biome="plain",
+            )
+            self._static = None
+            self._compositor.set_static(self._terrain)
+        else:
+            self._terrain = None
+            self._static = render_terrain_image(
+                terrain, self._tileset, room.room_id, biome="plain",
+            )
+            self._compositor.set_static(self._static)
 
         # Torch-Positionen berechnen: Wall_front mit Floor daneben
+        rng = random.Random(zlib.crc32(room.room_id.encode("utf-8")))
         self._torch_positions.clear()
-        for y in range(h):
+        for y in range(h - 1):
             for x in range(w):
-                if wall_grid[y][x] == 1 and y + 1 < h and wall_grid[y + 1][x] == 0:
+                if terrain[y][x] == "wall" and terrain[y + 1][x] != "wall":
                     # Wall_front → Fackel-Kandidat
                     if rng.random() < 0.12:
                         self._torch_positions.append((x, y))
 
-        # Skulls in Sackgassen
-        for y in range(1, h - 1):
-            for x in range(1, w - 1):
-                if wall_grid[y][x] != 0:
-                    continue
-                nbrs = sum(
-                    1 for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1))
-                    if 0 <= x + dx < w and 0 <= y + dy < h
-                    and wall_grid[y + dy][x + dx] == 0
-                )
-                if nbrs == 1 and self._skull_img:
-                    self._static.paste(
-                        self._skull_img,
-                        (x * TILE, y * TILE),
-                        self._skull_img,
-                    )
-
         logger.info("Static Layer gerendert: %dx%d (%d Fackeln)",
                      w, h, len(self._torch_positions))
 
+    def _on_terrain_changed(self, data: dict) -> None:
+        """Einzelne Zelle geaendert — nur den betroffenen Chunk neu zeichnen."""
+        room = self._get_room()
+        if not room or not self._compositor.has_static \
+                or data.get("room_id") != room.room_id:
+            return
+        x, y = data.get("x", -1), data.get("y", -1)
+        terrain = data.get("terrain", "floor")
+        if self._terrain is None:
+            self._build_static_layer()
+            return
+        chunks = self._terrain.set_terrain(x, y, terrain)
+        self._compositor.invalidate_static(chunks)
+        logger.debug("Terrain (%d,%d) -> %s: %d Chunk(s) neu", x, y, terrain, len(chunks))
+
     # ── Render-Loop ──────────────────────────────────────────────────────────
 
     def _start_render_loop(self) -> None:
@@ -536,10 +423,8 @@ class DungeonPixelTab(ttk.Frame):
         except Exception:
             pass
         self._update()
-        # Idle-Skip: nur jeden 4. Tick rendern wenn nichts animiert wird
-        is_active = bool(self._anim_queue or self._effects)
-        if is_active or self._tick_count % 4 == 0:
-            self._render()
+        # Idle-Frames kosten nur den Signatur-Vergleich im Compositor
+        self._render()
         self._after_id = self.after(TICK_MS, self._tick)
 
     def _update(self) -> None:
@@ -580,190 +465,93 @@ class DungeonPixelTab(ttk.Frame):
                 self._effects.remove(eff)
 
     def _render(self) -> None:
-        """Rendert den Viewport: Static Crop → Entities → FoW → Scale → Effects."""
-        if not self._static or not HAS_PIL:
+        """Komponiert den Viewport: nur Panels mit Aenderungen gehen an Tk."""
+        if not self._compositor.has_static or not HAS_PIL:
             return
 
         room = self._get_room()
         if not room:
             return
 
-        cam_x, cam_y = self._cam_x, self._cam_y
+        t0 = time.perf_counter()
         vp_tw = min(self._vp_tiles_x, self._room_w)
         vp_th = min(self._vp_tiles_y, self._room_h)
-
         if vp_tw <= 0 or vp_th <= 0:
             return
+        cam_x = max(0, min(self._room_w - vp_tw, self._cam_x))
+        cam_y = max(0, min(self._room_h - vp_th, self._cam_y))
+        self._compositor.set_camera(cam_x, cam_y, vp_tw, vp_th)
 
-        # Crop-Box (Source-Aufloesung)
-        crop_x = max(0, min(self._room_w * TILE - vp_tw * TILE, cam_x * TILE))
-        crop_y = max(0, min(self._room_h * TILE - vp_th * TILE, cam_y * TILE))
-        crop_w = vp_tw * TILE
-        crop_h = vp_th * TILE
-
-        src = self._static.crop((crop_x, crop_y, crop_x + crop_w, crop_y + crop_h))
-        src = src.copy()  # Crop ist Read-Only
-
-        # Animierte Fackeln
+        # Dynamischer Layer: Fackeln, dann Entities (nach Y sortiert)
+        sprites: list[Sprite] = []
         if self._torch_imgs:
             torch = self._torch_imgs[self._torch_frame]
-            for gx, gy in self._torch_positions:
-                vx = gx - cam_x
-                vy = gy - cam_y
-                if 0 <= vx < vp_tw and 0 <= vy < vp_th:
-                    src.paste(torch, (vx * TILE, vy * TILE), torch)
-
-        # Entities zeichnen (nach Y sortiert)
-        entities = list(room.entities.values())
-        entities.sort(key=lambda e: e.y)
+            sprites.extend(Sprite(gx, gy, torch) for gx, gy in self._torch_positions)
+
+        lights: list[tuple[int, int]] = []
+        entities = sorted(room.entities.values(), key=lambda e: e.y)
         for ent in entities:
             if not ent.alive:
                 continue
             # Visuelle Position (Animation oder Grid)
-            if ent.entity_id in self._anim_pos:
-                ex, ey = self._anim_pos[ent.entity_id]
-            else:
-                ex, ey = ent.x, ent.y
+            ex, ey = self._anim_pos.get(ent.entity_id, (ent.x, ent.y))
+            if ent.entity_type == "party_member":
+                lights.append((ex, ey))
+            hp, max_hp = self._get_entity_hp(ent)
+            bar = None
+            if max_hp > 0:
+                col = (70, 210, 70) if ent.entity_type == "party_member" else (210, 50, 50)
+                bar = (hp / max_hp, col)
+            sprites.append(Sprite(ex, ey, self._get_entity_sprite(ent), bar))
+
+        # Fog nur neu berechnen, wenn sich Lichter oder Kamera bewegt haben
+        fog_key = (tuple(lights), cam_x, cam_y, vp_tw, vp_th)
+        if fog_key != self._fog_key:
+            self._fog_key = fog_key
+            self._fog_alpha = fog_from_lights(lights, cam_x, cam_y, vp_tw, vp_th)
+
+        frame = self._compositor.compose(sprites, self._fog_alpha, self._effects)
+        stats = self._compositor.stats
+        if frame.skipped:
+            stats.skip()
+        else:
+            self._present(frame)
+            stats.record((time.perf_counter() - t0) * 1000, len(frame.panels))
+        # HUD aktualisieren (HP von Entities ausserhalb des Viewports)
+        if not frame.skipped or self._tick_count % 4 == 0:
+            self._update_hud(room)
+
+        if self._tick_count % (FPS * 2) == 0:
+            summary = stats.summary(FPS)
+            self._fps_var.set(
+                f"{summary['avg_ms']:.1f} ms  p95 {summary['p95_ms']:.1f}"
+            )
+            logger.debug(
+                "Frames: avg %.1f ms, p95 %.1f ms, max %.1f ms, %.0f%% im Budget, "
+                "%.0f%% uebersprungen, %.1f Panels",
+                summary["avg_ms"], summary["p95_ms"], summary["max_ms"],
+                summary["in_budget"] * 100, summary["skip_rate"] * 100, summary["panels"],
+            )
 
-            vx = ex - cam_x
-            vy = ey - cam_y
-            if not (0 <= vx < vp_tw and 0 <= vy < vp_th):
+    def _present(self, frame: Any) -> None:
+        """Uebergibt geaenderte Panels an ihre Canvas-Items."""
+        if frame.layout_changed:
+            for _, item_id in self._panel_items.values():
+                self._canvas.delete(item_id)
+            self._panel_items.clear()
+
+        for key, (px, py), img in frame.panels:
+            entry = self._panel_items.get(key)
+            if entry is not None and (entry[0].width(), entry[0].height()) == img.size:
+                entry[0].paste(img)
                 continue
-
-            sprite = self._get_entity_sprite(ent)
-            sp_w, sp_h = sprite.size
-            px, py = vx * TILE, vy * TILE
-            # Grosse Sprites zentriert auf Tile-Position
-            if sp_w > TILE or sp_h > TILE:
-                offset_x = -(sp_w - TILE) // 2
-                offset_y = -(sp_h - TILE) // 2
-                src.paste(sprite, (px + offset_x, py + offset_y), sprite)
+            photo = ImageTk.PhotoImage(img)
+            if entry is None:
+                item_id = self._canvas.create_image(px, py, anchor=tk.NW, image=photo)
             else:
-                src.paste(sprite, (px, py), sprite)
-
-            # HP-Balken
-            bw = TILE
-            by = py - 3
-            if by >= 0:
-                d = ImageDraw.Draw(src)
-                hp, max_hp = self._get_entity_hp(ent)
-                if max_hp > 0:
-                    ratio = max(0.0, min(1.0, hp / max_hp))
-                    d.rectangle([px, by, px + bw - 1, by + 1], fill=(40, 40, 40))
-                    filled = max(1, int(bw * ratio))
-                    if ratio > 0:
-                        col = (70, 210, 70) if ent.entity_type == "party_member" \
-                            else (210, 50, 50)
-                        d.rectangle([px, by, px + filled, by + 1], fill=col)
-
-        # Slash-Effekte (Source-Aufloesung)
-        d_src = ImageDraw.Draw(src)
-        for eff in self._effects:
-            if eff.kind == "slash":
-                sx = int(eff.x - cam_x) * TILE + TILE // 2
-                sy = int(eff.y - cam_y) * TILE + TILE // 2
-                col = eff.color
-                d_src.line([(sx - 4, sy - 4), (sx + 4, sy + 4)], fill=col, width=1)
-                d_src.line([(sx + 4, sy - 4), (sx - 4, sy + 4)], fill=col, width=1)
-
-        # Fog of War
-        self._render_fog(src, cam_x, cam_y, vp_tw, vp_th, room)
-
-        # Scale Up (NEAREST fuer Pixel-Art)
-        display_w = vp_tw * TILE * SCALE
-        display_h = vp_th * TILE * SCALE
-        big = src.resize((display_w, display_h), Image.NEAREST)
-
-        # Effekte auf skaliertem Bild
-        d = ImageDraw.Draw(big)
-        for eff in self._effects:
-            if eff.kind == "projectile":
-                sx = (eff.x - cam_x) * TILE * SCALE
-                sy = (eff.y - cam_y) * TILE * SCALE
-                ex = (eff.tx - cam_x) * TILE * SCALE
-                ey = (eff.ty - cam_y) * TILE * SCALE
-                cx = sx + (ex - sx) * eff.progress
-                cy = sy + (ey - sy) * eff.progress
-                d.ellipse((cx - 4, cy - 4, cx + 4, cy + 4), fill=eff.color)
-            elif eff.kind == "dmg_text":
-                rise = (1.0 - eff.ttl / eff.max_ttl) * 24
-                sx = (eff.x - cam_x) * TILE * SCALE
-                sy = (eff.y - cam_y) * TILE * SCALE - rise
-                fade = eff.ttl / eff.max_ttl if eff.max_ttl else 0
-                col = tuple(max(0, min(255, int(v * fade))) for v in eff.color)
-                d.text((int(sx), int(sy)), eff.text, fill=col)
-
-        # Auf Canvas anzeigen
-        self._tk_image = ImageTk.PhotoImage(big)
-        if self._canvas_img_id is None:
-            self._canvas_img_id = self._canvas.create_image(
-                0, 0, anchor=tk.NW, image=self._tk_image,
-            )
-        else:
-            self._canvas.itemconfig(self._canvas_img_id, image=self._tk_image)
-
-        # HUD aktualisieren
-        self._update_hud(room)
-
-    def _render_fog(self, src: "Image.Image", cam_x: int, cam_y: int,
-                    vp_tw: int, vp_th: int, room: Any) -> None:
-        """Fog of War: Party-Members beleuchten die Umgebung.
-
-        Performance-Optimierung: Fog wird als Tiny-Image (1px/Tile) berechnet
-        und per NEAREST-Resize auf Viewport-Groesse skaliert. ~100x schneller
-        als per-Tile ImageDraw.rectangle().
-        """
-        # Party-Member-Positionen sammeln
-        hero_positions: list[tuple[int, int]] = []
-        for ent in room.entities.values():
-            if ent.entity_type == "party_member" and ent.alive:
-                if ent.entity_id in self._anim_pos:
-                    hero_positions.append(self._anim_pos[ent.entity_id])
-                else:
-                    hero_positions.append((ent.x, ent.y))
-
-        if not hero_positions:
-            fog = Image.new("RGBA", src.size, (0, 0, 0, 230))
-            src.alpha_composite(fog)
-            return
-
-        # Cache nutzen wenn Hero-Positionen unveraendert
-        if hero_positions == self._fog_hero_pos and self._fog_cache \
-                and self._fog_cache.size == (vp_tw * TILE, vp_th * TILE):
-            src.alpha_composite(self._fog_cache)
-            return
-
-        self._fog_hero_pos = hero_positions[:]
-
-        # Beleuchtete Tiles berechnen
-        near_set: set[tuple[int, int]] = set()
-        mid_set: set[tuple[int, int]] = set()
-        for hx, hy in hero_positions:
-            for dy in range(-FOG_FAR - 1, FOG_FAR + 2):
-                for dx in range(-FOG_FAR - 1, FOG_FAR + 2):
-                    tx, ty = hx + dx, hy + dy
-                    dist_sq = dx * dx + dy * dy
-                    if dist_sq <= FOG_NEAR * FOG_NEAR:
-                        near_set.add((tx, ty))
-                    elif dist_sq <= FOG_FAR * FOG_FAR:
-                        mid_set.add((tx, ty))
-
-        # Tiny-Image: 1 Pixel pro Tile (statt 256 Pixel pro Tile)
-        fog_small = Image.new("RGBA", (vp_tw, vp_th), (0, 0, 0, 230))
-        fog_px = fog_small.load()
-        for vy in range(vp_th):
-            for vx in range(vp_tw):
-                pos = (vx + cam_x, vy + cam_y)
-                if pos in near_set:
-                    fog_px[vx, vy] = (0, 0, 0, 0)
-                elif pos in mid_set:
-                    fog_px[vx, vy] = (0, 0, 0, 128)
-
-        # Resize auf Viewport-Groesse (C-optimiert, schnell)
-        self._fog_cache = fog_small.resize(
-            (vp_tw * TILE, vp_th * TILE), Image.NEAREST,
-        )
-        src.alpha_composite(self._fog_cache)
+                item_id = entry[1]
+                self._canvas.itemconfig(item_id, image=photo)
+            self._panel_items[key] = (photo, item_id)
 
     # ── HUD ──────────────────────────────────────────────────────────────────
 
@@ -946,6 +734,8 @@ class DungeonPixelTab(ttk.Frame):
             self._on_entity_moved(data)
         elif event == "grid.combat_move":
             self._on_combat_move(data)
+        elif event == "grid.terrain_changed":
+            self._on_terrain_changed(data)
         elif event == "party.member_updated":
             # HP-Aenderung → Floating Text
             name = data.get("name", "")
@@ -1118,7 +908,6 @@ class DungeonPixelTab(ttk.Frame):
         # Static Layer bauen + Render starten
         self._room_w = room.width
         self._room_h = room.height
-        self._fog_cache = None
         self._build_static_layer()
         self._center_camera()
         self._start_render_loop()
@@ -1135,7 +924,6 @@ class DungeonPixelTab(ttk.Frame):
         self._demo_active = False
         self._demo_grid = None
         self._demo_btn.config(text="Demo")
-        self._fog_cache = None
         if self._demo_after:
             self.after_cancel(self._demo_after)
             self._demo_after = None
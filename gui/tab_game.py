@@ -1168,6 +1168,13 @@ class GameTab(ttk.Frame):
             else:
                 self._mic_vad_label.configure(text="", fg=FG_MUTED)
 
+        elif event == "stt.partial":
+            # Zwischenstand waehrend der Spieler noch spricht
+            text = data.get("text", "")
+            if text:
+                display = text if len(text) <= 77 else "..." + text[-74:]
+                self._stt_text_label.configure(text=display + " ...")
+
         elif event == "audio.stt_text":
             text = data.get("text", "")
             if text:
@@ -1175,3 +1182,14 @@ class GameTab(ttk.Frame):
                 self._stt_text_label.configure(text=display)
                 # Reset nach 5 Sekunden
                 self.after(5000, lambda: self._stt_text_label.configure(text="—"))
+
+        elif event == "audio.preload":
+            if data.get("status") == "loading":
+                self._stt_text_label.configure(text="Sprachmodelle werden geladen ...")
+
+        elif event == "audio.voice_ready":
+            voices = len(data.get("voices", []))
+            self._stt_text_label.configure(
+                text=f"Sprachmodelle bereit ({voices} Stimmen, {data.get('seconds', 0):.1f}s)"
+            )
+            self.after(5000, lambda: self._stt_text_label.configure(text="—"))
@@ -30,11 +30,11 @@ from gui.styles import (
 )
 from gui.pixel_renderer import (
     PixelTileset, render_terrain_image,
-    TILE, HAS_PIL,
-)
-from gui.world_stitcher import (
-    WorldLayout, stitch_adventure, load_adventure, scan_adventures_with_maps,
+    RENDER_VERSION, TILE, HAS_PIL,
 )
+from gui.terrain_chunks import ChunkedFog
+from gui.world_cache import WorldCache
+from gui.world_stitcher import WorldLayout
 
 if HAS_PIL:
     from PIL import Image, ImageDraw, ImageTk
@@ -93,6 +93,9 @@ class WorldMapTab(ttk.Frame):
         self._zoom: int = 2                   # 1-4
         self._selected_room: str | None = None
         self._fog_enabled: bool = False
+        self._fog: ChunkedFog | None = None   # Fog-Overlay in Chunks
+        self._fog_rooms: frozenset[str] | None = None  # Stand des letzten Fog-Updates
+        self._passage_rooms: dict[tuple[int, int], frozenset[str]] | None = None
         self._drag_start: tuple[int, int] | None = None
         self._tk_image: "ImageTk.PhotoImage | None" = None
         self._canvas_img_id: int | None = None
@@ -101,8 +104,10 @@ class WorldMapTab(ttk.Frame):
         self._render_scheduled: bool = False
         self._adventures: list[tuple[str, str, str]] = []  # (fn, title, stem)
 
-        # Tileset
+        # Tileset + persistenter Karten-Cache (data/world_cache/)
         self._tileset: PixelTileset | None = None
+        self._cache = WorldCache()
+        self._cache_key: str = ""
 
         self._build_ui()
         self._load_tileset()
@@ -232,7 +237,7 @@ class WorldMapTab(ttk.Frame):
         self._tileset.load()
 
     def _scan_adventures(self) -> None:
-        self._adventures = scan_adventures_with_maps()
+        self._adventures = self._cache.scan_adventures_with_maps()
         names = [f"{title} ({stem})" for _, title, stem in self._adventures]
         self._adv_combo["values"] = names
         if names:
@@ -258,42 +263,50 @@ class WorldMapTab(ttk.Frame):
         if not HAS_PIL or not self._tileset:
             return
 
-        adv = load_adventure(filename)
-        if adv is None:
-            self._status_var.set(f"Fehler beim Laden: {filename}")
-            return
-
-        layout = stitch_adventure(adv)
+        # Layout aus Cache (oder stitchen + speichern)
+        key, layout = self._cache.get_layout(filename, biome="cave", render=RENDER_VERSION)
         if layout is None:
-            self._status_var.set("Keine map-Daten im Adventure")
+            self._status_var.set(f"Keine map-Daten in {filename}")
             return
 
         self._layout = layout
+        self._cache_key = key
         self._selected_room = None
+        self._fog = ChunkedFog(layout.width, layout.height)
+        self._fog_rooms = None
+        self._passage_rooms = None
 
         # Alle Raeume discovern (Default: kein Fog)
         self._discovered_rooms = set(layout.room_bounds.keys())
 
-        # Statisches World-Image rendern (mit Biome + Tile-to-Room fuer Cave-Tiles)
-        self._world_static = render_terrain_image(
-            layout.terrain, self._tileset, "world_static",
-            biome="cave",
-            tile_to_room=layout.tile_to_room,
-            decorations=layout.decorations,
-        )
+        # Statischer Layer inkl. Marker + Minimap: vorgerendert aus dem Cache
+        self._world_static = self._cache.load_layer(key, "static")
+        self._minimap_img = self._cache.load_layer(key, "minimap")
 
         if self._world_static is None:
-            self._status_var.set("Render-Fehler")
-            return
+            # Statisches World-Image rendern (mit Biome + Tile-to-Room fuer Cave-Tiles)
+            self._world_static = render_terrain_image(
+                layout.terrain, self._tileset, "world_static",
+                biome="cave",
+                tile_to_room=layout.tile_to_room,
+                decorations=layout.decorations,
+            )
 
-        # Void-Tiles schwarz malen (render_terrain_image setzt sie als dunklen BG)
-        # Das ist bereits der Fall durch den (5,3,8) Hintergrund
+            if self._world_static is None:
+                self._status_var.set("Render-Fehler")
+                return
 
-        # Spawn-Marker und Exit-Marker auf das statische Bild zeichnen
-        self._draw_markers_on_static()
+            # Void-Tiles schwarz malen (render_terrain_image setzt sie als dunklen BG)
+            # Das ist bereits der Fall durch den (5,3,8) Hintergrund
 
-        # Minimap generieren
-        self._build_minimap()
+            # Spawn-Marker und Exit-Marker auf das statische Bild zeichnen
+            self._draw_markers_on_static()
+            self._cache.save_layer(key, "static", self._world_static)
+
+        if self._minimap_img is None:
+            # Minimap generieren
+            self._build_minimap()
+            self._cache.save_layer(key, "minimap", self._minimap_img)
 
         # Kamera auf Start-Location zentrieren
         if layout.start_location in layout.room_bounds:
@@ -534,54 +547,77 @@ class WorldMapTab(ttk.Frame):
     def _apply_fog(
         self, viewport: "Image.Image", crop_x1: int, crop_y1: int,
     ) -> None:
-        """Wendet Fog of War auf den Viewport an."""
-        if self._layout is None:
+        """Wendet Fog of War auf den Viewport an.
+
+        Die Fog-Karte (1 Alpha-Wert pro Tile) wird nur bei geaenderten
+        entdeckten Raeumen neu berechnet; ChunkedFog baut dann nur die
+        Chunks neu, in denen sich etwas geaendert hat.
+        """
+        if self._layout is None or self._fog is None:
             return
 
-        layout = self._layout
-        fog = Image.new("RGBA", viewport.size, (0, 0, 0, 0))
-        fog_px = fog.load()
+        discovered = frozenset(self._discovered_rooms)
+        if discovered != self._fog_rooms:
+            changed = self._fog.set_alpha(self._compute_fog_alpha(discovered))
+            self._fog_rooms = discovered
+            logger.debug("Fog aktualisiert: %d Chunk(s) neu", len(changed))
 
         vw, vh = viewport.size
-
-        for py in range(vh):
-            for px in range(vw):
-                # Welches Tile?
-                wx = (crop_x1 + px) // TILE
-                wy = (crop_y1 + py) // TILE
-
-                if wx < 0 or wy < 0 or wx >= layout.width or wy >= layout.height:
-                    fog_px[px, py] = (0, 0, 0, FOG_ALPHA_VOID)
-                    continue
-
-                cell = layout.terrain[wy][wx]
-                if cell == "void":
-                    fog_px[px, py] = (0, 0, 0, FOG_ALPHA_VOID)
-                    continue
-
-                room = layout.tile_to_room[wy][wx]
-                if room and room != "_passage" and room not in self._discovered_rooms:
-                    fog_px[px, py] = (0, 0, 0, FOG_ALPHA_HIDDEN)
-                elif room == "_passage":
-                    # Passage sichtbar wenn mindestens ein angrenzender Raum entdeckt
-                    adjacent_discovered = False
-                    for dy in range(-2, 3):
-                        for dx in range(-2, 3):
-                            ny, nx = wy + dy, wx + dx
-                            if 0 <= ny < layout.height and 0 <= nx < layout.width:
-                                r = layout.tile_to_room[ny][nx]
-                                if r and r != "_passage" and r in self._discovered_rooms:
-                                    adjacent_discovered = True
-                                    break
-                        if adjacent_discovered:
-                            break
-                    if not adjacent_discovered:
-                        fog_px[px, py] = (0, 0, 0, FOG_ALPHA_HIDDEN)
+        x0, y0 = crop_x1 // TILE, crop_y1 // TILE
+        fog = self._fog.region(
+            x0, y0, x0 + -(-vw // TILE), y0 + -(-vh // TILE),
+            outside=FOG_ALPHA_VOID,
+        )
+        if fog.size != viewport.size:
+            fog = fog.crop((0, 0, vw, vh))
 
         viewport_rgba = viewport.convert("RGBA")
         result = Image.alpha_composite(viewport_rgba, fog)
         viewport.paste(result)
 
+    def _compute_fog_alpha(self, discovered: frozenset[str]) -> "Image.Image":
+        """Fog-Alpha pro Tile als 'L'-Bild (Void, verborgene Raeume, Passagen)."""
+        layout = self._layout
+        if self._passage_rooms is None:
+            self._passage_rooms = self._collect_passage_rooms()
+        passage_rooms = self._passage_rooms
+        w, h = layout.width, layout.height
+        data = bytearray(w * h)
+        for y in range(h):
+            trow = layout.terrain[y]
+            rrow = layout.tile_to_room[y]
+            base = y * w
+            for x in range(w):
+                if trow[x] == "void":
+                    data[base + x] = FOG_ALPHA_VOID
+                    continue
+                room = rrow[x]
+                if room == "_passage":
+                    # Passage sichtbar wenn mindestens ein angrenzender Raum entdeckt
+                    if not (passage_rooms.get((x, y), frozenset()) & discovered):
+                        data[base + x] = FOG_ALPHA_HIDDEN
+                elif room and room not in discovered:
+                    data[base + x] = FOG_ALPHA_HIDDEN
+        return Image.frombytes("L", (w, h), bytes(data))
+
+    def _collect_passage_rooms(self) -> dict[tuple[int, int], frozenset[str]]:
+        """Raeume im 5x5-Umkreis jedes Passage-Tiles (einmal pro Layout)."""
+        layout = self._layout
+        result: dict[tuple[int, int], frozenset[str]] = {}
+        for y in range(layout.height):
+            for x in range(layout.width):
+                if layout.tile_to_room[y][x] != "_passage":
+                    continue
+                rooms = set()
+                for ny in range(max(0, y - 2), min(layout.height, y + 3)):
+                    row = layout.tile_to_room[ny]
+                    for nx in range(max(0, x - 2), min(layout.width, x + 3)):
+                        r = row[nx]
+                        if r and r != "_passage":
+                            rooms.add(r)
+                result[(x, y)] = frozenset(rooms)
+        return result
+
     def _composite_minimap(
         self, display: "Image.Image", canvas_w: int, canvas_h: int,
     ) -> "Image.Image":
@@ -0,0 +1,617 @@
+"""
+gui/terrain_chunks.py — Chunk-basierter Terrain-Renderer mit Tile-Atlas
+
+Statt die ganze Karte Tile fuer Tile per PIL.paste() zu zeichnen:
+  - Alle Terrain-Tiles liegen in einem TileAtlas (gui/pixel_renderer.py)
+  - Die Karte wird in CHUNK x CHUNK Tiles zerlegt; ein Chunk ist ein
+    Gather ueber Atlas-Indizes plus Alpha-Blend nur fuer Overlay-Zellen
+  - Autotile-Masken (Edges, Wall-Varianten) vektorisiert via autotile_masks()
+  - set_terrain()/invalidate_cells(): nur betroffene Chunks werden neu gerendert
+  - ChunkedFog: Fog-Overlay pro Chunk, nur geaenderte Chunks werden neu gebaut
+
+Floor-Varianten und Deko-Zufall kommen aus einem Hash pro Zelle statt aus
+einem sequentiellen RNG — ein einzeln neu gerenderter Chunk sieht exakt
+so aus wie vorher (und unabhaengig von PYTHONHASHSEED).
+
+Verwendung:
+    chunks = TerrainChunkRenderer(terrain, tileset, room_id="thronsaal")
+    static = chunks.render_full()
+    chunks.set_terrain(12, 7, "door")     # Tuer geoeffnet
+    chunks.update_image(static)           # nur der betroffene Chunk
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+import zlib
+from typing import Any, Callable, Iterable
+
+from gui.pixel_renderer import (
+    CHUNK, HAS_NUMPY, HAS_PIL, TILE, WALL_NAMES,
+    Autotiler, PixelTileset, _get_cave_tiles, autotile_masks,
+)
+
+if HAS_PIL:
+    from PIL import Image, ImageChops
+
+if HAS_NUMPY:
+    import numpy as np
+
+logger = logging.getLogger("ARS.gui.terrain_chunks")
+
+# ── Konstanten ───────────────────────────────────────────────────────────────
+
+T_VOID, T_WALL, T_FLOOR, T_DOOR, T_OBSTACLE, T_WATER = range(6)
+
+# Unbekannte Terrain-Typen werden wie Boden gezeichnet (wie render_terrain_image)
+_TERRAIN_CODES: dict[str, int] = {
+    "void": T_VOID, "wall": T_WALL, "floor": T_FLOOR,
+    "door": T_DOOR, "obstacle": T_OBSTACLE, "water": T_WATER,
+}
+
+# Zeichen-Ebenen in Render-Reihenfolge
+(_L_OVERLAY, _L_EDGE, _L_SPECIAL, _L_DECO,
+ _L_DEAD_END, _L_STALACTITE, _L_MOSS) = range(7)
+_N_LAYERS = 7
+
+# Je Zufallsentscheidung ein eigener Hash-Strom
+(_S_FLOOR, _S_FLOOR_PICK, _S_WALL_OV, _S_PICK, _S_DEAD_END,
+ _S_STALACTITE, _S_MOSS, _S_CRYSTAL, _S_DECO) = range(1, 10)
+
+# Wie weit ein Sprite maximal ueber seine Anker-Zelle hinausragt (Tiles);
+# Saeule 16x48 = 2 nach oben, Tuer 32x32 = 1 nach rechts/unten
+_MARGIN = 2
+
+_Parts = list[tuple[int, int, int]]   # [(dx, dy, atlas_idx)]
+
+
+# ── Hilfsfunktionen ─────────────────────────────────────────────────────────
+
+def _cell_hash(xs: "np.ndarray", ys: "np.ndarray", seed: int, salt: int) -> "np.ndarray":
+    """Deterministischer 32-Bit-Hash pro Zelle (Murmur3-Finalizer)."""
+    h = (xs.astype(np.uint32) * np.uint32(0x9E3779B1)) \
+        ^ (ys.astype(np.uint32) * np.uint32(0x85EBCA77))
+    h ^= np.uint32((seed + salt * 0x27D4EB2F) & 0xFFFFFFFF)
+    h ^= h >> np.uint32(16)
+    h *= np.uint32(0x7FEB352D)
+    h ^= h >> np.uint32(15)
+    h *= np.uint32(0x846CA68B)
+    h ^= h >> np.uint32(16)
+    return h
+
+
+def _cell_rand(xs: "np.ndarray", ys: "np.ndarray", seed: int, salt: int) -> "np.ndarray":
+    """Gleichverteilte Werte in [0, 1) pro Zelle."""
+    return _cell_hash(xs, ys, seed, salt) * (1.0 / 4294967296.0)
+
+
+def _chunk_range(lo: int, hi: int, size: int, limit: int) -> range:
+    """Chunk-Indizes, die das Tile-Intervall [lo, hi) schneiden."""
+    lo = max(0, lo)
+    hi = min(limit, hi)
+    if hi <= lo:
+        return range(0)
+    return range(lo // size, (hi - 1) // size + 1)
+
+
+def _compose_region(
+    chunk_image: Callable[[int, int], "Image.Image"],
+    size: int, width: int, height: int,
+    x0: int, y0: int, x1: int, y1: int,
+    fill: tuple[int, int, int, int],
+) -> "Image.Image":
+    """Setzt einen Tile-Ausschnitt aus gecachten Chunk-Bildern zusammen."""
+    out = Image.new("RGBA", ((x1 - x0) * TILE, (y1 - y0) * TILE), fill)
+    for cy in _chunk_range(y0, y1, size, height):
+        for cx in _chunk_range(x0, x1, size, width):
+            img = chunk_image(cx, cy)
+            out.paste(img, ((cx * size - x0) * TILE, (cy * size - y0) * TILE))
+    return out
+
+
+def _blend(
+    blocks: "np.ndarray", atlas: "np.ndarray", opaque: "np.ndarray",
+    ty: "np.ndarray", tx: "np.ndarray", idx: "np.ndarray",
+) -> None:
+    """Alpha-Blend von Atlas-Tiles auf Chunk-Bloecke (ch, cw, TILE, TILE, 4).
+
+    Mehrere Tiles auf derselben Zelle werden in Emissions-Reihenfolge
+    nacheinander geblendet; deckende Tiles (z.B. Edges) werden nur kopiert.
+    """
+    cw = blocks.shape[1]
+    while len(ty):
+        _, first = np.unique(ty * cw + tx, return_index=True)
+        sy, sx, si = ty[first], tx[first], idx[first]
+        solid = opaque[si]
+        if solid.any():
+            blocks[sy[solid], sx[solid]] = atlas[si[solid]]
+        if not solid.all():
+            sy, sx, si = sy[~solid], sx[~solid], si[~solid]
+            src = atlas[si].astype(np.uint16)
+            dst = blocks[sy, sx].astype(np.uint16)
+            a = src[..., 3:4]
+            inv = 255 - a
+            out = np.empty_like(dst)
+            out[..., :3] = (src[..., :3] * a + dst[..., :3] * inv + 127) // 255
+            out[..., 3:] = (a * 255 + dst[..., 3:] * inv + 127) // 255
+            blocks[sy, sx] = out.astype(np.uint8)
+        rest = np.ones(len(ty), dtype=bool)
+        rest[first] = False
+        ty, tx, idx = ty[rest], tx[rest], idx[rest]
+
+
+# ═════════════════════════════════════════════════════════════════════════════
+# TerrainChunkRenderer
+# ═════════════════════════════════════════════════════════════════════════════
+
+class TerrainChunkRenderer:
+    """
+    Statischer Terrain-Layer in gecachten Chunks.
+
+    API:
+      render_full()                 — komplettes Bild (alle Chunks)
+      render_region(x0, y0, x1, y1) — Tile-Ausschnitt aus Chunks
+      chunk_image(cx, cy)           — einzelner Chunk (gecacht)
+      set_terrain(x, y, terrain)    — Zelle aendern, betroffene Chunks dirty
+      invalidate_cells(cells)       — Chunks um diese Zellen verwerfen
+      update_image(img)             — dirty Chunks neu rendern und einfuegen
+    """
+
+    def __init__(
+        self,
+        terrain_2d: list[list[str]],
+        tileset: PixelTileset,
+        room_id: str = "",
+        biome: str = "",
+        tile_to_room: list[list[str | None]] | None = None,
+        decorations: list[dict] | None = None,
+        chunk: int = CHUNK,
+    ) -> None:
+        if not (HAS_PIL and HAS_NUMPY):
+            raise RuntimeError("TerrainChunkRenderer benoetigt Pillow und NumPy")
+
+        self.height = len(terrain_2d)
+        self.width = len(terrain_2d[0]) if terrain_2d else 0
+        self.chunk = chunk
+        self._seed = zlib.crc32(room_id.encode("utf-8")) if room_id else 42
+
+        # Terrain-Codes ([y][x]); fehlende Zellen in kurzen Zeilen = Wand
+        codes = bytearray()
+        for row in terrain_2d:
+            codes.extend(_TERRAIN_CODES.get(t, T_FLOOR) for t in row[:self.width])
+            codes.extend([T_WALL] * (self.width - min(len(row), self.width)))
+        self._code = np.frombuffer(bytes(codes), dtype=np.uint8).reshape(
+            self.height, self.width).copy()
+
+        self._passage = np.zeros((self.height, self.width), dtype=bool)
+        if tile_to_room:
+            for y, row in enumerate(tile_to_room[:self.height]):
+                for x, rid in enumerate(row[:self.width]):
+                    if rid == "_passage":
+                        self._passage[y, x] = True
+
+        self._wall = np.zeros((self.height, self.width), dtype=bool)
+        self._floor_pad = np.zeros((self.height + 2, self.width + 2), dtype=bool)
+        self._edge = np.zeros((self.height, self.width), dtype=np.uint8)
+        self._kind = np.zeros((self.height, self.width), dtype=np.uint8)
+        self._refresh_masks(0, 0, self.width, self.height)
+
+        self._atlas = tileset.atlas()
+        cave = _get_cave_tiles() if biome in ("cave", "dungeon", "") else {}
+        self._register_tiles(tileset, cave)
+        self._deco = self._place_decorations(decorations or [], cave)
+
+        self._chunks: dict[tuple[int, int], "Image.Image"] = {}
+        self._dirty: set[tuple[int, int]] = set()
+        self.stats: dict[str, float] = {"chunks_rendered": 0, "last_chunk_ms": 0.0}
+
+    # ------------------------------------------------------------------
+    # Setup
+    # ------------------------------------------------------------------
+
+    def _register_tiles(self, ts: PixelTileset, cave: dict[str, "Image.Image"]) -> None:
+        """Legt alle benoetigten Tiles im Atlas an und baut die Lookup-Tabellen."""
+        atlas = self._atlas
+
+        def pick(*needles: str, prefix: bool = False) -> list[_Parts]:
+            return [
+                atlas.add_sprite(f"cave:{k}", v) for k, v in sorted(cave.items())
+                if (k.startswith(needles) if prefix else any(n in k for n in needles))
+            ]
+
+        def base_list(*prefixes: str) -> "np.ndarray":
+            return np.array([
+                atlas.add_base(f"cave:{k}", v) for k, v in sorted(cave.items())
+                if k.startswith(prefixes)
+            ], dtype=np.int32)
+
+        self._b_void = atlas.add_base("void", None)
+        self._b_wall = np.array(
+            [atlas.add_base(f"wall:{n}", ts.get_wall_tile(n)) for n in WALL_NAMES],
+            dtype=np.int32,
+        )
+        self._b_plain = atlas.add_base("floor_plain", ts.floor_plain)
+        self._b_light = atlas.add_base("floor_light", ts.floor_light or ts.floor_plain)
+        self._b_stains = np.array(
+            [atlas.add_base(f"floor_stain_{i}", img) for i, img in enumerate(ts.floor_stains)],
+            dtype=np.int32,
+        )
+        self._b_cave_floor = base_list("cave_floor_")
+        self._b_passage = base_list("cave_passage_")
+
+        # Edge-Overlay je 4-Bit-Maske (-1 = keins)
+        self._edge_lut = np.full(16, -1, dtype=np.int32)
+        for mask, name in Autotiler.EDGE_MAP.items():
+            if name and name in ts.edge_tiles:
+                self._edge_lut[mask] = atlas.add_tile(f"edge:{name}", ts.edge_tiles[name])
+
+        self._wall_overlays = pick("cave_wall_", prefix=True)
+        puddle = cave.get("cave_puddle_medium") or cave.get("cave_puddle_large")
+        self._water = [atlas.add_sprite("water", puddle)] if puddle else []
+        self._door = [atlas.add_sprite("door", ts.door_img)] if ts.door_img else []
+        self._obstacle = pick("stalagmite", "rock_boulder")
+        if not self._obstacle and ts.column_img:
+            col_h = ts.column_img.height
+            self._obstacle = [atlas.add_sprite("column", ts.column_img, (0, -(col_h - TILE)))]
+        self._dead_end = pick("bone_pile", "debris_gravel")
+        if not self._dead_end and ts.skull_img:
+            self._dead_end = [atlas.add_sprite("skull", ts.skull_img)]
+        self._stalactites = pick("stalactite")
+        self._moss = pick("moss_floor", "moss_lichen")
+        self._crystals = pick("crystal_small")
+        self._deco_choices: dict[str, list[_Parts]] = {
+            "skull": pick("bone_pile", "debris"),
+            "obstacle": pick("stalagmite", "rock_", "rubble"),
+            "water": pick("puddle"),
+            "moss": pick("moss", "lichen"),
+            "crystal": pick("crystal"),
+        } if cave else {}
+
+    def _place_decorations(
+        self, decorations: list[dict], cave: dict[str, "Image.Image"],
+    ) -> list[tuple[int, int, _Parts]]:
+        """Waehlt je Deko-Eintrag ein Tile (deterministisch pro Position)."""
+        placed: list[tuple[int, int, _Parts]] = []
+        if not cave:
+            return placed
+        for i, d in enumerate(decorations):
+            choices = self._deco_choices.get(d.get("type", ""), [])
+            if not choices:
+                continue
+            x, y = int(d.get("x", 0)), int(d.get("y", 0))
+            h = int(_cell_hash(np.array([x]), np.array([y]), self._seed, _S_DECO + i)[0])
+            placed.append((x, y, choices[h % len(choices)]))
+        return placed
+
+    def _refresh_masks(self, x0: int, y0: int, x1: int, y1: int) -> None:
+        """Wand-/Boden-Masken und Autotile-Masken fuer [x0,x1) x [y0,y1) neu."""
+        x0, y0 = max(0, x0), max(0, y0)
+        x1, y1 = min(self.width, x1), min(self.height, y1)
+        if x1 <= x0 or y1 <= y0:
+            return
+        code = self._code[y0:y1, x0:x1]
+        wall = (code == T_WALL) | (code == T_VOID)
+        self._wall[y0:y1, x0:x1] = wall
+        self._floor_pad[y0 + 1:y1 + 1, x0 + 1:x1 + 1] = ~wall
+
+        # Autotiler braucht die Nachbarn: Fenster um 1 erweitern
+        ex0, ey0 = max(0, x0 - 1), max(0, y0 - 1)
+        ex1, ey1 = min(self.width, x1 + 1), min(self.height, y1 + 1)
+        edge, kind = autotile_masks(self._wall[ey0:ey1, ex0:ex1])
+        self._edge[y0:y1, x0:x1] = edge[y0 - ey0:y1 - ey0, x0 - ex0:x1 - ex0]
+        self._kind[y0:y1, x0:x1] = kind[y0 - ey0:y1 - ey0, x0 - ex0:x1 - ex0]
+
+    # ------------------------------------------------------------------
+    # Invalidierung
+    # ------------------------------------------------------------------
+
+    def set_terrain(self, x: int, y: int, terrain: str) -> list[tuple[int, int]]:
+        """Aendert eine Zelle (z.B. Tuer geoeffnet) und markiert betroffene Chunks.
+
+        Returns:
+            Die neu als dirty markierten Chunk-Keys (cx, cy).
+        """
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return []
+        code = _TERRAIN_CODES.get(terrain, T_FLOOR)
+        if self._code[y, x] == code:
+            return []
+        self._code[y, x] = code
+        self._refresh_masks(x - 1, y - 1, x + 2, y + 2)
+        return self.invalidate_cells([(x, y)])
+
+    def invalidate_cells(self, cells: Iterable[tuple[int, int]]) -> list[tuple[int, int]]:
+        """Verwirft alle Chunks, deren Bild von diesen Zellen abhaengt.
+
+        Reichweite: Autotile-Nachbarn (1) plus Sprite-Ueberhang (_MARGIN).
+        """
+        r = 1 + _MARGIN
+        marked: list[tuple[int, int]] = []
+        for x, y in cells:
+            for cy in _chunk_range(y - r, y + r + 1, self.chunk, self.height):
+                for cx in _chunk_range(x - r, x + r + 1, self.chunk, self.width):
+                    key = (cx, cy)
+                    self._chunks.pop(key, None)
+                    if key not in self._dirty:
+                        self._dirty.add(key)
+                        marked.append(key)
+        return marked
+
+    def invalidate_all(self) -> None:
+        self._dirty.update(self._chunks)
+        self._chunks.clear()
+
+    @property
+    def dirty_chunks(self) -> set[tuple[int, int]]:
+        return set(self._dirty)
+
+    # ------------------------------------------------------------------
+    # Abfragen
+    # ------------------------------------------------------------------
+
+    @property
+    def chunks_x(self) -> int:
+        return -(-self.width // self.chunk)
+
+    @property
+    def chunks_y(self) -> int:
+        return -(-self.height // self.chunk)
+
+    def chunk_image(self, cx: int, cy: int) -> "Image.Image":
+        """Gibt den (gecachten) Chunk zurueck, rendert ihn bei Bedarf."""
+        key = (cx, cy)
+        img = self._chunks.get(key)
+        if img is None:
+            img = self._render_chunk(cx, cy)
+            self._chunks[key] = img
+            self._dirty.discard(key)
+        return img
+
+    def render_full(self) -> "Image.Image":
+        """Komplettes Terrain-Bild in Source-Aufloesung (TILE pro Zelle)."""
+        return self.render_region(0, 0, self.width, self.height)
+
+    def render_region(self, x0: int, y0: int, x1: int, y1: int) -> "Image.Image":
+        """Tile-Ausschnitt [x0,x1) x [y0,y1); Zellen ausserhalb bleiben Hintergrund."""
+        return _compose_region(
+            self.chunk_image, self.chunk, self.width, self.height,
+            x0, y0, x1, y1, self._atlas.bg,
+        )
+
+    def update_image(self, img: "Image.Image") -> list[tuple[int, int, int, int]]:
+        """Rendert alle dirty Chunks neu und fuegt sie in ein Vollbild ein.
+
+        Returns:
+            Pixel-Rechtecke (x0, y0, x1, y1) der aktualisierten Bereiche.
+        """
+        rects: list[tuple[int, int, int, int]] = []
+        for cx, cy in sorted(self._dirty):
+            chunk = self.chunk_image(cx, cy)
+            px, py = cx * self.chunk * TILE, cy * self.chunk * TILE
+            img.paste(chunk, (px, py))
+            rects.append((px, py, px + chunk.width, py + chunk.height))
+        self._dirty.clear()
+        return rects
+
+    # ------------------------------------------------------------------
+    # Chunk-Rendering
+    # ------------------------------------------------------------------
+
+    def _render_chunk(self, cx: int, cy: int) -> "Image.Image":
+        t0 = time.perf_counter()
+        n = self.chunk
+        x0, y0 = cx * n, cy * n
+        x1, y1 = min(x0 + n, self.width), min(y0 + n, self.height)
+
+        # Quellfenster: Sprites benachbarter Zellen duerfen hineinragen
+        sx0, sy0 = max(0, x0 - _MARGIN), max(0, y0 - _MARGIN)
+        sx1, sy1 = min(self.width, x1 + _MARGIN), min(self.height, y1 + _MARGIN)
+
+        ops: list[list[tuple["np.ndarray", "np.ndarray", "np.ndarray"]]] = [
+            [] for _ in range(_N_LAYERS)
+        ]
+        base = self._plan(sx0, sy0, sx1, sy1, ops)
+
+        atlas = self._atlas.array
+        opaque = self._atlas.opaque
+        blocks = atlas[base[y0 - sy0:y1 - sy0, x0 - sx0:x1 - sx0]]
+        for layer in ops:
+            if not layer:
+                continue
+            ty = np.concatenate([o[0] for o in layer])
+            tx = np.concatenate([o[1] for o in layer])
+            idx = np.concatenate([o[2] for o in layer])
+            inside = (tx >= x0) & (tx < x1) & (ty >= y0) & (ty < y1)
+            if inside.any():
+                _blend(blocks, atlas, opaque, ty[inside] - y0, tx[inside] - x0, idx[inside])
+
+        ch, cw = blocks.shape[:2]
+        img = Image.fromarray(
+            np.ascontiguousarray(blocks.swapaxes(1, 2)).reshape(ch * TILE, cw * TILE, 4),
+            "RGBA",
+        )
+        self.stats["chunks_rendered"] += 1
+        self.stats["last_chunk_ms"] = (time.perf_counter() - t0) * 1000
+        return img
+
+    def _plan(
+        self, sx0: int, sy0: int, sx1: int, sy1: int,
+        ops: list[list[tuple["np.ndarray", "np.ndarray", "np.ndarray"]]],
+    ) -> "np.ndarray":
+        """Basis-Tiles und Overlay-Operationen fuer ein Quellfenster.
+
+        Returns:
+            Atlas-Index der Basis-Tiles [y][x] des Fensters; Overlays werden
+            als (ty, tx, idx)-Arrays pro Ebene in ops gesammelt.
+        """
+        seed = self._seed
+        ys, xs = np.mgrid[sy0:sy1, sx0:sx1]
+        code = self._code[sy0:sy1, sx0:sx1]
+        wall = self._wall[sy0:sy1, sx0:sx1]
+        floor = ~wall
+        pick = _cell_hash(xs, ys, seed, _S_PICK)
+
+        def emit(layer: int, mask: "np.ndarray", choices: list[_Parts], dy: int = 0) -> None:
+            if not choices or not mask.any():
+                return
+            mx, my = xs[mask], ys[mask]
+            k = pick[mask] % len(choices)
+            for ci, parts in enumerate(choices):
+                sel = k == ci
+                if not sel.any():
+                    continue
+                px, py = mx[sel], my[sel]
+                for pdx, pdy, idx in parts:
+                    ops[layer].append((py + pdy + dy, px + pdx, np.full(len(px), idx)))
+
+        # Basis: Boden-Variante / Wand-Variante / Hintergrund
+        r = _cell_rand(xs, ys, seed, _S_FLOOR)
+        fpick = _cell_hash(xs, ys, seed, _S_FLOOR_PICK)
+        fb = np.where(r < 0.10, self._b_light, self._b_plain)
+        if len(self._b_stains):
+            fb = np.where(r < 0.06, self._b_stains[fpick % len(self._b_stains)], fb)
+        if len(self._b_cave_floor):
+            fb = np.where(r < 0.25, self._b_cave_floor[fpick % len(self._b_cave_floor)], fb)
+        if len(self._b_passage):
+            passage = self._passage[sy0:sy1, sx0:sx1]
+            fb = np.where(passage, self._b_passage[fpick % len(self._b_passage)], fb)
+        base = np.where(floor, fb, self._b_wall[self._kind[sy0:sy1, sx0:sx1]])
+        base[code == T_VOID] = self._b_void
+
+        # Wand-Overlays, Wasser
+        if self._wall_overlays:
+            emit(_L_OVERLAY, (code == T_WALL) & (_cell_rand(xs, ys, seed, _S_WALL_OV) < 0.12),
+                 self._wall_overlays)
+        emit(_L_OVERLAY, code == T_WATER, self._water)
+
+        # Edges (alle begehbaren Zellen)
+        edge_idx = self._edge_lut[self._edge[sy0:sy1, sx0:sx1]]
+        has_edge = floor & (edge_idx >= 0)
+        if has_edge.any():
+            ops[_L_EDGE].append((ys[has_edge], xs[has_edge], edge_idx[has_edge]))
+
+        # Tueren, Hindernisse
+        emit(_L_SPECIAL, code == T_DOOR, self._door)
+        emit(_L_SPECIAL, code == T_OBSTACLE, self._obstacle)
+
+        # Deko aus dem Layout
+        for dx, dy, parts in self._deco:
+            if sx0 <= dx < sx1 and sy0 <= dy < sy1:
+                for pdx, pdy, idx in parts:
+                    ops[_L_DECO].append((np.array([dy + pdy]), np.array([dx + pdx]),
+                                         np.array([idx])))
+
+        # Nachbarschaft (nur Innenzellen, wie im Tile-Renderer)
+        fp = self._floor_pad
+        n_floor = (fp[sy0:sy1, sx0 + 1:sx1 + 1].astype(np.uint8)
+                   + fp[sy0 + 2:sy1 + 2, sx0 + 1:sx1 + 1]
+                   + fp[sy0 + 1:sy1 + 1, sx0:sx1]
+                   + fp[sy0 + 1:sy1 + 1, sx0 + 2:sx1 + 2])
+        interior = (xs >= 1) & (xs <= self.width - 2) & (ys >= 1) & (ys <= self.height - 2)
+
+        emit(_L_DEAD_END, interior & floor & (n_floor == 1), self._dead_end)
+
+        if self._stalactites:
+            floor_above = fp[sy0:sy1, sx0 + 1:sx1 + 1]
+            emit(_L_STALACTITE,
+                 interior & wall & floor_above
+                 & (_cell_rand(xs, ys, seed, _S_STALACTITE) < 0.08),
+                 self._stalactites, dy=-1)
+
+        if self._moss or self._crystals:
+            near_wall = interior & floor & (n_floor < 4)
+            moss = near_wall & (_cell_rand(xs, ys, seed, _S_MOSS) < 0.06) \
+                if self._moss else np.zeros_like(near_wall)
+            emit(_L_MOSS, moss, self._moss)
+            emit(_L_MOSS, near_wall & ~moss & (_cell_rand(xs, ys, seed, _S_CRYSTAL) < 0.03),
+                 self._crystals)
+
+        return base
+
+
+# ═════════════════════════════════════════════════════════════════════════════
+# ChunkedFog
+# ═════════════════════════════════════════════════════════════════════════════
+
+class ChunkedFog:
+    """
+    Fog-of-War-Overlay mit einem Alpha-Wert pro Tile, gecacht in Chunks.
+
+    set_alpha() vergleicht die neue Alpha-Karte mit der alten und verwirft
+    nur Chunks mit Aenderungen. Braucht nur Pillow (kein NumPy).
+    """
+
+    def __init__(self, width: int, height: int, chunk: int = CHUNK, alpha: int = 0) -> None:
+        self.width = width
+        self.height = height
+        self.chunk = chunk
+        self._alpha = Image.new("L", (max(1, width), max(1, height)), alpha)
+        self._chunks: dict[tuple[int, int], "Image.Image"] = {}
+
+    def _as_image(self, alpha: Any) -> "Image.Image":
+        if isinstance(alpha, Image.Image):
+            return alpha if alpha.mode == "L" else alpha.convert("L")
+        if HAS_NUMPY and isinstance(alpha, np.ndarray):
+            return Image.fromarray(alpha.astype(np.uint8), "L")
+        data = bytearray()
+        for row in alpha:
+            data.extend(row)
+        return Image.frombytes("L", (self.width, self.height), bytes(data))
+
+    def set_alpha(self, alpha: Any) -> list[tuple[int, int]]:
+        """Neue Fog-Karte setzen ('L'-Bild, NumPy-Array oder [y][x]-Liste).
+
+        Returns:
+            Chunk-Keys, deren Overlay sich geaendert hat.
+        """
+        new = self._as_image(alpha)
+        diff = ImageChops.difference(self._alpha, new)
+        self._alpha = new
+        bbox = diff.getbbox()
+        if bbox is None:
+            return []
+        changed: list[tuple[int, int]] = []
+        n = self.chunk
+        for cy in _chunk_range(bbox[1], bbox[3], n, self.height):
+            for cx in _chunk_range(bbox[0], bbox[2], n, self.width):
+                box = (cx * n, cy * n, min((cx + 1) * n, self.width),
+                       min((cy + 1) * n, self.height))
+                if diff.crop(box).getbbox() is not None:
+                    self._chunks.pop((cx, cy), None)
+                    changed.append((cx, cy))
+        return changed
+
+    def set_cells(self, cells: Iterable[tuple[int, int]], alpha: int) -> list[tuple[int, int]]:
+        """Setzt den Fog-Wert einzelner Tiles (z.B. Sicht geaendert)."""
+        px = self._alpha.load()
+        changed: set[tuple[int, int]] = set()
+        for x, y in cells:
+            if 0 <= x < self.width and 0 <= y < self.height and px[x, y] != alpha:
+                px[x, y] = alpha
+                key = (x // self.chunk, y // self.chunk)
+                self._chunks.pop(key, None)
+                changed.add(key)
+        return sorted(changed)
+
+    def chunk_image(self, cx: int, cy: int) -> "Image.Image":
+        """Schwarzes RGBA-Overlay eines Chunks in Source-Aufloesung."""
+        key = (cx, cy)
+        img = self._chunks.get(key)
+        if img is None:
+            n = self.chunk
+            box = (cx * n, cy * n, min((cx + 1) * n, self.width),
+                   min((cy + 1) * n, self.height))
+            small = self._alpha.crop(box)
+            size = (small.width * TILE, small.height * TILE)
+            img = Image.new("RGBA", size, (0, 0, 0, 0))
+            img.putalpha(small.resize(size, Image.NEAREST))
+            self._chunks[key] = img
+        return img
+
+    def region(self, x0: int, y0: int, x1: int, y1: int, outside: int = 255) -> "Image.Image":
+        """Fog-Overlay fuer den Tile-Ausschnitt; Tiles ausserhalb mit Alpha outside."""
+        return _compose_region(
+            self.chunk_image, self.chunk, self.width, self.height,
+            x0, y0, x1, y1, (0, 0, 0, outside),
+        )
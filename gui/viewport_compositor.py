@@ -0,0 +1,460 @@
+"""
+gui/viewport_compositor.py — Layer-Compositor fuer den Pixel-Dungeon-Viewport
+
+Statt pro Frame den ganzen Viewport zu croppen, zu bemalen, zu skalieren
+und als neues ImageTk-Bild zu uebergeben, haelt der Compositor Layer:
+
+  - static:  Terrain-Chunks, einmal pro Zoomstufe skaliert und gecacht
+  - dynamic: Fackeln, Entities, HP-Balken (Sprites einmal vorskaliert)
+  - fog:     ein Alpha-Wert pro Tile
+  - effects: Slash, Projektile, Schadenstext
+
+Der Viewport ist in Panels (PANEL x PANEL Tiles) zerlegt. Jedes Element
+hinterlaesst pro Tile eine Signatur; nur Panels mit geaenderten Signaturen
+werden neu komponiert. Ohne Aenderung wird der Frame uebersprungen.
+
+Verwendung:
+    comp = ViewportCompositor(scale=2)
+    comp.set_static(terrain_chunks)                # TerrainChunkRenderer oder PIL-Bild
+    comp.set_camera(cam_x, cam_y, vp_w, vp_h)
+    frame = comp.compose(sprites, fog_alpha, effects)
+    for key, (px, py), img in frame.panels:        # nur geaenderte Panels
+        ...
+    comp.stats.summary()
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from gui.pixel_renderer import CHUNK, FOG_FAR, FOG_NEAR, HAS_PIL, SCALE, TILE
+
+if HAS_PIL:
+    from PIL import Image, ImageDraw
+
+logger = logging.getLogger("ARS.gui.viewport_compositor")
+
+PANEL = 8            # Tiles pro Panel-Kante
+FOG_DARK = 230       # Alpha ausserhalb jeder Lichtquelle
+FOG_DIM = 128        # Alpha im Halbschatten (FOG_NEAR..FOG_FAR)
+
+
+# ── Datenstrukturen ─────────────────────────────────────────────────────────
+
+@dataclass
+class Sprite:
+    """Ein Element des dynamischen Layers (Tile-Koordinaten der Karte)."""
+    x: int
+    y: int
+    img: "Image.Image"
+    bar: tuple[float, tuple[int, int, int]] | None = None   # HP-Balken (Anteil, Farbe)
+
+
+@dataclass
+class Frame:
+    """Ergebnis von compose(): nur die neu komponierten Panels."""
+    panels: list[tuple[tuple[int, int], tuple[int, int], "Image.Image"]] = field(
+        default_factory=list)
+    layout_changed: bool = False    # Panel-Raster neu (Viewport-Groesse/Zoom)
+
+    @property
+    def skipped(self) -> bool:
+        return not self.panels
+
+
+@dataclass
+class _Item:
+    rect: tuple[int, int, int, int]     # Display-Pixel, viewport-relativ
+    sig: tuple
+    layer: int                          # 0 dynamic, 1 unter Fog, 2 ueber Fog
+    draw: Callable[["Image.Image", "ImageDraw.ImageDraw", int, int], None]
+
+
+class FrameStats:
+    """Frame-Zeiten (gleitendes Fenster) fuer FPS-/Budget-Auswertung."""
+
+    def __init__(self, window: int = 240) -> None:
+        self._times: deque[float] = deque(maxlen=window)
+        self._panels: deque[int] = deque(maxlen=window)
+        self.frames = 0
+        self.skipped = 0
+
+    def record(self, ms: float, panels: int) -> None:
+        self.frames += 1
+        self._times.append(ms)
+        self._panels.append(panels)
+
+    def skip(self) -> None:
+        self.frames += 1
+        self.skipped += 1
+
+    def summary(self, target_fps: float = 8.0) -> dict[str, float]:
+        """avg/p95/max in ms, Anteil im Frame-Budget, Skip-Quote."""
+        times = sorted(self._times)
+        if not times:
+            return {"avg_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0,
+                    "in_budget": 1.0, "skip_rate": self.skipped / max(1, self.frames),
+                    "panels": 0.0}
+        budget = 1000.0 / target_fps
+        return {
+            "avg_ms": sum(times) / len(times),
+            "p95_ms": times[min(len(times) - 1, int(len(times) * 0.95))],
+            "max_ms": times[-1],
+            "in_budget": sum(1 for t in times if t <= budget) / len(times),
+            "skip_rate": self.skipped / max(1, self.frames),
+            "panels": sum(self._panels) / len(self._panels),
+        }
+
+
+def fog_from_lights(
+    lights: list[tuple[int, int]],
+    cam_x: int, cam_y: int, vp_w: int, vp_h: int,
+    near: int = FOG_NEAR, far: int = FOG_FAR,
+) -> bytes:
+    """Fog-Alpha pro Viewport-Tile (Zeilen von oben) aus Lichtquellen.
+
+    Ohne Lichtquelle ist der ganze Viewport dunkel (FOG_DARK).
+    """
+    out = bytearray([FOG_DARK]) * (vp_w * vp_h)
+    near_sq, far_sq = near * near, far * far
+    for lx, ly in lights:
+        for vy in range(max(0, ly - far - cam_y), min(vp_h, ly + far + 1 - cam_y)):
+            dy = vy + cam_y - ly
+            row = vy * vp_w
+            for vx in range(max(0, lx - far - cam_x), min(vp_w, lx + far + 1 - cam_x)):
+                dx = vx + cam_x - lx
+                d = dx * dx + dy * dy
+                if d <= near_sq:
+                    out[row + vx] = 0
+                elif d <= far_sq and out[row + vx] > FOG_DIM:
+                    out[row + vx] = FOG_DIM
+    return bytes(out)
+
+
+# ═════════════════════════════════════════════════════════════════════════════
+# ViewportCompositor
+# ═════════════════════════════════════════════════════════════════════════════
+
+class ViewportCompositor:
+    """
+    Komponiert den Viewport aus Layern und liefert nur geaenderte Panels.
+
+    API:
+      set_static(source)              — TerrainChunkRenderer oder PIL-Bild
+      invalidate_static(chunk_keys)   — Terrain-Chunks neu (z.B. Tuer geoeffnet)
+      set_scale(scale)                — Zoomstufe (leert die Skalier-Caches)
+      set_camera(x, y, w, h)          — Viewport in Tiles
+      compose(sprites, fog, effects)  — Frame (nur dirty Panels)
+    """
+
+    def __init__(self, scale: int = SCALE) -> None:
+        self.scale = scale
+        self.stats = FrameStats()
+        self._source: Any = None
+        self._chunk_size = CHUNK
+        self._scaled_chunks: dict[tuple[int, int], "Image.Image"] = {}
+        self._scaled_sprites: dict[int, tuple["Image.Image", "Image.Image"]] = {}
+        self._view: "Image.Image | None" = None
+        self._cam: tuple[int, int, int, int] = (0, 0, 0, 0)
+        self._prev_sig: dict[tuple[int, int], tuple] = {}
+        self._prev_fog: bytes = b""
+        self._force: set[tuple[int, int]] = set()   # Panels, die neu muessen
+        self._layout_changed = True
+
+    # ------------------------------------------------------------------
+    # Static-Layer
+    # ------------------------------------------------------------------
+
+    @property
+    def has_static(self) -> bool:
+        return self._source is not None
+
+    def set_static(self, source: Any) -> None:
+        """Neue Terrain-Quelle: TerrainChunkRenderer (chunk_image) oder PIL-Bild."""
+        self._source = source
+        self._chunk_size = getattr(source, "chunk", CHUNK)
+        self._scaled_chunks.clear()
+        self._view = None
+
+    def set_scale(self, scale: int) -> None:
+        if scale == self.scale:
+            return
+        self.scale = scale
+        self._scaled_chunks.clear()
+        self._scaled_sprites.clear()
+        self._view = None
+        self._layout_changed = True
+
+    def invalidate_static(self, chunk_keys: list[tuple[int, int]]) -> None:
+        """Verwirft skalierte Chunks und zeichnet nur deren Viewport-Anteil neu."""
+        n = self._chunk_size
+        cam_x, cam_y, vw, vh = self._cam
+        for cx, cy in chunk_keys:
+            self._scaled_chunks.pop((cx, cy), None)
+            if self._view is None:
+                continue
+            # Sichtbarer Teil des Chunks (Tiles, viewport-relativ)
+            x0, y0 = max(0, cx * n - cam_x), max(0, cy * n - cam_y)
+            x1, y1 = min(vw, (cx + 1) * n - cam_x), min(vh, (cy + 1) * n - cam_y)
+            if x1 <= x0 or y1 <= y0:
+                continue
+            self._paste_chunk(cx, cy)
+            for py in range(y0 // PANEL, (y1 - 1) // PANEL + 1):
+                for px in range(x0 // PANEL, (x1 - 1) // PANEL + 1):
+                    self._force.add((px, py))
+
+    def _chunk(self, cx: int, cy: int) -> "Image.Image":
+        """Skalierter Terrain-Chunk (einmal pro Zoomstufe)."""
+        img = self._scaled_chunks.get((cx, cy))
+        if img is None:
+            src = self._source
+            if hasattr(src, "chunk_image"):
+                raw = src.chunk_image(cx, cy)
+            else:
+                n = self._chunk_size * TILE
+                raw = src.crop((cx * n, cy * n,
+                                min((cx + 1) * n, src.width), min((cy + 1) * n, src.height)))
+            img = raw.resize((raw.width * self.scale, raw.height * self.scale), Image.NEAREST)
+            self._scaled_chunks[(cx, cy)] = img
+        return img
+
+    def _source_tiles(self) -> tuple[int, int]:
+        src = self._source
+        if hasattr(src, "chunk_image"):
+            return src.width, src.height
+        return src.width // TILE, src.height // TILE
+
+    def _paste_chunk(self, cx: int, cy: int) -> None:
+        cam_x, cam_y, _, _ = self._cam
+        ts = TILE * self.scale
+        n = self._chunk_size
+        self._view.paste(self._chunk(cx, cy), ((cx * n - cam_x) * ts, (cy * n - cam_y) * ts))
+
+    def _build_view(self) -> None:
+        """Skalierter Static-Layer fuer den aktuellen Viewport (nur Pastes)."""
+        cam_x, cam_y, vw, vh = self._cam
+        ts = TILE * self.scale
+        self._view = Image.new("RGBA", (vw * ts, vh * ts), (5, 3, 8, 255))
+        if self._source is None:
+            return
+        n = self._chunk_size
+        w, h = self._source_tiles()
+        for cy in range(max(0, cam_y) // n, (min(h, cam_y + vh) - 1) // n + 1):
+            for cx in range(max(0, cam_x) // n, (min(w, cam_x + vw) - 1) // n + 1):
+                self._paste_chunk(cx, cy)
+
+    # ------------------------------------------------------------------
+    # Kamera
+    # ------------------------------------------------------------------
+
+    def set_camera(self, cam_x: int, cam_y: int, vp_w: int, vp_h: int) -> None:
+        cam = (cam_x, cam_y, vp_w, vp_h)
+        if cam == self._cam and self._view is not None:
+            return
+        if cam[2:] != self._cam[2:]:
+            self._layout_changed = True
+        self._cam = cam
+        self._view = None
+
+    def panel_grid(self) -> tuple[int, int]:
+        """Anzahl Panels (x, y) im aktuellen Viewport."""
+        _, _, vw, vh = self._cam
+        return -(-vw // PANEL), -(-vh // PANEL)
+
+    # ------------------------------------------------------------------
+    # Frame
+    # ------------------------------------------------------------------
+
+    def compose(
+        self,
+        sprites: list[Sprite],
+        fog_alpha: bytes | None = None,
+        effects: list[Any] | None = None,
+    ) -> Frame:
+        """Komponiert alle Panels, deren Inhalt sich seit dem letzten Frame geaendert hat.
+
+        Args:
+            sprites: Dynamischer Layer in Zeichenreihenfolge (Fackeln, Entities)
+            fog_alpha: vp_w*vp_h Bytes, ein Alpha-Wert pro Viewport-Tile
+            effects: Objekte mit kind/x/y/tx/ty/text/ttl/max_ttl/progress/color
+        """
+        frame = Frame(layout_changed=self._layout_changed)
+        if self._source is None:
+            return frame
+
+        full = self._view is None or self._layout_changed
+        if self._view is None:
+            self._build_view()
+        self._layout_changed = False
+
+        cam_x, cam_y, vw, vh = self._cam
+        items = self._collect_items(sprites, effects or [])
+
+        # Tile-Signaturen → dirty Panels
+        sig: dict[tuple[int, int], tuple] = {}
+        ts = TILE * self.scale
+        for i, item in enumerate(items):
+            x0, y0, x1, y1 = item.rect
+            for ty in range(max(0, y0 // ts), min(vh, -(-y1 // ts))):
+                for tx in range(max(0, x0 // ts), min(vw, -(-x1 // ts))):
+                    sig[(tx, ty)] = sig.get((tx, ty), ()) + (item.sig,)
+
+        fog = fog_alpha if fog_alpha is not None and len(fog_alpha) == vw * vh \
+            else bytes(vw * vh)
+
+        dirty: set[tuple[int, int]] = set(self._force)
+        self._force.clear()
+        if full:
+            pw, ph = self.panel_grid()
+            dirty.update((px, py) for py in range(ph) for px in range(pw))
+        else:
+            prev = self._prev_sig
+            for key in sig.keys() | prev.keys():
+                if sig.get(key) != prev.get(key):
+                    dirty.add((key[0] // PANEL, key[1] // PANEL))
+            if len(fog) != len(self._prev_fog):
+                pw, ph = self.panel_grid()
+                dirty.update((px, py) for py in range(ph) for px in range(pw))
+            elif fog != self._prev_fog:
+                prev_fog = self._prev_fog
+                for i in range(len(fog)):
+                    if fog[i] != prev_fog[i]:
+                        dirty.add(((i % vw) // PANEL, (i // vw) // PANEL))
+        self._prev_sig = sig
+        self._prev_fog = fog
+
+        for key in sorted(dirty):
+            frame.panels.append((key, (key[0] * PANEL * ts, key[1] * PANEL * ts),
+                                 self._compose_panel(key, items, fog)))
+        return frame
+
+    def _compose_panel(
+        self, key: tuple[int, int], items: list[_Item], fog: bytes,
+    ) -> "Image.Image":
+        _, _, vw, vh = self._cam
+        ts = TILE * self.scale
+        tx0, ty0 = key[0] * PANEL, key[1] * PANEL
+        tx1, ty1 = min(vw, tx0 + PANEL), min(vh, ty0 + PANEL)
+        ox, oy = tx0 * ts, ty0 * ts
+        box = (ox, oy, tx1 * ts, ty1 * ts)
+        img = self._view.crop(box)
+        draw = ImageDraw.Draw(img)
+
+        hits = [it for it in items
+                if it.rect[0] < box[2] and it.rect[2] > box[0]
+                and it.rect[1] < box[3] and it.rect[3] > box[1]]
+        for it in hits:
+            if it.layer < 2:
+                it.draw(img, draw, ox, oy)
+
+        # Fog: 1 Byte pro Tile → NEAREST auf Panel-Groesse
+        w, h = tx1 - tx0, ty1 - ty0
+        rows = b"".join(fog[(ty0 + r) * vw + tx0:(ty0 + r) * vw + tx1] for r in range(h))
+        if any(rows):
+            alpha = Image.frombytes("L", (w, h), rows).resize(img.size, Image.NEAREST)
+            shade = Image.new("RGBA", img.size, (0, 0, 0, 0))
+            shade.putalpha(alpha)
+            img.alpha_composite(shade)
+            draw = ImageDraw.Draw(img)
+
+        for it in hits:
+            if it.layer == 2:
+                it.draw(img, draw, ox, oy)
+        return img
+
+    # ------------------------------------------------------------------
+    # Elemente
+    # ------------------------------------------------------------------
+
+    def _scaled(self, img: "Image.Image") -> "Image.Image":
+        """Sprite einmal pro Zoomstufe skalieren (Cache per Objekt-Identitaet)."""
+        entry = self._scaled_sprites.get(id(img))
+        if entry is None or entry[0] is not img:
+            scaled = img.resize((img.width * self.scale, img.height * self.scale), Image.NEAREST)
+            entry = (img, scaled)
+            self._scaled_sprites[id(img)] = entry
+        return entry[1]
+
+    def _collect_items(self, sprites: list[Sprite], effects: list[Any]) -> list[_Item]:
+        cam_x, cam_y, vw, vh = self._cam
+        s = self.scale
+        ts = TILE * s
+        items: list[_Item] = []
+
+        for sp in sprites:
+            vx, vy = sp.x - cam_x, sp.y - cam_y
+            if not (0 <= vx < vw and 0 <= vy < vh):
+                continue
+            big = self._scaled(sp.img)
+            px, py = vx * ts, vy * ts
+            if sp.img.width > TILE or sp.img.height > TILE:
+                # Grosse Sprites zentriert auf Tile-Position
+                px += -(sp.img.width - TILE) // 2 * s
+                py += -(sp.img.height - TILE) // 2 * s
+            x0, y0, x1, y1 = px, py, px + big.width, py + big.height
+            bar = None
+            if sp.bar is not None and vy * TILE - 3 >= 0:
+                ratio, color = sp.bar
+                bar = (max(0.0, min(1.0, ratio)), color)
+                y0 = min(y0, vy * ts - 3 * s)
+                x1 = max(x1, vx * ts + ts + s)
+
+            def draw_sprite(img, d, ox, oy, big=big, px=px, py=py, vx=vx, vy=vy, bar=bar):
+                img.paste(big, (px - ox, py - oy), big)
+                if bar is None:
+                    return
+                ratio, color = bar
+                bx, by = vx * ts - ox, vy * ts - 3 * s - oy
+                d.rectangle([bx, by, bx + ts - 1, by + 2 * s - 1], fill=(40, 40, 40))
+                if ratio > 0:
+                    filled = max(1, int(TILE * ratio)) * s
+                    d.rectangle([bx, by, bx + filled + s - 1, by + 2 * s - 1], fill=color)
+
+            items.append(_Item((x0, y0, x1, y1),
+                               (id(sp.img), sp.x, sp.y, bar), 0, draw_sprite))
+
+        for eff in effects:
+            if eff.kind == "slash":
+                cx = int(eff.x - cam_x) * ts + ts // 2
+                cy = int(eff.y - cam_y) * ts + ts // 2
+                r = 4 * s
+
+                def draw_slash(img, d, ox, oy, cx=cx, cy=cy, r=r, col=eff.color):
+                    d.line([(cx - r - ox, cy - r - oy), (cx + r - ox, cy + r - oy)],
+                           fill=col, width=s)
+                    d.line([(cx + r - ox, cy - r - oy), (cx - r - ox, cy + r - oy)],
+                           fill=col, width=s)
+
+                items.append(_Item((cx - r - s, cy - r - s, cx + r + s, cy + r + s),
+                                   ("slash", cx, cy, eff.ttl), 1, draw_slash))
+            elif eff.kind == "projectile":
+                sx = (eff.x - cam_x) * ts
+                sy = (eff.y - cam_y) * ts
+                ex = (eff.tx - cam_x) * ts
+                ey = (eff.ty - cam_y) * ts
+                cx = sx + (ex - sx) * eff.progress
+                cy = sy + (ey - sy) * eff.progress
+
+                def draw_proj(img, d, ox, oy, cx=cx, cy=cy, col=eff.color):
+                    d.ellipse((cx - 4 - ox, cy - 4 - oy, cx + 4 - ox, cy + 4 - oy), fill=col)
+
+                items.append(_Item((math.floor(cx) - 5, math.floor(cy) - 5,
+                                    math.ceil(cx) + 6, math.ceil(cy) + 6),
+                                   ("proj", round(cx, 1), round(cy, 1)), 2, draw_proj))
+            elif eff.kind == "dmg_text":
+                rise = (1.0 - eff.ttl / eff.max_ttl) * 24
+                tx = int((eff.x - cam_x) * ts)
+                ty = int((eff.y - cam_y) * ts - rise)
+                fade = eff.ttl / eff.max_ttl if eff.max_ttl else 0
+                col = tuple(max(0, min(255, int(v * fade))) for v in eff.color)
+
+                def draw_text(img, d, ox, oy, tx=tx, ty=ty, col=col, text=eff.text):
+                    d.text((tx - ox, ty - oy), text, fill=col)
+
+                items.append(_Item((tx, ty, tx + 6 * len(eff.text) + 2, ty + 12),
+                                   ("text", tx, ty, col, eff.text), 2, draw_text))
+        return items
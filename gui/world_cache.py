@@ -0,0 +1,311 @@
+"""
+gui/world_cache.py — Persistenter Cache fuer gestitchte Weltkarten
+
+Content-adressierter Cache in data/world_cache/:
+  - <key>.json         — gestitchtes WorldLayout (Terrain palette-kodiert)
+  - <key>_<layer>.png  — vorgerenderte statische Layer (z.B. static, minimap)
+  - scan_index.json    — Adventure-Scan-Index (mtime/size -> has_map, title)
+
+Key = sha1(Adventure-Datei-Inhalt + STITCH_VERSION + Tileset-Fingerprint
++ Render-Parameter). Aendert sich eines davon, entsteht ein neuer Key;
+alte Eintraege werden per LRU (mtime) aufgeraeumt.
+
+Verwendung:
+    cache = WorldCache()
+    key, layout = cache.get_layout("crawltraining_full.json")
+    static = cache.load_layer(key, "static") or render_and_save(...)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any
+
+from core.adventure_store import open_adventure_store
+from gui.pixel_renderer import HAS_PIL, tileset_fingerprint
+from gui.world_stitcher import (
+    ADVENTURES_DIR, STITCH_VERSION, WorldLayout, stitch_store,
+)
+
+if HAS_PIL:
+    from PIL import Image
+
+logger = logging.getLogger("ARS.gui.world_cache")
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_DIR = os.path.join(_PROJECT_ROOT, "data", "world_cache")
+
+# Format-Version der Cache-Dateien selbst
+_CACHE_FORMAT = 1
+_MAX_ENTRIES = 48
+
+
+# ── Kodierung ────────────────────────────────────────────────────────────────
+
+def _encode_grid(grid: list[list[Any]]) -> dict[str, Any]:
+    """Palette-Kodierung: [y][x]-Werte -> Palette + ein String pro Zeile."""
+    palette: dict[Any, str] = {}
+    rows: list[str] = []
+    for row in grid:
+        chars = []
+        for v in row:
+            c = palette.get(v)
+            if c is None:
+                c = chr(0x30 + len(palette))
+                palette[v] = c
+            chars.append(c)
+        rows.append("".join(chars))
+    return {"palette": list(palette.keys()), "rows": rows}
+
+
+def _decode_grid(data: dict[str, Any]) -> list[list[Any]]:
+    palette = data["palette"]
+    return [[palette[ord(c) - 0x30] for c in row] for row in data["rows"]]
+
+
+def _layout_to_dict(layout: WorldLayout) -> dict[str, Any]:
+    return {
+        "format": _CACHE_FORMAT,
+        "width": layout.width,
+        "height": layout.height,
+        "terrain": _encode_grid(layout.terrain),
+        "tile_to_room": _encode_grid(layout.tile_to_room),
+        "room_bounds": layout.room_bounds,
+        "room_biome": layout.room_biome,
+        "spawns": layout.spawns,
+        "decorations": layout.decorations,
+        "start_location": layout.start_location,
+        "locations": layout.locations,
+    }
+
+
+def _layout_from_dict(data: dict[str, Any]) -> WorldLayout:
+    return WorldLayout(
+        width=data["width"],
+        height=data["height"],
+        terrain=_decode_grid(data["terrain"]),
+        room_bounds={k: tuple(v) for k, v in data["room_bounds"].items()},
+        room_biome=data["room_biome"],
+        tile_to_room=_decode_grid(data["tile_to_room"]),
+        spawns={k: tuple(v) for k, v in data["spawns"].items()},
+        decorations=data["decorations"],
+        start_location=data["start_location"],
+        locations=data["locations"],
+    )
+
+
+# ── WorldCache ───────────────────────────────────────────────────────────────
+
+class WorldCache:
+    """Content-adressierter Disk-Cache fuer WorldLayouts und Static-Layer."""
+
+    def __init__(self, cache_dir: str = CACHE_DIR,
+                 adventures_dir: str = ADVENTURES_DIR) -> None:
+        self._dir = Path(cache_dir)
+        self._adv_dir = Path(adventures_dir)
+        self._scan_index: dict[str, dict[str, Any]] | None = None
+
+    # ------------------------------------------------------------------
+    # Keys
+    # ------------------------------------------------------------------
+
+    def _adventure_path(self, filename: str) -> Path:
+        path = Path(filename)
+        if path.is_file():
+            return path
+        path = self._adv_dir / filename
+        if path.suffix != ".json":
+            path = path.with_suffix(".json")
+        return path
+
+    def make_key(self, content: bytes, **params: Any) -> str:
+        """Key aus Datei-Inhalt, Stitcher-Version, Tileset und Parametern."""
+        h = hashlib.sha1(content)
+        h.update(f"|stitch={STITCH_VERSION}|tiles={tileset_fingerprint()}".encode())
+        for k in sorted(params):
+            h.update(f"|{k}={params[k]}".encode())
+        return h.hexdigest()[:20]
+
+    # ------------------------------------------------------------------
+    # Layout
+    # ------------------------------------------------------------------
+
+    def get_layout(self, filename: str, **params: Any) -> tuple[str, WorldLayout | None]:
+        """Laedt das WorldLayout aus dem Cache oder stitcht und speichert es.
+
+        Returns:
+            (key, layout) — layout ist None wenn das Adventure keine Karten hat.
+        """
+        path = self._adventure_path(filename)
+        try:
+            content = path.read_bytes()
+        except OSError as exc:
+            logger.warning("Adventure nicht lesbar: %s: %s", path, exc)
+            return "", None
+
+        key = self.make_key(content, **params)
+        layout = self.load_layout(key)
+        if layout is not None:
+            logger.info("World-Cache Treffer: %s (%s)", path.name, key)
+            return key, layout
+
+        store = open_adventure_store(path)
+        if store is None:
+            return key, None
+
+        layout = stitch_store(store)
+        if layout is not None:
+            self.save_layout(key, layout)
+        return key, layout
+
+    def load_layout(self, key: str) -> WorldLayout | None:
+        path = self._dir / f"{key}.json"
+        if not path.exists():
+            return None
+        try:
+            with path.open("r", encoding="utf-8") as fh:
+                data = json.load(fh)
+            if data.get("format") != _CACHE_FORMAT:
+                return None
+            os.utime(path)  # LRU-Zeitstempel
+            return _layout_from_dict(data)
+        except (json.JSONDecodeError, OSError, KeyError, TypeError) as exc:
+            logger.warning("World-Cache Eintrag defekt (%s): %s", key, exc)
+            return None
+
+    def save_layout(self, key: str, layout: WorldLayout) -> None:
+        path = self._dir / f"{key}.json"
+        try:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            with tmp.open("w", encoding="utf-8") as fh:
+                json.dump(_layout_to_dict(layout), fh, ensure_ascii=False,
+                          separators=(",", ":"))
+            os.replace(str(tmp), str(path))
+        except OSError as exc:
+            logger.warning("World-Cache Speicherfehler: %s", exc)
+            return
+        self._prune()
+
+    # ------------------------------------------------------------------
+    # Static-Layer (PNG)
+    # ------------------------------------------------------------------
+
+    def load_layer(self, key: str, name: str) -> "Image.Image | None":
+        """Laedt einen vorgerenderten Layer oder None."""
+        if not HAS_PIL or not key:
+            return None
+        path = self._dir / f"{key}_{name}.png"
+        if not path.exists():
+            return None
+        try:
+            img = Image.open(path)
+            img.load()  # Komplett dekodieren, Datei wird danach geschlossen
+            return img
+        except OSError as exc:
+            logger.warning("World-Cache Layer defekt (%s_%s): %s", key, name, exc)
+            return None
+
+    def save_layer(self, key: str, name: str, img: "Image.Image") -> None:
+        if not HAS_PIL or not key or img is None:
+            return
+        path = self._dir / f"{key}_{name}.png"
+        try:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            img.save(tmp, format="PNG", compress_level=1)
+            os.replace(str(tmp), str(path))
+        except OSError as exc:
+            logger.warning("World-Cache Layer-Speicherfehler: %s", exc)
+
+    # ------------------------------------------------------------------
+    # Adventure-Scan
+    # ------------------------------------------------------------------
+
+    def scan_adventures_with_maps(self) -> list[tuple[str, str, str]]:
+        """Wie world_stitcher.scan_adventures_with_maps, aber mit mtime-Index.
+
+        Nur geaenderte oder neue JSONs werden (ueber den Adventure-Index) gelesen.
+        """
+        index = self._load_scan_index()
+        results: list[tuple[str, str, str]] = []
+        seen: set[str] = set()
+        changed = False
+        if not self._adv_dir.is_dir():
+            return results
+
+        for fn in sorted(os.listdir(self._adv_dir)):
+            if not fn.endswith(".json"):
+                continue
+            path = self._adv_dir / fn
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            seen.add(fn)
+            entry = index.get(fn)
+            if not entry or entry.get("mtime") != st.st_mtime_ns or entry.get("size") != st.st_size:
+                entry = {"mtime": st.st_mtime_ns, "size": st.st_size,
+                         "has_map": False, "title": fn[:-5]}
+                store = open_adventure_store(path)
+                if store is not None:
+                    entry["has_map"] = store.has_map
+                    entry["title"] = store.title
+                index[fn] = entry
+                changed = True
+            if entry["has_map"]:
+                results.append((fn, entry["title"], fn[:-5]))
+
+        for fn in set(index) - seen:
+            del index[fn]
+            changed = True
+        if changed:
+            self._save_scan_index(index)
+        return results
+
+    def _load_scan_index(self) -> dict[str, dict[str, Any]]:
+        if self._scan_index is None:
+            self._scan_index = {}
+            path = self._dir / "scan_index.json"
+            if path.exists():
+                try:
+                    with path.open("r", encoding="utf-8") as fh:
+                        self._scan_index = json.load(fh)
+                except (json.JSONDecodeError, OSError):
+                    logger.warning("Scan-Index defekt — wird neu aufgebaut.")
+        return self._scan_index
+
+    def _save_scan_index(self, index: dict[str, dict[str, Any]]) -> None:
+        path = self._dir / "scan_index.json"
+        try:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            with tmp.open("w", encoding="utf-8") as fh:
+                json.dump(index, fh, ensure_ascii=False)
+            os.replace(str(tmp), str(path))
+        except OSError as exc:
+            logger.warning("Scan-Index Speicherfehler: %s", exc)
+
+    # ------------------------------------------------------------------
+    # Aufraeumen
+    # ------------------------------------------------------------------
+
+    def _prune(self) -> None:
+        """Entfernt die aeltesten Layout-Eintraege (inkl. Layer) ueber _MAX_ENTRIES."""
+        try:
+            layouts = sorted(
+                (p for p in self._dir.glob("*.json") if p.name != "scan_index.json"),
+                key=lambda p: p.stat().st_mtime,
+            )
+        except OSError:
+            return
+        for old in layouts[:max(0, len(layouts) - _MAX_ENTRIES)]:
+            for p in self._dir.glob(f"{old.stem}*"):
+                try:
+                    p.unlink()
+                except OSError:
+                    pass
@@ -11,27 +11,44 @@ Pipeline:
   3. Aggressive Cellular Automaton fuer organische Hoehlenwaende
   4. Dekoration streuen (Schutt, Pfuetzen, Kristalle, Moos)
   5. -> WorldLayout als Ergebnis
+
+Schritte 3-4 laufen mit NumPy vektorisiert (Bit-identisch zur
+Python-Variante, die ohne NumPy als Fallback dient).
 """
 
 from __future__ import annotations
 
-import json
 import logging
 import math
 import os
 import random
+import zlib
 from collections import deque
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from typing import Any
 
+from core.adventure_store import AdventureStore, open_adventure_store
+
 logger = logging.getLogger("ARS.gui.world_stitcher")
 
+# ── NumPy Verfuegbarkeit ─────────────────────────────────────────────────────
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 # ── Pfade ────────────────────────────────────────────────────────────────────
 
 _PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 ADVENTURES_DIR = os.path.join(_PROJECT_ROOT, "modules", "adventures")
 GENERATED_DIR = os.path.join(_PROJECT_ROOT, "data", "tilesets", "generated")
 
+# Bei jeder Aenderung am Stitching-Algorithmus erhoehen (invalidiert World-Cache)
+STITCH_VERSION = 2
+
 
 # ── Datenstruktur ────────────────────────────────────────────────────────────
 
@@ -106,7 +123,8 @@ def stitch_adventure(adventure: dict) -> WorldLayout | None:
     if start_id not in loc_map:
         start_id = next(iter(loc_map))
 
-    rng = random.Random(hash(start_id) ^ 0xBEEF)
+    # Stabiler Seed (hash() auf str ist pro Prozess randomisiert)
+    rng = random.Random(zlib.crc32(start_id.encode("utf-8")) ^ 0xBEEF)
 
     # Raum-Groessen sammeln
     room_sizes: dict[str, tuple[int, int]] = {}
@@ -239,15 +257,28 @@ def stitch_adventure(adventure: dict) -> WorldLayout | None:
     _carve_winding_passages(terrain, tile_to_room, loc_map, placed, room_sizes,
                             world_w, world_h, rng)
 
-    # Aggressiver organischer Pass
-    _organic_smooth(terrain, tile_to_room, all_spawns, loc_map, placed, room_sizes,
-                    world_w, world_h, rng)
+    if HAS_NUMPY:
+        # Vektorisierte Pipeline — identisches Ergebnis bei gleichem Seed
+        grid, names = _terrain_to_array(terrain)
+        _wall_border_passages_np(grid, names)
+        protected = _protected_mask(loc_map, placed, all_spawns, world_w, world_h)
+        _organic_smooth_np(grid, names, protected, rng)
+        _round_edges_np(grid, names, rng)
+        extra_decos = _scatter_decorations_np(grid, names, tile_to_room, rng)
+        _array_to_terrain(grid, names, terrain)
+    else:
+        # Waende um Durchgaenge setzen
+        _wall_border_passages(terrain, world_w, world_h)
+
+        # Aggressiver organischer Pass
+        _organic_smooth(terrain, tile_to_room, all_spawns, loc_map, placed, room_sizes,
+                        world_w, world_h, rng)
 
-    # Zweiter Pass: Wand-Raender abrunden
-    _round_edges(terrain, world_w, world_h, rng)
+        # Zweiter Pass: Wand-Raender abrunden
+        _round_edges(terrain, world_w, world_h, rng)
 
-    # Dekoration streuen
-    extra_decos = _scatter_decorations(terrain, tile_to_room, world_w, world_h, rng)
+        # Dekoration streuen
+        extra_decos = _scatter_decorations(terrain, tile_to_room, world_w, world_h, rng)
     all_decos.extend(extra_decos)
 
     layout = WorldLayout(
@@ -381,9 +412,6 @@ def _carve_winding_passages(
                                 sx, sy, ex, ey,
                                 world_w, world_h, rng)
 
-    # Waende um Durchgaenge setzen
-    _wall_border_passages(terrain, world_w, world_h)
-
 
 def _carve_winding_path(
     terrain: list[list[str]],
@@ -701,31 +729,241 @@ def _scatter_decorations(
     return decos
 
 
+# ── Vektorisierte Pipeline (NumPy) ───────────────────────────────────────────
+#
+# Gleiche Regeln wie die Python-Passes oben, aber Nachbarzaehlung per
+# Array-Verschiebung. Zufallszahlen werden weiterhin aus demselben
+# random.Random gezogen — genau eine pro Kandidatenzelle in Zeilenreihenfolge,
+# so bleibt das Ergebnis bei gleichem Seed Bit-identisch zur Python-Variante.
+
+_WALKABLE = ("floor", "door", "obstacle", "water")
+
+
+def _terrain_to_array(terrain: list[list[str]]) -> tuple[Any, list[str]]:
+    """Terrain-Liste -> (uint8-Code-Array, Code-Namen)."""
+    names_arr, inv = np.unique(np.array(terrain), return_inverse=True)
+    names = [str(n) for n in names_arr]
+    for t in ("void", "wall") + _WALKABLE:
+        if t not in names:
+            names.append(t)
+    return inv.reshape(len(terrain), -1).astype(np.uint8), names
+
+
+def _array_to_terrain(grid: Any, names: list[str], terrain: list[list[str]]) -> None:
+    """Schreibt das Code-Array in-place in die Terrain-Liste zurueck."""
+    terrain[:] = np.array(names, dtype=object)[grid].tolist()
+
+
+def _mask(grid: Any, names: list[str], *types: str) -> Any:
+    """Bool-Maske aller Zellen mit einem der Terrain-Typen."""
+    return np.isin(grid, [names.index(t) for t in types])
+
+
+def _moore_count(mask: Any) -> Any:
+    """Anzahl gesetzter Moore-Nachbarn fuer alle Innenzellen [1:-1, 1:-1]."""
+    m = mask.astype(np.uint8)
+    return (m[:-2, :-2] + m[:-2, 1:-1] + m[:-2, 2:] +
+            m[1:-1, :-2] + m[1:-1, 2:] +
+            m[2:, :-2] + m[2:, 1:-1] + m[2:, 2:])
+
+
+def _draw_for(candidates: Any, rng: random.Random) -> Any:
+    """Eine rng.random()-Zahl pro Kandidat (Zeilenreihenfolge), sonst 1.0."""
+    draws = np.ones(candidates.shape, dtype=np.float64)
+    idx = np.flatnonzero(candidates)
+    if idx.size:
+        draws.flat[idx] = [rng.random() for _ in range(idx.size)]
+    return draws
+
+
+def _wall_border_passages_np(grid: Any, names: list[str]) -> None:
+    """Wie _wall_border_passages: void neben begehbarem Terrain -> wall."""
+    walk = np.pad(_mask(grid, names, *_WALKABLE), 1)
+    near = _moore_count(walk) > 0
+    grid[(grid == names.index("void")) & near] = names.index("wall")
+
+
+def _protected_mask(
+    loc_map: dict[str, dict],
+    placed: dict[str, tuple[int, int]],
+    spawns: dict[str, tuple[int, int]],
+    world_w: int, world_h: int,
+) -> Any:
+    """Schutz-Zonen (5x5 um Exits und Spawns) als Bool-Maske."""
+    protected = np.zeros((world_h, world_w), dtype=bool)
+    centers: list[tuple[int, int]] = []
+    for rid, (wx, wy) in placed.items():
+        for _, epos in loc_map[rid]["map"].get("exits", {}).items():
+            if isinstance(epos, list) and len(epos) == 2:
+                centers.append((wx + epos[0], wy + epos[1]))
+    centers.extend(spawns.values())
+    for cx, cy in centers:
+        protected[max(0, cy - 2):max(0, cy + 3), max(0, cx - 2):max(0, cx + 3)] = True
+    return protected
+
+
+def _organic_smooth_np(
+    grid: Any, names: list[str], protected: Any, rng: random.Random,
+) -> None:
+    """Vektorisierte Variante von _organic_smooth (inkl. Konnektivitaet)."""
+    wall, void, floor = names.index("wall"), names.index("void"), names.index("floor")
+    inner_protected = protected[1:-1, 1:-1]
+
+    for _ in range(5):
+        inner = grid[1:-1, 1:-1]
+        wall_count = _moore_count((grid == wall) | (grid == void))
+        floor_count = 8 - wall_count
+
+        active = ~inner_protected & (inner != void)
+        is_wall = active & (inner == wall)
+        rule_a = is_wall & (floor_count >= 1) & (wall_count <= 3)
+        rule_b = is_wall & ~rule_a & (floor_count >= 2) & (wall_count == 4)
+        rule_c = active & (inner == floor) & (wall_count >= 6)
+
+        draws = _draw_for(rule_a | rule_b | rule_c, rng)
+        to_floor = (rule_a & (draws < 0.50)) | (rule_b & (draws < 0.25))
+        to_wall = rule_c & (draws < 0.35)
+        inner[to_floor] = floor
+        inner[to_wall] = wall
+
+    _ensure_connectivity_np(grid, names)
+
+
+def _round_edges_np(grid: Any, names: list[str], rng: random.Random) -> None:
+    """Vektorisierte Variante von _round_edges."""
+    wall, floor = names.index("wall"), names.index("floor")
+    for _ in range(2):
+        inner = grid[1:-1, 1:-1]
+        open_ = _mask(grid, names, *_WALKABLE)
+        fl = grid == floor
+        floor_dirs = (open_[:-2, 1:-1].astype(np.uint8) + open_[2:, 1:-1] +
+                      open_[1:-1, 2:] + open_[1:-1, :-2])
+        n, s, e, w = fl[:-2, 1:-1], fl[2:, 1:-1], fl[1:-1, 2:], fl[1:-1, :-2]
+        is_l = (n & e) | (n & w) | (s & e) | (s & w)
+
+        is_wall = inner == wall
+        rule_a = is_wall & (floor_dirs >= 3)
+        rule_b = is_wall & (floor_dirs == 2) & is_l
+
+        draws = _draw_for(rule_a | rule_b, rng)
+        inner[(rule_a & (draws < 0.60)) | (rule_b & (draws < 0.40))] = floor
+
+
+def _ensure_connectivity_np(grid: Any, names: list[str]) -> None:
+    """Flood-Fill (4er-Nachbarschaft) auf flachen Indizes.
+
+    Dilatation per Array-Shift braucht so viele Durchlaeufe wie der
+    laengste Weg lang ist — bei langen Dungeon-Ketten ist die BFS ueber
+    einen bytearray-Puffer schneller.
+    """
+    walkable = _mask(grid, names, *_WALKABLE)
+    start = np.flatnonzero(walkable)
+    if not start.size:
+        return
+
+    h, w = walkable.shape
+    # Rand mit 0 auffuellen, damit keine Grenzpruefung noetig ist
+    open_ = bytearray(np.pad(walkable, 1).astype(np.uint8).tobytes())
+    pw = w + 2
+    sy, sx = divmod(int(start[0]), w)
+    first = (sy + 1) * pw + sx + 1
+    open_[first] = 2
+    queue = deque([first])
+    while queue:
+        i = queue.popleft()
+        for j in (i + 1, i - 1, i + pw, i - pw):
+            if open_[j] == 1:
+                open_[j] = 2
+                queue.append(j)
+
+    reached = np.frombuffer(bytes(open_), dtype=np.uint8).reshape(h + 2, pw)[1:-1, 1:-1] == 2
+    grid[walkable & ~reached] = names.index("wall")
+
+
+def _scatter_decorations_np(
+    grid: Any, names: list[str],
+    tile_to_room: list[list[str | None]],
+    rng: random.Random,
+) -> list[dict]:
+    """Vektorisierte Variante von _scatter_decorations."""
+    floor = names.index("floor")
+    walk = _mask(grid, names, *_WALKABLE).astype(np.uint8)
+    wallish = _mask(grid, names, "wall", "void").astype(np.uint8)
+    walkable_nbrs = walk[:-2, 1:-1] + walk[2:, 1:-1] + walk[1:-1, 2:] + walk[1:-1, :-2]
+    wall_nbrs = (wallish[:-2, 1:-1] + wallish[2:, 1:-1] +
+                 wallish[1:-1, 2:] + wallish[1:-1, :-2])
+
+    is_floor = grid[1:-1, 1:-1] == floor
+    passage = (np.array(tile_to_room, dtype=object) == "_passage")[1:-1, 1:-1]
+
+    dead_end = is_floor & (walkable_nbrs == 1)
+    live = is_floor & ~dead_end
+    in_passage = live & passage
+    by_wall = live & ~passage & (wall_nbrs >= 1)
+    open_area = live & ~passage & (wall_nbrs == 0) & (walkable_nbrs == 4)
+
+    draws = _draw_for(in_passage | by_wall | open_area, rng)
+
+    # (Maske, Schwelle-unten, Schwelle-oben, Typ, setzt Terrain)
+    rules = (
+        (in_passage, 0.00, 0.04, "obstacle", True),
+        (in_passage, 0.04, 0.07, "water", True),
+        (in_passage, 0.07, 0.10, "moss", False),
+        (by_wall, 0.00, 0.03, "moss", False),
+        (by_wall, 0.03, 0.05, "crystal", False),
+        (by_wall, 0.05, 0.08, "obstacle", True),
+        (open_area, 0.00, 0.03, "water", True),
+    )
+    kind = np.full(draws.shape, -1, dtype=np.int8)
+    kind[dead_end] = len(rules)
+    for i, (mask, lo, hi, _, _) in enumerate(rules):
+        kind[mask & (draws >= lo) & (draws < hi)] = i
+
+    decos: list[dict] = []
+    inner = grid[1:-1, 1:-1]
+    for iy, ix in zip(*np.nonzero(kind >= 0)):
+        y, x = int(iy) + 1, int(ix) + 1
+        k = int(kind[iy, ix])
+        room = tile_to_room[y][x]
+        if k == len(rules):
+            decos.append({"x": x, "y": y, "type": "skull", "room": room})
+            continue
+        _, _, _, deco_type, sets_terrain = rules[k]
+        if sets_terrain:
+            inner[iy, ix] = names.index(deco_type)
+        decos.append({"x": x, "y": y, "type": deco_type, "room": room})
+    return decos
+
+
+# ── Routing-Graph ────────────────────────────────────────────────────────────
+
+def build_world_graph(layout: WorldLayout) -> Any:
+    """Baut den HPA*-Portalgraphen (core.world_graph) fuer alle gestitchten Raeume."""
+    from core.grid_engine import GridEngine
+    from core.world_graph import WorldGraph
+
+    builder = GridEngine()
+    return WorldGraph.build(layout.locations.values(), builder.build_room_grid)
+
+
 # ── Adventure laden ──────────────────────────────────────────────────────────
 
-def load_adventure(name_or_path: str) -> dict | None:
-    """Laedt ein Adventure-JSON von Pfad oder aus modules/adventures/."""
-    if os.path.isfile(name_or_path):
-        path = name_or_path
-    else:
-        path = os.path.join(ADVENTURES_DIR, name_or_path)
-        if not path.endswith(".json"):
-            path += ".json"
+def load_adventure(name_or_path: str) -> Mapping[str, Any] | None:
+    """Adventure von Pfad oder aus modules/adventures/ (read-only Store-View)."""
+    store = open_adventure_store(name_or_path)
+    return store.view() if store is not None else None
 
-    if not os.path.isfile(path):
-        logger.warning("Adventure nicht gefunden: %s", path)
-        return None
 
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, OSError) as e:
-        logger.error("Adventure-Fehler: %s: %s", path, e)
-        return None
+def stitch_store(store: AdventureStore) -> WorldLayout | None:
+    """Stitcht direkt aus dem Store — materialisiert nur Locations mit map."""
+    return stitch_adventure({
+        "start_location": store.get("start_location", ""),
+        "locations": [store.locations[lid] for lid in store.locations.with_maps()],
+    })
 
 
 def scan_adventures_with_maps() -> list[tuple[str, str, str]]:
-    """Scannt adventures/ nach JSONs mit map-Feldern.
+    """Scannt adventures/ nach JSONs mit map-Feldern (ueber den Adventure-Index).
 
     Returns:
         Liste von (filename, title, stem) Tupeln
@@ -737,19 +975,8 @@ def scan_adventures_with_maps() -> list[tuple[str, str, str]]:
     for fn in sorted(os.listdir(ADVENTURES_DIR)):
         if not fn.endswith(".json"):
             continue
-        path = os.path.join(ADVENTURES_DIR, fn)
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                adv = json.load(f)
-            has_map = any(
-                "map" in loc and loc["map"] and "terrain" in loc.get("map", {})
-                for loc in adv.get("locations", [])
-            )
-            if has_map:
-                title = adv.get("title", adv.get("name", fn.replace(".json", "")))
-                stem = fn.replace(".json", "")
-                results.append((fn, title, stem))
-        except (json.JSONDecodeError, OSError):
-            pass
+        store = open_adventure_store(os.path.join(ADVENTURES_DIR, fn))
+        if store is not None and store.has_map:
+            results.append((fn, store.title, fn.replace(".json", "")))
 
     return results
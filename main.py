@@ -147,6 +147,15 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Batch-process all PDFs in coversion/workload/ (no game session)",
     )
+    parser.add_argument(
+        "--tts-prewarm",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="FILE",
+        help="Pre-synthesize known phrases into the TTS phrase cache and exit "
+             "(optional file: one phrase per line, '[role] text' for other voices)",
+    )
     parser.add_argument(
         "--webgui",
         action="store_true",
@@ -191,7 +200,18 @@ def main() -> None:
         logger.info("PDFs: %s", ", ".join(p.name for p in pdfs))
         sys.exit(0)
 
-    # --module ist Pflicht fuer alle Modi ausser --convert-all
+    # --tts-prewarm: Phrasen-Cache fuellen statt Spielsession (kein --module noetig)
+    if args.tts_prewarm is not None:
+        from audio.tts_cache import PREWARM_PHRASES, load_phrase_file
+        from audio.tts_handler import TTSHandler
+        phrases = list(PREWARM_PHRASES)
+        if args.tts_prewarm:
+            phrases += load_phrase_file(args.tts_prewarm)
+        added = TTSHandler().prewarm(phrases)
+        logger.info("TTS-Pre-Warm abgeschlossen: %d Saetze neu gecacht (%d Phrasen).", added, len(phrases))
+        sys.exit(0)
+
+    # --module ist Pflicht fuer alle Modi ausser --convert-all / --tts-prewarm
     if not args.module:
         logger.error("--module ist erforderlich (z.B. --module add_2e)")
         sys.exit(1)
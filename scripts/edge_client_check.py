@@ -0,0 +1,371 @@
+"""
+scripts/edge_client_check.py — Offline-Check fuer audio/edge_client.py
+
+Prueft EdgeTTSClient und Mp3Decoder ohne Netz und ohne edge-tts:
+
+  - FakeCommunicate ersetzt edge_tts.Communicate (communicate_factory) und
+    liefert Audio-Chunks mit einstellbarer Verzoegerung, haengt (Timeout)
+    oder wirft einen Fehler — wie ein lokaler Websocket-Ersatz.
+  - FakeCodec ersetzt den PyAV-CodecContext: parse() zerlegt den Strom an
+    Frame-Grenzen, decode() liefert int16-Stereo-Frames. Damit ist die
+    inkrementelle Ausgabe von Mp3Decoder.feed() pruefbar.
+  - Mit installiertem PyAV zusaetzlich ein echter MP3-Roundtrip.
+
+Geprueft: prefetch/take (Wiederverwendung, Limit), cancel_prefetched,
+Timeout-Pfad, Fehlerweitergabe, close() und inkrementelles Dekodieren.
+
+Starten:  python scripts/edge_client_check.py
+Exit-Code 0 wenn alle Checks bestehen.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import os
+import sys
+import threading
+import time
+from typing import Any
+
+import numpy as np
+
+# Projekt-Root in sys.path
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+_PROJECT_ROOT = os.path.dirname(_SCRIPT_DIR)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
+
+from audio.edge_client import EdgeCancelled, EdgeTTSClient, Mp3Decoder
+
+GREEN = "\033[92m"
+RED = "\033[91m"
+YELLOW = "\033[93m"
+RESET = "\033[0m"
+
+_results: list[bool] = []
+
+
+def _check(name: str, passed: bool, detail: str = "") -> None:
+    _results.append(passed)
+    mark = f"{GREEN}OK  {RESET}" if passed else f"{RED}FAIL{RESET}"
+    print(f"  {mark} {name}" + (f"  ({detail})" if detail else ""))
+
+
+def _skip(name: str, reason: str) -> None:
+    print(f"  {YELLOW}SKIP{RESET} {name}  ({reason})")
+
+
+# ---------------------------------------------------------------------------
+# Lokaler Ersatz fuer edge_tts.Communicate
+# ---------------------------------------------------------------------------
+
+class FakeServer:
+    """Zaehlt Anfragen und erzeugt FakeCommunicate-Objekte (communicate_factory)."""
+
+    def __init__(self, chunks: int = 3, delay: float = 0.01) -> None:
+        self.chunks = chunks
+        self.delay = delay
+        self.hang: set[str] = set()       # Texte, die nie antworten
+        self.fail: set[str] = set()       # Texte, die mit Fehler enden
+        self.requests: list[str] = []
+        self.cancelled: list[str] = []
+        self.completed: list[str] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, text: str, voice: str) -> FakeCommunicate:
+        with self._lock:
+            self.requests.append(text)
+        return FakeCommunicate(self, text)
+
+
+class FakeCommunicate:
+    """Wie edge_tts.Communicate: stream() liefert audio- und Metadaten-Chunks."""
+
+    def __init__(self, server: FakeServer, text: str) -> None:
+        self._server = server
+        self._text = text
+
+    async def stream(self) -> Any:
+        server = self._server
+        try:
+            yield {"type": "WordBoundary", "offset": 0, "text": self._text}
+            if self._text in server.hang:
+                await asyncio.sleep(3600)
+            for i in range(server.chunks):
+                await asyncio.sleep(server.delay)
+                if self._text in server.fail and i == 1:
+                    raise ConnectionError(f"Websocket geschlossen: {self._text}")
+                yield {"type": "audio", "data": f"{self._text}:{i}|".encode()}
+            server.completed.append(self._text)
+        except asyncio.CancelledError:
+            server.cancelled.append(self._text)
+            raise
+
+
+# ---------------------------------------------------------------------------
+# Lokaler Ersatz fuer den PyAV-CodecContext
+# ---------------------------------------------------------------------------
+
+class _Layout:
+    def __init__(self, channels: int) -> None:
+        self.channels = [None] * channels
+
+
+class _Format:
+    is_planar = False
+
+
+class FakeFrame:
+    """int16 interleaved Stereo, wie PyAV s16 (shape (1, n * kanaele))."""
+
+    def __init__(self, left: np.ndarray, right: np.ndarray, sample_rate: int) -> None:
+        self._data = np.stack([left, right], axis=1).reshape(1, -1)
+        self.layout = _Layout(2)
+        self.format = _Format()
+        self.sample_rate = sample_rate
+
+    def to_ndarray(self) -> np.ndarray:
+        return self._data
+
+
+class FakeCodec:
+    """parse() trennt an b"|" (Rest bleibt gepuffert), decode() -> ein Frame je Paket."""
+
+    FRAME = 4
+
+    def __init__(self) -> None:
+        self._pending = b""
+        self.flushed = False
+
+    def parse(self, data: bytes) -> list[bytes]:
+        self._pending += data
+        *packets, self._pending = self._pending.split(b"|")
+        if not data and self._pending:
+            packets.append(self._pending)
+            self._pending = b""
+        return packets
+
+    def decode(self, packet: bytes | None) -> list[FakeFrame]:
+        if packet is None:
+            self.flushed = True
+            return []
+        left = np.full(self.FRAME, 16384, dtype=np.int16)
+        right = np.full(self.FRAME, -8192, dtype=np.int16)
+        return [FakeFrame(left, right, 24000)]
+
+
+def _fake_decoder() -> tuple[Mp3Decoder, FakeCodec]:
+    decoder = Mp3Decoder()
+    codec = FakeCodec()
+    decoder._codec = codec
+    decoder._buffer = None
+    return decoder, codec
+
+
+# ---------------------------------------------------------------------------
+# Checks
+# ---------------------------------------------------------------------------
+
+def _collect(request: Any, timeout: float = 2.0) -> list[bytes]:
+    return list(request.chunks(timeout=timeout))
+
+
+def check_prefetch_take() -> None:
+    print("\n[prefetch/take]")
+    server = FakeServer()
+    client = EdgeTTSClient(communicate_factory=server, prefetch=2)
+    try:
+        client.prefetch("Satz eins.", "de-DE-Test")
+        client.prefetch("Satz eins.", "de-DE-Test")       # doppelt: keine zweite Anfrage
+        client.prefetch("Satz zwei.", "de-DE-Test")
+        client.prefetch("Satz drei.", "de-DE-Test")       # ueber dem Limit
+        time.sleep(0.2)
+        _check("Limit und Duplikate", server.requests == ["Satz eins.", "Satz zwei."],
+               f"Anfragen {server.requests}")
+
+        first = client.take("Satz eins.", "de-DE-Test")
+        t0 = time.monotonic()
+        data = _collect(first)
+        _check("take() nutzt die vorab gestartete Anfrage",
+               server.requests.count("Satz eins.") == 1 and len(data) == 3)
+        _check("vorab geladene Chunks sofort verfuegbar", time.monotonic() - t0 < 0.05,
+               f"{(time.monotonic() - t0) * 1000:.0f} ms")
+        _check("Chunks in Reihenfolge, nur audio",
+               data == [b"Satz eins.:0|", b"Satz eins.:1|", b"Satz eins.:2|"])
+
+        other = _collect(client.take("Satz drei.", "de-DE-Test"))
+        _check("take() ohne Prefetch startet neu",
+               server.requests[-1] == "Satz drei." and len(other) == 3)
+        voice = _collect(client.take("Satz zwei.", "de-DE-Andere"))
+        _check("Schluessel ist (Text, Stimme)",
+               server.requests.count("Satz zwei.") == 2 and len(voice) == 3)
+    finally:
+        client.close()
+
+
+def check_cancel_prefetched() -> None:
+    print("\n[cancel_prefetched]")
+    server = FakeServer()
+    server.hang.add("Haengt.")
+    client = EdgeTTSClient(communicate_factory=server, prefetch=2)
+    try:
+        client.prefetch("Haengt.", "v")
+        time.sleep(0.1)
+        request = client._prefetched[("Haengt.", "v")]
+        client.cancel_prefetched()
+        t0 = time.monotonic()
+        try:
+            _collect(request, timeout=5.0)
+            raised = False
+        except EdgeCancelled:
+            raised = True
+        elapsed = time.monotonic() - t0
+        _check("chunks() wirft EdgeCancelled", raised)
+        _check("ohne auf den Timeout zu warten", elapsed < 0.5, f"{elapsed * 1000:.0f} ms")
+        time.sleep(0.1)
+        _check("Koroutine abgebrochen", server.cancelled == ["Haengt."])
+        _check("Prefetch-Tabelle leer", not client._prefetched)
+
+        fresh = client.take("Haengt.", "v")
+        time.sleep(0.1)
+        _check("take() danach startet eine neue Anfrage", server.requests.count("Haengt.") == 2)
+        fresh.cancel()
+    finally:
+        client.close()
+
+
+def check_timeout_and_errors() -> None:
+    print("\n[timeout/fehler]")
+    server = FakeServer()
+    server.hang.add("Stumm.")
+    server.fail.add("Kaputt.")
+    client = EdgeTTSClient(communicate_factory=server, prefetch=0)
+    try:
+        request = client.take("Stumm.", "v")
+        t0 = time.monotonic()
+        try:
+            _collect(request, timeout=0.2)
+            raised = None
+        except TimeoutError as exc:
+            raised = exc
+        elapsed = time.monotonic() - t0
+        _check("TimeoutError nach timeout s ohne Chunk", raised is not None and 0.15 < elapsed < 1.0,
+               f"{elapsed * 1000:.0f} ms")
+        time.sleep(0.1)
+        _check("haengende Anfrage wird abgebrochen", "Stumm." in server.cancelled)
+
+        client.prefetch("Nie.", "v")
+        _check("prefetch=0 startet nichts vorab", "Nie." not in server.requests)
+
+        failing = client.take("Kaputt.", "v")
+        chunks: list[bytes] = []
+        try:
+            for chunk in failing.chunks(timeout=2.0):
+                chunks.append(chunk)
+            error = None
+        except ConnectionError as exc:
+            error = exc
+        _check("Fehler der Anfrage wird weitergereicht", error is not None and len(chunks) == 1,
+               f"{len(chunks)} Chunk(s) vor dem Fehler")
+
+        server.hang.add("Offen.")
+        client.take("Offen.", "v")
+        time.sleep(0.1)
+    finally:
+        client.close()
+    thread = client._thread
+    _check("close() beendet den Loop-Thread", thread is not None and not thread.is_alive())
+    _check("close() bricht offene Anfragen ab", "Offen." in server.cancelled)
+
+
+def check_decoder_incremental() -> None:
+    print("\n[Mp3Decoder inkrementell]")
+    decoder, codec = _fake_decoder()
+    outputs = [decoder.feed(b"a:0|a:"), decoder.feed(b"1|"), decoder.feed(b"a:2")]
+    _check("feed() liefert sofort fertige Frames",
+           outputs[0] is not None and outputs[1] is not None and outputs[2] is None)
+    samples, rate = outputs[0]
+    expected = (16384 - 8192) / 2 / 32768.0
+    _check("int16 Stereo -> float32 Mono", samples.dtype == np.float32
+           and np.allclose(samples, expected) and rate == 24000)
+    tail = decoder.finish()
+    _check("finish() dekodiert den Parser-Rest und flusht",
+           tail is not None and len(tail[0]) == FakeCodec.FRAME and codec.flushed)
+
+    # Ende-zu-Ende: Chunks des Fake-Servers direkt in den Decoder
+    server = FakeServer(chunks=5)
+    client = EdgeTTSClient(communicate_factory=server, prefetch=1)
+    try:
+        decoder, _ = _fake_decoder()
+        blocks = 0
+        total = 0
+        for chunk in client.take("Strom.", "v").chunks(timeout=2.0):
+            out = decoder.feed(chunk)
+            if out is not None:
+                blocks += 1
+                total += len(out[0])
+        _check("Bloecke waehrend der Uebertragung", blocks == 5 and total == 5 * FakeCodec.FRAME,
+               f"{blocks} Bloecke")
+    finally:
+        client.close()
+
+
+def check_decoder_pyav() -> None:
+    print("\n[Mp3Decoder PyAV]")
+    try:
+        import av  # type: ignore[import]
+    except ImportError:
+        _skip("echter MP3-Roundtrip", "PyAV nicht installiert")
+        return
+    try:
+        mp3 = _encode_mp3(av, seconds=1.0, rate=24000)
+    except Exception as exc:
+        _skip("echter MP3-Roundtrip", f"kein MP3-Encoder: {exc}")
+        return
+    decoder = Mp3Decoder()
+    parts = []
+    early = 0
+    for i in range(0, len(mp3), 1024):
+        out = decoder.feed(mp3[i:i + 1024])
+        if out is not None:
+            parts.append(out[0])
+            early += 1
+    out = decoder.finish()
+    if out is not None:
+        parts.append(out[0])
+    total = sum(len(p) for p in parts)
+    _check("Frames vor finish()", early > 0, f"{early} Bloecke")
+    _check("Laenge ~ 1 s", abs(total - 24000) < 2400, f"{total} Samples")
+
+
+def _encode_mp3(av: Any, seconds: float, rate: int) -> bytes:
+    buf = io.BytesIO()
+    container = av.open(buf, mode="w", format="mp3")
+    stream = container.add_stream("mp3", rate=rate)
+    t = np.arange(int(seconds * rate)) / rate
+    pcm = (np.sin(2 * np.pi * 440 * t) * 0.3).astype(np.float32).reshape(1, -1)
+    frame = av.AudioFrame.from_ndarray(pcm, format="flt", layout="mono")
+    frame.sample_rate = rate
+    for packet in stream.encode(frame):
+        container.mux(packet)
+    for packet in stream.encode(None):
+        container.mux(packet)
+    container.close()
+    return buf.getvalue()
+
+
+def main() -> int:
+    check_prefetch_take()
+    check_cancel_prefetched()
+    check_timeout_and_errors()
+    check_decoder_incremental()
+    check_decoder_pyav()
+    failed = _results.count(False)
+    color = GREEN if not failed else RED
+    print(f"\n{color}{len(_results) - failed} OK, {failed} Fehl{RESET}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,7 +12,7 @@ import re
 import sys
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from core.mechanics import MechanicsEngine
+from core.mechanics import load_treasure_tables
 
 # ── Kategorie → Unterverzeichnis Mapping ────────────────────────────────
 CATEGORY_DIRS = {
@@ -370,9 +370,10 @@ def main():
     base = os.path.join("data", "lore", "add_2e", "items")
     counts = {}
     total = 0
+    treasure = load_treasure_tables()
 
     # ── Magische Gegenstaende ────────────────────────────────────────
-    for category, items in MechanicsEngine._MAGIC_ITEM_SUBTABLES.items():
+    for category, items in treasure.magic_items.items():
         dir_name = CATEGORY_DIRS.get(category, "misc")
         out_dir = os.path.join(base, dir_name)
         os.makedirs(out_dir, exist_ok=True)
@@ -388,7 +389,7 @@ def main():
     gem_dir = os.path.join(base, "gems")
     os.makedirs(gem_dir, exist_ok=True)
     gem_count = 0
-    for _, base_value, tier, examples in MechanicsEngine._GEM_VALUE_TABLE:
+    for base_value, tier, examples in treasure.gems:
         for gem_name in examples:
             generate_gem(gem_name, tier, base_value, gem_dir)
             gem_count += 1
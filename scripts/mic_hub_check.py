@@ -0,0 +1,253 @@
+"""
+scripts/mic_hub_check.py — Offline-Check fuer audio/mic_hub.py
+
+Prueft MicCaptureHub ohne Mikrofon und ohne Silero:
+
+  - FakeVad ersetzt das Modell und zaehlt probs()-Aufrufe und Bloecke.
+  - Bloecke werden direkt ueber den PortAudio-Callback (_callback) in den
+    Ring geschrieben; der Hub-Thread (_run) laeuft erst danach an und
+    arbeitet den Rueckstau ab. So ist auch ein Ueberlauf reproduzierbar.
+  - Jeder Sprach-Block ist ein Gleichwert 0.1 + index * 1e-4 — hoch genug
+    fuer den Vorfilter, und aus samples[0] laesst sich der Block ablesen.
+
+Geprueft: Fan-out an Queue- und Callback-Abonnenten mit einer VAD-Inferenz
+pro Stapel, kein VAD ohne Abonnenten, Vorfilter mit Nachlauf, volle Queue
+(aeltester faellt, dropped zaehlt), Ueberlauf des Rings, wartende Bloecke
+nach Ring-Umlauf unveraendert, close() beendet get().
+
+Starten:  python scripts/mic_hub_check.py
+Exit-Code 0 wenn alle Checks bestehen.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+
+# Projekt-Root in sys.path
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+_PROJECT_ROOT = os.path.dirname(_SCRIPT_DIR)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
+
+from audio.mic_hub import CHUNK_SIZE, RING_BLOCKS, MicCaptureHub
+from audio.vad import HANGOVER_BLOCKS, SileroVad
+
+GREEN = "\033[92m"
+RED = "\033[91m"
+RESET = "\033[0m"
+
+SPEECH_PROB = 0.9
+
+_results: list[bool] = []
+
+
+def _check(name: str, passed: bool, detail: str = "") -> None:
+    _results.append(passed)
+    mark = f"{GREEN}OK  {RESET}" if passed else f"{RED}FAIL{RESET}"
+    print(f"  {mark} {name}" + (f"  ({detail})" if detail else ""))
+
+
+# ---------------------------------------------------------------------------
+# Lokaler Ersatz fuer Silero und das Mikrofon
+# ---------------------------------------------------------------------------
+
+class FakeVad(SileroVad):
+    """Konstante Sprach-Konfidenz; merkt sich die Stapelgroessen."""
+
+    backend = "fake"
+
+    def __init__(self) -> None:
+        self.batches: list[int] = []
+
+    def probs(self, blocks: np.ndarray) -> np.ndarray:
+        self.batches.append(len(blocks))
+        return np.full(len(blocks), SPEECH_PROB, dtype=np.float32)
+
+
+def _value(index: int) -> np.float32:
+    return np.float32(0.1 + index * 1e-4)
+
+
+def _feed(hub: MicCaptureHub, count: int, silent: bool = False) -> None:
+    """Schreibt count Bloecke wie der PortAudio-Callback (indata (512, 1))."""
+    for _ in range(count):
+        value = 0.0 if silent else _value(hub._written)
+        indata = np.full((CHUNK_SIZE, 1), value, dtype=np.float32)
+        hub._callback(indata, CHUNK_SIZE, None, None)
+
+
+def _drain(hub: MicCaptureHub) -> None:
+    """Laesst den Hub-Thread den Rueckstau abarbeiten und haelt ihn wieder an."""
+    hub._running = True
+    thread = threading.Thread(target=hub._run, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 2.0
+    while hub._read < hub._written and time.monotonic() < deadline:
+        time.sleep(0.005)
+    hub._running = False
+    hub._wake.set()
+    thread.join(timeout=1.0)
+
+
+def _queued(sub) -> list:
+    blocks = []
+    while True:
+        block = sub.get(timeout=0)
+        if block is None:
+            return blocks
+        blocks.append(block)
+
+
+def _intact(block) -> bool:
+    return bool(np.all(block.samples == _value(block.index)))
+
+
+# ---------------------------------------------------------------------------
+# Checks
+# ---------------------------------------------------------------------------
+
+def check_fan_out() -> None:
+    print("\n[Fan-out]")
+    vad = FakeVad()
+    hub = MicCaptureHub(vad)
+    sub = hub.subscribe()
+    seen = []
+    hub.subscribe(callback=seen.append)
+    _feed(hub, 10)
+    _drain(hub)
+    queued = _queued(sub)
+    _check("Queue erhaelt alle Bloecke in Reihenfolge",
+           [b.index for b in queued] == list(range(10)), f"{len(queued)} Bloecke")
+    _check("Callback erhaelt dieselben Bloecke",
+           len(seen) == 10 and all(a is b for a, b in zip(seen, queued)))
+    _check("eine VAD-Inferenz fuer den ganzen Stapel", vad.batches == [10], f"{vad.batches}")
+    _check("VAD-Wert und RMS im Block",
+           all(abs(b.vad - SPEECH_PROB) < 1e-6 and abs(b.rms - _value(b.index)) < 1e-6
+               for b in queued))
+    _check("Samples gehoeren zum Block", all(_intact(b) for b in queued))
+
+
+def check_no_subscribers() -> None:
+    print("\n[ohne Abonnenten]")
+    vad = FakeVad()
+    hub = MicCaptureHub(vad)
+    _feed(hub, 10)
+    _drain(hub)
+    stats = hub.stats()
+    _check("kein VAD-Aufruf", not vad.batches, f"{vad.batches}")
+    _check("Rueckstau trotzdem abgebaut", stats["blocks"] == 10 and stats["vad_blocks"] == 0,
+           f"{stats}")
+
+
+def check_gate() -> None:
+    print("\n[Vorfilter]")
+    vad = FakeVad()
+    hub = MicCaptureHub(vad)
+    sub = hub.subscribe()
+    _feed(hub, 5)
+    _feed(hub, 20, silent=True)
+    _drain(hub)
+    queued = _queued(sub)
+    open_blocks = 5 + HANGOVER_BLOCKS
+    _check("Stille nach dem Nachlauf nicht an Silero",
+           sum(vad.batches) == open_blocks, f"{sum(vad.batches)} von {len(queued)}")
+    _check("verworfene Bloecke mit vad 0.0",
+           all(b.vad == 0.0 for b in queued[open_blocks:])
+           and all(b.vad > 0.0 for b in queued[:open_blocks]))
+    stats = hub.stats()
+    _check("Statistik passt", stats["vad_blocks"] == open_blocks
+           and stats["gated_blocks"] == 25 - open_blocks, f"{stats}")
+
+
+def check_queue_full() -> None:
+    print("\n[volle Queue]")
+    hub = MicCaptureHub(FakeVad())
+    sub = hub.subscribe(maxsize=4)
+    _feed(hub, 10)
+    _drain(hub)
+    queued = _queued(sub)
+    _check("aelteste Bloecke fallen heraus",
+           [b.index for b in queued] == [6, 7, 8, 9], f"{[b.index for b in queued]}")
+    _check("dropped zaehlt", sub.dropped == 6, f"{sub.dropped}")
+
+
+def check_overrun() -> None:
+    print("\n[Ueberlauf des Rings]")
+    hub = MicCaptureHub(FakeVad())
+    sub = hub.subscribe(maxsize=1000)
+    total = RING_BLOCKS + 40
+    _feed(hub, total)
+    _drain(hub)
+    queued = _queued(sub)
+    skipped = total - RING_BLOCKS // 2
+    _check("overruns zaehlt die uebersprungenen Bloecke", hub.overruns == skipped,
+           f"{hub.overruns}")
+    _check("Verarbeitung springt zum noch gueltigen Teil",
+           [b.index for b in queued] == list(range(skipped, total)),
+           f"ab {queued[0].index if queued else '-'}")
+    _check("Samples der uebrigen Bloecke stimmen", all(_intact(b) for b in queued))
+    _check("stats() meldet den Ueberlauf", hub.stats()["overruns"] == skipped)
+
+
+def check_ring_wrap() -> None:
+    print("\n[wartende Bloecke nach Ring-Umlauf]")
+    hub = MicCaptureHub(FakeVad())
+    sub = hub.subscribe(maxsize=RING_BLOCKS)
+    _feed(hub, 32)
+    _drain(hub)
+    # Abonnent hat noch nicht gelesen, der Callback schreibt weiter und
+    # ueberholt die Ring-Slots der wartenden Bloecke (noch kein Ueberlauf)
+    ahead = RING_BLOCKS - 16
+    _feed(hub, ahead)
+    early = _queued(sub)
+    _check("fruehe Bloecke nicht ueberschrieben",
+           len(early) == 32 and all(_intact(b) for b in early),
+           f"Block 0: {early[0].samples[0]:.4f}" if early else "")
+    _check("Samples read-only", all(not b.samples.flags.writeable for b in early))
+    _drain(hub)
+    late = _queued(sub)
+    _check("Rest ohne Ueberlauf nachgeliefert",
+           len(late) == ahead and hub.overruns == 0 and all(_intact(b) for b in late),
+           f"{len(late)} Bloecke")
+
+
+def check_close() -> None:
+    print("\n[close]")
+    hub = MicCaptureHub(FakeVad())
+    sub = hub.subscribe()
+    ended: list = []
+
+    def reader() -> None:
+        ended.append(sub.get(timeout=5.0))
+
+    thread = threading.Thread(target=reader, daemon=True)
+    thread.start()
+    time.sleep(0.05)
+    t0 = time.monotonic()
+    hub.close()
+    thread.join(timeout=2.0)
+    _check("get() endet mit None", ended == [None] and time.monotonic() - t0 < 1.0)
+    _check("Abonnement geschlossen", sub.closed and not hub._subs)
+
+
+def main() -> int:
+    check_fan_out()
+    check_no_subscribers()
+    check_gate()
+    check_queue_full()
+    check_overrun()
+    check_ring_wrap()
+    check_close()
+    failed = _results.count(False)
+    color = GREEN if not failed else RED
+    print(f"\n{color}{len(_results) - failed} OK, {failed} Fehl{RESET}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
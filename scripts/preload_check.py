@@ -0,0 +1,211 @@
+"""
+scripts/preload_check.py — Offline-Check fuer audio/preload.py
+
+Prueft ohne Modelle und ohne Audio-Hardware:
+
+  - ModelLRU mit Platzhalter-Objekten und geschaetzten Groessen:
+    Verdraengungs-Reihenfolge (LRU, get() frischt auf), Byte-Buchhaltung
+    beim Ersetzen, der zuletzt eingefuegte Eintrag bleibt immer (auch ueber
+    dem Limit), full-Schwelle.
+  - preload_roles: Reihenfolge Erzaehler, Keeper, Party, VOICE_PRELOAD_ROLES;
+    Duplikate nur einmal, "all" expandiert auf VOICE_REGISTRY.
+  - VoicePreloader mit Fake-STT/TTS: Events audio.preload und
+    audio.voice_ready, fehlgeschlagener Job blockiert die Bereitschaft nicht.
+
+Starten:  python scripts/preload_check.py
+Exit-Code 0 wenn alle Checks bestehen.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from typing import Any
+
+# Projekt-Root in sys.path
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+_PROJECT_ROOT = os.path.dirname(_SCRIPT_DIR)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
+
+import audio.preload as preload
+from audio.preload import ModelLRU, VoicePreloader, preload_roles
+from audio.tts_handler import DEFAULT_VOICE, VOICE_REGISTRY
+from core.event_bus import EventBus
+
+GREEN = "\033[92m"
+RED = "\033[91m"
+RESET = "\033[0m"
+
+MB = 1_000_000
+
+_results: list[bool] = []
+
+
+def _check(name: str, passed: bool, detail: str = "") -> None:
+    _results.append(passed)
+    mark = f"{GREEN}OK  {RESET}" if passed else f"{RED}FAIL{RESET}"
+    print(f"  {mark} {name}" + (f"  ({detail})" if detail else ""))
+
+
+def _roles(extra: str, *args: Any) -> list[str]:
+    """preload_roles mit gesetztem VOICE_PRELOAD_ROLES."""
+    saved = preload.VOICE_PRELOAD_ROLES
+    preload.VOICE_PRELOAD_ROLES = extra
+    try:
+        return preload_roles(*args)
+    finally:
+        preload.VOICE_PRELOAD_ROLES = saved
+
+
+# ---------------------------------------------------------------------------
+# Checks
+# ---------------------------------------------------------------------------
+
+def check_lru_order() -> None:
+    print("\n[ModelLRU Verdraengung]")
+    lru = ModelLRU(max_bytes=100 * MB)
+    for key in ("a", "b", "c"):
+        lru.put(key, object(), 30 * MB)
+    _check("unter dem Limit nichts verdraengt",
+           lru.stats()["models"] == ["a", "b", "c"] and lru.evictions == 0)
+    lru.put("d", object(), 30 * MB)
+    _check("aeltester Eintrag faellt zuerst", lru.stats()["models"] == ["b", "c", "d"]
+           and "a" not in lru and lru.get("a") is None, f"{lru.stats()['models']}")
+    lru.get("b")
+    lru.put("e", object(), 30 * MB)
+    _check("get() frischt auf: naechster ist c", lru.stats()["models"] == ["d", "b", "e"],
+           f"{lru.stats()['models']}")
+    lru.put("f", object(), 60 * MB)
+    stats = lru.stats()
+    _check("mehrere auf einmal, bis es passt", stats["models"] == ["e", "f"]
+           and stats["mb"] == 90.0 and lru.evictions == 4, f"{stats}")
+
+
+def check_lru_accounting() -> None:
+    print("\n[ModelLRU Buchhaltung]")
+    lru = ModelLRU(max_bytes=100 * MB)
+    first, second = object(), object()
+    lru.put("a", first, 40 * MB)
+    lru.put("a", second, 50 * MB)
+    stats = lru.stats()
+    _check("Ersetzen zaehlt nur die neue Groesse", stats["mb"] == 50.0
+           and stats["models"] == ["a"] and lru.get("a") is second, f"{stats}")
+    _check("nicht voll unter dem Limit", not lru.full)
+    lru.put("b", object(), 50 * MB)
+    _check("voll ab genau dem Limit", lru.full and lru.evictions == 0, f"{lru.stats()['mb']} MB")
+
+
+def check_lru_newest() -> None:
+    print("\n[ModelLRU neuester Eintrag]")
+    lru = ModelLRU(max_bytes=100 * MB)
+    lru.put("a", object(), 40 * MB)
+    lru.put("b", object(), 40 * MB)
+    big = object()
+    lru.put("big", big, 250 * MB)
+    stats = lru.stats()
+    _check("Modell ueber dem Limit bleibt nutzbar",
+           stats["models"] == ["big"] and lru.get("big") is big, f"{stats}")
+    _check("alle aelteren verdraengt", lru.evictions == 2 and lru.full)
+    lru.put("small", object(), 10 * MB)
+    _check("naechstes put verdraengt das grosse Modell",
+           lru.stats()["models"] == ["small"] and not lru.full, f"{lru.stats()}")
+    solo = ModelLRU(max_bytes=0)
+    solo.put("x", object(), 1)
+    _check("Limit 0: letzter Eintrag trotzdem da", "x" in solo and solo.evictions == 0)
+
+
+def check_roles() -> None:
+    print("\n[preload_roles]")
+    _check("ohne Konfiguration nur der Erzaehler", _roles("") == [DEFAULT_VOICE],
+           f"{_roles('')}")
+    keeper = {"voice": "scholar"}
+    party = [{"voice": "child"}, {"name": "ohne Stimme"}, "kein dict", {"voice": "noble"}]
+    roles = _roles("", keeper, party)
+    _check("Reihenfolge Erzaehler, Keeper, Party",
+           roles == [DEFAULT_VOICE, "scholar", "child", "noble"], f"{roles}")
+    party = [{"voice": "child"}, {"voice": DEFAULT_VOICE}, {"voice": "child"}]
+    roles = _roles(" merchant, ,child,scholar ", {"voice": DEFAULT_VOICE}, party)
+    _check("Duplikate nur einmal, erste Position zaehlt",
+           roles == [DEFAULT_VOICE, "child", "merchant", "scholar"], f"{roles}")
+    roles = _roles("merchant,all", {"voice": "noble"}, [{"voice": "child"}])
+    _check('"all" expandiert auf VOICE_REGISTRY',
+           sorted(roles) == sorted(VOICE_REGISTRY) and len(roles) == len(set(roles)),
+           f"{len(roles)} von {len(VOICE_REGISTRY)}")
+    _check('"all": Konfigurierte zuerst', roles[:3] == [DEFAULT_VOICE, "noble", "child"],
+           f"{roles[:3]}")
+    roles = _roles("unbekannt", None, None)
+    _check("unbekannte Rolle bleibt fuer TTSHandler", roles == [DEFAULT_VOICE, "unbekannt"])
+
+
+class _FakeStt:
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+
+    def preload(self) -> bool:
+        if self.fail:
+            raise RuntimeError("fake stt failure")
+        return True
+
+
+class _FakeTts:
+    def __init__(self) -> None:
+        self.roles: list[str] = []
+
+    def preload(self, roles: list[str]) -> list[str]:
+        self.roles = list(roles)
+        return [f"voice-{r}" for r in roles]
+
+
+def _run_preloader(stt: _FakeStt, tts: _FakeTts, roles: list[str]) -> tuple[VoicePreloader, list]:
+    EventBus.reset()
+    events: list[tuple[str, dict]] = []
+    bus = EventBus.get()
+    bus.on("audio.preload", lambda d: events.append(("preload", dict(d))))
+    bus.on("audio.voice_ready", lambda d: events.append(("voice_ready", dict(d))))
+    loader = VoicePreloader(stt, tts, roles)
+    loader.start()
+    # wait() endet schon bei _done.set(); voice_ready kommt direkt danach
+    for thread in loader._threads:
+        thread.join(timeout=5.0)
+    return loader, events
+
+
+def check_preloader() -> None:
+    print("\n[VoicePreloader]")
+    tts = _FakeTts()
+    loader, events = _run_preloader(_FakeStt(), tts, ["keeper", "child"])
+    status = sorted((d["component"], d["status"]) for e, d in events if e == "preload")
+    _check("loading und ready je Komponente", status == [
+        ("stt", "loading"), ("stt", "ready"), ("tts", "loading"), ("tts", "ready")],
+        f"{status}")
+    ready = [d for e, d in events if e == "voice_ready"]
+    _check("voice_ready genau einmal, zuletzt",
+           len(ready) == 1 and events[-1][0] == "voice_ready" and loader.ready)
+    _check("Rollen an TTS, Stimmen zurueck",
+           tts.roles == ["keeper", "child"] and bool(ready)
+           and ready[0]["voices"] == ["voice-keeper", "voice-child"] and ready[0]["stt"])
+
+    loader, events = _run_preloader(_FakeStt(fail=True), _FakeTts(), ["keeper"])
+    failed = [d for e, d in events if e == "preload" and d["status"] == "failed"]
+    ready = [d for e, d in events if e == "voice_ready"]
+    _check("STT-Fehler: failed-Event, trotzdem bereit",
+           [d["component"] for d in failed] == ["stt"] and loader.ready
+           and bool(ready) and not ready[0]["stt"] and ready[0]["tts"], f"{ready}")
+    EventBus.reset()
+
+
+def main() -> int:
+    check_lru_order()
+    check_lru_accounting()
+    check_lru_newest()
+    check_roles()
+    check_preloader()
+    failed = _results.count(False)
+    color = GREEN if not failed else RED
+    print(f"\n{color}{len(_results) - failed} OK, {failed} Fehl{RESET}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,6 +10,7 @@ Verwendung:
   py -3 scripts/rules_tester.py status [--last N]
   py -3 scripts/rules_tester.py report --run-id N [--failures]
   py -3 scripts/rules_tester.py trends [--days N] [--regressions]
+  py -3 scripts/rules_tester.py balance --adventure crawltraining_stress --party add_stress_party
 """
 
 from __future__ import annotations
@@ -18,7 +19,6 @@ import argparse
 import json
 import math
 import os
-import random
 import socket
 import sqlite3
 import subprocess
@@ -31,6 +31,8 @@ from typing import Any
 # Projektpfad eintragen
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from core.dice_rng import ScriptedRNG, SeededRNG
+
 # ---------------------------------------------------------------------------
 # Pfade & Konstanten
 # ---------------------------------------------------------------------------
@@ -242,10 +244,15 @@ def _make_mechanics(seed: int | None = None):
     ruleset = _load_ruleset()
     dice_config = ModuleLoader.get_dice_config(ruleset)
     tables = _load_tables()
-    mech = MechanicsEngine(dice_config, tables)
-    # Deterministischen RNG injizieren
-    mech.rng = random.Random(seed if seed is not None else _seed)
-    return mech
+    # Deterministischer RNG statt CSPRNG
+    return MechanicsEngine(dice_config, tables,
+                           rng=SeededRNG(seed if seed is not None else _seed))
+
+
+def _make_simulator(seed: int | None = None):
+    from core.combat_sim import CombatSimulator
+    seed = seed if seed is not None else _seed
+    return CombatSimulator(_make_mechanics(seed), seed=seed)
 
 
 def _make_rules_engine():
@@ -271,81 +278,75 @@ def test_attack_roll(mech) -> None:
     print(f"\n{BOLD}{CYAN}[{group}]{RESET}")
 
     # Nat20 trifft immer — egal welche AC / THAC0
-    mech.rng = random.Random(None)
-    # Wir forcieren den RNG-Wert durch Subklasse
-    class _ForcedRNG:
-        def __init__(self, val): self._val = val
-        def randint(self, a, b): return self._val
-
-    mech.rng = _ForcedRNG(20)
+    mech.rng = ScriptedRNG([20])
     r = mech.attack_roll(thac0=20, target_ac=10)
     _record(group, "nat20_trifft_immer_ac10", r.is_success and r.success_level == "critical",
             {"thac0": 20, "ac": 10, "forced_roll": 20}, True, r.is_success)
 
-    mech.rng = _ForcedRNG(20)
+    mech.rng = ScriptedRNG([20])
     r = mech.attack_roll(thac0=20, target_ac=-5)
     _record(group, "nat20_trifft_immer_ac_minus5", r.is_success,
             {"thac0": 20, "ac": -5, "forced_roll": 20}, True, r.is_success)
 
-    mech.rng = _ForcedRNG(20)
+    mech.rng = ScriptedRNG([20])
     r = mech.attack_roll(thac0=1, target_ac=-10)
     _record(group, "nat20_trifft_immer_beste_ruestung", r.is_success,
             {"thac0": 1, "ac": -10, "forced_roll": 20}, True, r.is_success)
 
     # Nat1 verfehlt immer
-    mech.rng = _ForcedRNG(1)
+    mech.rng = ScriptedRNG([1])
     r = mech.attack_roll(thac0=1, target_ac=10)
     _record(group, "nat1_verfehlt_immer_ac10", not r.is_success and r.success_level == "fumble",
             {"thac0": 1, "ac": 10, "forced_roll": 1}, False, r.is_success)
 
-    mech.rng = _ForcedRNG(1)
+    mech.rng = ScriptedRNG([1])
     r = mech.attack_roll(thac0=1, target_ac=-10)
     _record(group, "nat1_verfehlt_immer_ac_minus10", not r.is_success,
             {"thac0": 1, "ac": -10, "forced_roll": 1}, False, r.is_success)
 
     # Normaler Treffer: thac0=15, ac=5, benoetigt=10, wurf=12 -> Treffer
-    mech.rng = _ForcedRNG(12)
+    mech.rng = ScriptedRNG([12])
     r = mech.attack_roll(thac0=15, target_ac=5)
     _record(group, "normaler_treffer_thac0_15_ac_5", r.is_success,
             {"thac0": 15, "ac": 5, "needed": 10, "roll": 12}, True, r.is_success)
 
     # Normaler Fehlschlag: benoetigt=10, wurf=8 -> Fehlschlag
-    mech.rng = _ForcedRNG(8)
+    mech.rng = ScriptedRNG([8])
     r = mech.attack_roll(thac0=15, target_ac=5)
     _record(group, "normaler_fehlschlag_roll_8", not r.is_success,
             {"thac0": 15, "ac": 5, "needed": 10, "roll": 8}, False, r.is_success)
 
     # Grenzfall: genau benoetigt (roll == needed) -> Treffer
-    mech.rng = _ForcedRNG(10)
+    mech.rng = ScriptedRNG([10])
     r = mech.attack_roll(thac0=15, target_ac=5)
     _record(group, "treffer_bei_exakt_benoetigt", r.is_success,
             {"thac0": 15, "ac": 5, "needed": 10, "roll": 10}, True, r.is_success)
 
     # Grenzfall: ein unter benoetigt -> Fehlschlag
-    mech.rng = _ForcedRNG(9)
+    mech.rng = ScriptedRNG([9])
     r = mech.attack_roll(thac0=15, target_ac=5)
     _record(group, "fehlschlag_eins_unter_benoetigt", not r.is_success,
             {"thac0": 15, "ac": 5, "needed": 10, "roll": 9}, False, r.is_success)
 
     # Modifikator +2: roll=8+2=10 gegen benoetigt=10 -> Treffer
-    mech.rng = _ForcedRNG(8)
+    mech.rng = ScriptedRNG([8])
     r = mech.attack_roll(thac0=15, target_ac=5, modifiers=2)
     _record(group, "modifikator_plus2_trifft", r.is_success,
             {"thac0": 15, "ac": 5, "needed": 10, "roll": 8, "mod": 2}, True, r.is_success)
 
     # Modifikator -3: roll=12-3=9 gegen benoetigt=10 -> Fehlschlag
-    mech.rng = _ForcedRNG(12)
+    mech.rng = ScriptedRNG([12])
     r = mech.attack_roll(thac0=15, target_ac=5, modifiers=-3)
     _record(group, "modifikator_minus3_verfehlt", not r.is_success,
             {"thac0": 15, "ac": 5, "needed": 10, "roll": 12, "mod": -3}, False, r.is_success)
 
     # Schwieriger Gegner: THAC0=20, AC=-5, benoetigt=25 -> nur nat20 trifft
-    mech.rng = _ForcedRNG(19)
+    mech.rng = ScriptedRNG([19])
     r = mech.attack_roll(thac0=20, target_ac=-5)
     _record(group, "fast_untreffbares_ziel_roll19", not r.is_success,
             {"thac0": 20, "ac": -5, "needed": 25, "roll": 19}, False, r.is_success)
 
-    mech.rng = _ForcedRNG(20)
+    mech.rng = ScriptedRNG([20])
     r = mech.attack_roll(thac0=20, target_ac=-5)
     _record(group, "fast_untreffbares_ziel_nat20", r.is_success,
             {"thac0": 20, "ac": -5, "needed": 25, "roll": 20}, True, r.is_success)
@@ -359,7 +360,7 @@ def test_attack_roll(mech) -> None:
         (15, -3, 18, True),  # benoetigt=18, roll=18 -> Treffer
         (15, -3, 17, False), # benoetigt=18, roll=17 -> Fehlschlag
     ]:
-        mech.rng = _ForcedRNG(roll)
+        mech.rng = ScriptedRNG([roll])
         r = mech.attack_roll(thac0=thac0, target_ac=ac)
         _record(group, f"thac0_{thac0}_ac_{ac}_roll_{roll}",
                 r.is_success == expected_hit,
@@ -367,7 +368,7 @@ def test_attack_roll(mech) -> None:
                 expected_hit, r.is_success)
 
     # RollResult Felder korrekt
-    mech.rng = _ForcedRNG(15)
+    mech.rng = ScriptedRNG([15])
     r = mech.attack_roll(thac0=18, target_ac=5)
     _record(group, "rollresult_hat_korrekte_felder",
             hasattr(r, "roll") and hasattr(r, "target") and
@@ -387,53 +388,50 @@ def test_saving_throw(mech) -> None:
     group = "mechanics.saving_throw"
     print(f"\n{BOLD}{CYAN}[{group}]{RESET}")
 
-    class _ForcedRNG:
-        def __init__(self, val): self._val = val
-        def randint(self, a, b): return self._val
 
     # Nat20 rettet immer
-    mech.rng = _ForcedRNG(20)
+    mech.rng = ScriptedRNG([20])
     r = mech.saving_throw(target=20)
     _record(group, "nat20_rettet_immer", r.is_success and r.success_level == "critical",
             {"target": 20, "roll": 20}, True, r.is_success)
 
-    mech.rng = _ForcedRNG(20)
+    mech.rng = ScriptedRNG([20])
     r = mech.saving_throw(target=19)
     _record(group, "nat20_rettet_bei_target_19", r.is_success,
             {"target": 19, "roll": 20}, True, r.is_success)
 
     # Nat1 scheitert immer
-    mech.rng = _ForcedRNG(1)
+    mech.rng = ScriptedRNG([1])
     r = mech.saving_throw(target=2)
     _record(group, "nat1_scheitert_immer", not r.is_success and r.success_level == "fumble",
             {"target": 2, "roll": 1}, False, r.is_success)
 
     # Roll-High: target=12, roll=14 -> Erfolg
-    mech.rng = _ForcedRNG(14)
+    mech.rng = ScriptedRNG([14])
     r = mech.saving_throw(target=12)
     _record(group, "roll_high_14_gegen_target_12", r.is_success,
             {"target": 12, "roll": 14}, True, r.is_success)
 
     # target=12, roll=11 -> Fehlschlag
-    mech.rng = _ForcedRNG(11)
+    mech.rng = ScriptedRNG([11])
     r = mech.saving_throw(target=12)
     _record(group, "roll_high_11_gegen_target_12", not r.is_success,
             {"target": 12, "roll": 11}, False, r.is_success)
 
     # Genau treffen: roll == target -> Erfolg
-    mech.rng = _ForcedRNG(12)
+    mech.rng = ScriptedRNG([12])
     r = mech.saving_throw(target=12)
     _record(group, "exakt_am_ziel_ist_erfolg", r.is_success,
             {"target": 12, "roll": 12}, True, r.is_success)
 
     # Modifikator +2: roll=10+2=12 gegen target=12 -> Erfolg
-    mech.rng = _ForcedRNG(10)
+    mech.rng = ScriptedRNG([10])
     r = mech.saving_throw(target=12, modifiers=2)
     _record(group, "modifikator_plus2_rettet", r.is_success,
             {"target": 12, "roll": 10, "mod": 2}, True, r.is_success)
 
     # Modifikator -2: roll=12-2=10 gegen target=12 -> Fehlschlag
-    mech.rng = _ForcedRNG(12)
+    mech.rng = ScriptedRNG([12])
     r = mech.saving_throw(target=12, modifiers=-2)
     _record(group, "modifikator_minus2_scheitert", not r.is_success,
             {"target": 12, "roll": 12, "mod": -2}, False, r.is_success)
@@ -447,14 +445,14 @@ def test_saving_throw(mech) -> None:
         (18, 19, True),
         (18, 17, False),
     ]:
-        mech.rng = _ForcedRNG(roll)
+        mech.rng = ScriptedRNG([roll])
         r = mech.saving_throw(target=target)
         _record(group, f"target_{target}_roll_{roll}",
                 r.is_success == expected,
                 {"target": target, "roll": roll}, expected, r.is_success)
 
     # Felder vorhanden
-    mech.rng = _ForcedRNG(12)
+    mech.rng = ScriptedRNG([12])
     r = mech.saving_throw(target=12)
     _record(group, "rollresult_hat_success_level",
             r.success_level in ("critical", "regular", "failure", "fumble"),
@@ -469,63 +467,54 @@ def test_morale_check(mech) -> None:
     group = "mechanics.morale_check"
     print(f"\n{BOLD}{CYAN}[{group}]{RESET}")
 
-    class _ForcedDiceRNG:
-        """Gibt vorgegebene Wuerfelwerte der Reihe nach zurueck."""
-        def __init__(self, values):
-            self._vals = list(values)
-            self._idx = 0
-        def randint(self, a, b):
-            v = self._vals[self._idx % len(self._vals)]
-            self._idx += 1
-            return v
 
     # 2d6 <= moral -> bleibt; 2d6 > moral -> flieht
     # moral=8: roll=3+3=6 <= 8 -> bleibt
-    mech.rng = _ForcedDiceRNG([3, 3])
+    mech.rng = ScriptedRNG([3, 3])
     r = mech.morale_check(morale_value=8)
     _record(group, "morale8_roll6_bleibt", r.is_success,
             {"morale": 8, "dice": [3, 3], "total": 6}, True, r.is_success)
 
     # moral=8: roll=5+5=10 > 8 -> flieht
-    mech.rng = _ForcedDiceRNG([5, 5])
+    mech.rng = ScriptedRNG([5, 5])
     r = mech.morale_check(morale_value=8)
     _record(group, "morale8_roll10_flieht", not r.is_success,
             {"morale": 8, "dice": [5, 5], "total": 10}, False, r.is_success)
 
     # Genau am Moralwert: roll == moral -> bleibt
-    mech.rng = _ForcedDiceRNG([4, 4])
+    mech.rng = ScriptedRNG([4, 4])
     r = mech.morale_check(morale_value=8)
     _record(group, "morale8_roll8_bleibt", r.is_success,
             {"morale": 8, "dice": [4, 4], "total": 8}, True, r.is_success)
 
     # Klemmen: morale_value=25 wird auf 20 geklemmt
-    mech.rng = _ForcedDiceRNG([6, 6])
+    mech.rng = ScriptedRNG([6, 6])
     r = mech.morale_check(morale_value=25)
     _record(group, "morale_wert_geklemmt_auf_20",
             r.target <= 20,
             {"morale_input": 25}, "<=20", r.target)
 
     # Klemmen unten: morale_value=-5 wird auf 2 geklemmt
-    mech.rng = _ForcedDiceRNG([1, 1])
+    mech.rng = ScriptedRNG([1, 1])
     r = mech.morale_check(morale_value=-5)
     _record(group, "morale_wert_geklemmt_auf_2",
             r.target >= 2,
             {"morale_input": -5}, ">=2", r.target)
 
     # Modifikator: morale=7, mod=+2 -> effective=9
-    mech.rng = _ForcedDiceRNG([4, 5])
+    mech.rng = ScriptedRNG([4, 5])
     r = mech.morale_check(morale_value=7, modifiers=2)
     _record(group, "modifikator_plus2_effective_9", r.target == 9,
             {"morale": 7, "mod": 2}, 9, r.target)
 
     # Modifikator: morale=10, mod=-3 -> effective=7, roll=4+4=8 > 7 -> flieht
-    mech.rng = _ForcedDiceRNG([4, 4])
+    mech.rng = ScriptedRNG([4, 4])
     r = mech.morale_check(morale_value=10, modifiers=-3)
     _record(group, "modifikator_minus3_flieht", not r.is_success,
             {"morale": 10, "mod": -3, "dice": [4, 4]}, False, r.is_success)
 
     # raw_rolls hat 2 Eintraege (2d6)
-    mech.rng = _ForcedDiceRNG([3, 4])
+    mech.rng = ScriptedRNG([3, 4])
     r = mech.morale_check(morale_value=10)
     _record(group, "raw_rolls_hat_2_eintraege", len(r.raw_rolls) == 2,
             None, 2, len(r.raw_rolls))
@@ -544,66 +533,58 @@ def test_reaction_roll(mech) -> None:
     group = "mechanics.reaction_roll"
     print(f"\n{BOLD}{CYAN}[{group}]{RESET}")
 
-    class _ForcedDiceRNG:
-        def __init__(self, values):
-            self._vals = list(values)
-            self._idx = 0
-        def randint(self, a, b):
-            v = self._vals[self._idx % len(self._vals)]
-            self._idx += 1
-            return v
 
     # Schluessel im Ergebnis-Dict
-    mech.rng = _ForcedDiceRNG([3, 3])
+    mech.rng = ScriptedRNG([3, 3])
     r = mech.reaction_roll()
     _record(group, "ergebnis_hat_alle_schluessel",
             all(k in r for k in ("roll", "modified_roll", "reaction_level", "description")),
             None, True, list(r.keys()))
 
     # Reaktionslevel-Mapping: modified_roll <= 2 -> hostile_attack
-    mech.rng = _ForcedDiceRNG([1, 1])
+    mech.rng = ScriptedRNG([1, 1])
     r = mech.reaction_roll(cha_modifier=0)
     _record(group, "roll2_ist_hostile_attack", r["reaction_level"] == "hostile_attack",
             {"dice": [1, 1], "total": 2}, "hostile_attack", r["reaction_level"])
 
     # modified_roll 3-5 -> hostile
-    mech.rng = _ForcedDiceRNG([2, 2])  # =4
+    mech.rng = ScriptedRNG([2, 2])  # =4
     r = mech.reaction_roll(cha_modifier=0)
     _record(group, "roll4_ist_hostile", r["reaction_level"] == "hostile",
             {"dice": [2, 2], "total": 4}, "hostile", r["reaction_level"])
 
     # modified_roll 6-8 -> neutral
-    mech.rng = _ForcedDiceRNG([3, 4])  # =7
+    mech.rng = ScriptedRNG([3, 4])  # =7
     r = mech.reaction_roll(cha_modifier=0)
     _record(group, "roll7_ist_neutral", r["reaction_level"] == "neutral",
             {"dice": [3, 4], "total": 7}, "neutral", r["reaction_level"])
 
     # modified_roll 9-11 -> friendly
-    mech.rng = _ForcedDiceRNG([5, 5])  # =10
+    mech.rng = ScriptedRNG([5, 5])  # =10
     r = mech.reaction_roll(cha_modifier=0)
     _record(group, "roll10_ist_friendly", r["reaction_level"] == "friendly",
             {"dice": [5, 5], "total": 10}, "friendly", r["reaction_level"])
 
     # modified_roll >= 12 -> enthusiastic
-    mech.rng = _ForcedDiceRNG([6, 6])  # =12
+    mech.rng = ScriptedRNG([6, 6])  # =12
     r = mech.reaction_roll(cha_modifier=0)
     _record(group, "roll12_ist_enthusiastic", r["reaction_level"] == "enthusiastic",
             {"dice": [6, 6], "total": 12}, "enthusiastic", r["reaction_level"])
 
     # CHA-Modifikator verschiebt das Ergebnis
-    mech.rng = _ForcedDiceRNG([2, 2])  # raw=4
+    mech.rng = ScriptedRNG([2, 2])  # raw=4
     r = mech.reaction_roll(cha_modifier=5)  # modified=9 -> friendly
     _record(group, "cha_mod_plus5_verschiebt_auf_friendly", r["reaction_level"] == "friendly",
             {"dice": [2, 2], "raw": 4, "mod": 5, "modified": 9}, "friendly", r["reaction_level"])
 
     # Negativer Modifikator
-    mech.rng = _ForcedDiceRNG([4, 4])  # raw=8
+    mech.rng = ScriptedRNG([4, 4])  # raw=8
     r = mech.reaction_roll(cha_modifier=-5)  # modified=3 -> hostile
     _record(group, "cha_mod_minus5_verschiebt_auf_hostile", r["reaction_level"] == "hostile",
             {"dice": [4, 4], "raw": 8, "mod": -5, "modified": 3}, "hostile", r["reaction_level"])
 
     # modified_roll korrekt berechnet
-    mech.rng = _ForcedDiceRNG([3, 4])  # raw=7
+    mech.rng = ScriptedRNG([3, 4])  # raw=7
     r = mech.reaction_roll(cha_modifier=2)
     _record(group, "modified_roll_korrekt_berechnet", r["modified_roll"] == 9,
             {"raw": 7, "mod": 2}, 9, r["modified_roll"])
@@ -617,14 +598,6 @@ def test_turn_undead(mech) -> None:
     group = "mechanics.turn_undead"
     print(f"\n{BOLD}{CYAN}[{group}]{RESET}")
 
-    class _ForcedDiceRNG:
-        def __init__(self, values):
-            self._vals = list(values)
-            self._idx = 0
-        def randint(self, a, b):
-            v = self._vals[self._idx % len(self._vals)]
-            self._idx += 1
-            return v
 
     # Unmoeglich: L1 vs Wraith ("-")
     r = mech.turn_undead(cleric_level=1, undead_hd="wraith")
@@ -646,7 +619,7 @@ def test_turn_undead(mech) -> None:
 
     # Normaler Wurf noetig: L1 vs Skelett (Zielwert 10)
     # roll=10 >= 10 -> vertrieben
-    mech.rng = _ForcedDiceRNG([5, 5])
+    mech.rng = ScriptedRNG([5, 5])
     r = mech.turn_undead(cleric_level=1, undead_hd="skeleton")
     _record(group, "level1_vs_skeleton_roll10_vertrieben",
             r["success"] and r["result_type"] == "turned",
@@ -654,7 +627,7 @@ def test_turn_undead(mech) -> None:
             "turned", r["result_type"])
 
     # roll=9 < 10 -> fehlgeschlagen
-    mech.rng = _ForcedDiceRNG([4, 5])
+    mech.rng = ScriptedRNG([4, 5])
     r = mech.turn_undead(cleric_level=1, undead_hd="skeleton")
     _record(group, "level1_vs_skeleton_roll9_fehlgeschlagen",
             not r["success"] and r["result_type"] == "failed",
@@ -662,13 +635,13 @@ def test_turn_undead(mech) -> None:
             "failed", r["result_type"])
 
     # Numerische HD
-    mech.rng = _ForcedDiceRNG([5, 5])
+    mech.rng = ScriptedRNG([5, 5])
     r = mech.turn_undead(cleric_level=1, undead_hd=1)
     _record(group, "level1_vs_hd1_numerisch_verarbeitet",
             "result_type" in r, None, True, True)
 
     # Vampire: L5 vs vampire -> "20" noetig (aus Tabelle)
-    mech.rng = _ForcedDiceRNG([6, 6])  # =12 < 20 -> fehlgeschlagen
+    mech.rng = ScriptedRNG([6, 6])  # =12 < 20 -> fehlgeschlagen
     r = mech.turn_undead(cleric_level=5, undead_hd="vampire")
     _record(group, "level5_vs_vampire_roll12_fehlgeschlagen",
             not r["success"],
@@ -689,7 +662,7 @@ def test_turn_undead(mech) -> None:
             None, True, list(r.keys()))
 
     # Lich: L7 vs lich -> tabelle = 20
-    mech.rng = _ForcedDiceRNG([6, 6])  # =12 < 20
+    mech.rng = ScriptedRNG([6, 6])  # =12 < 20
     r = mech.turn_undead(cleric_level=7, undead_hd="lich")
     _record(group, "level7_vs_lich_benoetigt_20",
             r["target"] == 20 if r["target"] is not None else False,
@@ -718,8 +691,8 @@ def test_roll_treasure(mech) -> None:
     group = "mechanics.roll_treasure"
     print(f"\n{BOLD}{CYAN}[{group}]{RESET}")
 
-    # RNG zuruecksetzen — vorherige Tests koennen einen _ForcedDiceRNG ohne choice() hinterlassen
-    mech.rng = random.Random(_seed)
+    # RNG zuruecksetzen — vorherige Tests hinterlassen einen ScriptedRNG
+    mech.rng = SeededRNG(_seed)
 
     # Alle Typen A-Q muessen valide Ergebnisse liefern
     for t in ["A", "B", "C", "D", "E", "F", "G", "H", "I", "J", "K", "L", "M", "N", "O", "P", "Q"]:
@@ -746,7 +719,7 @@ def test_roll_treasure(mech) -> None:
 
 
 # ---------------------------------------------------------------------------
-# Gruppe: mechanics.roll_expression (~10 Tests)
+# Gruppe: mechanics.roll_expression (~35 Tests)
 # ---------------------------------------------------------------------------
 
 def test_roll_expression(mech) -> None:
@@ -761,34 +734,34 @@ def test_roll_expression(mech) -> None:
     _record(group, "feste_zahl_0", r == 0, {"expr": "0"}, 0, r)
 
     # 1d6: Ergebnis zwischen 1-6
-    mech.rng = random.Random(42)
+    mech.rng = SeededRNG(42)
     r = mech.roll_expression("1d6")
     _record(group, "1d6_im_bereich", 1 <= r <= 6, {"expr": "1d6"}, "1-6", r)
 
     # 2d4+2: Bereich 4-10
-    mech.rng = random.Random(42)
+    mech.rng = SeededRNG(42)
     r = mech.roll_expression("2d4+2")
     _record(group, "2d4plus2_im_bereich", 4 <= r <= 10, {"expr": "2d4+2"}, "4-10", r)
 
     # 1d8+1: Bereich 2-9
-    mech.rng = random.Random(42)
+    mech.rng = SeededRNG(42)
     r = mech.roll_expression("1d8+1")
     _record(group, "1d8plus1_im_bereich", 2 <= r <= 9, {"expr": "1d8+1"}, "2-9", r)
 
     # 1d20: Bereich 1-20
-    mech.rng = random.Random(42)
+    mech.rng = SeededRNG(42)
     r = mech.roll_expression("1d20")
     _record(group, "1d20_im_bereich", 1 <= r <= 20, {"expr": "1d20"}, "1-20", r)
 
     # 3d6: Bereich 3-18
-    mech.rng = random.Random(42)
+    mech.rng = SeededRNG(42)
     r = mech.roll_expression("3d6")
     _record(group, "3d6_im_bereich", 3 <= r <= 18, {"expr": "3d6"}, "3-18", r)
 
     # Deterministisch: gleicher Seed -> gleiches Ergebnis
-    mech.rng = random.Random(1234)
+    mech.rng = SeededRNG(1234)
     r1 = mech.roll_expression("2d6")
-    mech.rng = random.Random(1234)
+    mech.rng = SeededRNG(1234)
     r2 = mech.roll_expression("2d6")
     _record(group, "gleicher_seed_gleiche_ergebnis", r1 == r2,
             {"seed": 1234, "expr": "2d6"}, r1, r2)
@@ -797,6 +770,63 @@ def test_roll_expression(mech) -> None:
     r = mech.roll_expression("xyz")
     _record(group, "unbekannter_ausdruck_gibt_1", r == 1, {"expr": "xyz"}, 1, r)
 
+    # Vorzeichen: unaeres '+' ist neutral, unaeres '-' unveraendert
+    for expr, expected in [("+3", 3), ("-3", -3), ("+2*3", 6), ("-(2+1)", -3),
+                           ("1-+2", -1), ("2d4+-1", 1)]:
+        mech.rng = ScriptedRNG([1])
+        r = mech.roll_expression(expr)
+        _record(group, f"vorzeichen_{expr}", r == expected, {"expr": expr}, expected, r)
+
+    # Modifikatoren mit vorgegebenen Wuerfen (ScriptedRNG: exakte Summen)
+    scripted = [
+        ("4d6kh3", [2, 5, 1, 6], 13, "4d6kh3: [2, 5, (1), 6] = 13"),
+        ("4d6kl2", [2, 5, 1, 6], 3, "4d6kl2: [2, (5), 1, (6)] = 3"),
+        ("4d6dl1", [2, 5, 1, 6], 13, "4d6dl1: [2, 5, (1), 6] = 13"),
+        ("1d6!", [6, 6, 3], 15, "1d6!: [6!+6!+3] = 15"),
+        ("2d6!5", [5, 2, 1], 8, "2d6!5: [5!+1, 2] = 8"),
+        ("d%", [42], 42, "d%: [42] = 42"),
+        ("d%+5", [100], 105, "d%+5: [100]+5 = 105"),
+        ("4dF", [1, 2, 3, 3], 1, "4df: [-1, 0, 1, 1] = 1"),
+        ("4dF+5", [1, 1, 1, 1], 1, "4df+5: [-1, -1, -1, -1]+5 = 1"),
+    ]
+    for expr, rolls, expected, detail in scripted:
+        mech.rng = ScriptedRNG(rolls)
+        total, text = mech.roll_damage(expr)
+        _record(group, f"scripted_{expr}", total == expected and text == detail,
+                {"expr": expr, "wuerfe": rolls}, (expected, detail), (total, text))
+
+    # Seeded: Bereichsgrenzen ueber viele Wuerfe, Wiederholbarkeit je Seed
+    seeded = [("4d6kh3", 3, 18), ("4d6kl1", 1, 6), ("1d6!", 1, None),
+              ("d%", 1, 100), ("4dF", -4, 4), ("+1d4", 1, 4)]
+    for expr, lo, hi in seeded:
+        mech.rng = SeededRNG(_seed)
+        first = [mech.roll_expression(expr) for _ in range(500)]
+        mech.rng = SeededRNG(_seed)
+        again = [mech.roll_expression(expr) for _ in range(500)]
+        in_range = all(v >= lo and (hi is None or v <= hi) for v in first)
+        _record(group, f"seeded_{expr}_bereich_und_replay", in_range and first == again,
+                {"expr": expr, "seed": _seed, "n": 500}, f"{lo}..{hi if hi is not None else 'inf'}",
+                f"{min(first)}..{max(first)}")
+
+    # Explosion: ab 6 bei 1d6! kommt im Seed-Lauf mindestens ein Wert > 6 vor
+    mech.rng = SeededRNG(_seed)
+    values = [mech.roll_expression("1d6!") for _ in range(500)]
+    _record(group, "seeded_1d6!_explodiert", max(values) > 6,
+            {"expr": "1d6!", "seed": _seed}, "> 6", max(values))
+
+    # dF ist symmetrisch um 0 (Batch, NumPy optional)
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return
+    mech.rng = SeededRNG(_seed)
+    batch = mech.roll_expression_batch("4dF", 20000)
+    mean = float(batch.mean())
+    _record(group, "batch_4dF_mittel_nahe_0",
+            abs(mean) < 0.1 and int(batch.min()) >= -4 and int(batch.max()) <= 4,
+            {"expr": "4dF", "n": 20000}, "|mean| < 0.1, -4..4",
+            f"{mean:.3f}, {int(batch.min())}..{int(batch.max())}")
+
 
 # ---------------------------------------------------------------------------
 # Gruppe: mechanics.skill_check (~10 Tests)
@@ -806,40 +836,37 @@ def test_skill_check(mech) -> None:
     group = "mechanics.skill_check"
     print(f"\n{BOLD}{CYAN}[{group}]{RESET}")
 
-    class _ForcedRNG:
-        def __init__(self, val): self._val = val
-        def randint(self, a, b): return self._val
 
     # d100-Modus (target > dice_faces=20): target=65 (Prozent-Fertigkeit)
-    mech.rng = _ForcedRNG(50)
+    mech.rng = ScriptedRNG([50])
     r = mech.skill_check(target=65)
     _record(group, "d100_modus_roll50_gegen_65_erfolg", r.is_success,
             {"target": 65, "roll": 50}, True, r.is_success)
 
-    mech.rng = _ForcedRNG(70)
+    mech.rng = ScriptedRNG([70])
     r = mech.skill_check(target=65)
     _record(group, "d100_modus_roll70_gegen_65_fehlschlag", not r.is_success,
             {"target": 65, "roll": 70}, False, r.is_success)
 
     # d20-Modus (target <= 20): target=15
-    mech.rng = _ForcedRNG(14)
+    mech.rng = ScriptedRNG([14])
     r = mech.skill_check(target=15)
     _record(group, "d20_modus_roll14_gegen_15_erfolg", r.is_success,
             {"target": 15, "roll": 14}, True, r.is_success)
 
-    mech.rng = _ForcedRNG(16)
+    mech.rng = ScriptedRNG([16])
     r = mech.skill_check(target=15)
     _record(group, "d20_modus_roll16_gegen_15_fehlschlag", not r.is_success,
             {"target": 15, "roll": 16}, False, r.is_success)
 
     # Kritisch: d100, roll=1
-    mech.rng = _ForcedRNG(1)
+    mech.rng = ScriptedRNG([1])
     r = mech.skill_check(target=65)
     _record(group, "d100_roll1_kritisch", r.success_level == "critical",
             {"target": 65, "roll": 1}, "critical", r.success_level)
 
     # Patzer: d100, roll >= 96
-    mech.rng = _ForcedRNG(98)
+    mech.rng = ScriptedRNG([98])
     r = mech.skill_check(target=65)
     _record(group, "d100_roll98_patzer", r.success_level == "fumble",
             {"target": 65, "roll": 98}, "fumble", r.success_level)
@@ -936,23 +963,20 @@ def test_initiative_roll(mech) -> None:
 
     # Mehrere Rolls: Ergebnis immer >= 1
     for seed in range(5):
-        mech.rng = random.Random(seed * 100)
+        mech.rng = SeededRNG(seed * 100)
         r = mech.initiative_roll(0)
         _record(group, f"initiative_seed{seed}_gueltig",
                 isinstance(r, int),
                 {"seed": seed}, True, r)
 
     # Modifikator wird addiert
-    class _ForcedRNG:
-        def __init__(self, val): self._val = val
-        def randint(self, a, b): return self._val
 
-    mech.rng = _ForcedRNG(5)
+    mech.rng = ScriptedRNG([5])
     r = mech.initiative_roll(modifier=3)
     _record(group, "modifikator_3_addiert", r == 8,
             {"roll": 5, "mod": 3}, 8, r)
 
-    mech.rng = _ForcedRNG(5)
+    mech.rng = ScriptedRNG([5])
     r = mech.initiative_roll(modifier=-2)
     _record(group, "modifikator_minus2_subtrahiert", r == 3,
             {"roll": 5, "mod": -2}, 3, r)
@@ -1160,6 +1184,15 @@ def test_extract_combat_tags() -> None:
             len(r) == 2,
             {"text": text}, 2, len(r))
 
+    # Reihenfolge: Tags in Textreihenfolge, nicht nach Typ gruppiert
+    text = ("[ANGRIFF: Schwert | 15 | 8 | 0] [RETTUNGSWURF: Gift | 12] "
+            "[ANGRIFF: Axt | 14 | 6 | 0]")
+    r = extract_combat_tags(text)
+    order = [t for t, _ in r]
+    expected_order = ["ANGRIFF", "RETTUNGSWURF", "ANGRIFF"]
+    _record(group, "kampftags_textreihenfolge", order == expected_order,
+            {"text": text}, expected_order, order)
+
     # Negativer Modifikator
     text = "[ANGRIFF: Dolch | 18 | 7 | -2]"
     r = extract_combat_tags(text)
@@ -1528,6 +1561,646 @@ def test_combat_tracker() -> None:
             ct._combatants["goblin1"].hp == 7,
             {"hp_vorher": 6, "regen": 5, "hp_max": 7}, 7, ct._combatants["goblin1"].hp)
 
+    # Atemwaffe: Quelle im Kampf trifft die Gegenseite (ein Rettungswurf pro Ziel)
+    ct = _make_tracker_with_combatants()
+    res = ct.apply_breath_weapon("Goblin", 6, _make_mechanics(seed=7))
+    _record(group, "atemwaffe_npc_quelle_trifft_spielerseite",
+            [r["target_id"] for r in res] == ["player"] and res[0]["player"]
+            and res[0]["damage"] == (3 if res[0]["saved"] else 6),
+            {"quelle": "Goblin", "schaden": 6}, ["player"], [r["target_id"] for r in res])
+
+    # Atemwaffe: unbekannte Quelle ohne Ziele -> kein stiller Default
+    ct = _make_tracker_with_combatants()
+    res = ct.apply_breath_weapon("Feuerfalle", 6, _make_mechanics(seed=7))
+    _record(group, "atemwaffe_unbekannte_quelle_ohne_ziele_leer",
+            res == [] and ct._combatants["player"].hp == 15,
+            {"quelle": "Feuerfalle"}, [], res)
+
+    # Atemwaffe: unbekannte Quelle mit expliziten Zielen
+    ct = _make_tracker_with_combatants()
+    res = ct.apply_breath_weapon(
+        "Feuerfalle", 6, _make_mechanics(seed=7), targets=ct.living_ids(True),
+    )
+    _record(group, "atemwaffe_explizite_ziele",
+            [r["target_id"] for r in res] == ["player"]
+            and ct._combatants["goblin1"].hp == 7,
+            {"quelle": "Feuerfalle", "targets": ["player"]}, ["player"],
+            [r["target_id"] for r in res])
+
+
+# ---------------------------------------------------------------------------
+# Gruppe: name_resolver (~12 Tests)
+# ---------------------------------------------------------------------------
+
+def _resolve_linear(names: list[str], query: str) -> str | None:
+    """Referenz: lineare Suche wie vor dem NameResolver (exakt, dann Teilstring)."""
+    from core.name_resolver import normalize_name
+    key = normalize_name(query)
+    if not key:
+        return None
+    keys = [normalize_name(n) for n in names]
+    if key in keys:
+        return names[keys.index(key)]
+    for name, k in zip(names, keys):
+        if key in k or k in key:
+            return name
+    return None
+
+
+def test_name_resolver() -> None:
+    import random
+    from core.name_resolver import NameResolver
+    group = "name_resolver"
+    print(f"\n{BOLD}{CYAN}[{group}]{RESET}")
+
+    def _resolver(names, **kw):
+        return NameResolver(((n, n) for n in names), **kw)
+
+    names = ["Thorg der Starke", "Goblin", "Goblin-Haeuptling", "Elara"]
+    r = _resolver(names)
+
+    # Exakt: Gross-/Kleinschreibung und Whitespace egal
+    got = r.resolve("  thorg   DER starke ")
+    _record(group, "exakt_normalisiert", got == "Thorg der Starke",
+            {"query": "  thorg   DER starke "}, "Thorg der Starke", got)
+
+    # Anfrage in Name (Trigramm-Index)
+    got = r.resolve("thorg")
+    _record(group, "teilstring_anfrage_in_name", got == "Thorg der Starke",
+            {"query": "thorg"}, "Thorg der Starke", got)
+
+    # Name in Anfrage (Laengenfilter)
+    got = r.resolve("der fiese goblin")
+    _record(group, "teilstring_name_in_anfrage", got == "Goblin",
+            {"query": "der fiese goblin"}, "Goblin", got)
+
+    # Exakt schlaegt Teilstring, sonst gewinnt der frueher eingetragene Name
+    bows = _resolver(["Composite Long Bow", "Long Bow"])
+    got = (bows.resolve("long bow"), bows.resolve("bow"))
+    _record(group, "exakt_vor_teilstring_dann_reihenfolge",
+            got == ("Long Bow", "Composite Long Bow"),
+            {"queries": ["long bow", "bow"]}, ("Long Bow", "Composite Long Bow"), got)
+
+    # Kurze Anfrage ohne Trigramme
+    got = r.resolve("el")
+    _record(group, "kurze_anfrage_ohne_trigramme", got == "Elara",
+            {"query": "el"}, "Elara", got)
+
+    # Doppelter Schluessel: der erste gilt
+    dup = NameResolver([("Goblin", 1), ("goblin", 2)])
+    _record(group, "doppelter_name_erster_gewinnt", dup.resolve("GOBLIN") == 1,
+            {"entries": [("Goblin", 1), ("goblin", 2)]}, 1, dup.resolve("GOBLIN"))
+
+    # Fuzzy nur mit cutoff
+    plain, fuzzy = r.resolve("Elra"), _resolver(names, fuzzy_cutoff=0.5).resolve("Elra")
+    _record(group, "fuzzy_nur_mit_cutoff", plain is None and fuzzy == "Elara",
+            {"query": "Elra"}, (None, "Elara"), (plain, fuzzy))
+
+    # Ohne Teilstring-Suche nur exakt
+    exact_only = _resolver(names, substring=False)
+    got = exact_only.resolve("thorg")
+    _record(group, "substring_aus_nur_exakt", got is None,
+            {"query": "thorg", "substring": False}, None, got)
+
+    # Gecachter Fehlschlag wird durch add() verworfen
+    r = _resolver(names)
+    before = r.resolve("Ork")
+    r.add("Ork", "Ork")
+    after = r.resolve("Ork")
+    _record(group, "cache_verworfen_nach_add", before is None and after == "Ork",
+            {"query": "Ork"}, (None, "Ork"), (before, after))
+
+    # rebuild ersetzt alle Eintraege
+    r.rebuild([("Elara", "Elara")])
+    got = (len(r), r.resolve("goblin"))
+    _record(group, "rebuild_ersetzt_eintraege", got == (1, None),
+            {"rebuild": ["Elara"]}, (1, None), got)
+
+    # LRU-Cache bleibt begrenzt
+    r = _resolver(names, cache_size=4)
+    for q in ("a", "b", "c", "d", "e", "f", "goblin", "thorg"):
+        r.resolve(q)
+    _record(group, "lru_cache_begrenzt", len(r._cache) <= 4,
+            {"cache_size": 4, "queries": 8}, "<=4", len(r._cache))
+
+    # Aequivalenz zur linearen Suche (zufaellige Namen und Anfragen)
+    rng = random.Random(_seed)
+    syllables = ["gob", "lin", "or", "k", "thor", "g", "el", "ara", " ", "der", "ha"]
+    pool = ["".join(rng.choice(syllables) for _ in range(rng.randint(1, 4))).strip() or "x"
+            for _ in range(40)]
+    r = _resolver(pool)
+    queries = pool + ["".join(rng.choice(syllables) for _ in range(rng.randint(1, 3)))
+                      for _ in range(200)]
+    mismatches = [q for q in queries if r.resolve(q) != _resolve_linear(pool, q)]
+    # Zweiter Durchlauf ueber den Cache liefert dasselbe
+    mismatches += [q for q in queries if r.resolve(q) != _resolve_linear(pool, q)]
+    _record(group, "aequivalent_zur_linearen_suche", not mismatches,
+            {"namen": len(pool), "anfragen": len(queries) * 2}, [], mismatches[:5])
+
+
+# ---------------------------------------------------------------------------
+# Gruppe: adventure.conditions (~10 Tests)
+# ---------------------------------------------------------------------------
+
+def _eval_condition_ref(condition: Any, flags: dict[str, Any]) -> bool:
+    """Referenz: interpretierende Auswertung wie vor compile_condition."""
+    if condition is None or condition is True:
+        return True
+    if condition is False:
+        return False
+    if isinstance(condition, str):
+        return bool(flags.get(condition))
+    if not isinstance(condition, dict):
+        return False
+    for op in ("AND", "OR"):
+        if op in condition:
+            sub = condition[op]
+            if not isinstance(sub, list):
+                sub = [sub]
+            results = [_eval_condition_ref(c, flags) for c in sub]
+            return all(results) if op == "AND" else any(results)
+    if "NOT" in condition:
+        return not _eval_condition_ref(condition["NOT"], flags)
+    if "flag" in condition:
+        if "eq" in condition:
+            return flags.get(condition["flag"]) == condition["eq"]
+        return bool(flags.get(condition["flag"]))
+    return False
+
+
+def _condition_adventure() -> dict[str, Any]:
+    return {
+        "title": "Bedingungstest",
+        "start_location": "halle",
+        "flags": {"door_open": False, "alarm": False, "phase": 1},
+        "locations": [
+            {"id": "halle", "name": "Halle", "clues_available": ["c_tuer", "c_wache", "c_frei"]},
+            {"id": "keller", "name": "Keller", "clues_available": ["c_phase", "c_wache"]},
+        ],
+        "clues": [
+            {"id": "c_tuer", "requires_flag": "door_open"},
+            {"id": "c_wache", "condition": {"AND": ["door_open", {"NOT": "alarm"}]}},
+            {"id": "c_phase", "condition": {"OR": [{"flag": "phase", "eq": 2}, "alarm"]}},
+            {"id": "c_frei"},
+        ],
+    }
+
+
+def test_adventure_conditions() -> None:
+    import itertools
+    import random
+    from core.adventure_manager import AdventureManager, compile_condition
+    from core.event_bus import EventBus
+    group = "adventure.conditions"
+    print(f"\n{BOLD}{CYAN}[{group}]{RESET}")
+
+    conditions = [
+        None, True, False, "a", {"flag": "a"}, {"flag": "b", "eq": 2},
+        {"flag": "c", "eq": "x"}, {"NOT": "a"}, {"AND": ["a", "b"]},
+        {"AND": "a"}, {"OR": ["a", {"NOT": "b"}]}, {"AND": []}, {"OR": []},
+        {"AND": [{"NOT": "a"}, {"OR": ["b", {"flag": "c", "eq": "x"}]}]},
+        {"NOT": {"OR": [{"flag": "b", "eq": 2}, {"AND": ["a", "c"]}]}},
+        {"unbekannt": 1}, 42,
+    ]
+    expected_deps = [
+        set(), set(), set(), {"a"}, {"a"}, {"b"}, {"c"}, {"a"}, {"a", "b"}, {"a"},
+        {"a", "b"}, set(), set(), {"a", "b", "c"}, {"a", "b", "c"}, set(), set(),
+    ]
+    values = [None, False, True, 0, 2, "x"]
+    assignments = [dict(zip("abc", combo)) for combo in itertools.product(values, repeat=3)]
+
+    # Kompilierte Closure == interpretierende Referenz fuer alle Belegungen
+    compiled = [compile_condition(c) for c in conditions]
+    mismatches = [
+        (cond, flags) for cond, comp in zip(conditions, compiled) for flags in assignments
+        if comp.test(flags) != _eval_condition_ref(cond, flags)
+    ]
+    _record(group, "kompiliert_gleich_referenz", not mismatches,
+            {"bedingungen": len(conditions), "belegungen": len(assignments)},
+            [], [repr(m) for m in mismatches[:3]])
+
+    # Gelesene Flags je Bedingung
+    deps = [set(c.flags) for c in compiled]
+    wrong = [(c, d) for c, d, e in zip(conditions, deps, expected_deps) if d != e]
+    _record(group, "abhaengige_flags_korrekt", not wrong,
+            {"bedingungen": len(conditions)}, [], [repr(w) for w in wrong[:3]])
+
+    # evaluate_condition nutzt den Memo und liefert dasselbe
+    am = AdventureManager()
+    am.load(_condition_adventure())
+    cond = {"AND": ["door_open", {"NOT": "alarm"}]}
+    first = am.evaluate_condition(cond)
+    am.set_flag("door_open", True)
+    second = am.evaluate_condition(dict(cond))
+    _record(group, "evaluate_condition_memo_folgt_flags",
+            (first, second) == (False, True),
+            {"condition": cond}, (False, True), (first, second))
+
+    # Rueckwaerts-Index Flag -> Clues / Locations
+    am = AdventureManager()
+    am.load(_condition_adventure())
+    got = {
+        "door_open": sorted(am._flag_clues.get("door_open", ())),
+        "alarm": sorted(am._flag_clues.get("alarm", ())),
+        "phase": sorted(am._flag_clues.get("phase", ())),
+    }
+    expected = {
+        "door_open": ["c_tuer", "c_wache"],
+        "alarm": ["c_phase", "c_wache"],
+        "phase": ["c_phase"],
+    }
+    _record(group, "rueckwaerts_index_flag_zu_clues", got == expected,
+            {"flags": list(expected)}, expected, got)
+    got = (sorted(am.locations_for_flag("alarm")), sorted(am.locations_for_flag("phase")),
+           sorted(am.locations_for_flag("unbekannt")))
+    expected = (["halle", "keller"], ["keller"], [])
+    _record(group, "rueckwaerts_index_flag_zu_locations", got == expected,
+            {"flags": ["alarm", "phase", "unbekannt"]}, expected, got)
+
+    # Sichtbare Clues bleiben nach beliebigen Flag-Folgen == Vollauswertung
+    adventure = _condition_adventure()
+    clue_conds = {c["id"]: c.get("requires_flag") or c.get("condition")
+                  for c in adventure["clues"]}
+    events: list[dict[str, Any]] = []
+    bus = EventBus.get()
+    bus.on("adventure.clues_changed", events.append)
+    try:
+        am = AdventureManager()
+        am.load(adventure)
+        rng = random.Random(_seed)
+        diverged: list[Any] = []
+        spurious = 0
+        for step in range(200):
+            before = set(am._visible_clues)
+            n_events = len(events)
+            op = rng.random()
+            if op < 0.8:
+                am.set_flag(rng.choice(["door_open", "alarm", "phase", "sonstwas"]),
+                            rng.choice([True, False, 1, 2]))
+            elif op < 0.9:
+                am.merge_flags_from_world_state({
+                    "flag:alarm": rng.choice([True, False]), "phase": rng.choice([1, 2]),
+                })
+            else:
+                am.reset_flags()
+            flags = am.get_all_flags()
+            full = {cid for cid, c in clue_conds.items() if _eval_condition_ref(c, flags)}
+            if am._visible_clues != full:
+                diverged.append((step, sorted(am._visible_clues), sorted(full)))
+            # Event genau dann, wenn sich die Sichtbarkeit aendert
+            if (len(events) > n_events) != (before != am._visible_clues):
+                spurious += 1
+    finally:
+        bus.off("adventure.clues_changed", events.append)
+    _record(group, "sichtbare_clues_gleich_vollauswertung", not diverged,
+            {"schritte": 200}, [], diverged[:2])
+    _record(group, "clues_changed_nur_bei_wechsel", spurious == 0 and bool(events),
+            {"schritte": 200, "events": len(events)}, 0, spurious)
+
+    # get_available_clues liest die gepflegte Menge
+    am = AdventureManager()
+    am.load(_condition_adventure())
+    am.set_flag("door_open", True)
+    got = [c["id"] for c in am.get_available_clues()]
+    expected = ["c_tuer", "c_wache", "c_frei"]
+    _record(group, "verfuegbare_clues_am_ort", got == expected,
+            {"flags": {"door_open": True}}, expected, got)
+
+
+# ---------------------------------------------------------------------------
+# Gruppe: adventure.store (~14 Tests)
+# ---------------------------------------------------------------------------
+
+def _store_adventure() -> dict[str, Any]:
+    return {
+        "title": "Lazy-Test äöü",
+        "start_location": "tor",
+        "flags": {"tor_offen": False},
+        "locations": [
+            {"id": "tor", "name": "Stadttor", "atmosphere": "Kühl und feucht. " * 20,
+             "exits": ["markt"], "clues_available": ["c_spur"], "npcs_present": ["wache"],
+             "sub_locations": [{"id": "wachstube", "name": "Wachstube", "exits": ["tor"]}]},
+            {"id": "markt", "name": "Marktplatz — Süd", "exits": ["tor", "gasse"],
+             "map": {"terrain": ["..", ".."], "exits": ["tor"]}},
+            "kein dict",
+        ],
+        "npcs": [
+            {"id": "wache", "name": "Wache Jörg", "personality": "Müde", "secret": "Bestechlich",
+             "mechanics": {"level": 2, "hp": 9}},
+        ],
+        "clues": [
+            {"id": "c_spur", "information": "Fußspuren im Schlamm.",
+             "requires_flag": "tor_offen"},
+            {"id": "c_frei", "information": "Ein Aushang."},
+        ],
+    }
+
+
+def test_adventure_store() -> None:
+    import tempfile
+    import core.adventure_store as adventure_store
+    from core.adventure_manager import AdventureManager
+    from core.adventure_store import AdventureChangedError, AdventureStore, open_adventure_store
+    group = "adventure.store"
+    print(f"\n{BOLD}{CYAN}[{group}]{RESET}")
+
+    data = _store_adventure()
+    builds: list[int] = []
+    real_build = adventure_store.build_index
+    real_index_dir = adventure_store.INDEX_DIR
+
+    def _counting_build(raw: bytes) -> dict[str, Any]:
+        builds.append(len(raw))
+        return real_build(raw)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = Path(tmp) / "lazy_test.json"
+        # BOM + Umlaute: Byte-Spans muessen trotzdem stimmen
+        source.write_bytes(b"\xef\xbb\xbf"
+                           + json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8"))
+        adventure_store.INDEX_DIR = Path(tmp) / "index"
+        adventure_store.build_index = _counting_build
+        stores: list[AdventureStore] = []
+        shared_store = None
+        try:
+            store = AdventureStore(source)
+            stores.append(store)
+            index_files = list(adventure_store.INDEX_DIR.glob("lazy_test-*.json"))
+            _record(group, "index_beim_ersten_oeffnen_gebaut",
+                    len(builds) == 1 and len(index_files) == 1,
+                    {"source": source.name}, (1, 1), (len(builds), len(index_files)))
+
+            # Oeffnen, Namen und Index-Felder lesen ohne Materialisierung
+            names = store.locations.names()
+            peeked = (store.locations.peek("tor", "clues_available"),
+                      store.locations.peek("wachstube", "_parent"),
+                      store.clues.peek("c_spur", "requires_flag"),
+                      store.locations.links(), store.locations.with_maps())
+            _record(group, "index_felder_ohne_materialisierung",
+                    store.locations.materialized == 0 and store.clues.materialized == 0
+                    and store._fh is None,
+                    {"peek": ["clues_available", "_parent", "requires_flag", "links"]},
+                    0, store.locations.materialized + store.clues.materialized)
+            expected = ([("tor", "Stadttor"), ("wachstube", "Wachstube"),
+                         ("markt", "Marktplatz — Süd")],
+                        (["c_spur"], "tor", "tor_offen",
+                         {"tor": ["markt"], "markt": ["tor"]}, ["markt"]))
+            _record(group, "index_felder_korrekt", (names, peeked) == expected,
+                    {"source": source.name}, repr(expected), repr((names, peeked)))
+
+            # prompt_dict liest die Quelldatei nicht
+            prompt = store.prompt_dict()
+            npc_prompt = prompt["npcs"][0]
+            _record(group, "prompt_dict_ohne_quelldatei",
+                    store._fh is None and npc_prompt.get("secret") == "Bestechlich"
+                    and npc_prompt.get("mechanics") == {"level": 2}
+                    and len(prompt["locations"][0]["atmosphere"]) == 150,
+                    {"felder": ["secret", "mechanics", "atmosphere"]}, True,
+                    {"fh": store._fh, "npc": npc_prompt})
+
+            # Zugriff materialisiert genau einen Eintrag, per Byte-Span korrekt
+            markt = store.locations["markt"]
+            _record(group, "zugriff_materialisiert_einzeln",
+                    markt == data["locations"][1] and store.locations.materialized == 1,
+                    {"key": "markt"}, (data["locations"][1]["name"], 1),
+                    (markt.get("name"), store.locations.materialized))
+            again = store.locations["markt"]
+            _record(group, "materialisierung_gecacht", again is markt,
+                    {"key": "markt"}, True, again is markt)
+            sub = store.locations["wachstube"]
+            _record(group, "sub_location_mit_parent",
+                    sub.get("_parent") == "tor" and sub.get("name") == "Wachstube"
+                    and store.locations["wachstube"] is sub,
+                    {"key": "wachstube"}, "tor", sub.get("_parent"))
+            parent_sub = store.locations["tor"]["sub_locations"][0]
+            _record(group, "sub_location_parent_unveraendert", "_parent" not in parent_sub,
+                    {"key": "tor.sub_locations[0]"}, False, "_parent" in parent_sub)
+
+            # view() und to_dict() entsprechen dem Original (Sub-Zugriff mutiert nichts)
+            view = store.view()
+            same = (view["title"] == data["title"]
+                    and view["locations"] == store.to_dict()["locations"]
+                    and list(view) == list(data)
+                    and store.to_dict()["npcs"] == data["npcs"])
+            _record(group, "view_gleich_original", same,
+                    {"keys": list(data)}, True, same)
+
+            # AdventureManager: Store und Dict liefern dasselbe
+            from_store, from_dict = AdventureManager(), AdventureManager()
+            from_store.load(store)
+            from_dict.load(data)
+            from_store.set_flag("tor_offen", True)
+            from_dict.set_flag("tor_offen", True)
+            got = (from_store.list_locations(), from_store.list_npcs(),
+                   sorted(from_store._visible_clues),
+                   [c["id"] for c in from_store.get_available_clues()])
+            expected = (from_dict.list_locations(), from_dict.list_npcs(),
+                        sorted(from_dict._visible_clues),
+                        [c["id"] for c in from_dict.get_available_clues()])
+            _record(group, "manager_store_gleich_dict", got == expected,
+                    {"flag": "tor_offen"}, repr(expected), repr(got))
+
+            # Zweites Oeffnen nutzt den Sidecar-Index
+            store2 = AdventureStore(source)
+            stores.append(store2)
+            _record(group, "index_wiederverwendet", len(builds) == 1,
+                    {"oeffnungen": 2}, 1, len(builds))
+
+            # Geteilter Store pro Datei
+            shared = open_adventure_store(source)
+            stores.append(shared)
+            same_store = shared is open_adventure_store(source)
+            _record(group, "store_prozessweit_geteilt", same_store,
+                    {"source": source.name}, True, same_store)
+
+            # Geaenderte Quelle -> Index neu gebaut, Store erneuert; alte Stores
+            # bleiben fuer ihre Halter offen
+            shared.locations["markt"]           # Handle offen
+            cold = AdventureStore(source)       # Handle noch nicht offen
+            stores.append(cold)
+            data["locations"][0]["name"] = "Altes Stadttor"
+            replacement = source.with_suffix(".tmp")
+            replacement.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+            if os.name == "nt":
+                # Offene Dateien sind unter Windows nicht ersetzbar: in-place schreiben
+                source.write_bytes(replacement.read_bytes())
+                replacement.unlink()
+            else:
+                os.replace(replacement, source)
+            stale = not shared.is_current()
+            fresh = open_adventure_store(source)
+            got = (stale, fresh is not shared, len(builds),
+                   fresh.locations.peek("tor", "name"), fresh.locations["tor"]["name"])
+            expected = (True, True, 2, "Altes Stadttor", "Altes Stadttor")
+            _record(group, "geaenderte_quelle_neuer_index", got == expected,
+                    {"aenderung": "locations[0].name"}, expected, got)
+
+            # Alter Store mit offenem Handle liest die indizierte Fassung weiter
+            # (bei in-place-Schreiben: klarer Fehler statt falscher Spans)
+            try:
+                old_name = shared.locations["tor"]["name"]
+            except AdventureChangedError:
+                old_name = None
+            expected_old = None if os.name == "nt" else "Stadttor"
+            _record(group, "alter_store_liest_alte_fassung", old_name == expected_old,
+                    {"ersetzt": os.name != "nt"}, expected_old, old_name)
+
+            # Alter Store ohne Handle: Datei passt nicht mehr zum Index
+            try:
+                cold.locations["tor"]
+                error = None
+            except AdventureChangedError as exc:
+                error = type(exc).__name__
+            _record(group, "veralteter_store_klarer_fehler", error == "AdventureChangedError",
+                    {"store": "ohne Handle"}, "AdventureChangedError", error)
+        finally:
+            adventure_store.build_index = real_build
+            adventure_store.INDEX_DIR = real_index_dir
+            with adventure_store._stores_lock:
+                shared_store = adventure_store._stores.pop(source.resolve(), None)
+            for s in stores + ([shared_store] if shared_store else []):
+                s.close()
+
+
+# ---------------------------------------------------------------------------
+# Gruppe: world_graph (~12 Tests)
+# ---------------------------------------------------------------------------
+
+def _graph_location(lid: str, name: str, exits: dict[str, tuple[int, int]],
+                    walls: tuple[tuple[int, int], ...] = (), w: int = 9, h: int = 7) -> dict:
+    """Location mit Karte (w x h, Rahmen aus Waenden) fuer WorldGraph-Tests."""
+    terrain = [
+        ["wall" if x in (0, w - 1) or y in (0, h - 1) or (x, y) in walls else "floor"
+         for x in range(w)]
+        for y in range(h)
+    ]
+    return {"id": lid, "name": name, "exits": list(exits),
+            "map": {"terrain": terrain, "exits": {e: list(p) for e, p in exits.items()}}}
+
+
+def _graph_locations() -> list[dict]:
+    # halle -> gang -> thron -> keller (einseitig), seite_* nur hinter keller
+    return [
+        _graph_location("halle", "Eingangshalle", {"gang": (8, 3)}),
+        _graph_location("gang", "Fallengang", {"halle": (0, 3), "thron": (8, 3)}),
+        _graph_location("thron", "Nordturm", {"gang": (0, 3), "keller": (4, 6)}),
+        # Default-Eingang (3, 3) ist eine Wand -> Gegenportal muss ausweichen
+        _graph_location("keller", "Keller", {"seite_1": (8, 3)}, walls=((3, 3),)),
+        _graph_location("seite_1", "Seitenkammer", {"keller": (0, 3)}),
+    ]
+
+
+def test_world_graph() -> None:
+    from core.event_bus import EventBus
+    from core.grid_engine import GridEngine
+    from core.world_graph import WorldGraph
+    group = "world_graph"
+    print(f"\n{BOLD}{CYAN}[{group}]{RESET}")
+
+    engine = GridEngine()
+    locations = _graph_locations()
+    by_id = {loc["id"]: loc for loc in locations}
+    graph = WorldGraph.build(locations, engine.build_room_grid)
+
+    # Route ueber drei Raeume: 6 (Halle) + 1 + 8 (Gang) + 1 = 16
+    route = graph.plan_route("halle", (2, 3), "thron")
+    got = (route.rooms, route.next_exit, route.cost) if route else None
+    expected = (["halle", "gang", "thron"], "gang", 16)
+    _record(group, "route_ueber_raeume", got == expected,
+            {"start": ("halle", (2, 3)), "ziel": "thron"}, expected, got)
+
+    # Gleicher Raum: direkte BFS-Distanz
+    route = graph.plan_route("gang", (1, 3), "gang", (7, 3))
+    got = (route.rooms, route.cost) if route else None
+    _record(group, "route_im_selben_raum", got == (["gang"], 6),
+            {"start": (1, 3), "ziel": (7, 3)}, (["gang"], 6), got)
+
+    # Unbekannter Zielraum -> None
+    route = graph.plan_route("halle", (2, 3), "gibtsnicht")
+    _record(group, "unbekanntes_ziel_none", route is None,
+            {"ziel": "gibtsnicht"}, None, route)
+
+    # Einseitige Verbindung: Gegenportal auf begehbare Zelle gezogen
+    keller_portal = graph.portals("keller").get("thron")
+    keller_room = graph._rooms["keller"]
+    walkable = keller_portal is not None and keller_room.is_walkable(*keller_portal)
+    _record(group, "gegenportal_begehbar", walkable and keller_portal != (3, 3),
+            {"default": (3, 3), "wand": True}, "begehbar", keller_portal)
+    # 6 + 1 + 8 + 1 + 4 (Thron -> Suedtuer) + 1 + 3 (Gegenportal -> Ziel)
+    route = graph.plan_route("halle", (2, 3), "keller", (6, 5))
+    got = (route.rooms, route.cost) if route else None
+    expected = (["halle", "gang", "thron", "keller"], 24)
+    _record(group, "einseitige_verbindung_mit_zielposition", got == expected,
+            {"ziel": ("keller", (6, 5))}, expected, got)
+
+    # invalidate_room: Gang blockiert -> keine Route; ohne Raum neu gebaut -> wieder da
+    gang_walls = tuple((4, y) for y in range(1, 6))
+    blocked = engine.build_room_grid(
+        _graph_location("gang", "Fallengang", {"halle": (0, 3), "thron": (8, 3)},
+                        walls=gang_walls), "gang",
+    )
+    graph.invalidate_room("gang", blocked)
+    blocked_route = graph.plan_route("halle", (2, 3), "thron")
+    graph.invalidate_room("gang")
+    restored = graph.plan_route("halle", (2, 3), "thron")
+    got = (blocked_route, restored.cost if restored else None)
+    _record(group, "invalidate_room_blockiert_und_neu_gebaut", got == (None, 16),
+            {"raum": "gang", "wand_x": 4}, (None, 16), got)
+
+    # lazy(): nur Raeume entlang der Suche bauen, gleiche Route wie build()
+    loaded: list[str] = []
+
+    def _loader(room_id: str) -> dict:
+        loaded.append(room_id)
+        return by_id[room_id]
+
+    links = {loc["id"]: list(loc["exits"]) for loc in locations}
+    lazy_graph = WorldGraph.lazy(links, _loader, engine.build_room_grid)
+    _record(group, "lazy_baut_vorab_nichts", lazy_graph.built_rooms == 0 and not loaded,
+            {"raeume": len(links)}, 0, lazy_graph.built_rooms)
+    route = lazy_graph.plan_route("halle", (2, 3), "thron")
+    got = ((route.rooms, route.cost) if route else None, sorted(set(loaded)))
+    expected = ((["halle", "gang", "thron"], 16), ["gang", "halle", "thron"])
+    _record(group, "lazy_nur_raeume_entlang_der_suche", got == expected,
+            {"ziel": "thron"}, expected, got)
+    route = lazy_graph.plan_route("halle", (2, 3), "keller", (6, 5))
+    got = (route.rooms if route else None, len(loaded) == len(set(loaded)))
+    expected = (["halle", "gang", "thron", "keller"], True)
+    _record(group, "lazy_baut_jeden_raum_einmal", got == expected,
+            {"ziel": "keller"}, expected, got)
+
+    # parse_player_movement: explizite Richtung schlaegt Namens-Treffer
+    def _engine_in_halle() -> GridEngine:
+        ge = GridEngine()
+        ge.set_adventure({"locations": _graph_locations()})
+        ge.setup_room(by_id["halle"], "halle")
+        ge.place_party([{"id": "held", "name": "Held", "class": "fighter"}])
+        return ge
+
+    bus = EventBus.get()
+    planned: list[dict] = []
+    bus.on("grid.route_planned", planned.append)
+    try:
+        ge = _engine_in_halle()
+        start = (ge._party_members["held"].x, ge._party_members["held"].y)
+        ge.parse_player_movement("Ich gehe nach Norden, Richtung Nordturm")
+        held = ge._party_members["held"]
+        got = (held.x == start[0] and held.y < start[1], len(planned))
+        _record(group, "bewegung_explizite_richtung_vor_route", got == (True, 0),
+                {"input": "nach Norden, Richtung Nordturm", "start": start},
+                (True, 0), ((held.x, held.y), len(planned)))
+
+        # Ohne Richtung: Route zum genannten Raum (Nordturm ist kein "nord")
+        ge = _engine_in_halle()
+        ge.parse_player_movement("Wir gehen zum Nordturm")
+        held = ge._party_members["held"]
+        got = (held.x > start[0] and held.y == start[1], [p["to"] for p in planned])
+        _record(group, "bewegung_route_ohne_richtung", got == (True, ["thron"]),
+                {"input": "zum Nordturm", "start": start},
+                (True, ["thron"]), ((held.x, held.y), [p["to"] for p in planned]))
+    finally:
+        bus.off("grid.route_planned", planned.append)
+
 
 # ---------------------------------------------------------------------------
 # ============================================================
@@ -1539,22 +2212,33 @@ def run_matrix_tests(iterations: int = 1000) -> None:
     """Statistische Tests mit vielen Iterationen."""
     global _run_id
 
+    from core.combat_sim import HAS_NUMPY
     print(f"\n{BOLD}=== MATRIX-TESTS ({iterations} Iterationen pro Zelle) ==={RESET}")
 
     # --- attack_roll Matrix ---
-    _matrix_attack_roll(iterations)
+    attack_rates = _matrix_attack_roll(iterations)
 
     # --- saving_throw Matrix ---
-    _matrix_saving_throw(iterations)
+    save_rates = _matrix_saving_throw(iterations)
 
     # --- morale_check Matrix ---
-    _matrix_morale_check(iterations)
+    morale_rates = _matrix_morale_check(iterations)
+
+    # --- CombatSimulator (Batch-API, braucht numpy) ---
+    if not HAS_NUMPY:
+        print(f"\n  {YELLOW}numpy fehlt — Simulator-Matrix uebersprungen.{RESET}")
+        return
+    _matrix_sim_attack_roll(iterations, attack_rates)
+    _matrix_sim_saving_throw(iterations, save_rates)
+    _matrix_sim_morale_check(iterations, morale_rates)
+    _matrix_sim_roll_damage(iterations)
 
 
-def _matrix_attack_roll(iterations: int) -> None:
+def _matrix_attack_roll(iterations: int) -> dict[int, float]:
     group = "matrix.attack_roll"
     print(f"\n{BOLD}{CYAN}[{group}]{RESET}")
     mech = _make_mechanics()
+    rates: dict[int, float] = {}
 
     # Adaptive Toleranz: ~3% bei 1000 Iter, ~10% bei 100 Iter
     tol = max(0.025, 3.0 / math.sqrt(iterations))
@@ -1579,6 +2263,7 @@ def _matrix_attack_roll(iterations: int) -> None:
                 nat1s += 1
 
         hit_rate = hits / iterations
+        rates[thac0] = hit_rate
         nat20_rate = nat20s / iterations
         nat1_rate = nat1s / iterations
 
@@ -1610,12 +2295,14 @@ def _matrix_attack_roll(iterations: int) -> None:
                     "<=", round(hit_rate, 3))
         prev_hit_rate = hit_rate
         prev_thac0 = thac0
+    return rates
 
 
-def _matrix_saving_throw(iterations: int) -> None:
+def _matrix_saving_throw(iterations: int) -> dict[int, float]:
     group = "matrix.saving_throw"
     print(f"\n{BOLD}{CYAN}[{group}]{RESET}")
     mech = _make_mechanics()
+    rates: dict[int, float] = {}
 
     tol = max(0.025, 3.0 / math.sqrt(iterations))
     targets = [5, 10, 15, 18]
@@ -1633,6 +2320,7 @@ def _matrix_saving_throw(iterations: int) -> None:
                 nat20s += 1
 
         save_rate = saves / iterations
+        rates[target] = save_rate
         nat20_rate = nat20s / iterations
 
         _record_matrix_cell(group, f"target_{target}_saves",
@@ -1655,12 +2343,14 @@ def _matrix_saving_throw(iterations: int) -> None:
                     "<=", round(save_rate, 3))
         prev_save_rate = save_rate
         prev_target = target
+    return rates
 
 
-def _matrix_morale_check(iterations: int) -> None:
+def _matrix_morale_check(iterations: int) -> dict[int, float]:
     group = "matrix.morale_check"
     print(f"\n{BOLD}{CYAN}[{group}]{RESET}")
     mech = _make_mechanics()
+    rates: dict[int, float] = {}
 
     morale_vals = [4, 8, 12, 16]
     prev_pass_rate = None
@@ -1674,6 +2364,144 @@ def _matrix_morale_check(iterations: int) -> None:
                 passes += 1
 
         pass_rate = passes / iterations
+        rates[morale] = pass_rate
+
+        _record_matrix_cell(group, f"morale_{morale}_passes",
+                            iterations, passes, iterations - passes, [pass_rate])
+
+        _record(group, f"morale_{morale}_pass_rate_gueltig",
+                0.0 <= pass_rate <= 1.0,
+                {"morale": morale, "iterations": iterations}, "0.0-1.0", round(pass_rate, 3))
+
+        # Hoehere Moral -> hoehere Pass-Rate
+        if prev_pass_rate is not None:
+            _record(group, f"monotonie_morale_{prev_morale}_zu_{morale}",
+                    pass_rate >= prev_pass_rate - 0.03,
+                    {"prev": round(prev_pass_rate, 3), "curr": round(pass_rate, 3)},
+                    ">=", round(pass_rate, 3))
+        prev_pass_rate = pass_rate
+        prev_morale = morale
+    return rates
+
+
+def _matrix_sim_attack_roll(iterations: int, reference: dict[int, float]) -> None:
+    group = "matrix.sim.attack_roll"
+    print(f"\n{BOLD}{CYAN}[{group}]{RESET}")
+    sim = _make_simulator()
+
+    # Adaptive Toleranz: ~3% bei 1000 Iter, ~10% bei 100 Iter
+    tol = max(0.025, 3.0 / math.sqrt(iterations))
+
+    # THAC0 und AC Kombinationen testen
+    thac0_vals = [5, 10, 15, 20]
+
+    # Monotonie pruefen: hoehere THAC0 -> niedrigere Trefferrate
+    prev_hit_rate = None
+    prev_thac0 = None
+    for thac0 in thac0_vals:
+        batch = sim.attack_rolls(thac0=thac0, target_ac=5, n=iterations)
+        hits = int(batch.is_success.sum())
+        hit_rate = hits / iterations
+        nat20_rate = batch.rate_of(20)
+        nat1_rate = batch.rate_of(1)
+
+        _record_matrix_cell(group, f"thac0_{thac0}_ac5_hits",
+                            iterations, hits, iterations - hits, [hit_rate])
+
+        _record(group, f"thac0_{thac0}_ac5_hit_rate_gueltig_bereich",
+                0.0 <= hit_rate <= 1.0,
+                {"thac0": thac0, "ac": 5, "iterations": iterations},
+                "0.0-1.0", round(hit_rate, 3))
+
+        # nat20 ca. 5% (adaptive Toleranz)
+        _record(group, f"thac0_{thac0}_nat20_rate_circa_5pct",
+                abs(nat20_rate - 0.05) < tol,
+                {"expected": "~5%", "actual": f"{nat20_rate:.1%}", "tol": f"{tol:.1%}"},
+                "~5%", f"{nat20_rate:.1%}")
+
+        # nat1 ca. 5% (adaptive Toleranz)
+        _record(group, f"thac0_{thac0}_nat1_rate_circa_5pct",
+                abs(nat1_rate - 0.05) < tol,
+                {"expected": "~5%", "actual": f"{nat1_rate:.1%}", "tol": f"{tol:.1%}"},
+                "~5%", f"{nat1_rate:.1%}")
+
+        # Gleiche Regeln wie MechanicsEngine: Raten innerhalb der Toleranz
+        mech_rate = reference.get(thac0)
+        if mech_rate is not None:
+            _record(group, f"thac0_{thac0}_wie_mechanics",
+                    abs(hit_rate - mech_rate) < 2 * tol,
+                    {"thac0": thac0, "mechanics": round(mech_rate, 3), "tol": round(2 * tol, 3)},
+                    round(mech_rate, 3), round(hit_rate, 3))
+
+        # Monotonie: hoehere THAC0 -> nicht hoehere Trefferrate
+        if prev_hit_rate is not None:
+            _record(group, f"monotonie_thac0_{prev_thac0}_zu_{thac0}",
+                    hit_rate <= prev_hit_rate + 0.03,
+                    {"prev_rate": round(prev_hit_rate, 3), "curr_rate": round(hit_rate, 3)},
+                    "<=", round(hit_rate, 3))
+        prev_hit_rate = hit_rate
+        prev_thac0 = thac0
+
+
+def _matrix_sim_saving_throw(iterations: int, reference: dict[int, float]) -> None:
+    group = "matrix.sim.saving_throw"
+    print(f"\n{BOLD}{CYAN}[{group}]{RESET}")
+    sim = _make_simulator()
+
+    tol = max(0.025, 3.0 / math.sqrt(iterations))
+    targets = [5, 10, 15, 18]
+    prev_save_rate = None
+    prev_target = None
+
+    for target in targets:
+        batch = sim.saving_throws(target=target, n=iterations)
+        saves = int(batch.is_success.sum())
+        save_rate = saves / iterations
+        nat20_rate = batch.rate_of(20)
+
+        _record_matrix_cell(group, f"target_{target}_saves",
+                            iterations, saves, iterations - saves, [save_rate])
+
+        _record(group, f"target_{target}_save_rate_gueltig",
+                0.0 <= save_rate <= 1.0,
+                {"target": target, "iterations": iterations}, "0.0-1.0", round(save_rate, 3))
+
+        _record(group, f"target_{target}_nat20_circa_5pct",
+                abs(nat20_rate - 0.05) < tol,
+                {"expected": "~5%", "actual": f"{nat20_rate:.1%}", "tol": f"{tol:.1%}"},
+                "~5%", f"{nat20_rate:.1%}")
+
+        # Gleiche Regeln wie MechanicsEngine: Raten innerhalb der Toleranz
+        mech_rate = reference.get(target)
+        if mech_rate is not None:
+            _record(group, f"target_{target}_wie_mechanics",
+                    abs(save_rate - mech_rate) < 2 * tol,
+                    {"target": target, "mechanics": round(mech_rate, 3), "tol": round(2 * tol, 3)},
+                    round(mech_rate, 3), round(save_rate, 3))
+
+        # Hoehere Targets -> niedrigere Save-Rate
+        if prev_save_rate is not None:
+            _record(group, f"monotonie_target_{prev_target}_zu_{target}",
+                    save_rate <= prev_save_rate + 0.03,
+                    {"prev": round(prev_save_rate, 3), "curr": round(save_rate, 3)},
+                    "<=", round(save_rate, 3))
+        prev_save_rate = save_rate
+        prev_target = target
+
+
+def _matrix_sim_morale_check(iterations: int, reference: dict[int, float]) -> None:
+    group = "matrix.sim.morale_check"
+    print(f"\n{BOLD}{CYAN}[{group}]{RESET}")
+    sim = _make_simulator()
+
+    tol = max(0.025, 3.0 / math.sqrt(iterations))
+    morale_vals = [4, 8, 12, 16]
+    prev_pass_rate = None
+    prev_morale = None
+
+    for morale in morale_vals:
+        passes = int(sim.morale_checks(morale_value=morale, n=iterations).is_success.sum())
+        pass_rate = passes / iterations
 
         _record_matrix_cell(group, f"morale_{morale}_passes",
                             iterations, passes, iterations - passes, [pass_rate])
@@ -1682,6 +2510,14 @@ def _matrix_morale_check(iterations: int) -> None:
                 0.0 <= pass_rate <= 1.0,
                 {"morale": morale, "iterations": iterations}, "0.0-1.0", round(pass_rate, 3))
 
+        # Gleiche Regeln wie MechanicsEngine: Raten innerhalb der Toleranz
+        mech_rate = reference.get(morale)
+        if mech_rate is not None:
+            _record(group, f"morale_{morale}_wie_mechanics",
+                    abs(pass_rate - mech_rate) < 2 * tol,
+                    {"morale": morale, "mechanics": round(mech_rate, 3), "tol": round(2 * tol, 3)},
+                    round(mech_rate, 3), round(pass_rate, 3))
+
         # Hoehere Moral -> hoehere Pass-Rate
         if prev_pass_rate is not None:
             _record(group, f"monotonie_morale_{prev_morale}_zu_{morale}",
@@ -1692,6 +2528,41 @@ def _matrix_morale_check(iterations: int) -> None:
         prev_morale = morale
 
 
+def _matrix_sim_roll_damage(iterations: int) -> None:
+    group = "matrix.sim.roll_damage"
+    print(f"\n{BOLD}{CYAN}[{group}]{RESET}")
+    sim = _make_simulator()
+
+    # (Ausdruck, Minimum, Maximum, Erwartungswert)
+    cases = [
+        ("1d6", 1, 6, 3.5),
+        ("2d4", 2, 8, 5.0),
+        ("1d8+2", 3, 10, 6.5),
+        ("1d10+6", 7, 16, 11.5),
+        ("2d4-3", 0, 5, 2.0625),   # nie negativ: 2d4-3 wird bei 0 gekappt
+    ]
+    for expr, lo, hi, expected in cases:
+        values = sim.damage_rolls(expr, iterations)
+        mean = float(values.mean())
+        std = float(values.std())
+        in_range = int(((values >= lo) & (values <= hi)).sum())
+
+        _record_matrix_cell(group, f"{expr}_in_range", iterations,
+                            in_range, iterations - in_range, [mean])
+
+        _record(group, f"{expr}_bereich_{lo}_{hi}",
+                in_range == iterations,
+                {"expr": expr, "min": int(values.min()), "max": int(values.max())},
+                f"{lo}-{hi}", f"{int(values.min())}-{int(values.max())}")
+
+        # Mittelwert innerhalb von 4 Standardfehlern
+        tol = max(0.05, 4.0 * std / math.sqrt(iterations))
+        _record(group, f"{expr}_mittelwert_circa_{expected}",
+                abs(mean - expected) < tol,
+                {"expected": expected, "actual": round(mean, 3), "tol": round(tol, 3)},
+                str(expected), round(mean, 3))
+
+
 # ---------------------------------------------------------------------------
 # ============================================================
 # SCENARIO-TESTS
@@ -1915,6 +2786,10 @@ def run_unit_tests(group_filter: str | None = None) -> None:
         ("tag_parser.extract_party",        test_extract_party_tags),
         ("validation",                      test_validation),
         ("combat_tracker",                  test_combat_tracker),
+        ("name_resolver",                   test_name_resolver),
+        ("adventure.conditions",            test_adventure_conditions),
+        ("adventure.store",                 test_adventure_store),
+        ("world_graph",                     test_world_graph),
     ]
 
     print(f"\n{BOLD}=== UNIT-TESTS ==={RESET}")
@@ -1985,6 +2860,91 @@ def cmd_run(args) -> None:
         sys.exit(1)
 
 
+# ---------------------------------------------------------------------------
+# BALANCE (Monte-Carlo-Begegnungen)
+# ---------------------------------------------------------------------------
+
+def cmd_balance(args) -> None:
+    """Simuliert alle Kampf-Locations eines Adventures gegen eine Party."""
+    from core.combat_sim import (
+        HAS_NUMPY, monsters_from_npcs, party_from_stats, player_stats_from_character,
+    )
+    if not HAS_NUMPY:
+        print(f"{RED}numpy fehlt — Balance-Simulation nicht moeglich.{RESET}")
+        sys.exit(1)
+
+    modules_dir = Path(__file__).parent.parent / "modules"
+    adv_path = modules_dir / "adventures" / f"{args.adventure.removesuffix('.json')}.json"
+    party_path = modules_dir / "parties" / f"{args.party.removesuffix('.json')}.json"
+    try:
+        with adv_path.open(encoding="utf-8") as f:
+            adventure = json.load(f)
+        with party_path.open(encoding="utf-8") as f:
+            party_data = json.load(f)
+    except (OSError, json.JSONDecodeError) as exc:
+        print(f"{RED}Laden fehlgeschlagen: {exc}{RESET}")
+        sys.exit(1)
+
+    sim = _make_simulator(args.seed)
+    mech = sim.mechanics
+
+    party_stats = []
+    for char_id in party_data.get("members", []):
+        char_path = modules_dir / "characters" / f"{char_id}.json"
+        try:
+            with char_path.open(encoding="utf-8") as f:
+                party_stats.append(player_stats_from_character(json.load(f), mech))
+        except (OSError, json.JSONDecodeError) as exc:
+            print(f"{YELLOW}Charakter {char_id} uebersprungen: {exc}{RESET}")
+    if not party_stats:
+        print(f"{RED}Party ohne Mitglieder.{RESET}")
+        sys.exit(1)
+
+    npcs = {n.get("id"): n for n in adventure.get("npcs", []) if isinstance(n, dict)}
+    locations = [
+        loc for loc in adventure.get("locations", [])
+        if isinstance(loc, dict) and (not args.location or loc.get("id") == args.location)
+    ]
+
+    print(f"\n{BOLD}Balance: {adventure.get('title', args.adventure)}{RESET} | "
+          f"Party: {party_data.get('name', args.party)} | "
+          f"{args.trials} Durchlaeufe | Seed: {args.seed}")
+    started = time.time()
+    for loc in locations:
+        foes = [npcs[nid] for nid in loc.get("npcs_present", []) if nid in npcs]
+        foes = [n for n in foes if n.get("type", "monster") == "monster"
+                or "stats" in n or "thac0" in n]
+        if not foes:
+            continue
+        # Jede Location startet mit frischer Party (Einzelbegegnung)
+        party = party_from_stats(party_stats, mech)
+        monsters = monsters_from_npcs(foes, mech)
+        t0 = time.time()
+        result = sim.simulate_encounter(
+            party, monsters, trials=args.trials, max_rounds=args.max_rounds,
+            monster_morale=args.morale,
+        )
+        s = result.summary()
+        color = GREEN if s["win_rate"] >= 0.9 else (YELLOW if s["win_rate"] >= 0.6 else RED)
+        print(f"\n{CYAN}[{loc.get('id')}]{RESET} {loc.get('name', '')} "
+              f"— {len(monsters)} Gegner ({time.time() - t0:.2f}s)")
+        print(f"  Sieg: {color}{s['win_rate']:.1%}{RESET}  "
+              f"TPK: {s['tpk_rate']:.1%}  Flucht: {s['rout_rate']:.1%}  "
+              f"Timeout: {s['timeout_rate']:.1%}")
+        print(f"  TTK: avg {s['ttk_mean']:.1f} | p50 {s['ttk_p50']:.0f} | "
+              f"p90 {s['ttk_p90']:.0f} Runden")
+        print(f"  Schaden an Party: avg {s['party_damage_mean']:.0f} | "
+              f"p90 {s['party_damage_p90']:.0f} | Tote: avg {s['party_deaths_mean']:.2f}")
+        deadliest = sorted(
+            ((name, rate) for name, rate in s["death_rate"].items()
+             if name in {p.name for p in party}),
+            key=lambda x: -x[1],
+        )[:3]
+        print("  Todesrate: " + ", ".join(f"{n} {r:.0%}" for n, r in deadliest))
+
+    print(f"\nDauer: {time.time() - started:.1f}s")
+
+
 # ---------------------------------------------------------------------------
 # STATUS / REPORT / TRENDS
 # ---------------------------------------------------------------------------
@@ -2137,6 +3097,8 @@ Beispiele:
   py -3 scripts/rules_tester.py status --last 5
   py -3 scripts/rules_tester.py report --run-id 3 --failures
   py -3 scripts/rules_tester.py trends --days 14 --regressions
+  py -3 scripts/rules_tester.py balance --adventure crawltraining_stress \\
+        --party add_stress_party --trials 20000 --morale 10
         """,
     )
 
@@ -2171,6 +3133,22 @@ Beispiele:
     trends_p.add_argument("--regressions", action="store_true",
                           help="Regressionen seit letztem Lauf anzeigen")
 
+    # balance
+    balance_p = sub.add_parser("balance", help="Monte-Carlo-Begegnungsbalance")
+    balance_p.add_argument("--adventure", type=str, required=True,
+                           help="Adventure-ID (modules/adventures/<id>.json)")
+    balance_p.add_argument("--party", type=str, required=True,
+                           help="Party-ID (modules/parties/<id>.json)")
+    balance_p.add_argument("--location", type=str, default=None,
+                           help="Nur diese Location simulieren")
+    balance_p.add_argument("--trials", type=int, default=10000,
+                           help="Durchlaeufe pro Begegnung (Standard: 10000)")
+    balance_p.add_argument("--max-rounds", type=int, default=50, dest="max_rounds",
+                           help="Rundenlimit pro Durchlauf (Standard: 50)")
+    balance_p.add_argument("--morale", type=int, default=None,
+                           help="Monster-Moral fuer Fluchtprobe bei 50%% Verlusten")
+    balance_p.add_argument("--seed", type=int, default=42, help="Zufallsseed (Standard: 42)")
+
     args = parser.parse_args()
 
     if args.command == "run":
@@ -2181,6 +3159,8 @@ Beispiele:
         cmd_report(args)
     elif args.command == "trends":
         cmd_trends(args)
+    elif args.command == "balance":
+        cmd_balance(args)
     else:
         parser.print_help()
 
@@ -0,0 +1,201 @@
+"""
+scripts/stt_stream_check.py — Offline-Check fuer audio/stt_stream.py
+
+Prueft StreamingTranscriber ohne Whisper und ohne Mikrofon:
+
+  - FakeWhisper ersetzt die transcribe-Funktion. Jedes Sample traegt seine
+    absolute Position als Wert, daraus liest der Fake den Fensterbeginn ab
+    und liefert die Woerter eines festen Skripts als Segmente relativ zum
+    Fenster. Ein Wort, das ueber das Fensterende hinausreicht, kommt wie
+    bei Whisper abgeschnitten zurueck.
+  - Eine 7,3 s lange Aeusserung wird in 100-ms-Chunks eingespeist.
+
+Geprueft: Teil-Commits waehrend der Aufnahme, Finale nur ueber den offenen
+Rest mit voller Beam-Breite, exaktes Stitching, fehlgeschlagene
+Zwischenlaeufe und der Rueckfall auf den offenen Rest (_tail), wenn das
+Finale scheitert.
+
+Starten:  python scripts/stt_stream_check.py
+Exit-Code 0 wenn alle Checks bestehen.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from typing import Any
+
+import numpy as np
+
+# Projekt-Root in sys.path
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+_PROJECT_ROOT = os.path.dirname(_SCRIPT_DIR)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
+
+from audio.stt_stream import StreamingTranscriber
+
+GREEN = "\033[92m"
+RED = "\033[91m"
+RESET = "\033[0m"
+
+RATE = 16000
+DURATION = 7.3
+CHUNK = RATE // 10
+PARTIAL_BEAM = 1
+FINAL_BEAM = 5
+
+# Skript: 14 Woerter a 0,4 s mit 0,1 s Pause (Fenstergrenzen schneiden Woerter),
+# danach Stille bis 7,3 s
+WORDS = [(0.25 + 0.5 * i, 0.65 + 0.5 * i, f"wort{i:02d}") for i in range(14)]
+FULL_TEXT = " ".join(text for _, _, text in WORDS)
+
+_results: list[bool] = []
+
+
+def _check(name: str, passed: bool, detail: str = "") -> None:
+    _results.append(passed)
+    mark = f"{GREEN}OK  {RESET}" if passed else f"{RED}FAIL{RESET}"
+    print(f"  {mark} {name}" + (f"  ({detail})" if detail else ""))
+
+
+# ---------------------------------------------------------------------------
+# Lokaler Ersatz fuer Whisper
+# ---------------------------------------------------------------------------
+
+class FakeWhisper:
+    """transcribe(audio, beam_size, prompt) ueber ein festes Wort-Skript."""
+
+    def __init__(self, fail_beams: tuple[int, ...] = ()) -> None:
+        self.fail_beams = fail_beams
+        self.calls: list[dict[str, Any]] = []
+
+    def __call__(self, audio: np.ndarray, beam_size: int, prompt: str) -> list:
+        offset = int(audio[0]) / RATE
+        end = offset + len(audio) / RATE
+        self.calls.append({"offset": offset, "seconds": len(audio) / RATE,
+                           "beam": beam_size, "prompt": prompt})
+        if beam_size in self.fail_beams:
+            raise RuntimeError("fake whisper failure")
+        segments = []
+        for ws, we, text in WORDS:
+            if ws < offset or ws >= end:
+                continue
+            if we > end:
+                # Am Fensterende abgeschnitten (wie Whisper bei halbem Wort)
+                keep = max(1, int(len(text) * (end - ws) / (we - ws)))
+                text, we = text[:keep] + "-", end
+            segments.append((ws - offset, we - offset, text))
+        return segments
+
+
+def _utterance() -> np.ndarray:
+    # Sample-Wert = absolute Position (float32 exakt bis 2**24)
+    return np.arange(int(DURATION * RATE), dtype=np.float32)
+
+
+def _stream(whisper: FakeWhisper, wait: bool = True) -> tuple[StreamingTranscriber, list]:
+    partials: list[tuple[str, str]] = []
+    tr = StreamingTranscriber(
+        whisper, RATE, lambda c, t: partials.append((c, t)),
+        interval=1.0, partial_beam=PARTIAL_BEAM, final_beam=FINAL_BEAM,
+    )
+    audio = _utterance()
+    for pos in range(0, len(audio), CHUNK):
+        tr.append(audio[pos:pos + CHUNK])
+        # Schneller Transkribierer: jeder Zwischenlauf endet vor dem naechsten Chunk
+        if wait and tr._worker is not None:
+            tr._worker.join()
+    return tr, partials
+
+
+# ---------------------------------------------------------------------------
+# Checks
+# ---------------------------------------------------------------------------
+
+def check_partial_commits() -> None:
+    print("\n[Teil-Commits]")
+    whisper = FakeWhisper()
+    tr, partials = _stream(whisper)
+    committed = tr.committed_text
+    _check("Zwischenlaeufe waehrend der Aufnahme", tr.partial_runs >= 5,
+           f"{tr.partial_runs} Laeufe")
+    _check("bestaetigter Text ist Praefix", bool(committed) and FULL_TEXT.startswith(committed),
+           committed[-30:])
+    _check("committed_at rueckt vor", tr._committed_at > 0,
+           f"{tr._committed_at / RATE:.2f} s")
+    _check("Partials nur mit Zwischen-Beam",
+           all(c["beam"] == PARTIAL_BEAM for c in whisper.calls))
+    stable = all(FULL_TEXT.startswith(c) for c, _ in partials)
+    _check("jeder Partial bestaetigt nur Stabiles", stable and len(partials) == tr.partial_runs,
+           f"{len(partials)} Callbacks")
+    cut = any(t.endswith("-") for _, t in partials)
+    _check("abgeschnittenes Wort bleibt offen", cut and "-" not in committed)
+    prompts = [c["prompt"] for c in whisper.calls[1:]]
+    _check("bestaetigter Text als Prompt", any(prompts) and all(p in FULL_TEXT for p in prompts))
+
+
+def check_final_tail_only() -> None:
+    print("\n[Finale nur ueber den Rest]")
+    whisper = FakeWhisper()
+    tr, _ = _stream(whisper)
+    start = tr._committed_at
+    n_before = len(whisper.calls)
+    text = tr.finish()
+    final = whisper.calls[n_before:]
+    _check("genau ein Finallauf mit voller Beam-Breite",
+           len(final) == 1 and final[0]["beam"] == FINAL_BEAM,
+           f"{[c['beam'] for c in final]}")
+    tail_s = (len(_utterance()) - start) / RATE
+    _check("Finale sieht nur den offenen Rest",
+           bool(final) and abs(final[0]["seconds"] - tail_s) < 1e-6 and tail_s < DURATION / 2,
+           f"{tail_s:.2f} s von {DURATION} s")
+    _check("7,3 s Aeusserung exakt zusammengesetzt", text == FULL_TEXT, text[-40:])
+
+
+def check_concurrent_worker() -> None:
+    print("\n[Worker parallel zur Aufnahme]")
+    whisper = FakeWhisper()
+    tr, _ = _stream(whisper, wait=False)
+    text = tr.finish()
+    _check("Stitching auch ohne Warten exakt", text == FULL_TEXT, text[-40:])
+
+
+def check_partial_errors() -> None:
+    print("\n[fehlgeschlagene Zwischenlaeufe]")
+    whisper = FakeWhisper(fail_beams=(PARTIAL_BEAM,))
+    tr, partials = _stream(whisper)
+    text = tr.finish()
+    final = whisper.calls[-1]
+    _check("keine Commits, kein Partial", tr.committed_text == "" and not partials)
+    _check("Finale ueber die ganze Aeusserung", abs(final["seconds"] - DURATION) < 1e-6,
+           f"{final['seconds']:.2f} s")
+    _check("Text trotzdem vollstaendig", text == FULL_TEXT, text[-40:])
+
+
+def check_final_error_fallback() -> None:
+    print("\n[Finale scheitert -> offener Rest]")
+    whisper = FakeWhisper(fail_beams=(FINAL_BEAM,))
+    tr, partials = _stream(whisper)
+    committed, tail = partials[-1]
+    text = tr.finish()
+    expected = " ".join(p for p in (committed, tail) if p)
+    _check("Rueckfall auf bestaetigt + _tail", text == expected and tail == tr._tail,
+           text[-40:])
+    _check("bestaetigter Teil bleibt erhalten", text.startswith(tr.committed_text))
+
+
+def main() -> int:
+    check_partial_commits()
+    check_final_tail_only()
+    check_concurrent_worker()
+    check_partial_errors()
+    check_final_error_fallback()
+    failed = _results.count(False)
+    color = GREEN if not failed else RED
+    print(f"\n{color}{len(_results) - failed} OK, {failed} Fehl{RESET}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+"""
+scripts/vad_check.py — Offline-Check fuer den Vorfilter in audio/vad.py
+
+Prueft block_features und PreGate ohne Silero und ohne Mikrofon mit
+synthetischen 512er-Bloecken (16 kHz):
+
+  - Stille und leises Grundrauschen (unter RMS_GATE)
+  - Hochpass-Rauschen mit hoher Nulldurchgangsrate (Luefter/Zischen)
+    knapp ueber RMS_GATE — bleibt draussen
+  - Sprachaehnlicher Ton (200 Hz) und lautes Rauschen (ab
+    RMS_GATE * ZCR_LOUD_FACTOR zaehlt die ZCR nicht mehr) — gehen durch
+  - Nachlauf: HANGOVER_BLOCKS offen nach dem letzten Treffer, dann zu;
+    auch ueber Stapelgrenzen hinweg (Rueckstau in mehreren Aufrufen)
+
+Starten:  python scripts/vad_check.py
+Exit-Code 0 wenn alle Checks bestehen.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+import numpy as np
+
+# Projekt-Root in sys.path
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+_PROJECT_ROOT = os.path.dirname(_SCRIPT_DIR)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
+
+from audio.vad import (
+    CHUNK_SIZE,
+    HANGOVER_BLOCKS,
+    RMS_GATE,
+    SAMPLE_RATE,
+    ZCR_LOUD_FACTOR,
+    ZCR_MAX,
+    PreGate,
+    block_features,
+)
+
+GREEN = "\033[92m"
+RED = "\033[91m"
+RESET = "\033[0m"
+
+_results: list[bool] = []
+
+
+def _check(name: str, passed: bool, detail: str = "") -> None:
+    _results.append(passed)
+    mark = f"{GREEN}OK  {RESET}" if passed else f"{RED}FAIL{RESET}"
+    print(f"  {mark} {name}" + (f"  ({detail})" if detail else ""))
+
+
+# ---------------------------------------------------------------------------
+# Synthetische Bloecke (k, 512) float32
+# ---------------------------------------------------------------------------
+
+_rng = np.random.default_rng(49)
+
+
+def _silence(k: int) -> np.ndarray:
+    return np.zeros((k, CHUNK_SIZE), dtype=np.float32)
+
+
+def _hum(k: int) -> np.ndarray:
+    """Leises Grundrauschen, RMS ~ RMS_GATE / 4."""
+    return (_rng.standard_normal((k, CHUNK_SIZE)) * RMS_GATE / 4).astype(np.float32)
+
+
+def _noise(k: int, rms: float) -> np.ndarray:
+    """Weisses Rauschen (ZCR ~ 0.5) mit gegebenem RMS."""
+    return (_rng.standard_normal((k, CHUNK_SIZE)) * rms).astype(np.float32)
+
+
+def _hiss(k: int, rms: float = RMS_GATE * 2) -> np.ndarray:
+    """Hochpass-Rauschen (Differenz weissen Rauschens, ZCR ~ 2/3) mit gegebenem RMS."""
+    hiss = np.diff(_rng.standard_normal((k, CHUNK_SIZE + 1)), axis=1) / np.sqrt(2)
+    return (hiss * rms).astype(np.float32)
+
+
+def _tone(k: int, freq: float = 200.0, amp: float = 0.3) -> np.ndarray:
+    """Sprachaehnlicher Ton, fortlaufend ueber die Bloecke."""
+    t = np.arange(k * CHUNK_SIZE) / SAMPLE_RATE
+    return (amp * np.sin(2 * np.pi * freq * t + 0.1)).astype(np.float32).reshape(k, CHUNK_SIZE)
+
+
+def _gate(blocks: np.ndarray, gate: PreGate | None = None) -> np.ndarray:
+    gate = gate or PreGate()
+    return gate(*block_features(blocks))
+
+
+# ---------------------------------------------------------------------------
+# Checks
+# ---------------------------------------------------------------------------
+
+def check_features() -> None:
+    print("\n[block_features]")
+    blocks = np.concatenate([_silence(1), _tone(2), _noise(1, 0.05), _hiss(1), _hum(1)])
+    rms, zcr = block_features(blocks)
+    ref_rms = np.array([np.sqrt(np.mean(b.astype(np.float64) ** 2)) for b in blocks])
+    ref_zcr = np.array([np.mean(np.signbit(b[1:]) != np.signbit(b[:-1])) for b in blocks])
+    _check("ein Wert pro Block", rms.shape == zcr.shape == (len(blocks),), f"{rms.shape}")
+    _check("RMS wie Einzelblock-Rechnung", np.allclose(rms, ref_rms, rtol=1e-5, atol=1e-7),
+           f"max. Abw. {np.max(np.abs(rms - ref_rms)):.2e}")
+    _check("ZCR wie Einzelblock-Rechnung", np.allclose(zcr, ref_zcr))
+    tone_zcr = 2 * 200.0 / SAMPLE_RATE
+    _check("200-Hz-Ton: RMS amp/sqrt(2), ZCR 2f/fs",
+           abs(rms[1] - 0.3 / np.sqrt(2)) < 5e-3 and abs(zcr[1] - tone_zcr) < 5e-3,
+           f"rms {rms[1]:.3f}, zcr {zcr[1]:.3f}")
+    _check("weisses Rauschen: ZCR ~ 0.5", 0.4 < zcr[3] < 0.6, f"zcr {zcr[3]:.2f}")
+    _check("Hochpass-Rauschen: ZCR ~ 2/3", 0.58 < zcr[4] < 0.75, f"zcr {zcr[4]:.2f}")
+    _check("Stille: RMS 0, ZCR 0", rms[0] == 0.0 and zcr[0] == 0.0)
+
+
+def check_silence() -> None:
+    print("\n[Stille]")
+    gate = PreGate()
+    mask = _gate(np.concatenate([_silence(10), _hum(10)]), gate)
+    _check("Stille und Grundrauschen bleiben draussen", not mask.any(), f"{int(mask.sum())}/20")
+    _check("skipped zaehlt alle", gate.skipped == 20 and gate.passed == 0,
+           f"passed {gate.passed}, skipped {gate.skipped}")
+
+
+def check_noise() -> None:
+    print("\n[Rauschen mit hoher ZCR]")
+    blocks = _hiss(20)
+    rms, zcr = block_features(blocks)
+    in_band = bool(np.all(rms >= RMS_GATE) and np.all(rms < RMS_GATE * ZCR_LOUD_FACTOR)
+                   and np.all(zcr > ZCR_MAX))
+    _check("Testsignal ueber RMS_GATE, unter der Laut-Schwelle", in_band,
+           f"rms {rms.min():.3f}-{rms.max():.3f}, zcr min {zcr.min():.2f}")
+    mask = PreGate()(rms, zcr)
+    _check("Luefter/Zischen geht nicht an Silero", not mask.any(), f"{int(mask.sum())}/20")
+    loose = PreGate(zcr_max=1.0)(rms, zcr)
+    _check("ohne ZCR-Grenze ginge es durch", bool(loose.all()))
+
+
+def check_loud() -> None:
+    print("\n[laute Sprache]")
+    mask = _gate(_tone(10))
+    _check("200-Hz-Ton geht durch", bool(mask.all()), f"{int(mask.sum())}/10")
+    loud_hiss = _hiss(10, rms=RMS_GATE * ZCR_LOUD_FACTOR * 2)
+    rms, zcr = block_features(loud_hiss)
+    mask = PreGate()(rms, zcr)
+    _check("lautes Rauschen ignoriert die ZCR (Frikative)",
+           bool(mask.all()) and bool(np.all(zcr > ZCR_MAX)), f"zcr min {zcr.min():.2f}")
+    quiet_tone = _tone(5, amp=RMS_GATE)        # RMS ~ 0.007 < RMS_GATE
+    _check("zu leiser Ton bleibt draussen", not _gate(quiet_tone).any())
+
+
+def check_hangover() -> None:
+    print("\n[Nachlauf]")
+    gate = PreGate()
+    tail = 12
+    mask = _gate(np.concatenate([_tone(3), _silence(tail)]), gate)
+    expected = [True] * (3 + HANGOVER_BLOCKS) + [False] * (tail - HANGOVER_BLOCKS)
+    _check(f"nach dem Treffer {HANGOVER_BLOCKS} Bloecke offen, dann zu",
+           mask.tolist() == expected, "".join("1" if m else "0" for m in mask))
+    _check("Zaehler", gate.passed == 3 + HANGOVER_BLOCKS
+           and gate.skipped == tail - HANGOVER_BLOCKS, f"{gate.passed}/{gate.skipped}")
+
+    gate = PreGate()
+    first = _gate(np.concatenate([_silence(4), _tone(1)]), gate)
+    second = _gate(_silence(HANGOVER_BLOCKS + 2), gate)
+    _check("Nachlauf ueber Stapelgrenzen",
+           first.tolist() == [False] * 4 + [True]
+           and second.tolist() == [True] * HANGOVER_BLOCKS + [False] * 2,
+           "".join("1" if m else "0" for m in np.concatenate([first, second])))
+
+    gate = PreGate()
+    blocks = np.concatenate([_tone(1), _silence(5), _tone(1), _silence(HANGOVER_BLOCKS + 1)])
+    mask = _gate(blocks, gate)
+    _check("neuer Treffer setzt den Nachlauf zurueck",
+           bool(mask[:7 + HANGOVER_BLOCKS].all()) and not mask[-1])
+
+    mask = _gate(np.concatenate([_tone(2), _silence(3)]), PreGate(hangover=0))
+    _check("hangover=0: nur Treffer", mask.tolist() == [True, True, False, False, False])
+
+
+def main() -> int:
+    check_features()
+    check_silence()
+    check_noise()
+    check_loud()
+    check_hangover()
+    failed = _results.count(False)
+    color = GREEN if not failed else RED
+    print(f"\n{color}{len(_results) - failed} OK, {failed} Fehl{RESET}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())